@@ -0,0 +1,109 @@
+"""Per-call client overhead of the generated DigitalMarketplace client and the wrapper.
+
+Composes buy and set_price calls with fixed suggested params, so algod is never
+contacted and only the Python side of a call is measured.
+
+    poetry run python -m benchmarks.client_overhead
+"""
+
+import argparse
+import base64
+import timeit
+import tracemalloc
+from collections.abc import Callable
+
+import algokit_utils
+from algosdk import account
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.transaction import PaymentTxn, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.digital_marketplace import client as generated
+from smart_contracts.digital_marketplace.client import Composer
+
+APP_ID = 1_234
+ASSET_ID = 5_678
+
+
+def _calls() -> dict[str, Callable[[], object]]:
+    private_key, address = account.generate_account()
+    signer = AccountTransactionSigner(private_key)
+    # never used to send a request, every call below gets suggested params
+    algod_client = AlgodClient("a" * 64, "http://localhost:4001")
+    app_client = generated.DigitalMarketplaceClient(
+        algod_client, app_id=APP_ID, sender=address, signer=signer
+    ).app_client
+    suggested_params = SuggestedParams(
+        fee=2_000,
+        first=1,
+        last=1_001,
+        gh=base64.b64encode(bytes(32)).decode(),
+        gen="benchmark",
+        flat_fee=True,
+        min_fee=1_000,
+    )
+    buyer_txn = TransactionWithSigner(
+        PaymentTxn(address, suggested_params, app_client.app_address, 6_600_000),
+        signer,
+    )
+    buy_parameters = algokit_utils.TransactionParameters(
+        suggested_params=suggested_params, foreign_assets=[ASSET_ID]
+    )
+    set_price_parameters = algokit_utils.TransactionParameters(
+        suggested_params=suggested_params
+    )
+
+    def generated_composer() -> generated.Composer:
+        return generated.Composer(app_client, AtomicTransactionComposer())
+
+    def wrapper_composer() -> Composer:
+        return Composer(app_client, AtomicTransactionComposer())
+
+    return {
+        "buy (generated)": lambda: generated_composer().buy(
+            buyer_txn=buyer_txn, quantity=2, transaction_parameters=buy_parameters
+        ),
+        "buy (wrapper)": lambda: wrapper_composer().buy(
+            buyer_txn=buyer_txn, quantity=2, transaction_parameters=buy_parameters
+        ),
+        "set_price (generated)": lambda: generated_composer().set_price(
+            unitary_price=3_300_000, transaction_parameters=set_price_parameters
+        ),
+        "set_price (wrapper)": lambda: wrapper_composer().set_price(
+            unitary_price=3_300_000, transaction_parameters=set_price_parameters
+        ),
+    }
+
+
+def _peak_allocation(call: Callable[[], object]) -> int:
+    """Bytes allocated at the busiest point of a single call."""
+    tracemalloc.start()
+    try:
+        call()
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - before
+
+
+def main(number: int, repeat: int) -> None:
+    print(f"{'call':<24}{'µs/call':>10}{'peak KiB':>10}")
+    for name, call in _calls().items():
+        seconds = min(timeit.repeat(call, number=number, repeat=repeat)) / number
+        kib = _peak_allocation(call) / 1024
+        print(f"{name:<24}{seconds * 1e6:>10.1f}{kib:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.number, args.repeat)
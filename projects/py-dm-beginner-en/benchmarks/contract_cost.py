@@ -0,0 +1,62 @@
+"""Opcode cost and size of the DigitalMarketplace methods, against an earlier commit.
+
+Reads the approval TEAL in the artifacts and the one of --baseline from git, and
+prints the static cost of every ABI method (the router included) for both. buy
+has no branches, so its static cost is exactly the budget a call consumes.
+
+    poetry run python -m benchmarks.contract_cost
+    poetry run python -m benchmarks.contract_cost --baseline HEAD~3
+"""
+
+import argparse
+import subprocess
+import tempfile
+from pathlib import Path
+
+from smart_contracts.helpers import manifest
+
+artifact_dir = Path("smart_contracts") / "artifacts" / "digital_marketplace"
+contract_name = "DigitalMarketplace"
+
+
+def _baseline_manifest(ref: str) -> manifest.Manifest:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for suffix in (".approval.teal", ".clear.teal", ".arc32.json"):
+            file_name = f"{contract_name}{suffix}"
+            result = subprocess.run(
+                ["git", "show", f"{ref}:./{artifact_dir / file_name}"],
+                capture_output=True,
+                check=False,
+            )
+            if result.returncode:
+                raise Exception(
+                    f"Could not read {file_name} at {ref}:\n{result.stderr.decode()}"
+                )
+            (Path(temp_dir) / file_name).write_bytes(result.stdout)
+        return manifest.build_manifest(Path(temp_dir))
+
+
+def main(baseline: str) -> None:
+    before = _baseline_manifest(baseline)
+    after = manifest.build_manifest(artifact_dir)
+    print(f"{'method':<40}{baseline:>10}{'current':>10}{'change':>10}")
+    for signature, method in after["methods"].items():
+        cost = method["static_cost"]
+        previous = before["methods"].get(signature, {}).get("static_cost")
+        change = "" if cost is None or previous is None else f"{cost - previous:+d}"
+        print(f"{signature:<40}{previous!s:>10}{cost!s:>10}{change:>10}")
+    size_before = before["approval"]["bytes"] + before["clear"]["bytes"]
+    size_after = after["approval"]["bytes"] + after["clear"]["bytes"]
+    print(
+        f"{'program bytes':<40}{size_before:>10}{size_after:>10}"
+        f"{size_after - size_before:>+10d}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--baseline", default="HEAD", help="git revision to compare against"
+    )
+    args = parser.parse_args()
+    main(args.baseline)
@@ -0,0 +1,285 @@
+"""Load test of the buy path of DigitalMarketplace, reported as JSON.
+
+Funds N buyers, spreads them over one or more marketplace apps and fires their buy
+groups through DigitalMarketplaceClient at a Poisson arrival rate. The report holds
+throughput, submit-to-confirm latency percentiles, fees paid and failure reasons,
+and the same config gives the same arrival times, so CI can compare two commits.
+
+    poetry run python -m benchmarks.load --node emulator --buyers 20 --rate 50
+    poetry run python -m benchmarks.load --node localnet --output load.json
+"""
+
+import argparse
+import dataclasses
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import algokit_utils
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import (
+    AlgorandClient,
+    AssetCreateParams,
+    AssetOptInParams,
+    AssetTransferParams,
+    PayParams,
+)
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+from smart_contracts.digital_marketplace.client import DigitalMarketplaceClient
+from smart_contracts.helpers import emulator
+from smart_contracts.helpers.account_pool import MAX_GROUP_SIZE, AccountPool
+from smart_contracts.helpers.suggested_params import SuggestedParamsCache
+
+SCHEMA_VERSION = 1
+UNITARY_PRICE = 1_000_000
+# covers the payments, the fees and the min balance of the asset holding
+BUYER_OVERHEAD = 1_000_000
+
+
+@dataclasses.dataclass(frozen=True)
+class LoadConfig:
+    node: str
+    buyers: int
+    apps: int
+    orders_per_buyer: int
+    quantity: int
+    # mean number of buy groups per second, arriving as a Poisson process
+    rate: float
+    # buy groups in flight at once
+    concurrency: int
+    seed: int
+
+
+@dataclasses.dataclass(frozen=True)
+class _Buyer:
+    account: AddressAndSigner
+    client: DigitalMarketplaceClient
+    asset_id: int
+
+
+@dataclasses.dataclass(frozen=True)
+class _Outcome:
+    latency: float | None
+    fees: int
+    failure: str | None = None
+
+
+def _algorand(node: str) -> tuple[AlgorandClient, AddressAndSigner]:
+    if node == "emulator":
+        algorand = emulator.algorand_client()
+        dispenser = emulator.dispenser(algorand)
+    else:
+        algorand = AlgorandClient.default_local_net()
+        dispenser = algorand.account.dispenser()
+    # every group closes a round on either node, so the payments of the buy groups
+    # get fresh suggested params and a window that outlasts the queue of orders
+    algorand.set_suggested_params_timeout(0).set_default_validity_window(1000)
+    return algorand, dispenser
+
+
+def _create_marketplace(
+    algorand: AlgorandClient, creator: AddressAndSigner, supply: int
+) -> tuple[DigitalMarketplaceClient, int]:
+    asset_id = algorand.send.asset_create(
+        AssetCreateParams(sender=creator.address, total=supply)
+    )["confirmation"]["asset-index"]
+    client = DigitalMarketplaceClient(
+        algod_client=algorand.client.algod,
+        sender=creator.address,
+        signer=creator.signer,
+    )
+    client.create_create_application(unitary_price=UNITARY_PRICE, asset_id=asset_id)
+    mbr_pay_txn = algorand.transactions.payment(
+        PayParams(sender=creator.address, receiver=client.app_address, amount=200_000)
+    )
+    client.opt_in_to_asset(
+        mbr_pay=TransactionWithSigner(txn=mbr_pay_txn, signer=creator.signer),
+        transaction_parameters=algokit_utils.TransactionParameters(
+            foreign_assets=[asset_id]
+        ),
+    )
+    algorand.send.asset_transfer(
+        AssetTransferParams(
+            sender=creator.address,
+            receiver=client.app_address,
+            asset_id=asset_id,
+            amount=supply,
+        )
+    )
+    return client, asset_id
+
+
+def _setup(
+    algorand: AlgorandClient, pool: AccountPool, config: LoadConfig
+) -> list[_Buyer]:
+    # the buyers of an app share its supply, so each app holds enough for all of them
+    buyers_per_app = math.ceil(config.buyers / config.apps)
+    supply = buyers_per_app * config.orders_per_buyer * config.quantity
+    creator_pool = AccountPool(
+        algorand, pool.dispenser, batch_size=min(config.apps, MAX_GROUP_SIZE)
+    )
+    marketplaces = [
+        _create_marketplace(algorand, creator_pool.take(), supply)
+        for _ in range(config.apps)
+    ]
+    suggested_params_cache = SuggestedParamsCache(algorand.client.algod)
+    buyers = []
+    for index in range(config.buyers):
+        account = pool.take()
+        app_client, asset_id = marketplaces[index % config.apps]
+        algorand.send.asset_opt_in(
+            AssetOptInParams(sender=account.address, asset_id=asset_id)
+        )
+        client = DigitalMarketplaceClient(
+            algod_client=algorand.client.algod,
+            app_id=app_client.app_id,
+            sender=account.address,
+            signer=account.signer,
+            suggested_params_cache=suggested_params_cache,
+        )
+        buyers.append(_Buyer(account, client, asset_id))
+    return buyers
+
+
+def _failure_reason(ex: Exception) -> str:
+    """The error of ex without the ids that make every failure unique."""
+    reason = str(ex).splitlines()[0] if str(ex) else type(ex).__name__
+    reason = re.sub(r"\b[A-Z2-7]{52}\b", "<txid>", reason)
+    reason = re.sub(r"\b[A-Z2-7]{58}\b", "<address>", reason)
+    return re.sub(r"\d+", "<n>", reason)[:200]
+
+
+def _buy(
+    algorand: AlgorandClient, buyer: _Buyer, quantity: int, note: bytes
+) -> _Outcome:
+    payment = algorand.transactions.payment(
+        PayParams(
+            sender=buyer.account.address,
+            receiver=buyer.client.app_address,
+            amount=quantity * UNITARY_PRICE,
+            # tells apart the otherwise identical groups of a buyer
+            note=note,
+        )
+    )
+    atc = (
+        buyer.client.compose()
+        .buy(
+            buyer_txn=TransactionWithSigner(txn=payment, signer=buyer.account.signer),
+            quantity=quantity,
+            transaction_parameters=algokit_utils.TransactionParameters(
+                foreign_assets=[buyer.asset_id], note=note
+            ),
+        )
+        .build()
+    )
+    fees = sum(txn.txn.fee for txn in atc.build_group())
+    submitted_at = time.perf_counter()
+    atc.execute(algorand.client.algod, 10)
+    return _Outcome(latency=time.perf_counter() - submitted_at, fees=fees)
+
+
+def _percentile(values: list[float], percent: float) -> float | None:
+    """Nearest-rank percentile, None when there are no values."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def run(config: LoadConfig) -> dict:
+    algorand, dispenser = _algorand(config.node)
+    pool = AccountPool(
+        algorand,
+        dispenser,
+        amount=config.orders_per_buyer * config.quantity * UNITARY_PRICE
+        + BUYER_OVERHEAD,
+    )
+    buyers = _setup(algorand, pool, config)
+
+    rng = random.Random(config.seed)
+    orders = [
+        (buyers[order % config.buyers], order)
+        for order in range(config.buyers * config.orders_per_buyer)
+    ]
+    rng.shuffle(orders)
+    outcomes: list[_Outcome] = []
+    lock = threading.Lock()
+
+    def place(buyer: _Buyer, order: int) -> None:
+        try:
+            outcome = _buy(algorand, buyer, config.quantity, f"load-{order}".encode())
+        except Exception as ex:
+            outcome = _Outcome(latency=None, fees=0, failure=_failure_reason(ex))
+        with lock:
+            outcomes.append(outcome)
+
+    started_at = time.perf_counter()
+    with ThreadPoolExecutor(config.concurrency) as executor:
+        arrival = 0.0
+        for buyer, order in orders:
+            arrival += rng.expovariate(config.rate)
+            delay = started_at + arrival - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            executor.submit(place, buyer, order)
+    duration = time.perf_counter() - started_at
+
+    latencies = [o.latency for o in outcomes if o.latency is not None]
+    failures = Counter(o.failure for o in outcomes if o.failure is not None)
+    fees = sum(o.fees for o in outcomes)
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "config": dataclasses.asdict(config),
+        "submitted": len(outcomes),
+        "confirmed": len(latencies),
+        "failed": len(outcomes) - len(latencies),
+        "duration_seconds": duration,
+        "throughput_groups_per_second": len(latencies) / duration,
+        "latency_seconds": {
+            "p50": _percentile(latencies, 50),
+            "p99": _percentile(latencies, 99),
+            "mean": sum(latencies) / len(latencies) if latencies else None,
+            "max": max(latencies, default=None),
+        },
+        "fees_microalgos": {
+            "total": fees,
+            "per_confirmed_group": fees / len(latencies) if latencies else None,
+        },
+        "failures": dict(failures.most_common()),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--node", choices=("localnet", "emulator"), default="localnet")
+    parser.add_argument("--buyers", type=int, default=10)
+    parser.add_argument("--apps", type=int, default=1)
+    parser.add_argument("--orders-per-buyer", type=int, default=5)
+    parser.add_argument("--quantity", type=int, default=1)
+    parser.add_argument("--rate", type=float, default=20.0)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the report here instead of stdout")
+    args = parser.parse_args()
+    config = LoadConfig(
+        node=args.node,
+        buyers=args.buyers,
+        apps=args.apps,
+        orders_per_buyer=args.orders_per_buyer,
+        quantity=args.quantity,
+        rate=args.rate,
+        concurrency=args.concurrency,
+        seed=args.seed,
+    )
+    report = json.dumps(run(config), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
@@ -0,0 +1,206 @@
+"""Onboarding latency of a seller, without and with MarketplaceFactory, as JSON.
+
+Every seller creates an asset, then puts it on sale once through the four step
+flow (create the app, fund it and opt it in, deposit) and once through a single
+create_marketplace call of the factory. The report holds the latency, the
+confirmations waited for and the spendable ALGO each flow costs, MBR included.
+
+    poetry run python -m benchmarks.onboarding --sellers 10
+    poetry run python -m benchmarks.onboarding --output onboarding.json
+"""
+
+import argparse
+import dataclasses
+import functools
+import json
+import math
+import time
+from collections.abc import Callable
+
+import algokit_utils
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import (
+    AlgorandClient,
+    AssetCreateParams,
+    AssetTransferParams,
+    PayParams,
+)
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+from smart_contracts.artifacts.marketplace_factory.client import (
+    MarketplaceFactoryClient,
+)
+from smart_contracts.digital_marketplace.client import DigitalMarketplaceClient
+from smart_contracts.helpers.account_pool import AccountPool
+from smart_contracts.marketplace_factory.onboarding import onboard, update_programs
+
+SCHEMA_VERSION = 1
+UNITARY_PRICE = 1_000_000
+# every seller onboards one asset per flow, the factory takes a bit under 0.5 ALGO
+SELLER_AMOUNT = 2_000_000
+
+
+@dataclasses.dataclass(frozen=True)
+class OnboardingConfig:
+    sellers: int
+    quantity: int
+
+
+@dataclasses.dataclass(frozen=True)
+class _Outcome:
+    latency: float
+    confirmations: int
+    # how much less the seller can spend afterwards, fees and MBR included
+    spent: int
+
+
+def _direct(
+    algorand: AlgorandClient, seller: AddressAndSigner, asset_id: int, quantity: int
+) -> int:
+    """The four step flow, one confirmation each but for funding and opt-in."""
+    client = DigitalMarketplaceClient(
+        algod_client=algorand.client.algod,
+        sender=seller.address,
+        signer=seller.signer,
+    )
+    client.create_create_application(unitary_price=UNITARY_PRICE, asset_id=asset_id)
+    mbr_pay_txn = algorand.transactions.payment(
+        PayParams(sender=seller.address, receiver=client.app_address, amount=200_000)
+    )
+    client.opt_in_to_asset(
+        mbr_pay=TransactionWithSigner(txn=mbr_pay_txn, signer=seller.signer),
+        transaction_parameters=algokit_utils.TransactionParameters(
+            foreign_assets=[asset_id]
+        ),
+    )
+    algorand.send.asset_transfer(
+        AssetTransferParams(
+            sender=seller.address,
+            receiver=client.app_address,
+            asset_id=asset_id,
+            amount=quantity,
+        )
+    )
+    return 3
+
+
+def _factory(
+    factory_client: MarketplaceFactoryClient,
+    seller: AddressAndSigner,
+    asset_id: int,
+    quantity: int,
+) -> int:
+    onboard(
+        factory_client,
+        seller=seller.address,
+        signer=seller.signer,
+        asset_id=asset_id,
+        quantity=quantity,
+        unitary_price=UNITARY_PRICE,
+    )
+    return 1
+
+
+def _spendable(algorand: AlgorandClient, address: str) -> int:
+    # the app the direct flow creates locks MBR in the seller account instead
+    info = algorand.account.get_information(address)
+    return info["amount"] - info["min-balance"]
+
+
+def _measure(
+    algorand: AlgorandClient, seller: AddressAndSigner, flow: Callable[[], int]
+) -> _Outcome:
+    before = _spendable(algorand, seller.address)
+    started_at = time.perf_counter()
+    confirmations = flow()
+    latency = time.perf_counter() - started_at
+    spent = before - _spendable(algorand, seller.address)
+    return _Outcome(latency=latency, confirmations=confirmations, spent=spent)
+
+
+def _create_asset(
+    algorand: AlgorandClient, seller: AddressAndSigner, quantity: int
+) -> int:
+    return algorand.send.asset_create(
+        AssetCreateParams(sender=seller.address, total=quantity)
+    )["confirmation"]["asset-index"]
+
+
+def _create_factory(algorand: AlgorandClient) -> MarketplaceFactoryClient:
+    creator = algokit_utils.get_localnet_default_account(algorand.client.algod)
+    client = MarketplaceFactoryClient(
+        algod_client=algorand.client.algod,
+        sender=creator.address,
+        signer=creator.signer,
+    )
+    client.create_bare()
+    algorand.send.payment(
+        PayParams(sender=creator.address, receiver=client.app_address, amount=100_000)
+    )
+    update_programs(client, creator)
+    return client
+
+
+def _percentile(values: list[float], percent: float) -> float:
+    """Nearest-rank percentile."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(percent / 100 * len(ordered)) - 1)]
+
+
+def _summary(outcomes: list[_Outcome]) -> dict:
+    latencies = [o.latency for o in outcomes]
+    return {
+        "latency_seconds": {
+            "p50": _percentile(latencies, 50),
+            "p99": _percentile(latencies, 99),
+            "mean": sum(latencies) / len(latencies),
+            "max": max(latencies),
+        },
+        "confirmations_per_seller": outcomes[0].confirmations,
+        "spent_microalgos_per_seller": sum(o.spent for o in outcomes) / len(outcomes),
+    }
+
+
+def run(config: OnboardingConfig) -> dict:
+    # the emulator implements neither boxes nor inner app calls
+    algorand = AlgorandClient.default_local_net()
+    pool = AccountPool(algorand, algorand.account.dispenser(), amount=SELLER_AMOUNT)
+    factory_client = _create_factory(algorand)
+
+    direct: list[_Outcome] = []
+    factory: list[_Outcome] = []
+    for _ in range(config.sellers):
+        seller = pool.take()
+        # a new asset per flow, so the factory opts in to it within the measured group
+        direct_asset_id = _create_asset(algorand, seller, config.quantity)
+        factory_asset_id = _create_asset(algorand, seller, config.quantity)
+        direct_flow = functools.partial(
+            _direct, algorand, seller, direct_asset_id, config.quantity
+        )
+        factory_flow = functools.partial(
+            _factory, factory_client, seller, factory_asset_id, config.quantity
+        )
+        direct.append(_measure(algorand, seller, direct_flow))
+        factory.append(_measure(algorand, seller, factory_flow))
+
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "config": dataclasses.asdict(config),
+        "direct": _summary(direct),
+        "factory": _summary(factory),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sellers", type=int, default=10)
+    parser.add_argument("--quantity", type=int, default=10)
+    parser.add_argument("--output", help="write the report here instead of stdout")
+    args = parser.parse_args()
+    config = OnboardingConfig(sellers=args.sellers, quantity=args.quantity)
+    report = json.dumps(run(config), indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report + "\n")
+    else:
+        print(report)
@@ -1,12 +1,19 @@
+import argparse
+import dataclasses
+import json
 import logging
-import sys
+import shlex
 from pathlib import Path
 
 from dotenv import load_dotenv
 
-from smart_contracts.config import contracts
-from smart_contracts.helpers.build import build
-from smart_contracts.helpers.deploy import deploy
+from smart_contracts.config import discover_contracts
+from smart_contracts.helpers.parallel import (
+    ContractLogFilter,
+    build_all,
+    contract_context,
+    deploy_all,
+)
 from smart_contracts.helpers.util import find_app_spec_file
 
 # Uncomment the following lines to enable auto generation of AVM Debugger compliant sourcemap and simulation trace file.
@@ -15,42 +22,192 @@ from smart_contracts.helpers.util import find_app_spec_file
 # from algokit_utils.config import config
 # config.configure(debug=True, trace_all=True)
 logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
+    level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(contract)s%(message)s"
 )
+for handler in logging.getLogger().handlers:
+    handler.addFilter(ContractLogFilter())
 logger = logging.getLogger(__name__)
 logger.info("Loading .env")
 load_dotenv()
 root_path = Path(__file__).parent
 
 
-def main(action: str) -> None:
+def main(
+    action: str,
+    jobs: int = 1,
+    *,
+    in_process: bool = True,
+    only: list[str] | None = None,
+    update_baseline: bool = False,
+    no_baseline: bool = False,
+    avm_versions: list[int] | None = None,
+    simulate: bool = False,
+    pytest_args: list[str] | None = None,
+    app_ids: list[int] | None = None,
+    method: str = "buy",
+) -> None:
     artifact_path = root_path / "artifacts"
+    contracts = discover_contracts(only)
     match action:
         case "build":
-            for contract in contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            build_all(artifact_path, contracts, jobs, in_process=in_process)
         case "deploy":
+            app_spec_paths = {}
             for contract in contracts:
-                logger.info(f"Deploying app {contract.name}")
                 output_dir = artifact_path / contract.name
                 app_spec_file_name = find_app_spec_file(output_dir)
                 if app_spec_file_name is None:
                     raise Exception("Could not deploy app, .arc32.json file not found")
-                app_spec_path = output_dir / app_spec_file_name
-                if contract.deploy:
-                    deploy(app_spec_path, contract.deploy)
+                app_spec_paths[contract.name] = output_dir / app_spec_file_name
+            deploy_all(app_spec_paths, contracts, jobs)
         case "all":
+            app_spec_paths = build_all(
+                artifact_path, contracts, jobs, in_process=in_process
+            )
+            deploy_all(app_spec_paths, contracts, jobs)
+        case "profile":
+            # only needed here, keeps algokit_utils out of build-only runs
+            from smart_contracts.helpers.profile import baseline_file_name, profile
+
             for contract in contracts:
-                logger.info(f"Building app at {contract.path}")
-                app_spec_path = build(artifact_path / contract.name, contract.path)
-                logger.info(f"Deploying {contract.path.name}")
-                if contract.deploy:
-                    deploy(app_spec_path, contract.deploy)
+                if contract.profile is None:
+                    logger.info(f"No profile_config for {contract.name}, skipping")
+                    continue
+                baseline_path = contract.path.parent / baseline_file_name
+                approval_teal_path = next(
+                    (artifact_path / contract.name).glob("*.approval.teal"), None
+                )
+                if approval_teal_path is None:
+                    raise Exception("Could not profile app, .approval.teal not found")
+                with contract_context(contract.name):
+                    profile(
+                        contract.name,
+                        approval_teal_path,
+                        contract.profile,
+                        None if no_baseline else baseline_path,
+                        update_baseline=update_baseline,
+                    )
+        case "sweep":
+            from smart_contracts.helpers.sweep import sweep
+
+            for contract in contracts:
+                with contract_context(contract.name):
+                    sweep(
+                        contract,
+                        artifact_path / contract.name,
+                        avm_versions=avm_versions or (None,),
+                        simulate=simulate,
+                        pytest_args=pytest_args or [],
+                        in_process=in_process,
+                    )
+        case "sales":
+            from algokit_utils import get_indexer_client
+
+            from smart_contracts.helpers.sales import sales_dir, scan_sales
+
+            if len(contracts) != 1 or not app_ids:
+                raise Exception("sales needs one --only NAME and at least one --app-id")
+            contract = contracts[0]
+            app_spec_file_name = find_app_spec_file(artifact_path / contract.name)
+            if app_spec_file_name is None:
+                raise Exception("Could not read sales, .arc32.json file not found")
+            app_spec_path = artifact_path / contract.name / app_spec_file_name
+            with contract_context(contract.name):
+                sales = scan_sales(
+                    get_indexer_client(),
+                    json.loads(app_spec_path.read_text()),
+                    app_ids,
+                    sales_dir / f"{contract.name}.{method}.json",
+                    method_name=method,
+                )
+            print(
+                json.dumps(
+                    {app_id: dataclasses.asdict(s) for app_id, s in sales.items()},
+                    indent=2,
+                )
+            )
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main("all")
+    parser = argparse.ArgumentParser(prog="python -m smart_contracts")
+    parser.add_argument(
+        "action",
+        nargs="?",
+        default="all",
+        choices=["build", "deploy", "all", "profile", "sweep", "sales"],
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of contracts to build (in processes) or deploy (in threads) "
+        "at the same time",
+    )
+    parser.add_argument(
+        "--subprocess",
+        action="store_true",
+        help="always compile with `poetry run puyapy` and `algokit generate client` "
+        "instead of calling them in this interpreter",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="NAME",
+        help="only build/deploy the contract in smart_contracts/NAME, can be repeated",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="profile: overwrite the stored baseline instead of checking against it",
+    )
+    parser.add_argument(
+        "--no-baseline",
+        action="store_true",
+        help="profile: only write the report, neither check nor store a baseline",
+    )
+    parser.add_argument(
+        "--avm-version",
+        type=int,
+        action="append",
+        metavar="VERSION",
+        help="sweep: also compile for this AVM version, can be repeated "
+        "(default: the puyapy default only)",
+    )
+    parser.add_argument(
+        "--simulate",
+        action="store_true",
+        help="sweep: rank variants by the opcode budget `profile` measures on LocalNet "
+        "instead of the static cost in the size manifest",
+    )
+    parser.add_argument(
+        "--pytest-args",
+        default="",
+        help="sweep: arguments for the pytest run that vets each variant, "
+        "e.g. '--backend=emulator'",
+    )
+    parser.add_argument(
+        "--app-id",
+        type=int,
+        action="append",
+        help="sales: an app to report the sales of, can be repeated",
+    )
+    parser.add_argument(
+        "--method",
+        default="buy",
+        help="sales: the ABI method whose calls are sales (default: buy)",
+    )
+    args = parser.parse_args()
+    main(
+        args.action,
+        jobs=args.jobs,
+        in_process=not args.subprocess,
+        only=args.only,
+        update_baseline=args.update_baseline,
+        no_baseline=args.no_baseline,
+        avm_versions=args.avm_version,
+        simulate=args.simulate,
+        pytest_args=shlex.split(args.pytest_args),
+        app_ids=args.app_id,
+        method=args.method,
+    )
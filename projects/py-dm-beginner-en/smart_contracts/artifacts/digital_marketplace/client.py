@@ -50,8 +50,8 @@ _APP_SPEC_JSON = r"""{
         }
     },
     "source": {
-        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuYXBwcm92YWxfcHJvZ3JhbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIwLTIxCiAgICAvLyAjIFdlIHdhbnQgdGhlIG1ldGhvZHMgaW4gb3VyIGNvbnRyYWN0IHRvIGZvbGxvdyB0aGUgQVJDNCBzdGFuZGFyZAogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKGFyYzQuQVJDNENvbnRyYWN0KToKICAgIG1ldGhvZCAiY3JlYXRlX2FwcGxpY2F0aW9uKGFzc2V0LHVpbnQ2NCl2b2lkIgogICAgbWV0aG9kICJzZXRfcHJpY2UodWludDY0KXZvaWQiCiAgICBtZXRob2QgIm9wdF9pbl90b19hc3NldChwYXkpdm9pZCIKICAgIG1ldGhvZCAiYnV5KHBheSx1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiZGVsZXRlX2FwcGxpY2F0aW9uKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9jcmVhdGVfYXBwbGljYXRpb25fcm91dGVAMSBtYWluX3NldF9wcmljZV9yb3V0ZUAyIG1haW5fb3B0X2luX3RvX2Fzc2V0X3JvdXRlQDMgbWFpbl9idXlfcm91dGVANCBtYWluX2RlbGV0ZV9hcHBsaWNhdGlvbl9yb3V0ZUA1CiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX2NyZWF0ZV9hcHBsaWNhdGlvbl9yb3V0ZUAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjktMzcKICAgIC8vICMgV2Ugd2FudCBjcmVhdGVfYXBwbGljYXRpb24gdG8gYmUgYSBwbHVibGljIEFCSSBtZXRob2QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgKICAgIC8vICAgICAjIFRoZXJlIGFyZSBjZXJ0YWluIGFjdGlvbnMgdGhhdCBhIGNvbnRyYWN0IGNhbGwgY2FuIGRvCiAgICAvLyAgICAgIyBTb21lIGV4YW1wbGVzIGFyZSBVcGRhdGVBcHBsaWNhdGlvbiwgRGVsZXRlQXBwbGljYXRpb24sIGFuZCBOb09wCiAgICAvLyAgICAgIyBOb09wIGlzIGEgY2FsbCB0aGF0IGRvZXMgbm90aGluZyBzcGVjaWFsIGFmdGVyIGl0IGlzIGV4ZWN0ZWQKICAgIC8vICAgICBhbGxvd19hY3Rpb25zPVsiTm9PcCJdLAogICAgLy8gICAgICMgUmVxdWlyZSB0aGF0IHRoaXMgbWV0aG9kIGlzIG9ubHkgY2FsbGFibGUgd2hlbiBjcmVhdGluZyB0aGUgYXBwCiAgICAvLyAgICAgY3JlYXRlPSJyZXF1aXJlIiwKICAgIC8vICkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBpcyBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjAtMjEKICAgIC8vICMgV2Ugd2FudCB0aGUgbWV0aG9kcyBpbiBvdXIgY29udHJhY3QgdG8gZm9sbG93IHRoZSBBUkM0IHN0YW5kYXJkCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoYXJjNC5BUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyOS0zNwogICAgLy8gIyBXZSB3YW50IGNyZWF0ZV9hcHBsaWNhdGlvbiB0byBiZSBhIHBsdWJsaWMgQUJJIG1ldGhvZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKAogICAgLy8gICAgICMgVGhlcmUgYXJlIGNlcnRhaW4gYWN0aW9ucyB0aGF0IGEgY29udHJhY3QgY2FsbCBjYW4gZG8KICAgIC8vICAgICAjIFNvbWUgZXhhbXBsZXMgYXJlIFVwZGF0ZUFwcGxpY2F0aW9uLCBEZWxldGVBcHBsaWNhdGlvbiwgYW5kIE5vT3AKICAgIC8vICAgICAjIE5vT3AgaXMgYSBjYWxsIHRoYXQgZG9lcyBub3RoaW5nIHNwZWNpYWwgYWZ0ZXIgaXQgaXMgZXhlY3RlZAogICAgLy8gICAgIGFsbG93X2FjdGlvbnM9WyJOb09wIl0sCiAgICAvLyAgICAgIyBSZXF1aXJlIHRoYXQgdGhpcyBtZXRob2QgaXMgb25seSBjYWxsYWJsZSB3aGVuIGNyZWF0aW5nIHRoZSBhcHAKICAgIC8vICAgICBjcmVhdGU9InJlcXVpcmUiLAogICAgLy8gKQogICAgY2FsbHN1YiBjcmVhdGVfYXBwbGljYXRpb24KICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fc2V0X3ByaWNlX3JvdXRlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMC0yMQogICAgLy8gIyBXZSB3YW50IHRoZSBtZXRob2RzIGluIG91ciBjb250cmFjdCB0byBmb2xsb3cgdGhlIEFSQzQgc3RhbmRhcmQKICAgIC8vIGNsYXNzIERpZ2l0YWxNYXJrZXRwbGFjZShhcmM0LkFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo0OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF9wcmljZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9vcHRfaW5fdG9fYXNzZXRfcm91dGVAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU5LTYxCiAgICAvLyAjIEJlZm9yZSBhbnkgYWNjb3VudCBjYW4gcmVjZWl2ZSBhbiBhc3NldCwgaXQgbXVzdCBvcHQtaW4gdG8gaXQKICAgIC8vICMgVGhpcyBtZXRob2QgZW5hYmxlcyB0aGUgYXBwbGljYXRpb24gdG8gb3B0LWluIHRvIHRoZSBhc3NldAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMC0yMQogICAgLy8gIyBXZSB3YW50IHRoZSBtZXRob2RzIGluIG91ciBjb250cmFjdCB0byBmb2xsb3cgdGhlIEFSQzQgc3RhbmRhcmQKICAgIC8vIGNsYXNzIERpZ2l0YWxNYXJrZXRwbGFjZShhcmM0LkFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU5LTYxCiAgICAvLyAjIEJlZm9yZSBhbnkgYWNjb3VudCBjYW4gcmVjZWl2ZSBhbiBhc3NldCwgaXQgbXVzdCBvcHQtaW4gdG8gaXQKICAgIC8vICMgVGhpcyBtZXRob2QgZW5hYmxlcyB0aGUgYXBwbGljYXRpb24gdG8gb3B0LWluIHRvIHRoZSBhc3NldAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIG9wdF9pbl90b19hc3NldAogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9idXlfcm91dGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIwLTIxCiAgICAvLyAjIFdlIHdhbnQgdGhlIG1ldGhvZHMgaW4gb3VyIGNvbnRyYWN0IHRvIGZvbGxvdyB0aGUgQVJDNCBzdGFuZGFyZAogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKGFyYzQuQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnQgMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50IHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBidXkKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZGVsZXRlX2FwcGxpY2F0aW9uX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMTUtMTE4CiAgICAvLyBAYXJjNC5hYmltZXRob2QoCiAgICAvLyAgICAgIyBUaGlzIG1ldGhvZCBpcyBjYWxsZWQgd2hlbiB0aGUgYXBwbGljYXRpb24gaXMgZGVsZXRlZAogICAgLy8gICAgIGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdCiAgICAvLyApCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnQgRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBkZWxldGVfYXBwbGljYXRpb24KICAgIGludCAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuY3JlYXRlX2FwcGxpY2F0aW9uKGFzc2V0X2lkOiB1aW50NjQsIHVuaXRhcnlfcHJpY2U6IHVpbnQ2NCkgLT4gdm9pZDoKY3JlYXRlX2FwcGxpY2F0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjktNDQKICAgIC8vICMgV2Ugd2FudCBjcmVhdGVfYXBwbGljYXRpb24gdG8gYmUgYSBwbHVibGljIEFCSSBtZXRob2QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgKICAgIC8vICAgICAjIFRoZXJlIGFyZSBjZXJ0YWluIGFjdGlvbnMgdGhhdCBhIGNvbnRyYWN0IGNhbGwgY2FuIGRvCiAgICAvLyAgICAgIyBTb21lIGV4YW1wbGVzIGFyZSBVcGRhdGVBcHBsaWNhdGlvbiwgRGVsZXRlQXBwbGljYXRpb24sIGFuZCBOb09wCiAgICAvLyAgICAgIyBOb09wIGlzIGEgY2FsbCB0aGF0IGRvZXMgbm90aGluZyBzcGVjaWFsIGFmdGVyIGl0IGlzIGV4ZWN0ZWQKICAgIC8vICAgICBhbGxvd19hY3Rpb25zPVsiTm9PcCJdLAogICAgLy8gICAgICMgUmVxdWlyZSB0aGF0IHRoaXMgbWV0aG9kIGlzIG9ubHkgY2FsbGFibGUgd2hlbiBjcmVhdGluZyB0aGUgYXBwCiAgICAvLyAgICAgY3JlYXRlPSJyZXF1aXJlIiwKICAgIC8vICkKICAgIC8vIGRlZiBjcmVhdGVfYXBwbGljYXRpb24oCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICAjIFRoZSBJRCBvZiB0aGUgYXNzZXQgd2UncmUgc2VsbGluZwogICAgLy8gICAgIGFzc2V0X2lkOiBBc3NldCwKICAgIC8vICAgICAjIFRoZSBpbml0aWFsIHNhbGUgcHJpY2UKICAgIC8vICAgICB1bml0YXJ5X3ByaWNlOiBVSW50NjQsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ1LTQ2CiAgICAvLyAjIFNhdmUgdGhlIHZhbHVlcyB3ZSBwYXNzZWQgaW4gdG8gb3VyIG1ldGhvZCBpbiB0aGUgY29udHJhY3QncyBzdGF0ZQogICAgLy8gc2VsZi5hc3NldF9pZCA9IGFzc2V0X2lkLmlkCiAgICBieXRlICJhc3NldF9pZCIKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ3CiAgICAvLyBzZWxmLnVuaXRhcnlfcHJpY2UgPSB1bml0YXJ5X3ByaWNlCiAgICBieXRlICJ1bml0YXJ5X3ByaWNlIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLnNldF9wcmljZSh1bml0YXJ5X3ByaWNlOiB1aW50NjQpIC0+IHZvaWQ6CnNldF9wcmljZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ5LTUwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXRfcHJpY2Uoc2VsZiwgdW5pdGFyeV9wcmljZTogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MS01NAogICAgLy8gIyBXZSBkb24ndCB3YW50IGFueW9uZSB0byBiZSBhYmxlIHRvIGNvbWUgaW4gYW5kIG1vZGlmeSB0aGUgcHJpY2UKICAgIC8vICMgWW91IGNvdWxkIGltcGxlbWVudCBzb21lIHNvcnQgb2YgUkJBQywKICAgIC8vICMgYnV0IGluIHRoaXMgY2FzZSBqdXN0IG1ha2luZyBzdXJlIHRoZSBjYWxsZXIgaXMgdGhlIGFwcCBjcmVhdG9yIHdvcmtzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU2LTU3CiAgICAvLyAjIFNhdmUgdGhlIG5ldyBwcmljZQogICAgLy8gc2VsZi51bml0YXJ5X3ByaWNlID0gdW5pdGFyeV9wcmljZQogICAgYnl0ZSAidW5pdGFyeV9wcmljZSIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5vcHRfaW5fdG9fYXNzZXQobWJyX3BheTogdWludDY0KSAtPiB2b2lkOgpvcHRfaW5fdG9fYXNzZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1OS02NwogICAgLy8gIyBCZWZvcmUgYW55IGFjY291bnQgY2FuIHJlY2VpdmUgYW4gYXNzZXQsIGl0IG11c3Qgb3B0LWluIHRvIGl0CiAgICAvLyAjIFRoaXMgbWV0aG9kIGVuYWJsZXMgdGhlIGFwcGxpY2F0aW9uIHRvIG9wdC1pbiB0byB0aGUgYXNzZXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIG9wdF9pbl90b19hc3NldCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgICMgV2hlbmV2ZXIgc29tZW9uZSBjYWxscyB0aGlzIG1ldGhvZCwgdGhleSBhbHNvIG5lZWQgdG8gc2VuZCBhIHBheW1lbnQKICAgIC8vICAgICAjIEEgcGF5bWVudCB0cmFuc2FjdGlvbiBpcyBhIHRyYW5zZmVyIG9mIEFMR08KICAgIC8vICAgICBtYnJfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NjgtNjkKICAgIC8vICMgV2Ugd2FudCB0byBtYWtlIHN1cmUgdGhhdCB0aGUgYXBwbGljYXRpb24gYWRkcmVzcyBpcyBub3QgYWxyZWFkeSBvcHRlZCBpbgogICAgLy8gYXNzZXJ0IG5vdCBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmlzX29wdGVkX2luKEFzc2V0KHNlbGYuYXNzZXRfaWQpKQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGludCAwCiAgICBieXRlICJhc3NldF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgYXNzZXRfaWQgZXhpc3RzCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3NC03NgogICAgLy8gIyBKdXN0IGJlY2F1c2Ugd2UgbWFkZSBpdCBhbiBhcmd1bWVudCB0byB0aGUgbWV0aG9kLCB0aGVyZSdzIG5vIGd1cmFudGVlCiAgICAvLyAjIGl0IGlzIGJlaW5nIHNlbnQgdG8gdGhlIGFwbGljYXRpb24ncyBhZGRyZXNzIHNvIHdlIG5lZWQgdG8gbWFudWFsbHkgYXNzZXJ0CiAgICAvLyBhc3NlcnQgbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzgtODIKICAgIC8vICMgT24gQWxnb3JhbmQsIGVhY2ggYWNjb3VudCBoYXMgYSBtaW5pbXVtIGJhbGFuY2UgcmVxdWlyZW1lbnQgKE1CUikKICAgIC8vICMgVGhlIE1CUiBpcyBsb2NrZWQgaW4gdGhlIGFjY291bnQgYW5kIGNhbm5vdCBiZSBzcGVudCAodW50aWwgZXhwbGljaXRseSB1bmxvY2tlZCkKICAgIC8vICMgRXZlcnkgYWNjb3VudHMgaGFzIGFuIE1CUiBvZiAwLjEgQUxHTyAoR2xvYmFsLm1pbl9iYWxhbmNlKQogICAgLy8gIyBPcHRpbmcgaW50byBhbiBhc3NldCBpbmNyZWFzZXMgdGhlIE1CUiBieSAwLjEgQUxHTyAoR2xvYmFsLmFzc2V0X29wdF9pbl9taW5fYmFsYW5jZSkKICAgIC8vIGFzc2VydCBtYnJfcGF5LmFtb3VudCA9PSBHbG9iYWwubWluX2JhbGFuY2UgKyBHbG9iYWwuYXNzZXRfb3B0X2luX21pbl9iYWxhbmNlCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIGdsb2JhbCBBc3NldE9wdEluTWluQmFsYW5jZQogICAgKwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODQtOTIKICAgIC8vICMgVHJhbnNhY3Rpb25zIGNhbiBiZSBzZW50IGZyb20gYSB1c2VyIHZpYSBzaWduYXR1cmVzCiAgICAvLyAjIFRoZXkgY2FuIGFsc28gYmUgc2VudCBwcm9ncmFtbWF0aWNhbGx5IGZyb20gYSBzbWFydCBjb250cmFjdAogICAgLy8gIyBIZXJlIHdlIHdhbnQgdG8gaXNzdWUgYW4gb3B0LWluIHRyYW5zYWN0aW9uCiAgICAvLyAjIEFuIG9wdC1pbiB0cmFuc2FjdGlvbiBpcyBzaW1wbHkgdHJhbnNmZXJyaW5nIDAgb2YgYW4gYXNzZXQgdG8geW91cnNlbGYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYXNzZXRfaWQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg5CiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYXNzZXRfaWQsCiAgICBpbnQgMAogICAgYnl0ZSAiYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIGFzc2V0X2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTAKICAgIC8vIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTEKICAgIC8vIGFzc2V0X2Ftb3VudD0wLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg0LTg4CiAgICAvLyAjIFRyYW5zYWN0aW9ucyBjYW4gYmUgc2VudCBmcm9tIGEgdXNlciB2aWEgc2lnbmF0dXJlcwogICAgLy8gIyBUaGV5IGNhbiBhbHNvIGJlIHNlbnQgcHJvZ3JhbW1hdGljYWxseSBmcm9tIGEgc21hcnQgY29udHJhY3QKICAgIC8vICMgSGVyZSB3ZSB3YW50IHRvIGlzc3VlIGFuIG9wdC1pbiB0cmFuc2FjdGlvbgogICAgLy8gIyBBbiBvcHQtaW4gdHJhbnNhY3Rpb24gaXMgc2ltcGx5IHRyYW5zZmVycmluZyAwIG9mIGFuIGFzc2V0IHRvIHlvdXJzZWxmCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg0LTkyCiAgICAvLyAjIFRyYW5zYWN0aW9ucyBjYW4gYmUgc2VudCBmcm9tIGEgdXNlciB2aWEgc2lnbmF0dXJlcwogICAgLy8gIyBUaGV5IGNhbiBhbHNvIGJlIHNlbnQgcHJvZ3JhbW1hdGljYWxseSBmcm9tIGEgc21hcnQgY29udHJhY3QKICAgIC8vICMgSGVyZSB3ZSB3YW50IHRvIGlzc3VlIGFuIG9wdC1pbiB0cmFuc2FjdGlvbgogICAgLy8gIyBBbiBvcHQtaW4gdHJhbnNhY3Rpb24gaXMgc2ltcGx5IHRyYW5zZmVycmluZyAwIG9mIGFuIGFzc2V0IHRvIHlvdXJzZWxmCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFzc2V0X2lkLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLmJ1eShidXllcl90eG46IHVpbnQ2NCwgcXVhbnRpdHk6IHVpbnQ2NCkgLT4gdm9pZDoKYnV5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTQtMTAxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBidXkoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICAjIFRvIGJ1eSBhc3NldHMsIGEgcGF5bWVudCBtdXN0IGJlIHNlbnQKICAgIC8vICAgICBidXllcl90eG46IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLAogICAgLy8gICAgICMgVGhlIHF1YW50aXR5IG9mIGFzc2V0cyB0byBidXkKICAgIC8vICAgICBxdWFudGl0eTogVUludDY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDItMTA0CiAgICAvLyAjIFdlIG5lZWQgdG8gdmVyaWZ5IHRoYXQgdGhlIHBheW1lbnQgaXMgYmVpbmcgc2VudCB0byB0aGUgYXBwbGljYXRpb24KICAgIC8vICMgYW5kIGlzIGVub3VnaCB0byBjb3ZlciB0aGUgY29zdCBvZiB0aGUgYXNzZXQKICAgIC8vIGFzc2VydCBidXllcl90eG4uc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDUKICAgIC8vIGFzc2VydCBidXllcl90eG4ucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwNgogICAgLy8gYXNzZXJ0IGJ1eWVyX3R4bi5hbW91bnQgPT0gc2VsZi51bml0YXJ5X3ByaWNlICogcXVhbnRpdHkKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgQW1vdW50CiAgICBpbnQgMAogICAgYnl0ZSAidW5pdGFyeV9wcmljZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgdW5pdGFyeV9wcmljZSBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgKgogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA4LTExMwogICAgLy8gIyBPbmNlIHdlJ3ZlIHZlcmlmaWVkIHRoZSBwYXltZW50LCB3ZSBjYW4gdHJhbnNmZXIgdGhlIGFzc2V0CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFzc2V0X2lkLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXF1YW50aXR5LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTEwCiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYXNzZXRfaWQsCiAgICBpbnQgMAogICAgYnl0ZSAiYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIGFzc2V0X2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTExCiAgICAvLyBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDgtMTA5CiAgICAvLyAjIE9uY2Ugd2UndmUgdmVyaWZpZWQgdGhlIHBheW1lbnQsIHdlIGNhbiB0cmFuc2ZlciB0aGUgYXNzZXQKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludCBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTA4LTExMwogICAgLy8gIyBPbmNlIHdlJ3ZlIHZlcmlmaWVkIHRoZSBwYXltZW50LCB3ZSBjYW4gdHJhbnNmZXIgdGhlIGFzc2V0CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFzc2V0X2lkLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXF1YW50aXR5LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5kZWxldGVfYXBwbGljYXRpb24oKSAtPiB2b2lkOgpkZWxldGVfYXBwbGljYXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMTUtMTE5CiAgICAvLyBAYXJjNC5hYmltZXRob2QoCiAgICAvLyAgICAgIyBUaGlzIG1ldGhvZCBpcyBjYWxsZWQgd2hlbiB0aGUgYXBwbGljYXRpb24gaXMgZGVsZXRlZAogICAgLy8gICAgIGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdCiAgICAvLyApCiAgICAvLyBkZWYgZGVsZXRlX2FwcGxpY2F0aW9uKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMC0xMjEKICAgIC8vICMgT25seSBhbGxvdyB0aGUgY3JlYXRvciB0byBkZWxldGUgdGhlIGFwcGxpY2F0aW9uCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMy0xMzIKICAgIC8vICMgU2VuZCBhbGwgdGhlIHVuc29sZCBhc3NldHMgdG8gdGhlIGNyZWF0b3IKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYXNzZXRfaWQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICAjIFRoZSBhbW91bnQgaXMgMCwgYnV0IHRoZSBhc3NldF9jbG9zZV90byBmaWVsZCBpcyBzZXQKICAgIC8vICAgICAjIFRoaXMgbWVhbnMgdGhhdCBBTEwgYXNzZXRzIGFyZSBiZWluZyBzZW50IHRvIHRoZSBhc3NldF9jbG9zZV90byBhZGRyZXNzCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyAgICAgIyBDbG9zZSB0aGUgYXNzZXQgdG8gdW5sb2NrIHRoZSAwLjEgQUxHTyB0aGF0IHdhcyBsb2NrZWQgaW4gb3B0X2luX3RvX2Fzc2V0CiAgICAvLyAgICAgYXNzZXRfY2xvc2VfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyNQogICAgLy8geGZlcl9hc3NldD1zZWxmLmFzc2V0X2lkLAogICAgaW50IDAKICAgIGJ5dGUgImFzc2V0X2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBhc3NldF9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyNgogICAgLy8gYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTMwLTEzMQogICAgLy8gIyBDbG9zZSB0aGUgYXNzZXQgdG8gdW5sb2NrIHRoZSAwLjEgQUxHTyB0aGF0IHdhcyBsb2NrZWQgaW4gb3B0X2luX3RvX2Fzc2V0CiAgICAvLyBhc3NldF9jbG9zZV90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFzc2V0Q2xvc2VUbwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTI3LTEyOQogICAgLy8gIyBUaGUgYW1vdW50IGlzIDAsIGJ1dCB0aGUgYXNzZXRfY2xvc2VfdG8gZmllbGQgaXMgc2V0CiAgICAvLyAjIFRoaXMgbWVhbnMgdGhhdCBBTEwgYXNzZXRzIGFyZSBiZWluZyBzZW50IHRvIHRoZSBhc3NldF9jbG9zZV90byBhZGRyZXNzCiAgICAvLyBhc3NldF9hbW91bnQ9MCwKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjMtMTI0CiAgICAvLyAjIFNlbmQgYWxsIHRoZSB1bnNvbGQgYXNzZXRzIHRvIHRoZSBjcmVhdG9yCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyMy0xMzIKICAgIC8vICMgU2VuZCBhbGwgdGhlIHVuc29sZCBhc3NldHMgdG8gdGhlIGNyZWF0b3IKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYXNzZXRfaWQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICAjIFRoZSBhbW91bnQgaXMgMCwgYnV0IHRoZSBhc3NldF9jbG9zZV90byBmaWVsZCBpcyBzZXQKICAgIC8vICAgICAjIFRoaXMgbWVhbnMgdGhhdCBBTEwgYXNzZXRzIGFyZSBiZWluZyBzZW50IHRvIHRoZSBhc3NldF9jbG9zZV90byBhZGRyZXNzCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyAgICAgIyBDbG9zZSB0aGUgYXNzZXQgdG8gdW5sb2NrIHRoZSAwLjEgQUxHTyB0aGF0IHdhcyBsb2NrZWQgaW4gb3B0X2luX3RvX2Fzc2V0CiAgICAvLyAgICAgYXNzZXRfY2xvc2VfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMzQtMTQwCiAgICAvLyAjIFNlbmQgdGhlIHJlbWFpbmluZyBiYWxhbmNlIHRvIHRoZSBjcmVhdG9yCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9MCwKICAgIC8vICAgICAjIENsb3NlIHRoZSBhY2NvdW50IHRvIGdldCBiYWNrIEFMTCB0aGUgQUxHTyBpbiB0aGUgYWNjb3VudAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTM2CiAgICAvLyByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMzgtMTM5CiAgICAvLyAjIENsb3NlIHRoZSBhY2NvdW50IHRvIGdldCBiYWNrIEFMTCB0aGUgQUxHTyBpbiB0aGUgYWNjb3VudAogICAgLy8gY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQ2xvc2VSZW1haW5kZXJUbwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTM3CiAgICAvLyBhbW91bnQ9MCwKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTM0LTEzNQogICAgLy8gIyBTZW5kIHRoZSByZW1haW5pbmcgYmFsYW5jZSB0byB0aGUgY3JlYXRvcgogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTM0LTE0MAogICAgLy8gIyBTZW5kIHRoZSByZW1haW5pbmcgYmFsYW5jZSB0byB0aGUgY3JlYXRvcgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PTAsCiAgICAvLyAgICAgIyBDbG9zZSB0aGUgYWNjb3VudCB0byBnZXQgYmFjayBBTEwgdGhlIEFMR08gaW4gdGhlIGFjY291bnQKICAgIC8vICAgICBjbG9zZV9yZW1haW5kZXJfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIK",
-        "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIwLTIxCiAgICAvLyAjIFdlIHdhbnQgdGhlIG1ldGhvZHMgaW4gb3VyIGNvbnRyYWN0IHRvIGZvbGxvdyB0aGUgQVJDNCBzdGFuZGFyZAogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKGFyYzQuQVJDNENvbnRyYWN0KToKICAgIGludCAxCiAgICByZXR1cm4K"
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuYXBwcm92YWxfcHJvZ3JhbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIyLTIzCiAgICAvLyAjIFdlIHdhbnQgdGhlIG1ldGhvZHMgaW4gb3VyIGNvbnRyYWN0IHRvIGZvbGxvdyB0aGUgQVJDNCBzdGFuZGFyZAogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKGFyYzQuQVJDNENvbnRyYWN0KToKICAgIG1ldGhvZCAiY3JlYXRlX2FwcGxpY2F0aW9uKGFzc2V0LHVpbnQ2NCl2b2lkIgogICAgbWV0aG9kICJzZXRfcHJpY2UodWludDY0KXZvaWQiCiAgICBtZXRob2QgIm9wdF9pbl90b19hc3NldChwYXkpdm9pZCIKICAgIG1ldGhvZCAiYnV5KHBheSx1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiZGVsZXRlX2FwcGxpY2F0aW9uKCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9jcmVhdGVfYXBwbGljYXRpb25fcm91dGVAMSBtYWluX3NldF9wcmljZV9yb3V0ZUAyIG1haW5fb3B0X2luX3RvX2Fzc2V0X3JvdXRlQDMgbWFpbl9idXlfcm91dGVANCBtYWluX2RlbGV0ZV9hcHBsaWNhdGlvbl9yb3V0ZUA1CiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX2NyZWF0ZV9hcHBsaWNhdGlvbl9yb3V0ZUAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzEtMzkKICAgIC8vICMgV2Ugd2FudCBjcmVhdGVfYXBwbGljYXRpb24gdG8gYmUgYSBwbHVibGljIEFCSSBtZXRob2QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgKICAgIC8vICAgICAjIFRoZXJlIGFyZSBjZXJ0YWluIGFjdGlvbnMgdGhhdCBhIGNvbnRyYWN0IGNhbGwgY2FuIGRvCiAgICAvLyAgICAgIyBTb21lIGV4YW1wbGVzIGFyZSBVcGRhdGVBcHBsaWNhdGlvbiwgRGVsZXRlQXBwbGljYXRpb24sIGFuZCBOb09wCiAgICAvLyAgICAgIyBOb09wIGlzIGEgY2FsbCB0aGF0IGRvZXMgbm90aGluZyBzcGVjaWFsIGFmdGVyIGl0IGlzIGV4ZWN0ZWQKICAgIC8vICAgICBhbGxvd19hY3Rpb25zPVsiTm9PcCJdLAogICAgLy8gICAgICMgUmVxdWlyZSB0aGF0IHRoaXMgbWV0aG9kIGlzIG9ubHkgY2FsbGFibGUgd2hlbiBjcmVhdGluZyB0aGUgYXBwCiAgICAvLyAgICAgY3JlYXRlPSJyZXF1aXJlIiwKICAgIC8vICkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBpcyBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MjItMjMKICAgIC8vICMgV2Ugd2FudCB0aGUgbWV0aG9kcyBpbiBvdXIgY29udHJhY3QgdG8gZm9sbG93IHRoZSBBUkM0IHN0YW5kYXJkCiAgICAvLyBjbGFzcyBEaWdpdGFsTWFya2V0cGxhY2UoYXJjNC5BUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTozMS0zOQogICAgLy8gIyBXZSB3YW50IGNyZWF0ZV9hcHBsaWNhdGlvbiB0byBiZSBhIHBsdWJsaWMgQUJJIG1ldGhvZAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKAogICAgLy8gICAgICMgVGhlcmUgYXJlIGNlcnRhaW4gYWN0aW9ucyB0aGF0IGEgY29udHJhY3QgY2FsbCBjYW4gZG8KICAgIC8vICAgICAjIFNvbWUgZXhhbXBsZXMgYXJlIFVwZGF0ZUFwcGxpY2F0aW9uLCBEZWxldGVBcHBsaWNhdGlvbiwgYW5kIE5vT3AKICAgIC8vICAgICAjIE5vT3AgaXMgYSBjYWxsIHRoYXQgZG9lcyBub3RoaW5nIHNwZWNpYWwgYWZ0ZXIgaXQgaXMgZXhlY3RlZAogICAgLy8gICAgIGFsbG93X2FjdGlvbnM9WyJOb09wIl0sCiAgICAvLyAgICAgIyBSZXF1aXJlIHRoYXQgdGhpcyBtZXRob2QgaXMgb25seSBjYWxsYWJsZSB3aGVuIGNyZWF0aW5nIHRoZSBhcHAKICAgIC8vICAgICBjcmVhdGU9InJlcXVpcmUiLAogICAgLy8gKQogICAgY2FsbHN1YiBjcmVhdGVfYXBwbGljYXRpb24KICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fc2V0X3ByaWNlX3JvdXRlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMi0yMwogICAgLy8gIyBXZSB3YW50IHRoZSBtZXRob2RzIGluIG91ciBjb250cmFjdCB0byBmb2xsb3cgdGhlIEFSQzQgc3RhbmRhcmQKICAgIC8vIGNsYXNzIERpZ2l0YWxNYXJrZXRwbGFjZShhcmM0LkFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF9wcmljZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9vcHRfaW5fdG9fYXNzZXRfcm91dGVAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYxLTYzCiAgICAvLyAjIEJlZm9yZSBhbnkgYWNjb3VudCBjYW4gcmVjZWl2ZSBhbiBhc3NldCwgaXQgbXVzdCBvcHQtaW4gdG8gaXQKICAgIC8vICMgVGhpcyBtZXRob2QgZW5hYmxlcyB0aGUgYXBwbGljYXRpb24gdG8gb3B0LWluIHRvIHRoZSBhc3NldAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToyMi0yMwogICAgLy8gIyBXZSB3YW50IHRoZSBtZXRob2RzIGluIG91ciBjb250cmFjdCB0byBmb2xsb3cgdGhlIEFSQzQgc3RhbmRhcmQKICAgIC8vIGNsYXNzIERpZ2l0YWxNYXJrZXRwbGFjZShhcmM0LkFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjYxLTYzCiAgICAvLyAjIEJlZm9yZSBhbnkgYWNjb3VudCBjYW4gcmVjZWl2ZSBhbiBhc3NldCwgaXQgbXVzdCBvcHQtaW4gdG8gaXQKICAgIC8vICMgVGhpcyBtZXRob2QgZW5hYmxlcyB0aGUgYXBwbGljYXRpb24gdG8gb3B0LWluIHRvIHRoZSBhc3NldAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIG9wdF9pbl90b19hc3NldAogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9idXlfcm91dGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIyLTIzCiAgICAvLyAjIFdlIHdhbnQgdGhlIG1ldGhvZHMgaW4gb3VyIGNvbnRyYWN0IHRvIGZvbGxvdyB0aGUgQVJDNCBzdGFuZGFyZAogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKGFyYzQuQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnQgMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50IHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBidXkKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZGVsZXRlX2FwcGxpY2F0aW9uX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjItMTI1CiAgICAvLyBAYXJjNC5hYmltZXRob2QoCiAgICAvLyAgICAgIyBUaGlzIG1ldGhvZCBpcyBjYWxsZWQgd2hlbiB0aGUgYXBwbGljYXRpb24gaXMgZGVsZXRlZAogICAgLy8gICAgIGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdCiAgICAvLyApCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnQgRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBkZWxldGVfYXBwbGljYXRpb24KICAgIGludCAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuY3JlYXRlX2FwcGxpY2F0aW9uKGFzc2V0X2lkOiB1aW50NjQsIHVuaXRhcnlfcHJpY2U6IHVpbnQ2NCkgLT4gdm9pZDoKY3JlYXRlX2FwcGxpY2F0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MzEtNDYKICAgIC8vICMgV2Ugd2FudCBjcmVhdGVfYXBwbGljYXRpb24gdG8gYmUgYSBwbHVibGljIEFCSSBtZXRob2QKICAgIC8vIEBhcmM0LmFiaW1ldGhvZCgKICAgIC8vICAgICAjIFRoZXJlIGFyZSBjZXJ0YWluIGFjdGlvbnMgdGhhdCBhIGNvbnRyYWN0IGNhbGwgY2FuIGRvCiAgICAvLyAgICAgIyBTb21lIGV4YW1wbGVzIGFyZSBVcGRhdGVBcHBsaWNhdGlvbiwgRGVsZXRlQXBwbGljYXRpb24sIGFuZCBOb09wCiAgICAvLyAgICAgIyBOb09wIGlzIGEgY2FsbCB0aGF0IGRvZXMgbm90aGluZyBzcGVjaWFsIGFmdGVyIGl0IGlzIGV4ZWN0ZWQKICAgIC8vICAgICBhbGxvd19hY3Rpb25zPVsiTm9PcCJdLAogICAgLy8gICAgICMgUmVxdWlyZSB0aGF0IHRoaXMgbWV0aG9kIGlzIG9ubHkgY2FsbGFibGUgd2hlbiBjcmVhdGluZyB0aGUgYXBwCiAgICAvLyAgICAgY3JlYXRlPSJyZXF1aXJlIiwKICAgIC8vICkKICAgIC8vIGRlZiBjcmVhdGVfYXBwbGljYXRpb24oCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICAjIFRoZSBJRCBvZiB0aGUgYXNzZXQgd2UncmUgc2VsbGluZwogICAgLy8gICAgIGFzc2V0X2lkOiBBc3NldCwKICAgIC8vICAgICAjIFRoZSBpbml0aWFsIHNhbGUgcHJpY2UKICAgIC8vICAgICB1bml0YXJ5X3ByaWNlOiBVSW50NjQsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ3LTQ4CiAgICAvLyAjIFNhdmUgdGhlIHZhbHVlcyB3ZSBwYXNzZWQgaW4gdG8gb3VyIG1ldGhvZCBpbiB0aGUgY29udHJhY3QncyBzdGF0ZQogICAgLy8gc2VsZi5hc3NldF9pZCA9IGFzc2V0X2lkLmlkCiAgICBieXRlICJhc3NldF9pZCIKICAgIGZyYW1lX2RpZyAtMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBzZWxmLnVuaXRhcnlfcHJpY2UgPSB1bml0YXJ5X3ByaWNlCiAgICBieXRlICJ1bml0YXJ5X3ByaWNlIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLnNldF9wcmljZSh1bml0YXJ5X3ByaWNlOiB1aW50NjQpIC0+IHZvaWQ6CnNldF9wcmljZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjUxLTUyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXRfcHJpY2Uoc2VsZiwgdW5pdGFyeV9wcmljZTogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo1My01NgogICAgLy8gIyBXZSBkb24ndCB3YW50IGFueW9uZSB0byBiZSBhYmxlIHRvIGNvbWUgaW4gYW5kIG1vZGlmeSB0aGUgcHJpY2UKICAgIC8vICMgWW91IGNvdWxkIGltcGxlbWVudCBzb21lIHNvcnQgb2YgUkJBQywKICAgIC8vICMgYnV0IGluIHRoaXMgY2FzZSBqdXN0IG1ha2luZyBzdXJlIHRoZSBjYWxsZXIgaXMgdGhlIGFwcCBjcmVhdG9yIHdvcmtzCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjU4LTU5CiAgICAvLyAjIFNhdmUgdGhlIG5ldyBwcmljZQogICAgLy8gc2VsZi51bml0YXJ5X3ByaWNlID0gdW5pdGFyeV9wcmljZQogICAgYnl0ZSAidW5pdGFyeV9wcmljZSIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5vcHRfaW5fdG9fYXNzZXQobWJyX3BheTogdWludDY0KSAtPiB2b2lkOgpvcHRfaW5fdG9fYXNzZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo2MS02OQogICAgLy8gIyBCZWZvcmUgYW55IGFjY291bnQgY2FuIHJlY2VpdmUgYW4gYXNzZXQsIGl0IG11c3Qgb3B0LWluIHRvIGl0CiAgICAvLyAjIFRoaXMgbWV0aG9kIGVuYWJsZXMgdGhlIGFwcGxpY2F0aW9uIHRvIG9wdC1pbiB0byB0aGUgYXNzZXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIG9wdF9pbl90b19hc3NldCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgICMgV2hlbmV2ZXIgc29tZW9uZSBjYWxscyB0aGlzIG1ldGhvZCwgdGhleSBhbHNvIG5lZWQgdG8gc2VuZCBhIHBheW1lbnQKICAgIC8vICAgICAjIEEgcGF5bWVudCB0cmFuc2FjdGlvbiBpcyBhIHRyYW5zZmVyIG9mIEFMR08KICAgIC8vICAgICBtYnJfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6NzAtNzEKICAgIC8vICMgV2Ugd2FudCB0byBtYWtlIHN1cmUgdGhhdCB0aGUgYXBwbGljYXRpb24gYWRkcmVzcyBpcyBub3QgYWxyZWFkeSBvcHRlZCBpbgogICAgLy8gYXNzZXJ0IG5vdCBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmlzX29wdGVkX2luKEFzc2V0KHNlbGYuYXNzZXRfaWQpKQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGludCAwCiAgICBieXRlICJhc3NldF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgYXNzZXRfaWQgZXhpc3RzCiAgICBhc3NldF9ob2xkaW5nX2dldCBBc3NldEJhbGFuY2UKICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weTo3Ni03OAogICAgLy8gIyBKdXN0IGJlY2F1c2Ugd2UgbWFkZSBpdCBhbiBhcmd1bWVudCB0byB0aGUgbWV0aG9kLCB0aGVyZSdzIG5vIGd1cmFudGVlCiAgICAvLyAjIGl0IGlzIGJlaW5nIHNlbnQgdG8gdGhlIGFwbGljYXRpb24ncyBhZGRyZXNzIHNvIHdlIG5lZWQgdG8gbWFudWFsbHkgYXNzZXJ0CiAgICAvLyBhc3NlcnQgbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODAtODQKICAgIC8vICMgT24gQWxnb3JhbmQsIGVhY2ggYWNjb3VudCBoYXMgYSBtaW5pbXVtIGJhbGFuY2UgcmVxdWlyZW1lbnQgKE1CUikKICAgIC8vICMgVGhlIE1CUiBpcyBsb2NrZWQgaW4gdGhlIGFjY291bnQgYW5kIGNhbm5vdCBiZSBzcGVudCAodW50aWwgZXhwbGljaXRseSB1bmxvY2tlZCkKICAgIC8vICMgRXZlcnkgYWNjb3VudHMgaGFzIGFuIE1CUiBvZiAwLjEgQUxHTyAoR2xvYmFsLm1pbl9iYWxhbmNlKQogICAgLy8gIyBPcHRpbmcgaW50byBhbiBhc3NldCBpbmNyZWFzZXMgdGhlIE1CUiBieSAwLjEgQUxHTyAoR2xvYmFsLmFzc2V0X29wdF9pbl9taW5fYmFsYW5jZSkKICAgIC8vIGFzc2VydCBtYnJfcGF5LmFtb3VudCA9PSBHbG9iYWwubWluX2JhbGFuY2UgKyBHbG9iYWwuYXNzZXRfb3B0X2luX21pbl9iYWxhbmNlCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFtb3VudAogICAgZ2xvYmFsIE1pbkJhbGFuY2UKICAgIGdsb2JhbCBBc3NldE9wdEluTWluQmFsYW5jZQogICAgKwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6ODYtOTQKICAgIC8vICMgVHJhbnNhY3Rpb25zIGNhbiBiZSBzZW50IGZyb20gYSB1c2VyIHZpYSBzaWduYXR1cmVzCiAgICAvLyAjIFRoZXkgY2FuIGFsc28gYmUgc2VudCBwcm9ncmFtbWF0aWNhbGx5IGZyb20gYSBzbWFydCBjb250cmFjdAogICAgLy8gIyBIZXJlIHdlIHdhbnQgdG8gaXNzdWUgYW4gb3B0LWluIHRyYW5zYWN0aW9uCiAgICAvLyAjIEFuIG9wdC1pbiB0cmFuc2FjdGlvbiBpcyBzaW1wbHkgdHJhbnNmZXJyaW5nIDAgb2YgYW4gYXNzZXQgdG8geW91cnNlbGYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYXNzZXRfaWQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9MCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjkxCiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYXNzZXRfaWQsCiAgICBpbnQgMAogICAgYnl0ZSAiYXNzZXRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIGFzc2V0X2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTIKICAgIC8vIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTMKICAgIC8vIGFzc2V0X2Ftb3VudD0wLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg2LTkwCiAgICAvLyAjIFRyYW5zYWN0aW9ucyBjYW4gYmUgc2VudCBmcm9tIGEgdXNlciB2aWEgc2lnbmF0dXJlcwogICAgLy8gIyBUaGV5IGNhbiBhbHNvIGJlIHNlbnQgcHJvZ3JhbW1hdGljYWxseSBmcm9tIGEgc21hcnQgY29udHJhY3QKICAgIC8vICMgSGVyZSB3ZSB3YW50IHRvIGlzc3VlIGFuIG9wdC1pbiB0cmFuc2FjdGlvbgogICAgLy8gIyBBbiBvcHQtaW4gdHJhbnNhY3Rpb24gaXMgc2ltcGx5IHRyYW5zZmVycmluZyAwIG9mIGFuIGFzc2V0IHRvIHlvdXJzZWxmCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5Ojg2LTk0CiAgICAvLyAjIFRyYW5zYWN0aW9ucyBjYW4gYmUgc2VudCBmcm9tIGEgdXNlciB2aWEgc2lnbmF0dXJlcwogICAgLy8gIyBUaGV5IGNhbiBhbHNvIGJlIHNlbnQgcHJvZ3JhbW1hdGljYWxseSBmcm9tIGEgc21hcnQgY29udHJhY3QKICAgIC8vICMgSGVyZSB3ZSB3YW50IHRvIGlzc3VlIGFuIG9wdC1pbiB0cmFuc2FjdGlvbgogICAgLy8gIyBBbiBvcHQtaW4gdHJhbnNhY3Rpb24gaXMgc2ltcGx5IHRyYW5zZmVycmluZyAwIG9mIGFuIGFzc2V0IHRvIHlvdXJzZWxmCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFzc2V0X2lkLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmRpZ2l0YWxfbWFya2V0cGxhY2UuY29udHJhY3QuRGlnaXRhbE1hcmtldHBsYWNlLmJ1eShidXllcl90eG46IHVpbnQ2NCwgcXVhbnRpdHk6IHVpbnQ2NCkgLT4gdm9pZDoKYnV5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6OTYtMTAzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBidXkoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICAjIFRvIGJ1eSBhc3NldHMsIGEgcGF5bWVudCBtdXN0IGJlIHNlbnQKICAgIC8vICAgICBidXllcl90eG46IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLAogICAgLy8gICAgICMgVGhlIHF1YW50aXR5IG9mIGFzc2V0cyB0byBidXkKICAgIC8vICAgICBxdWFudGl0eTogVUludDY0LAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDQtMTA2CiAgICAvLyAjIFdlIG5lZWQgdG8gdmVyaWZ5IHRoYXQgdGhlIHBheW1lbnQgaXMgYmVpbmcgc2VudCB0byB0aGUgYXBwbGljYXRpb24KICAgIC8vICMgYW5kIGlzIGVub3VnaCB0byBjb3ZlciB0aGUgY29zdCBvZiB0aGUgYXNzZXQKICAgIC8vIGFzc2VydCBidXllcl90eG4uc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMDcKICAgIC8vIGFzc2VydCBidXllcl90eG4ucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEwOC0xMTAKICAgIC8vICMgY3JlYXRlX2FwcGxpY2F0aW9uIGFsd2F5cyBzZXRzIHRoZSBwcmljZSwgc28gaXQgaXMgcmVhZCB3aXRob3V0IHRoZQogICAgLy8gIyBleGlzdGVuY2UgY2hlY2sgdGhhdCByZWFkaW5nIHNlbGYudW5pdGFyeV9wcmljZSB3b3VsZCBhZGQKICAgIC8vIGFzc2VydCBidXllcl90eG4uYW1vdW50ID09IG9wLkFwcEdsb2JhbC5nZXRfdWludDY0KGIidW5pdGFyeV9wcmljZSIpICogcXVhbnRpdHkKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgQW1vdW50CiAgICBieXRlICJ1bml0YXJ5X3ByaWNlIgogICAgYXBwX2dsb2JhbF9nZXQKICAgIGZyYW1lX2RpZyAtMQogICAgKgogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTEyLTEyMAogICAgLy8gIyBPbmNlIHdlJ3ZlIHZlcmlmaWVkIHRoZSBwYXltZW50LCB3ZSBjYW4gdHJhbnNmZXIgdGhlIGFzc2V0CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgIyBUaGUgY2FsbCBoYXMgdG8gcmVmZXJlbmNlIHRoZSBhc3NldCBhbnl3YXksIHNvIGl0IGlzIHJlYWQgZnJvbSB0aGVyZQogICAgLy8gICAgICMgaW5zdGVhZCBvZiBmcm9tIGdsb2JhbCBzdGF0ZS4gVGhlIGFwcCBvbmx5IGV2ZXIgb3B0cyBpbiB0bwogICAgLy8gICAgICMgc2VsZi5hc3NldF9pZCwgc28gYSB0cmFuc2ZlciBvZiBhbnkgb3RoZXIgYXNzZXQgZmFpbHMKICAgIC8vICAgICB4ZmVyX2Fzc2V0PVR4bi5hc3NldHMoMCksCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9cXVhbnRpdHksCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMTQtMTE3CiAgICAvLyAjIFRoZSBjYWxsIGhhcyB0byByZWZlcmVuY2UgdGhlIGFzc2V0IGFueXdheSwgc28gaXQgaXMgcmVhZCBmcm9tIHRoZXJlCiAgICAvLyAjIGluc3RlYWQgb2YgZnJvbSBnbG9iYWwgc3RhdGUuIFRoZSBhcHAgb25seSBldmVyIG9wdHMgaW4gdG8KICAgIC8vICMgc2VsZi5hc3NldF9pZCwgc28gYSB0cmFuc2ZlciBvZiBhbnkgb3RoZXIgYXNzZXQgZmFpbHMKICAgIC8vIHhmZXJfYXNzZXQ9VHhuLmFzc2V0cygwKSwKICAgIHR4bmEgQXNzZXRzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExOAogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTEyLTExMwogICAgLy8gIyBPbmNlIHdlJ3ZlIHZlcmlmaWVkIHRoZSBwYXltZW50LCB3ZSBjYW4gdHJhbnNmZXIgdGhlIGFzc2V0CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjExMi0xMjAKICAgIC8vICMgT25jZSB3ZSd2ZSB2ZXJpZmllZCB0aGUgcGF5bWVudCwgd2UgY2FuIHRyYW5zZmVyIHRoZSBhc3NldAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgICMgVGhlIGNhbGwgaGFzIHRvIHJlZmVyZW5jZSB0aGUgYXNzZXQgYW55d2F5LCBzbyBpdCBpcyByZWFkIGZyb20gdGhlcmUKICAgIC8vICAgICAjIGluc3RlYWQgb2YgZnJvbSBnbG9iYWwgc3RhdGUuIFRoZSBhcHAgb25seSBldmVyIG9wdHMgaW4gdG8KICAgIC8vICAgICAjIHNlbGYuYXNzZXRfaWQsIHNvIGEgdHJhbnNmZXIgb2YgYW55IG90aGVyIGFzc2V0IGZhaWxzCiAgICAvLyAgICAgeGZlcl9hc3NldD1UeG4uYXNzZXRzKDApLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXF1YW50aXR5LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5kaWdpdGFsX21hcmtldHBsYWNlLmNvbnRyYWN0LkRpZ2l0YWxNYXJrZXRwbGFjZS5kZWxldGVfYXBwbGljYXRpb24oKSAtPiB2b2lkOgpkZWxldGVfYXBwbGljYXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMjItMTI2CiAgICAvLyBAYXJjNC5hYmltZXRob2QoCiAgICAvLyAgICAgIyBUaGlzIG1ldGhvZCBpcyBjYWxsZWQgd2hlbiB0aGUgYXBwbGljYXRpb24gaXMgZGVsZXRlZAogICAgLy8gICAgIGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdCiAgICAvLyApCiAgICAvLyBkZWYgZGVsZXRlX2FwcGxpY2F0aW9uKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEyNy0xMjgKICAgIC8vICMgT25seSBhbGxvdyB0aGUgY3JlYXRvciB0byBkZWxldGUgdGhlIGFwcGxpY2F0aW9uCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEzMC0xMzkKICAgIC8vICMgU2VuZCBhbGwgdGhlIHVuc29sZCBhc3NldHMgdG8gdGhlIGNyZWF0b3IKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYXNzZXRfaWQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICAjIFRoZSBhbW91bnQgaXMgMCwgYnV0IHRoZSBhc3NldF9jbG9zZV90byBmaWVsZCBpcyBzZXQKICAgIC8vICAgICAjIFRoaXMgbWVhbnMgdGhhdCBBTEwgYXNzZXRzIGFyZSBiZWluZyBzZW50IHRvIHRoZSBhc3NldF9jbG9zZV90byBhZGRyZXNzCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyAgICAgIyBDbG9zZSB0aGUgYXNzZXQgdG8gdW5sb2NrIHRoZSAwLjEgQUxHTyB0aGF0IHdhcyBsb2NrZWQgaW4gb3B0X2luX3RvX2Fzc2V0CiAgICAvLyAgICAgYXNzZXRfY2xvc2VfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEzMgogICAgLy8geGZlcl9hc3NldD1zZWxmLmFzc2V0X2lkLAogICAgaW50IDAKICAgIGJ5dGUgImFzc2V0X2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBhc3NldF9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEzMwogICAgLy8gYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTM3LTEzOAogICAgLy8gIyBDbG9zZSB0aGUgYXNzZXQgdG8gdW5sb2NrIHRoZSAwLjEgQUxHTyB0aGF0IHdhcyBsb2NrZWQgaW4gb3B0X2luX3RvX2Fzc2V0CiAgICAvLyBhc3NldF9jbG9zZV90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFzc2V0Q2xvc2VUbwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTM0LTEzNgogICAgLy8gIyBUaGUgYW1vdW50IGlzIDAsIGJ1dCB0aGUgYXNzZXRfY2xvc2VfdG8gZmllbGQgaXMgc2V0CiAgICAvLyAjIFRoaXMgbWVhbnMgdGhhdCBBTEwgYXNzZXRzIGFyZSBiZWluZyBzZW50IHRvIHRoZSBhc3NldF9jbG9zZV90byBhZGRyZXNzCiAgICAvLyBhc3NldF9hbW91bnQ9MCwKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxMzAtMTMxCiAgICAvLyAjIFNlbmQgYWxsIHRoZSB1bnNvbGQgYXNzZXRzIHRvIHRoZSBjcmVhdG9yCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjEzMC0xMzkKICAgIC8vICMgU2VuZCBhbGwgdGhlIHVuc29sZCBhc3NldHMgdG8gdGhlIGNyZWF0b3IKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYXNzZXRfaWQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICAjIFRoZSBhbW91bnQgaXMgMCwgYnV0IHRoZSBhc3NldF9jbG9zZV90byBmaWVsZCBpcyBzZXQKICAgIC8vICAgICAjIFRoaXMgbWVhbnMgdGhhdCBBTEwgYXNzZXRzIGFyZSBiZWluZyBzZW50IHRvIHRoZSBhc3NldF9jbG9zZV90byBhZGRyZXNzCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyAgICAgIyBDbG9zZSB0aGUgYXNzZXQgdG8gdW5sb2NrIHRoZSAwLjEgQUxHTyB0aGF0IHdhcyBsb2NrZWQgaW4gb3B0X2luX3RvX2Fzc2V0CiAgICAvLyAgICAgYXNzZXRfY2xvc2VfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNDEtMTQ3CiAgICAvLyAjIFNlbmQgdGhlIHJlbWFpbmluZyBiYWxhbmNlIHRvIHRoZSBjcmVhdG9yCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9MCwKICAgIC8vICAgICAjIENsb3NlIHRoZSBhY2NvdW50IHRvIGdldCBiYWNrIEFMTCB0aGUgQUxHTyBpbiB0aGUgYWNjb3VudAogICAgLy8gICAgIGNsb3NlX3JlbWFpbmRlcl90bz1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQzCiAgICAvLyByZWNlaXZlcj1HbG9iYWwuY3JlYXRvcl9hZGRyZXNzLAogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvZGlnaXRhbF9tYXJrZXRwbGFjZS9jb250cmFjdC5weToxNDUtMTQ2CiAgICAvLyAjIENsb3NlIHRoZSBhY2NvdW50IHRvIGdldCBiYWNrIEFMTCB0aGUgQUxHTyBpbiB0aGUgYWNjb3VudAogICAgLy8gY2xvc2VfcmVtYWluZGVyX3RvPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICBkdXAKICAgIGl0eG5fZmllbGQgQ2xvc2VSZW1haW5kZXJUbwogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQ0CiAgICAvLyBhbW91bnQ9MCwKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQxLTE0MgogICAgLy8gIyBTZW5kIHRoZSByZW1haW5pbmcgYmFsYW5jZSB0byB0aGUgY3JlYXRvcgogICAgLy8gaXR4bi5QYXltZW50KAogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2RpZ2l0YWxfbWFya2V0cGxhY2UvY29udHJhY3QucHk6MTQxLTE0NwogICAgLy8gIyBTZW5kIHRoZSByZW1haW5pbmcgYmFsYW5jZSB0byB0aGUgY3JlYXRvcgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPUdsb2JhbC5jcmVhdG9yX2FkZHJlc3MsCiAgICAvLyAgICAgYW1vdW50PTAsCiAgICAvLyAgICAgIyBDbG9zZSB0aGUgYWNjb3VudCB0byBnZXQgYmFjayBBTEwgdGhlIEFMR08gaW4gdGhlIGFjY291bnQKICAgIC8vICAgICBjbG9zZV9yZW1haW5kZXJfdG89R2xvYmFsLmNyZWF0b3JfYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIK",
+        "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuZGlnaXRhbF9tYXJrZXRwbGFjZS5jb250cmFjdC5EaWdpdGFsTWFya2V0cGxhY2UuY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9kaWdpdGFsX21hcmtldHBsYWNlL2NvbnRyYWN0LnB5OjIyLTIzCiAgICAvLyAjIFdlIHdhbnQgdGhlIG1ldGhvZHMgaW4gb3VyIGNvbnRyYWN0IHRvIGZvbGxvdyB0aGUgQVJDNCBzdGFuZGFyZAogICAgLy8gY2xhc3MgRGlnaXRhbE1hcmtldHBsYWNlKGFyYzQuQVJDNENvbnRyYWN0KToKICAgIGludCAxCiAgICByZXR1cm4K"
     },
     "state": {
         "global": {
@@ -0,0 +1,831 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^1.2.0
+import base64
+import dataclasses
+import decimal
+import typing
+from abc import ABC, abstractmethod
+
+import algokit_utils
+import algosdk
+from algosdk.v2client import models
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    SimulateAtomicTransactionResponse,
+    TransactionSigner,
+    TransactionWithSigner
+)
+
+_APP_SPEC_JSON = r"""{
+    "hints": {
+        "set_programs(byte[],byte[])void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "allow_asset(pay,asset)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "create_marketplace(pay,axfer,uint64)uint64": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "set_price(asset,uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "delete_marketplace(asset)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        }
+    },
+    "source": {
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMubWFya2V0cGxhY2VfZmFjdG9yeS5jb250cmFjdC5NYXJrZXRwbGFjZUZhY3RvcnkuYXBwcm92YWxfcHJvZ3JhbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjM2LTM5CiAgICAvLyAjIENyZWF0ZXMgYSBEaWdpdGFsTWFya2V0cGxhY2UgZm9yIGEgc2VsbGVyIGluIGEgc2luZ2xlIGFwcCBjYWxsCiAgICAvLyAjIFRoZSBmYWN0b3J5IGlzIHRoZSBjcmVhdG9yIG9mIGV2ZXJ5IG1hcmtldHBsYWNlIGl0IGNyZWF0ZXMsIHNvIHRoZSBzZWxsZXIKICAgIC8vICMgY2hhbmdlcyB0aGUgcHJpY2UgYW5kIGRlbGV0ZXMgdGhlIG1hcmtldHBsYWNlIHRocm91Z2ggdGhlIGZhY3RvcnkKICAgIC8vIGNsYXNzIE1hcmtldHBsYWNlRmFjdG9yeShhcmM0LkFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAOQogICAgbWV0aG9kICJzZXRfcHJvZ3JhbXMoYnl0ZVtdLGJ5dGVbXSl2b2lkIgogICAgbWV0aG9kICJhbGxvd19hc3NldChwYXksYXNzZXQpdm9pZCIKICAgIG1ldGhvZCAiY3JlYXRlX21hcmtldHBsYWNlKHBheSxheGZlcix1aW50NjQpdWludDY0IgogICAgbWV0aG9kICJzZXRfcHJpY2UoYXNzZXQsdWludDY0KXZvaWQiCiAgICBtZXRob2QgImRlbGV0ZV9tYXJrZXRwbGFjZShhc3NldCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9zZXRfcHJvZ3JhbXNfcm91dGVAMiBtYWluX2FsbG93X2Fzc2V0X3JvdXRlQDMgbWFpbl9jcmVhdGVfbWFya2V0cGxhY2Vfcm91dGVANCBtYWluX3NldF9wcmljZV9yb3V0ZUA1IG1haW5fZGVsZXRlX21hcmtldHBsYWNlX3JvdXRlQDYKICAgIGVyciAvLyByZWplY3QgdHJhbnNhY3Rpb24KCm1haW5fc2V0X3Byb2dyYW1zX3JvdXRlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weTo0MC00MgogICAgLy8gIyBUaGUgY3JlYXRvciBzdG9yZXMgdGhlIHByb2dyYW1zIGV2ZXJ5IG5ldyBtYXJrZXRwbGFjZSBpcyBjcmVhdGVkIHdpdGgKICAgIC8vICMgVGhlIGFwcCBhY2NvdW50IG11c3QgYWxyZWFkeSBob2xkIHRoZSBNQlIgb2YgdGhlIHR3byBib3hlcwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weTozNi0zOQogICAgLy8gIyBDcmVhdGVzIGEgRGlnaXRhbE1hcmtldHBsYWNlIGZvciBhIHNlbGxlciBpbiBhIHNpbmdsZSBhcHAgY2FsbAogICAgLy8gIyBUaGUgZmFjdG9yeSBpcyB0aGUgY3JlYXRvciBvZiBldmVyeSBtYXJrZXRwbGFjZSBpdCBjcmVhdGVzLCBzbyB0aGUgc2VsbGVyCiAgICAvLyAjIGNoYW5nZXMgdGhlIHByaWNlIGFuZCBkZWxldGVzIHRoZSBtYXJrZXRwbGFjZSB0aHJvdWdoIHRoZSBmYWN0b3J5CiAgICAvLyBjbGFzcyBNYXJrZXRwbGFjZUZhY3RvcnkoYXJjNC5BUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weTo0MC00MgogICAgLy8gIyBUaGUgY3JlYXRvciBzdG9yZXMgdGhlIHByb2dyYW1zIGV2ZXJ5IG5ldyBtYXJrZXRwbGFjZSBpcyBjcmVhdGVkIHdpdGgKICAgIC8vICMgVGhlIGFwcCBhY2NvdW50IG11c3QgYWxyZWFkeSBob2xkIHRoZSBNQlIgb2YgdGhlIHR3byBib3hlcwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF9wcm9ncmFtcwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9hbGxvd19hc3NldF9yb3V0ZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6NTMtNTUKICAgIC8vICMgVGhlIGRlcG9zaXQgZ29lcyB0aHJvdWdoIHRoZSBmYWN0b3J5LCBzbyBpdCBtdXN0IG9wdC1pbiB0byB0aGUgYXNzZXQgZmlyc3QKICAgIC8vICMgQW55b25lIGNhbiBwYXkgZm9yIHRoZSBvcHQtaW4sIGl0IG9ubHkgbmVlZHMgdG8gaGFwcGVuIG9uY2UgcGVyIGFzc2V0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjM2LTM5CiAgICAvLyAjIENyZWF0ZXMgYSBEaWdpdGFsTWFya2V0cGxhY2UgZm9yIGEgc2VsbGVyIGluIGEgc2luZ2xlIGFwcCBjYWxsCiAgICAvLyAjIFRoZSBmYWN0b3J5IGlzIHRoZSBjcmVhdG9yIG9mIGV2ZXJ5IG1hcmtldHBsYWNlIGl0IGNyZWF0ZXMsIHNvIHRoZSBzZWxsZXIKICAgIC8vICMgY2hhbmdlcyB0aGUgcHJpY2UgYW5kIGRlbGV0ZXMgdGhlIG1hcmtldHBsYWNlIHRocm91Z2ggdGhlIGZhY3RvcnkKICAgIC8vIGNsYXNzIE1hcmtldHBsYWNlRmFjdG9yeShhcmM0LkFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6NTMtNTUKICAgIC8vICMgVGhlIGRlcG9zaXQgZ29lcyB0aHJvdWdoIHRoZSBmYWN0b3J5LCBzbyBpdCBtdXN0IG9wdC1pbiB0byB0aGUgYXNzZXQgZmlyc3QKICAgIC8vICMgQW55b25lIGNhbiBwYXkgZm9yIHRoZSBvcHQtaW4sIGl0IG9ubHkgbmVlZHMgdG8gaGFwcGVuIG9uY2UgcGVyIGFzc2V0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgYWxsb3dfYXNzZXQKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX21hcmtldHBsYWNlX3JvdXRlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weTo2OC03MQogICAgLy8gIyBDcmVhdGVzIHRoZSBtYXJrZXRwbGFjZSwgZnVuZHMgaXQsIG9wdHMgaXQgaW4gdG8gdGhlIGFzc2V0IGFuZCBoYW5kcyBpdCB0aGUKICAgIC8vICMgZGVwb3NpdCwgd2hpY2ggaXMgZXZlcnl0aGluZyBhIHNlbGxlciBvdGhlcndpc2UgZG9lcyBpbiBmb3VyIHN0ZXBzCiAgICAvLyAjIFJldHVybnMgdGhlIGlkIG9mIHRoZSBuZXcgbWFya2V0cGxhY2UKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MzYtMzkKICAgIC8vICMgQ3JlYXRlcyBhIERpZ2l0YWxNYXJrZXRwbGFjZSBmb3IgYSBzZWxsZXIgaW4gYSBzaW5nbGUgYXBwIGNhbGwKICAgIC8vICMgVGhlIGZhY3RvcnkgaXMgdGhlIGNyZWF0b3Igb2YgZXZlcnkgbWFya2V0cGxhY2UgaXQgY3JlYXRlcywgc28gdGhlIHNlbGxlcgogICAgLy8gIyBjaGFuZ2VzIHRoZSBwcmljZSBhbmQgZGVsZXRlcyB0aGUgbWFya2V0cGxhY2UgdGhyb3VnaCB0aGUgZmFjdG9yeQogICAgLy8gY2xhc3MgTWFya2V0cGxhY2VGYWN0b3J5KGFyYzQuQVJDNENvbnRyYWN0KToKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnQgMgogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50IHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6NjgtNzEKICAgIC8vICMgQ3JlYXRlcyB0aGUgbWFya2V0cGxhY2UsIGZ1bmRzIGl0LCBvcHRzIGl0IGluIHRvIHRoZSBhc3NldCBhbmQgaGFuZHMgaXQgdGhlCiAgICAvLyAjIGRlcG9zaXQsIHdoaWNoIGlzIGV2ZXJ5dGhpbmcgYSBzZWxsZXIgb3RoZXJ3aXNlIGRvZXMgaW4gZm91ciBzdGVwcwogICAgLy8gIyBSZXR1cm5zIHRoZSBpZCBvZiB0aGUgbmV3IG1hcmtldHBsYWNlCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgY3JlYXRlX21hcmtldHBsYWNlCiAgICBpdG9iCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3NldF9wcmljZV9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTQxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjM2LTM5CiAgICAvLyAjIENyZWF0ZXMgYSBEaWdpdGFsTWFya2V0cGxhY2UgZm9yIGEgc2VsbGVyIGluIGEgc2luZ2xlIGFwcCBjYWxsCiAgICAvLyAjIFRoZSBmYWN0b3J5IGlzIHRoZSBjcmVhdG9yIG9mIGV2ZXJ5IG1hcmtldHBsYWNlIGl0IGNyZWF0ZXMsIHNvIHRoZSBzZWxsZXIKICAgIC8vICMgY2hhbmdlcyB0aGUgcHJpY2UgYW5kIGRlbGV0ZXMgdGhlIG1hcmtldHBsYWNlIHRocm91Z2ggdGhlIGZhY3RvcnkKICAgIC8vIGNsYXNzIE1hcmtldHBsYWNlRmFjdG9yeShhcmM0LkFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE0MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF9wcmljZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9kZWxldGVfbWFya2V0cGxhY2Vfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weTozNi0zOQogICAgLy8gIyBDcmVhdGVzIGEgRGlnaXRhbE1hcmtldHBsYWNlIGZvciBhIHNlbGxlciBpbiBhIHNpbmdsZSBhcHAgY2FsbAogICAgLy8gIyBUaGUgZmFjdG9yeSBpcyB0aGUgY3JlYXRvciBvZiBldmVyeSBtYXJrZXRwbGFjZSBpdCBjcmVhdGVzLCBzbyB0aGUgc2VsbGVyCiAgICAvLyAjIGNoYW5nZXMgdGhlIHByaWNlIGFuZCBkZWxldGVzIHRoZSBtYXJrZXRwbGFjZSB0aHJvdWdoIHRoZSBmYWN0b3J5CiAgICAvLyBjbGFzcyBNYXJrZXRwbGFjZUZhY3RvcnkoYXJjNC5BUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxNTQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBkZWxldGVfbWFya2V0cGxhY2UKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weTozNi0zOQogICAgLy8gIyBDcmVhdGVzIGEgRGlnaXRhbE1hcmtldHBsYWNlIGZvciBhIHNlbGxlciBpbiBhIHNpbmdsZSBhcHAgY2FsbAogICAgLy8gIyBUaGUgZmFjdG9yeSBpcyB0aGUgY3JlYXRvciBvZiBldmVyeSBtYXJrZXRwbGFjZSBpdCBjcmVhdGVzLCBzbyB0aGUgc2VsbGVyCiAgICAvLyAjIGNoYW5nZXMgdGhlIHByaWNlIGFuZCBkZWxldGVzIHRoZSBtYXJrZXRwbGFjZSB0aHJvdWdoIHRoZSBmYWN0b3J5CiAgICAvLyBjbGFzcyBNYXJrZXRwbGFjZUZhY3RvcnkoYXJjNC5BUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIHJlamVjdCB0cmFuc2FjdGlvbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBpcyBjcmVhdGluZwogICAgaW50IDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5tYXJrZXRwbGFjZV9mYWN0b3J5LmNvbnRyYWN0Lk1hcmtldHBsYWNlRmFjdG9yeS5zZXRfcHJvZ3JhbXMoYXBwcm92YWw6IGJ5dGVzLCBjbGVhcjogYnl0ZXMpIC0+IHZvaWQ6CnNldF9wcm9ncmFtczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjQwLTQzCiAgICAvLyAjIFRoZSBjcmVhdG9yIHN0b3JlcyB0aGUgcHJvZ3JhbXMgZXZlcnkgbmV3IG1hcmtldHBsYWNlIGlzIGNyZWF0ZWQgd2l0aAogICAgLy8gIyBUaGUgYXBwIGFjY291bnQgbXVzdCBhbHJlYWR5IGhvbGQgdGhlIE1CUiBvZiB0aGUgdHdvIGJveGVzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXRfcHJvZ3JhbXMoc2VsZiwgYXBwcm92YWw6IEJ5dGVzLCBjbGVhcjogQnl0ZXMpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjQ2LTQ4CiAgICAvLyAjIEEgYm94IGNhbid0IGNoYW5nZSBzaXplLCBzbyB0aGUgb2xkIHByb2dyYW1zIGFyZSBkZWxldGVkIGZpcnN0CiAgICAvLyAjIFRoZSByZXN1bHRzIGFyZSBhc3NpZ25lZCwgcHV5YXB5IDAuNyBjYW4ndCBjb21waWxlIGEgZGlzY2FyZGVkIGJveF9kZWwKICAgIC8vIF9kZWxldGVkID0gb3AuQm94LmRlbGV0ZShBUFBST1ZBTF9CT1gpCiAgICBieXRlICJhcHByb3ZhbCIKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6NDkKICAgIC8vIG9wLkJveC5wdXQoQVBQUk9WQUxfQk9YLCBhcHByb3ZhbCkKICAgIGJ5dGUgImFwcHJvdmFsIgogICAgZnJhbWVfZGlnIC0yCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weTo1MAogICAgLy8gX2RlbGV0ZWQgPSBvcC5Cb3guZGVsZXRlKENMRUFSX0JPWCkKICAgIGJ5dGUgImNsZWFyIgogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weTo1MQogICAgLy8gb3AuQm94LnB1dChDTEVBUl9CT1gsIGNsZWFyKQogICAgYnl0ZSAiY2xlYXIiCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5tYXJrZXRwbGFjZV9mYWN0b3J5LmNvbnRyYWN0Lk1hcmtldHBsYWNlRmFjdG9yeS5hbGxvd19hc3NldChtYnJfcGF5OiB1aW50NjQsIGFzc2V0OiB1aW50NjQpIC0+IHZvaWQ6CmFsbG93X2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6NTMtNTYKICAgIC8vICMgVGhlIGRlcG9zaXQgZ29lcyB0aHJvdWdoIHRoZSBmYWN0b3J5LCBzbyBpdCBtdXN0IG9wdC1pbiB0byB0aGUgYXNzZXQgZmlyc3QKICAgIC8vICMgQW55b25lIGNhbiBwYXkgZm9yIHRoZSBvcHQtaW4sIGl0IG9ubHkgbmVlZHMgdG8gaGFwcGVuIG9uY2UgcGVyIGFzc2V0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBhbGxvd19hc3NldChzZWxmLCBtYnJfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwgYXNzZXQ6IEFzc2V0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weTo1NwogICAgLy8gYXNzZXJ0IG5vdCBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmlzX29wdGVkX2luKGFzc2V0KQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6NTkKICAgIC8vIGFzc2VydCBtYnJfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weTo2MAogICAgLy8gYXNzZXJ0IG1icl9wYXkuYW1vdW50ID09IEdsb2JhbC5hc3NldF9vcHRfaW5fbWluX2JhbGFuY2UKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgQW1vdW50CiAgICBnbG9iYWwgQXNzZXRPcHRJbk1pbkJhbGFuY2UKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjYyLTY2CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6NjQKICAgIC8vIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6NjUKICAgIC8vIGFzc2V0X2Ftb3VudD0wLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6NjIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludCBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6NjItNjYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm1hcmtldHBsYWNlX2ZhY3RvcnkuY29udHJhY3QuTWFya2V0cGxhY2VGYWN0b3J5LmNyZWF0ZV9tYXJrZXRwbGFjZShtYnJfcGF5OiB1aW50NjQsIGRlcG9zaXQ6IHVpbnQ2NCwgdW5pdGFyeV9wcmljZTogdWludDY0KSAtPiB1aW50NjQ6CmNyZWF0ZV9tYXJrZXRwbGFjZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjY4LTc3CiAgICAvLyAjIENyZWF0ZXMgdGhlIG1hcmtldHBsYWNlLCBmdW5kcyBpdCwgb3B0cyBpdCBpbiB0byB0aGUgYXNzZXQgYW5kIGhhbmRzIGl0IHRoZQogICAgLy8gIyBkZXBvc2l0LCB3aGljaCBpcyBldmVyeXRoaW5nIGEgc2VsbGVyIG90aGVyd2lzZSBkb2VzIGluIGZvdXIgc3RlcHMKICAgIC8vICMgUmV0dXJucyB0aGUgaWQgb2YgdGhlIG5ldyBtYXJrZXRwbGFjZQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgY3JlYXRlX21hcmtldHBsYWNlKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgbWJyX3BheTogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sCiAgICAvLyAgICAgZGVwb3NpdDogZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24sCiAgICAvLyAgICAgdW5pdGFyeV9wcmljZTogVUludDY0LAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBhc3NldCA9IGRlcG9zaXQueGZlcl9hc3NldAogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5Ojc5CiAgICAvLyBrZXkgPSBtYXJrZXRwbGFjZV9rZXkoVHhuLnNlbmRlciwgYXNzZXQpCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgY2FsbHN1YiBtYXJrZXRwbGFjZV9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjgwLTgxCiAgICAvLyAjIEEgc2VsbGVyIGNhbiBvbmx5IGhhdmUgb25lIG1hcmtldHBsYWNlIHBlciBhc3NldAogICAgLy8gX3ZhbHVlLCBleGlzdHMgPSBvcC5Cb3guZ2V0KGtleSkKICAgIGR1cAogICAgYm94X2dldAogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weTo4MgogICAgLy8gYXNzZXJ0IG5vdCBleGlzdHMKICAgICEKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6ODQtODUKICAgIC8vICMgVGhlIHNlbGxlciBwYXlzIGZvciB0aGUgbWFya2V0cGxhY2UgYXBwLCBpdHMgYm94IGhlcmUgYW5kIGl0cyBvd24gTUJSCiAgICAvLyBhc3NlcnQgbWJyX3BheS5zZW5kZXIgPT0gVHhuLnNlbmRlcgogICAgZnJhbWVfZGlnIC0zCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBhc3NlcnQgbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTMKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6ODcKICAgIC8vIGFzc2VydCBtYnJfcGF5LmFtb3VudCA9PSAoCiAgICBmcmFtZV9kaWcgLTMKICAgIGd0eG5zIEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6ODgtODkKICAgIC8vIE1BUktFVFBMQUNFX0FQUF9NQlIKICAgIC8vICsgTUFSS0VUUExBQ0VfQk9YX01CUgogICAgaW50IDE3ODcwMAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6OTAKICAgIC8vICsgR2xvYmFsLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgTWluQmFsYW5jZQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6ODgtOTAKICAgIC8vIE1BUktFVFBMQUNFX0FQUF9NQlIKICAgIC8vICsgTUFSS0VUUExBQ0VfQk9YX01CUgogICAgLy8gKyBHbG9iYWwubWluX2JhbGFuY2UKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjkxCiAgICAvLyArIEdsb2JhbC5hc3NldF9vcHRfaW5fbWluX2JhbGFuY2UKICAgIGdsb2JhbCBBc3NldE9wdEluTWluQmFsYW5jZQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6ODgtOTEKICAgIC8vIE1BUktFVFBMQUNFX0FQUF9NQlIKICAgIC8vICsgTUFSS0VUUExBQ0VfQk9YX01CUgogICAgLy8gKyBHbG9iYWwubWluX2JhbGFuY2UKICAgIC8vICsgR2xvYmFsLmFzc2V0X29wdF9pbl9taW5fYmFsYW5jZQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6ODctOTEKICAgIC8vIGFzc2VydCBtYnJfcGF5LmFtb3VudCA9PSAoCiAgICAvLyAgICAgTUFSS0VUUExBQ0VfQVBQX01CUgogICAgLy8gICAgICsgTUFSS0VUUExBQ0VfQk9YX01CUgogICAgLy8gICAgICsgR2xvYmFsLm1pbl9iYWxhbmNlCiAgICAvLyAgICAgKyBHbG9iYWwuYXNzZXRfb3B0X2luX21pbl9iYWxhbmNlCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6ODctOTIKICAgIC8vIGFzc2VydCBtYnJfcGF5LmFtb3VudCA9PSAoCiAgICAvLyAgICAgTUFSS0VUUExBQ0VfQVBQX01CUgogICAgLy8gICAgICsgTUFSS0VUUExBQ0VfQk9YX01CUgogICAgLy8gICAgICsgR2xvYmFsLm1pbl9iYWxhbmNlCiAgICAvLyAgICAgKyBHbG9iYWwuYXNzZXRfb3B0X2luX21pbl9iYWxhbmNlCiAgICAvLyApCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5Ojk0CiAgICAvLyBhc3NlcnQgZGVwb3NpdC5zZW5kZXIgPT0gVHhuLnNlbmRlcgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBTZW5kZXIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5Ojk1CiAgICAvLyBhc3NlcnQgZGVwb3NpdC5hc3NldF9yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIEFzc2V0UmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weTo5NgogICAgLy8gYXNzZXJ0IGRlcG9zaXQuYXNzZXRfYW1vdW50ID4gMAogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBBc3NldEFtb3VudAogICAgZHVwCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5Ojk4CiAgICAvLyBhcHByb3ZhbCwgYXBwcm92YWxfZXhpc3RzID0gb3AuQm94LmdldChBUFBST1ZBTF9CT1gpCiAgICBieXRlICJhcHByb3ZhbCIKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5Ojk5CiAgICAvLyBjbGVhciwgY2xlYXJfZXhpc3RzID0gb3AuQm94LmdldChDTEVBUl9CT1gpCiAgICBieXRlICJjbGVhciIKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjEwMAogICAgLy8gYXNzZXJ0IGFwcHJvdmFsX2V4aXN0cyBhbmQgY2xlYXJfZXhpc3RzCiAgICAmJgogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxMDQtMTE1CiAgICAvLyBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIC8vICAgICBhcHByb3ZhbF9wcm9ncmFtPWFwcHJvdmFsLAogICAgLy8gICAgIGNsZWFyX3N0YXRlX3Byb2dyYW09Y2xlYXIsCiAgICAvLyAgICAgZ2xvYmFsX251bV91aW50PTIsCiAgICAvLyAgICAgYXBwX2FyZ3M9KAogICAgLy8gICAgICAgICBhcmM0LmFyYzRfc2lnbmF0dXJlKCJjcmVhdGVfYXBwbGljYXRpb24oYXNzZXQsdWludDY0KXZvaWQiKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50OCgwKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQodW5pdGFyeV9wcmljZSksCiAgICAvLyAgICAgKSwKICAgIC8vICAgICBhc3NldHM9KGFzc2V0LCksCiAgICAvLyApCiAgICAvLyAuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjExMQogICAgLy8gYXJjNC5VSW50NjQodW5pdGFyeV9wcmljZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGRpZyA1CiAgICBpdHhuX2ZpZWxkIEFzc2V0cwogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTA5CiAgICAvLyBhcmM0LmFyYzRfc2lnbmF0dXJlKCJjcmVhdGVfYXBwbGljYXRpb24oYXNzZXQsdWludDY0KXZvaWQiKSwKICAgIG1ldGhvZCAiY3JlYXRlX2FwcGxpY2F0aW9uKGFzc2V0LHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjExMAogICAgLy8gYXJjNC5VSW50OCgwKSwKICAgIGJ5dGUgMHgwMAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxMDcKICAgIC8vIGdsb2JhbF9udW1fdWludD0yLAogICAgaW50IDIKICAgIGl0eG5fZmllbGQgR2xvYmFsTnVtVWludAogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbVBhZ2VzCiAgICBpdHhuX2ZpZWxkIEFwcHJvdmFsUHJvZ3JhbVBhZ2VzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxMDQKICAgIC8vIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgaW50IGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjEwNC0xMTUKICAgIC8vIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgLy8gICAgIGFwcHJvdmFsX3Byb2dyYW09YXBwcm92YWwsCiAgICAvLyAgICAgY2xlYXJfc3RhdGVfcHJvZ3JhbT1jbGVhciwKICAgIC8vICAgICBnbG9iYWxfbnVtX3VpbnQ9MiwKICAgIC8vICAgICBhcHBfYXJncz0oCiAgICAvLyAgICAgICAgIGFyYzQuYXJjNF9zaWduYXR1cmUoImNyZWF0ZV9hcHBsaWNhdGlvbihhc3NldCx1aW50NjQpdm9pZCIpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ4KDApLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NCh1bml0YXJ5X3ByaWNlKSwKICAgIC8vICAgICApLAogICAgLy8gICAgIGFzc2V0cz0oYXNzZXQsKSwKICAgIC8vICkKICAgIC8vIC5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gQ3JlYXRlZEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjExOS0xMzAKICAgIC8vICMgb3B0X2luX3RvX2Fzc2V0IGNoZWNrcyB0aGUgcGF5bWVudCBqdXN0IGJlZm9yZSBpdCwgc28gYm90aCBnbyBpbiBvbmUgZ3JvdXAKICAgIC8vIGl0eG4uc3VibWl0X3R4bnMoCiAgICAvLyAgICAgaXR4bi5QYXltZW50KAogICAgLy8gICAgICAgICByZWNlaXZlcj1tYXJrZXRwbGFjZS5hZGRyZXNzLAogICAgLy8gICAgICAgICBhbW91bnQ9R2xvYmFsLm1pbl9iYWxhbmNlICsgR2xvYmFsLmFzc2V0X29wdF9pbl9taW5fYmFsYW5jZSwKICAgIC8vICAgICApLAogICAgLy8gICAgIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgLy8gICAgICAgICBhcHBfaWQ9bWFya2V0cGxhY2UsCiAgICAvLyAgICAgICAgIGFwcF9hcmdzPShhcmM0LmFyYzRfc2lnbmF0dXJlKCJvcHRfaW5fdG9fYXNzZXQocGF5KXZvaWQiKSwpLAogICAgLy8gICAgICAgICBhc3NldHM9KGFzc2V0LCksCiAgICAvLyAgICAgKSwKICAgIC8vICkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjEyMgogICAgLy8gcmVjZWl2ZXI9bWFya2V0cGxhY2UuYWRkcmVzcywKICAgIGR1cAogICAgYXBwX3BhcmFtc19nZXQgQXBwQWRkcmVzcwogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTIzCiAgICAvLyBhbW91bnQ9R2xvYmFsLm1pbl9iYWxhbmNlICsgR2xvYmFsLmFzc2V0X29wdF9pbl9taW5fYmFsYW5jZSwKICAgIGdsb2JhbCBNaW5CYWxhbmNlCiAgICBnbG9iYWwgQXNzZXRPcHRJbk1pbkJhbGFuY2UKICAgICsKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxMjEKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludCBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjExOS0xMzAKICAgIC8vICMgb3B0X2luX3RvX2Fzc2V0IGNoZWNrcyB0aGUgcGF5bWVudCBqdXN0IGJlZm9yZSBpdCwgc28gYm90aCBnbyBpbiBvbmUgZ3JvdXAKICAgIC8vIGl0eG4uc3VibWl0X3R4bnMoCiAgICAvLyAgICAgaXR4bi5QYXltZW50KAogICAgLy8gICAgICAgICByZWNlaXZlcj1tYXJrZXRwbGFjZS5hZGRyZXNzLAogICAgLy8gICAgICAgICBhbW91bnQ9R2xvYmFsLm1pbl9iYWxhbmNlICsgR2xvYmFsLmFzc2V0X29wdF9pbl9taW5fYmFsYW5jZSwKICAgIC8vICAgICApLAogICAgLy8gICAgIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgLy8gICAgICAgICBhcHBfaWQ9bWFya2V0cGxhY2UsCiAgICAvLyAgICAgICAgIGFwcF9hcmdzPShhcmM0LmFyYzRfc2lnbmF0dXJlKCJvcHRfaW5fdG9fYXNzZXQocGF5KXZvaWQiKSwpLAogICAgLy8gICAgICAgICBhc3NldHM9KGFzc2V0LCksCiAgICAvLyAgICAgKSwKICAgIC8vICkKICAgIGl0eG5fbmV4dAogICAgZGlnIDMKICAgIGl0eG5fZmllbGQgQXNzZXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxMjcKICAgIC8vIGFwcF9hcmdzPShhcmM0LmFyYzRfc2lnbmF0dXJlKCJvcHRfaW5fdG9fYXNzZXQocGF5KXZvaWQiKSwpLAogICAgbWV0aG9kICJvcHRfaW5fdG9fYXNzZXQocGF5KXZvaWQiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjEyNQogICAgLy8gaXR4bi5BcHBsaWNhdGlvbkNhbGwoCiAgICBpbnQgYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTE5LTEzMAogICAgLy8gIyBvcHRfaW5fdG9fYXNzZXQgY2hlY2tzIHRoZSBwYXltZW50IGp1c3QgYmVmb3JlIGl0LCBzbyBib3RoIGdvIGluIG9uZSBncm91cAogICAgLy8gaXR4bi5zdWJtaXRfdHhucygKICAgIC8vICAgICBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgICAgIHJlY2VpdmVyPW1hcmtldHBsYWNlLmFkZHJlc3MsCiAgICAvLyAgICAgICAgIGFtb3VudD1HbG9iYWwubWluX2JhbGFuY2UgKyBHbG9iYWwuYXNzZXRfb3B0X2luX21pbl9iYWxhbmNlLAogICAgLy8gICAgICksCiAgICAvLyAgICAgaXR4bi5BcHBsaWNhdGlvbkNhbGwoCiAgICAvLyAgICAgICAgIGFwcF9pZD1tYXJrZXRwbGFjZSwKICAgIC8vICAgICAgICAgYXBwX2FyZ3M9KGFyYzQuYXJjNF9zaWduYXR1cmUoIm9wdF9pbl90b19hc3NldChwYXkpdm9pZCIpLCksCiAgICAvLyAgICAgICAgIGFzc2V0cz0oYXNzZXQsKSwKICAgIC8vICAgICApLAogICAgLy8gKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjEzMi0xMzYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPW1hcmtldHBsYWNlLmFkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWRlcG9zaXQuYXNzZXRfYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTM0CiAgICAvLyBhc3NldF9yZWNlaXZlcj1tYXJrZXRwbGFjZS5hZGRyZXNzLAogICAgZHVwCiAgICBhcHBfcGFyYW1zX2dldCBBcHBBZGRyZXNzCiAgICBhc3NlcnQgLy8gYXBwbGljYXRpb24gZXhpc3RzCiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgdW5jb3ZlciAyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTMyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjEzMi0xMzYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPW1hcmtldHBsYWNlLmFkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWRlcG9zaXQuYXNzZXRfYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjEzOAogICAgLy8gb3AuQm94LnB1dChrZXksIG9wLml0b2IobWFya2V0cGxhY2UuaWQpKQogICAgZHVwCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjEzOQogICAgLy8gcmV0dXJuIG1hcmtldHBsYWNlLmlkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMubWFya2V0cGxhY2VfZmFjdG9yeS5jb250cmFjdC5tYXJrZXRwbGFjZV9rZXkoc2VsbGVyOiBieXRlcywgYXNzZXQ6IHVpbnQ2NCkgLT4gYnl0ZXM6Cm1hcmtldHBsYWNlX2tleToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjMxLTMyCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIG1hcmtldHBsYWNlX2tleShzZWxsZXI6IEFjY291bnQsIGFzc2V0OiBBc3NldCkgLT4gQnl0ZXM6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjMzCiAgICAvLyByZXR1cm4gc2VsbGVyLmJ5dGVzICsgb3AuaXRvYihhc3NldC5pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5tYXJrZXRwbGFjZV9mYWN0b3J5LmNvbnRyYWN0Lk1hcmtldHBsYWNlRmFjdG9yeS5zZXRfcHJpY2UoYXNzZXQ6IHVpbnQ2NCwgdW5pdGFyeV9wcmljZTogdWludDY0KSAtPiB2b2lkOgpzZXRfcHJpY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxNDEtMTQyCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBzZXRfcHJpY2Uoc2VsZiwgYXNzZXQ6IEFzc2V0LCB1bml0YXJ5X3ByaWNlOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE0My0xNDQKICAgIC8vICMgVGhlIGtleSBpcyBkZXJpdmVkIGZyb20gdGhlIHNlbmRlciwgc28gc2VsbGVycyBjYW4gb25seSBjaGFuZ2UgdGhlaXIgb3duIHByaWNlCiAgICAvLyBtYXJrZXRwbGFjZSA9IHNlbGYubWFya2V0cGxhY2UoVHhuLnNlbmRlciwgYXNzZXQpCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgbWFya2V0cGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE0Ni0xNTIKICAgIC8vIGl0eG4uQXBwbGljYXRpb25DYWxsKAogICAgLy8gICAgIGFwcF9pZD1tYXJrZXRwbGFjZSwKICAgIC8vICAgICBhcHBfYXJncz0oCiAgICAvLyAgICAgICAgIGFyYzQuYXJjNF9zaWduYXR1cmUoInNldF9wcmljZSh1aW50NjQpdm9pZCIpLAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NCh1bml0YXJ5X3ByaWNlKSwKICAgIC8vICAgICApLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTUwCiAgICAvLyBhcmM0LlVJbnQ2NCh1bml0YXJ5X3ByaWNlKSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTQ5CiAgICAvLyBhcmM0LmFyYzRfc2lnbmF0dXJlKCJzZXRfcHJpY2UodWludDY0KXZvaWQiKSwKICAgIG1ldGhvZCAic2V0X3ByaWNlKHVpbnQ2NCl2b2lkIgogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbkFyZ3MKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uSUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE0NgogICAgLy8gaXR4bi5BcHBsaWNhdGlvbkNhbGwoCiAgICBpbnQgYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTQ2LTE1MgogICAgLy8gaXR4bi5BcHBsaWNhdGlvbkNhbGwoCiAgICAvLyAgICAgYXBwX2lkPW1hcmtldHBsYWNlLAogICAgLy8gICAgIGFwcF9hcmdzPSgKICAgIC8vICAgICAgICAgYXJjNC5hcmM0X3NpZ25hdHVyZSgic2V0X3ByaWNlKHVpbnQ2NCl2b2lkIiksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHVuaXRhcnlfcHJpY2UpLAogICAgLy8gICAgICksCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm1hcmtldHBsYWNlX2ZhY3RvcnkuY29udHJhY3QuTWFya2V0cGxhY2VGYWN0b3J5Lm1hcmtldHBsYWNlKHNlbGxlcjogYnl0ZXMsIGFzc2V0OiB1aW50NjQpIC0+IHVpbnQ2NDoKbWFya2V0cGxhY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxODYtMTg4CiAgICAvLyAjIFRoZSBtYXJrZXRwbGFjZSBzZWxsZXIgY3JlYXRlZCBmb3IgYXNzZXQsIGZhaWxzIGlmIHRoZXJlIGlzIG5vbmUKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgbWFya2V0cGxhY2Uoc2VsZiwgc2VsbGVyOiBBY2NvdW50LCBhc3NldDogQXNzZXQpIC0+IEFwcGxpY2F0aW9uOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxODkKICAgIC8vIHZhbHVlLCBleGlzdHMgPSBvcC5Cb3guZ2V0KG1hcmtldHBsYWNlX2tleShzZWxsZXIsIGFzc2V0KSkKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIG1hcmtldHBsYWNlX2tleQogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTkwCiAgICAvLyBhc3NlcnQgZXhpc3RzCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE5MQogICAgLy8gcmV0dXJuIEFwcGxpY2F0aW9uKG9wLmJ0b2kodmFsdWUpKQogICAgYnRvaQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm1hcmtldHBsYWNlX2ZhY3RvcnkuY29udHJhY3QuTWFya2V0cGxhY2VGYWN0b3J5LmRlbGV0ZV9tYXJrZXRwbGFjZShhc3NldDogdWludDY0KSAtPiB2b2lkOgpkZWxldGVfbWFya2V0cGxhY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxNTQtMTU1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBkZWxldGVfbWFya2V0cGxhY2Uoc2VsZiwgYXNzZXQ6IEFzc2V0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxNTYKICAgIC8vIG1hcmtldHBsYWNlID0gc2VsZi5tYXJrZXRwbGFjZShUeG4uc2VuZGVyLCBhc3NldCkKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBtYXJrZXRwbGFjZQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTU4LTE2MAogICAgLy8gIyBUaGUgbWFya2V0cGxhY2UgY2xvc2VzIG91dCB0byBpdHMgY3JlYXRvciwgdGhlIGZhY3RvcnksCiAgICAvLyAjIHNvIHdoYXRldmVyIHRoZSBmYWN0b3J5IGdhaW5zIGZyb20gdGhlIGRlbGV0aW9uIGJlbG9uZ3MgdG8gdGhlIHNlbGxlcgogICAgLy8gYmFsYW5jZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0QmFsYW5jZQogICAgc3dhcAogICAgY292ZXIgMgogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxNjEKICAgIC8vIHVuaXRzID0gYXNzZXQuYmFsYW5jZShHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzKQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gYWNjb3VudCBvcHRlZCBpbnRvIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxNjItMTY3CiAgICAvLyBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIC8vICAgICBhcHBfaWQ9bWFya2V0cGxhY2UsCiAgICAvLyAgICAgb25fY29tcGxldGlvbj1PbkNvbXBsZXRlQWN0aW9uLkRlbGV0ZUFwcGxpY2F0aW9uLAogICAgLy8gICAgIGFwcF9hcmdzPShhcmM0LmFyYzRfc2lnbmF0dXJlKCJkZWxldGVfYXBwbGljYXRpb24oKXZvaWQiKSwpLAogICAgLy8gICAgIGFzc2V0cz0oYXNzZXQsKSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBBc3NldHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE2NQogICAgLy8gYXBwX2FyZ3M9KGFyYzQuYXJjNF9zaWduYXR1cmUoImRlbGV0ZV9hcHBsaWNhdGlvbigpdm9pZCIpLCksCiAgICBtZXRob2QgImRlbGV0ZV9hcHBsaWNhdGlvbigpdm9pZCIKICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25BcmdzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxNjQKICAgIC8vIG9uX2NvbXBsZXRpb249T25Db21wbGV0ZUFjdGlvbi5EZWxldGVBcHBsaWNhdGlvbiwKICAgIGludCBEZWxldGVBcHBsaWNhdGlvbgogICAgaXR4bl9maWVsZCBPbkNvbXBsZXRpb24KICAgIGl0eG5fZmllbGQgQXBwbGljYXRpb25JRAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTYyCiAgICAvLyBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIGludCBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxNjItMTY3CiAgICAvLyBpdHhuLkFwcGxpY2F0aW9uQ2FsbCgKICAgIC8vICAgICBhcHBfaWQ9bWFya2V0cGxhY2UsCiAgICAvLyAgICAgb25fY29tcGxldGlvbj1PbkNvbXBsZXRlQWN0aW9uLkRlbGV0ZUFwcGxpY2F0aW9uLAogICAgLy8gICAgIGFwcF9hcmdzPShhcmM0LmFyYzRfc2lnbmF0dXJlKCJkZWxldGVfYXBwbGljYXRpb24oKXZvaWQiKSwpLAogICAgLy8gICAgIGFzc2V0cz0oYXNzZXQsKSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxNjktMTc0CiAgICAvLyAjIFNlbmQgdGhlIHVuc29sZCB1bml0cyBiYWNrIHRvIHRoZSBzZWxsZXIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFzc2V0LmJhbGFuY2UoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcykgLSB1bml0cywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE3MgogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE3MwogICAgLy8gYXNzZXRfYW1vdW50PWFzc2V0LmJhbGFuY2UoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcykgLSB1bml0cywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBmcmFtZV9kaWcgLTEKICAgIGFzc2V0X2hvbGRpbmdfZ2V0IEFzc2V0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgb3B0ZWQgaW50byBhc3NldAogICAgdW5jb3ZlciAyCiAgICAtCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE2OS0xNzAKICAgIC8vICMgU2VuZCB0aGUgdW5zb2xkIHVuaXRzIGJhY2sgdG8gdGhlIHNlbGxlcgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxNjktMTc0CiAgICAvLyAjIFNlbmQgdGhlIHVuc29sZCB1bml0cyBiYWNrIHRvIHRoZSBzZWxsZXIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PWFzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFzc2V0LmJhbGFuY2UoR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcykgLSB1bml0cywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxNzYtMTc3CiAgICAvLyAjIERlbGV0aW5nIHRoZSBhcHAgYW5kIHRoZSBib3ggdW5sb2NrcyB0aGVpciBNQlIsIHNvIHdlIHJlZnVuZCBpdCBhcyB3ZWxsCiAgICAvLyBfZGVsZXRlZCA9IG9wLkJveC5kZWxldGUobWFya2V0cGxhY2Vfa2V5KFR4bi5zZW5kZXIsIGFzc2V0KSkKICAgIHR4biBTZW5kZXIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBtYXJrZXRwbGFjZV9rZXkKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTc4LTE4NAogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYW1vdW50PUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgLy8gICAgIC0gYmFsYW5jZQogICAgLy8gICAgICsgTUFSS0VUUExBQ0VfQVBQX01CUgogICAgLy8gICAgICsgTUFSS0VUUExBQ0VfQk9YX01CUiwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE3OQogICAgLy8gcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE4MAogICAgLy8gYW1vdW50PUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0QmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxODAtMTgxCiAgICAvLyBhbW91bnQ9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5iYWxhbmNlCiAgICAvLyAtIGJhbGFuY2UKICAgIHVuY292ZXIgMgogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTgyCiAgICAvLyArIE1BUktFVFBMQUNFX0FQUF9NQlIKICAgIGludCAxNTcwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE4MC0xODIKICAgIC8vIGFtb3VudD1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIC8vIC0gYmFsYW5jZQogICAgLy8gKyBNQVJLRVRQTEFDRV9BUFBfTUJSCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxODMKICAgIC8vICsgTUFSS0VUUExBQ0VfQk9YX01CUiwKICAgIGludCAyMTcwMAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2ZhY3RvcnkvY29udHJhY3QucHk6MTgwLTE4MwogICAgLy8gYW1vdW50PUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MuYmFsYW5jZQogICAgLy8gLSBiYWxhbmNlCiAgICAvLyArIE1BUktFVFBMQUNFX0FQUF9NQlIKICAgIC8vICsgTUFSS0VUUExBQ0VfQk9YX01CUiwKICAgICsKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfZmFjdG9yeS9jb250cmFjdC5weToxNzgKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludCBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjE3OC0xODQKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFtb3VudD1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmJhbGFuY2UKICAgIC8vICAgICAtIGJhbGFuY2UKICAgIC8vICAgICArIE1BUktFVFBMQUNFX0FQUF9NQlIKICAgIC8vICAgICArIE1BUktFVFBMQUNFX0JPWF9NQlIsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCg==",
+        "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMubWFya2V0cGxhY2VfZmFjdG9yeS5jb250cmFjdC5NYXJrZXRwbGFjZUZhY3RvcnkuY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9mYWN0b3J5L2NvbnRyYWN0LnB5OjM2LTM5CiAgICAvLyAjIENyZWF0ZXMgYSBEaWdpdGFsTWFya2V0cGxhY2UgZm9yIGEgc2VsbGVyIGluIGEgc2luZ2xlIGFwcCBjYWxsCiAgICAvLyAjIFRoZSBmYWN0b3J5IGlzIHRoZSBjcmVhdG9yIG9mIGV2ZXJ5IG1hcmtldHBsYWNlIGl0IGNyZWF0ZXMsIHNvIHRoZSBzZWxsZXIKICAgIC8vICMgY2hhbmdlcyB0aGUgcHJpY2UgYW5kIGRlbGV0ZXMgdGhlIG1hcmtldHBsYWNlIHRocm91Z2ggdGhlIGZhY3RvcnkKICAgIC8vIGNsYXNzIE1hcmtldHBsYWNlRmFjdG9yeShhcmM0LkFSQzRDb250cmFjdCk6CiAgICBpbnQgMQogICAgcmV0dXJuCg=="
+    },
+    "state": {
+        "global": {
+            "num_byte_slices": 0,
+            "num_uints": 0
+        },
+        "local": {
+            "num_byte_slices": 0,
+            "num_uints": 0
+        }
+    },
+    "schema": {
+        "global": {
+            "declared": {},
+            "reserved": {}
+        },
+        "local": {
+            "declared": {},
+            "reserved": {}
+        }
+    },
+    "contract": {
+        "name": "MarketplaceFactory",
+        "methods": [
+            {
+                "name": "set_programs",
+                "args": [
+                    {
+                        "type": "byte[]",
+                        "name": "approval"
+                    },
+                    {
+                        "type": "byte[]",
+                        "name": "clear"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "allow_asset",
+                "args": [
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    },
+                    {
+                        "type": "asset",
+                        "name": "asset"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "create_marketplace",
+                "args": [
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    },
+                    {
+                        "type": "axfer",
+                        "name": "deposit"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "unitary_price"
+                    }
+                ],
+                "returns": {
+                    "type": "uint64"
+                }
+            },
+            {
+                "name": "set_price",
+                "args": [
+                    {
+                        "type": "asset",
+                        "name": "asset"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "unitary_price"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "delete_marketplace",
+                "args": [
+                    {
+                        "type": "asset",
+                        "name": "asset"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            }
+        ],
+        "networks": {}
+    },
+    "bare_call_config": {
+        "no_op": "CREATE"
+    }
+}"""
+APP_SPEC = algokit_utils.ApplicationSpecification.from_json(_APP_SPEC_JSON)
+_TReturn = typing.TypeVar("_TReturn")
+
+
+class _ArgsBase(ABC, typing.Generic[_TReturn]):
+    @staticmethod
+    @abstractmethod
+    def method() -> str:
+        ...
+
+
+_TArgs = typing.TypeVar("_TArgs", bound=_ArgsBase[typing.Any])
+
+
+@dataclasses.dataclass(kw_only=True)
+class _TArgsHolder(typing.Generic[_TArgs]):
+    args: _TArgs
+
+
+def _filter_none(value: dict | typing.Any) -> dict | typing.Any:
+    if isinstance(value, dict):
+        return {k: _filter_none(v) for k, v in value.items() if v is not None}
+    return value
+
+
+def _as_dict(data: typing.Any, *, convert_all: bool = True) -> dict[str, typing.Any]:
+    if data is None:
+        return {}
+    if not dataclasses.is_dataclass(data):
+        raise TypeError(f"{data} must be a dataclass")
+    if convert_all:
+        result = dataclasses.asdict(data)
+    else:
+        result = {f.name: getattr(data, f.name) for f in dataclasses.fields(data)}
+    return _filter_none(result)
+
+
+def _convert_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.TransactionParametersDict:
+    return typing.cast(algokit_utils.TransactionParametersDict, _as_dict(transaction_parameters))
+
+
+def _convert_call_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.OnCompleteCallParametersDict:
+    return typing.cast(algokit_utils.OnCompleteCallParametersDict, _as_dict(transaction_parameters))
+
+
+def _convert_create_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+    on_complete: algokit_utils.OnCompleteActionName,
+) -> algokit_utils.CreateCallParametersDict:
+    result = typing.cast(algokit_utils.CreateCallParametersDict, _as_dict(transaction_parameters))
+    on_complete_enum = on_complete.replace("_", " ").title().replace(" ", "") + "OC"
+    result["on_complete"] = getattr(algosdk.transaction.OnComplete, on_complete_enum)
+    return result
+
+
+def _convert_deploy_args(
+    deploy_args: algokit_utils.DeployCallArgs | None,
+) -> algokit_utils.ABICreateCallArgsDict | None:
+    if deploy_args is None:
+        return None
+
+    deploy_args_dict = typing.cast(algokit_utils.ABICreateCallArgsDict, _as_dict(deploy_args))
+    if isinstance(deploy_args, _TArgsHolder):
+        deploy_args_dict["args"] = _as_dict(deploy_args.args)
+        deploy_args_dict["method"] = deploy_args.args.method()
+
+    return deploy_args_dict
+
+
+@dataclasses.dataclass(kw_only=True)
+class SetProgramsArgs(_ArgsBase[None]):
+    approval: bytes | bytearray
+    clear: bytes | bytearray
+
+    @staticmethod
+    def method() -> str:
+        return "set_programs(byte[],byte[])void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class AllowAssetArgs(_ArgsBase[None]):
+    mbr_pay: TransactionWithSigner
+    asset: int
+
+    @staticmethod
+    def method() -> str:
+        return "allow_asset(pay,asset)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class CreateMarketplaceArgs(_ArgsBase[int]):
+    mbr_pay: TransactionWithSigner
+    deposit: TransactionWithSigner
+    unitary_price: int
+
+    @staticmethod
+    def method() -> str:
+        return "create_marketplace(pay,axfer,uint64)uint64"
+
+
+@dataclasses.dataclass(kw_only=True)
+class SetPriceArgs(_ArgsBase[None]):
+    asset: int
+    unitary_price: int
+
+    @staticmethod
+    def method() -> str:
+        return "set_price(asset,uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class DeleteMarketplaceArgs(_ArgsBase[None]):
+    asset: int
+
+    @staticmethod
+    def method() -> str:
+        return "delete_marketplace(asset)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class SimulateOptions:
+    allow_more_logs: bool = dataclasses.field(default=False)
+    allow_empty_signatures: bool = dataclasses.field(default=False)
+    extra_opcode_budget: int = dataclasses.field(default=0)
+    exec_trace_config: models.SimulateTraceConfig | None         = dataclasses.field(default=None)
+
+
+class Composer:
+
+    def __init__(self, app_client: algokit_utils.ApplicationClient, atc: AtomicTransactionComposer):
+        self.app_client = app_client
+        self.atc = atc
+
+    def build(self) -> AtomicTransactionComposer:
+        return self.atc
+
+    def simulate(self, options: SimulateOptions | None = None) -> SimulateAtomicTransactionResponse:
+        request = models.SimulateRequest(
+            allow_more_logs=options.allow_more_logs,
+            allow_empty_signatures=options.allow_empty_signatures,
+            extra_opcode_budget=options.extra_opcode_budget,
+            exec_trace_config=options.exec_trace_config,
+            txn_groups=[]
+        ) if options else None
+        result = self.atc.simulate(self.app_client.algod_client, request)
+        return result
+
+    def execute(self) -> AtomicTransactionResponse:
+        return self.app_client.execute_atc(self.atc)
+
+    def set_programs(
+        self,
+        *,
+        approval: bytes | bytearray,
+        clear: bytes | bytearray,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `set_programs(byte[],byte[])void` ABI method
+        
+        :param bytes | bytearray approval: The `approval` ABI parameter
+        :param bytes | bytearray clear: The `clear` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = SetProgramsArgs(
+            approval=approval,
+            clear=clear,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def allow_asset(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `allow_asset(pay,asset)void` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param int asset: The `asset` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = AllowAssetArgs(
+            mbr_pay=mbr_pay,
+            asset=asset,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def create_marketplace(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        deposit: TransactionWithSigner,
+        unitary_price: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `create_marketplace(pay,axfer,uint64)uint64` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param TransactionWithSigner deposit: The `deposit` ABI parameter
+        :param int unitary_price: The `unitary_price` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = CreateMarketplaceArgs(
+            mbr_pay=mbr_pay,
+            deposit=deposit,
+            unitary_price=unitary_price,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def set_price(
+        self,
+        *,
+        asset: int,
+        unitary_price: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `set_price(asset,uint64)void` ABI method
+        
+        :param int asset: The `asset` ABI parameter
+        :param int unitary_price: The `unitary_price` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = SetPriceArgs(
+            asset=asset,
+            unitary_price=unitary_price,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def delete_marketplace(
+        self,
+        *,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `delete_marketplace(asset)void` ABI method
+        
+        :param int asset: The `asset` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = DeleteMarketplaceArgs(
+            asset=asset,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def create_bare(
+        self,
+        *,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to create an application using the no_op bare method
+        
+        :param typing.Literal[no_op] on_complete: On completion type to use
+        :param algokit_utils.CreateTransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        self.app_client.compose_create(
+            self.atc,
+            call_abi_method=False,
+            transaction_parameters=_convert_create_transaction_parameters(transaction_parameters, on_complete),
+        )
+        return self
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> "Composer":
+        """Adds a call to the application with on completion set to ClearState
+    
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass"""
+    
+        self.app_client.compose_clear_state(self.atc, _convert_transaction_parameters(transaction_parameters), app_args)
+        return self
+
+
+class MarketplaceFactoryClient:
+    """A class for interacting with the MarketplaceFactory app providing high productivity and
+    strongly typed methods to deploy and call the app"""
+
+    @typing.overload
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        app_id: int = 0,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        ...
+
+    @typing.overload
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        creator: str | algokit_utils.Account,
+        indexer_client: algosdk.v2client.indexer.IndexerClient | None = None,
+        existing_deployments: algokit_utils.AppLookup | None = None,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        ...
+
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        creator: str | algokit_utils.Account | None = None,
+        indexer_client: algosdk.v2client.indexer.IndexerClient | None = None,
+        existing_deployments: algokit_utils.AppLookup | None = None,
+        app_id: int = 0,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        """
+        MarketplaceFactoryClient can be created with an app_id to interact with an existing application, alternatively
+        it can be created with a creator and indexer_client specified to find existing applications by name and creator.
+        
+        :param AlgodClient algod_client: AlgoSDK algod client
+        :param int app_id: The app_id of an existing application, to instead find the application by creator and name
+        use the creator and indexer_client parameters
+        :param str | Account creator: The address or Account of the app creator to resolve the app_id
+        :param IndexerClient indexer_client: AlgoSDK indexer client, only required if deploying or finding app_id by
+        creator and app name
+        :param AppLookup existing_deployments:
+        :param TransactionSigner | Account signer: Account or signer to use to sign transactions, if not specified and
+        creator was passed as an Account will use that.
+        :param str sender: Address to use as the sender for all transactions, will use the address associated with the
+        signer if not specified.
+        :param TemplateValueMapping template_values: Values to use for TMPL_* template variables, dictionary keys should
+        *NOT* include the TMPL_ prefix
+        :param str | None app_name: Name of application to use when deploying, defaults to name defined on the
+        Application Specification
+            """
+
+        self.app_spec = APP_SPEC
+        
+        # calling full __init__ signature, so ignoring mypy warning about overloads
+        self.app_client = algokit_utils.ApplicationClient(  # type: ignore[call-overload, misc]
+            algod_client=algod_client,
+            app_spec=self.app_spec,
+            app_id=app_id,
+            creator=creator,
+            indexer_client=indexer_client,
+            existing_deployments=existing_deployments,
+            signer=signer,
+            sender=sender,
+            suggested_params=suggested_params,
+            template_values=template_values,
+            app_name=app_name,
+        )
+
+    @property
+    def algod_client(self) -> algosdk.v2client.algod.AlgodClient:
+        return self.app_client.algod_client
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @app_id.setter
+    def app_id(self, value: int) -> None:
+        self.app_client.app_id = value
+
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+
+    @property
+    def sender(self) -> str | None:
+        return self.app_client.sender
+
+    @sender.setter
+    def sender(self, value: str) -> None:
+        self.app_client.sender = value
+
+    @property
+    def signer(self) -> TransactionSigner | None:
+        return self.app_client.signer
+
+    @signer.setter
+    def signer(self, value: TransactionSigner) -> None:
+        self.app_client.signer = value
+
+    @property
+    def suggested_params(self) -> algosdk.transaction.SuggestedParams | None:
+        return self.app_client.suggested_params
+
+    @suggested_params.setter
+    def suggested_params(self, value: algosdk.transaction.SuggestedParams | None) -> None:
+        self.app_client.suggested_params = value
+
+    def set_programs(
+        self,
+        *,
+        approval: bytes | bytearray,
+        clear: bytes | bytearray,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `set_programs(byte[],byte[])void` ABI method
+        
+        :param bytes | bytearray approval: The `approval` ABI parameter
+        :param bytes | bytearray clear: The `clear` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = SetProgramsArgs(
+            approval=approval,
+            clear=clear,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def allow_asset(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `allow_asset(pay,asset)void` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param int asset: The `asset` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = AllowAssetArgs(
+            mbr_pay=mbr_pay,
+            asset=asset,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def create_marketplace(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        deposit: TransactionWithSigner,
+        unitary_price: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[int]:
+        """Calls `create_marketplace(pay,axfer,uint64)uint64` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param TransactionWithSigner deposit: The `deposit` ABI parameter
+        :param int unitary_price: The `unitary_price` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[int]: The result of the transaction"""
+
+        args = CreateMarketplaceArgs(
+            mbr_pay=mbr_pay,
+            deposit=deposit,
+            unitary_price=unitary_price,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def set_price(
+        self,
+        *,
+        asset: int,
+        unitary_price: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `set_price(asset,uint64)void` ABI method
+        
+        :param int asset: The `asset` ABI parameter
+        :param int unitary_price: The `unitary_price` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = SetPriceArgs(
+            asset=asset,
+            unitary_price=unitary_price,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def delete_marketplace(
+        self,
+        *,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `delete_marketplace(asset)void` ABI method
+        
+        :param int asset: The `asset` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = DeleteMarketplaceArgs(
+            asset=asset,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def create_bare(
+        self,
+        *,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Creates an application using the no_op bare method
+        
+        :param typing.Literal[no_op] on_complete: On completion type to use
+        :param algokit_utils.CreateTransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+
+        result = self.app_client.create(
+            call_abi_method=False,
+            transaction_parameters=_convert_create_transaction_parameters(transaction_parameters, on_complete),
+        )
+        return result
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Calls the application with on completion set to ClearState
+    
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+    
+        return self.app_client.clear_state(_convert_transaction_parameters(transaction_parameters), app_args)
+
+    def deploy(
+        self,
+        version: str | None = None,
+        *,
+        signer: TransactionSigner | None = None,
+        sender: str | None = None,
+        allow_update: bool | None = None,
+        allow_delete: bool | None = None,
+        on_update: algokit_utils.OnUpdate = algokit_utils.OnUpdate.Fail,
+        on_schema_break: algokit_utils.OnSchemaBreak = algokit_utils.OnSchemaBreak.Fail,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        create_args: algokit_utils.DeployCallArgs | None = None,
+        update_args: algokit_utils.DeployCallArgs | None = None,
+        delete_args: algokit_utils.DeployCallArgs | None = None,
+    ) -> algokit_utils.DeployResponse:
+        """Deploy an application and update client to reference it.
+        
+        Idempotently deploy (create, update/delete if changed) an app against the given name via the given creator
+        account, including deploy-time template placeholder substitutions.
+        To understand the architecture decisions behind this functionality please see
+        <https://github.com/algorandfoundation/algokit-cli/blob/main/docs/architecture-decisions/2023-01-12_smart-contract-deployment.md>
+        
+        ```{note}
+        If there is a breaking state schema change to an existing app (and `on_schema_break` is set to
+        'ReplaceApp' the existing app will be deleted and re-created.
+        ```
+        
+        ```{note}
+        If there is an update (different TEAL code) to an existing app (and `on_update` is set to 'ReplaceApp')
+        the existing app will be deleted and re-created.
+        ```
+        
+        :param str version: version to use when creating or updating app, if None version will be auto incremented
+        :param algosdk.atomic_transaction_composer.TransactionSigner signer: signer to use when deploying app
+        , if None uses self.signer
+        :param str sender: sender address to use when deploying app, if None uses self.sender
+        :param bool allow_delete: Used to set the `TMPL_DELETABLE` template variable to conditionally control if an app
+        can be deleted
+        :param bool allow_update: Used to set the `TMPL_UPDATABLE` template variable to conditionally control if an app
+        can be updated
+        :param OnUpdate on_update: Determines what action to take if an application update is required
+        :param OnSchemaBreak on_schema_break: Determines what action to take if an application schema requirements
+        has increased beyond the current allocation
+        :param dict[str, int|str|bytes] template_values: Values to use for `TMPL_*` template variables, dictionary keys
+        should *NOT* include the TMPL_ prefix
+        :param algokit_utils.DeployCallArgs | None create_args: Arguments used when creating an application
+        :param algokit_utils.DeployCallArgs | None update_args: Arguments used when updating an application
+        :param algokit_utils.DeployCallArgs | None delete_args: Arguments used when deleting an application
+        :return DeployResponse: details action taken and relevant transactions
+        :raises DeploymentError: If the deployment failed"""
+
+        return self.app_client.deploy(
+            version,
+            signer=signer,
+            sender=sender,
+            allow_update=allow_update,
+            allow_delete=allow_delete,
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            template_values=template_values,
+            create_args=_convert_deploy_args(create_args),
+            update_args=_convert_deploy_args(update_args),
+            delete_args=_convert_deploy_args(delete_args),
+        )
+
+    def compose(self, atc: AtomicTransactionComposer | None = None) -> Composer:
+        return Composer(self.app_client, atc or AtomicTransactionComposer())
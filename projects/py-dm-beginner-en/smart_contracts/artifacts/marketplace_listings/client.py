@@ -0,0 +1,935 @@
+# flake8: noqa
+# fmt: off
+# mypy: disable-error-code="no-any-return, no-untyped-call, misc, type-arg"
+# This file was automatically generated by algokit-client-generator.
+# DO NOT MODIFY IT BY HAND.
+# requires: algokit-utils@^1.2.0
+import base64
+import dataclasses
+import decimal
+import typing
+from abc import ABC, abstractmethod
+
+import algokit_utils
+import algosdk
+from algosdk.v2client import models
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    SimulateAtomicTransactionResponse,
+    TransactionSigner,
+    TransactionWithSigner
+)
+
+_APP_SPEC_JSON = r"""{
+    "hints": {
+        "allow_asset(pay,asset)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "list_asset(pay,axfer,uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "set_price(asset,uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "buy(account,asset,pay,uint64)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "buy_many(pay,(address,uint64,uint64)[])void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        },
+        "delist(asset)void": {
+            "call_config": {
+                "no_op": "CALL"
+            }
+        }
+    },
+    "source": {
+        "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMubWFya2V0cGxhY2VfbGlzdGluZ3MuY29udHJhY3QuTWFya2V0cGxhY2VMaXN0aW5ncy5hcHByb3ZhbF9wcm9ncmFtOgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjQzLTQ1CiAgICAvLyAjIE9uZSBhcHAgaG9zdHMgdGhlIGxpc3RpbmdzIG9mIG1hbnkgc2VsbGVycyBhbmQgbWFueSBhc3NldHMKICAgIC8vICMgSW5zdGVhZCBvZiBnbG9iYWwgc3RhdGUsIGV2ZXJ5IGxpc3RpbmcgbGl2ZXMgaW4gaXRzIG93biBib3gga2V5ZWQgYnkgKHNlbGxlciwgYXNzZXQpCiAgICAvLyBjbGFzcyBNYXJrZXRwbGFjZUxpc3RpbmdzKGFyYzQuQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxMAogICAgbWV0aG9kICJhbGxvd19hc3NldChwYXksYXNzZXQpdm9pZCIKICAgIG1ldGhvZCAibGlzdF9hc3NldChwYXksYXhmZXIsdWludDY0KXZvaWQiCiAgICBtZXRob2QgInNldF9wcmljZShhc3NldCx1aW50NjQpdm9pZCIKICAgIG1ldGhvZCAiYnV5KGFjY291bnQsYXNzZXQscGF5LHVpbnQ2NCl2b2lkIgogICAgbWV0aG9kICJidXlfbWFueShwYXksKGFkZHJlc3MsdWludDY0LHVpbnQ2NClbXSl2b2lkIgogICAgbWV0aG9kICJkZWxpc3QoYXNzZXQpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fYWxsb3dfYXNzZXRfcm91dGVAMiBtYWluX2xpc3RfYXNzZXRfcm91dGVAMyBtYWluX3NldF9wcmljZV9yb3V0ZUA0IG1haW5fYnV5X3JvdXRlQDUgbWFpbl9idXlfbWFueV9yb3V0ZUA2IG1haW5fZGVsaXN0X3JvdXRlQDcKICAgIGVyciAvLyByZWplY3QgdHJhbnNhY3Rpb24KCm1haW5fYWxsb3dfYXNzZXRfcm91dGVAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo0Ni00OAogICAgLy8gIyBCZWZvcmUgdGhlIGFwcCBjYW4gaG9sZCBhbiBhc3NldCwgaXQgbXVzdCBvcHQtaW4gdG8gaXQKICAgIC8vICMgQW55b25lIGNhbiBwYXkgZm9yIHRoZSBvcHQtaW4sIGl0IG9ubHkgbmVlZHMgdG8gaGFwcGVuIG9uY2UgcGVyIGFzc2V0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo0My00NQogICAgLy8gIyBPbmUgYXBwIGhvc3RzIHRoZSBsaXN0aW5ncyBvZiBtYW55IHNlbGxlcnMgYW5kIG1hbnkgYXNzZXRzCiAgICAvLyAjIEluc3RlYWQgb2YgZ2xvYmFsIHN0YXRlLCBldmVyeSBsaXN0aW5nIGxpdmVzIGluIGl0cyBvd24gYm94IGtleWVkIGJ5IChzZWxsZXIsIGFzc2V0KQogICAgLy8gY2xhc3MgTWFya2V0cGxhY2VMaXN0aW5ncyhhcmM0LkFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjQ2LTQ4CiAgICAvLyAjIEJlZm9yZSB0aGUgYXBwIGNhbiBob2xkIGFuIGFzc2V0LCBpdCBtdXN0IG9wdC1pbiB0byBpdAogICAgLy8gIyBBbnlvbmUgY2FuIHBheSBmb3IgdGhlIG9wdC1pbiwgaXQgb25seSBuZWVkcyB0byBoYXBwZW4gb25jZSBwZXIgYXNzZXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBhbGxvd19hc3NldAogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9saXN0X2Fzc2V0X3JvdXRlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6NjEtNjMKICAgIC8vICMgQSBzZWxsZXIgbGlzdHMgYW4gYXNzZXQgYnkgZGVwb3NpdGluZyBpdCBhbmQgcGF5aW5nIGZvciB0aGUgYm94IHRoYXQgc3RvcmVzIHRoZSBsaXN0aW5nCiAgICAvLyAjIE5vdCBuYW1lZCAibGlzdCIsIHRoZSBnZW5lcmF0ZWQgY2xpZW50IHdvdWxkIHNoYWRvdyB0aGUgYnVpbHRpbiB3aXRoIGl0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo0My00NQogICAgLy8gIyBPbmUgYXBwIGhvc3RzIHRoZSBsaXN0aW5ncyBvZiBtYW55IHNlbGxlcnMgYW5kIG1hbnkgYXNzZXRzCiAgICAvLyAjIEluc3RlYWQgb2YgZ2xvYmFsIHN0YXRlLCBldmVyeSBsaXN0aW5nIGxpdmVzIGluIGl0cyBvd24gYm94IGtleWVkIGJ5IChzZWxsZXIsIGFzc2V0KQogICAgLy8gY2xhc3MgTWFya2V0cGxhY2VMaXN0aW5ncyhhcmM0LkFSQzRDb250cmFjdCk6CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDIKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnQgMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50IGF4ZmVyCiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgYXhmZXIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo2MS02MwogICAgLy8gIyBBIHNlbGxlciBsaXN0cyBhbiBhc3NldCBieSBkZXBvc2l0aW5nIGl0IGFuZCBwYXlpbmcgZm9yIHRoZSBib3ggdGhhdCBzdG9yZXMgdGhlIGxpc3RpbmcKICAgIC8vICMgTm90IG5hbWVkICJsaXN0IiwgdGhlIGdlbmVyYXRlZCBjbGllbnQgd291bGQgc2hhZG93IHRoZSBidWlsdGluIHdpdGggaXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBsaXN0X2Fzc2V0CiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3NldF9wcmljZV9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjkxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo0My00NQogICAgLy8gIyBPbmUgYXBwIGhvc3RzIHRoZSBsaXN0aW5ncyBvZiBtYW55IHNlbGxlcnMgYW5kIG1hbnkgYXNzZXRzCiAgICAvLyAjIEluc3RlYWQgb2YgZ2xvYmFsIHN0YXRlLCBldmVyeSBsaXN0aW5nIGxpdmVzIGluIGl0cyBvd24gYm94IGtleWVkIGJ5IChzZWxsZXIsIGFzc2V0KQogICAgLy8gY2xhc3MgTWFya2V0cGxhY2VMaXN0aW5ncyhhcmM0LkFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo5MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIHNldF9wcmljZQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9idXlfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxMDcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjQzLTQ1CiAgICAvLyAjIE9uZSBhcHAgaG9zdHMgdGhlIGxpc3RpbmdzIG9mIG1hbnkgc2VsbGVycyBhbmQgbWFueSBhc3NldHMKICAgIC8vICMgSW5zdGVhZCBvZiBnbG9iYWwgc3RhdGUsIGV2ZXJ5IGxpc3RpbmcgbGl2ZXMgaW4gaXRzIG93biBib3gga2V5ZWQgYnkgKHNlbGxlciwgYXNzZXQpCiAgICAvLyBjbGFzcyBNYXJrZXRwbGFjZUxpc3RpbmdzKGFyYzQuQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnQgMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50IHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjEwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBjYWxsc3ViIGJ1eQogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9idXlfbWFueV9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjEyMC0xMjIKICAgIC8vICMgQnV5cyBhIHdob2xlIGNhcnQgd2l0aCBhIHNpbmdsZSBwYXltZW50IHRvIHRoZSBhcHAKICAgIC8vICMgVGhlIGFwcCBmb3J3YXJkcyBlYWNoIHNlbGxlcidzIHNoYXJlIHdpdGggYW4gaW5uZXIgcGF5bWVudAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6NDMtNDUKICAgIC8vICMgT25lIGFwcCBob3N0cyB0aGUgbGlzdGluZ3Mgb2YgbWFueSBzZWxsZXJzIGFuZCBtYW55IGFzc2V0cwogICAgLy8gIyBJbnN0ZWFkIG9mIGdsb2JhbCBzdGF0ZSwgZXZlcnkgbGlzdGluZyBsaXZlcyBpbiBpdHMgb3duIGJveCBrZXllZCBieSAoc2VsbGVyLCBhc3NldCkKICAgIC8vIGNsYXNzIE1hcmtldHBsYWNlTGlzdGluZ3MoYXJjNC5BUkM0Q29udHJhY3QpOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTIwLTEyMgogICAgLy8gIyBCdXlzIGEgd2hvbGUgY2FydCB3aXRoIGEgc2luZ2xlIHBheW1lbnQgdG8gdGhlIGFwcAogICAgLy8gIyBUaGUgYXBwIGZvcndhcmRzIGVhY2ggc2VsbGVyJ3Mgc2hhcmUgd2l0aCBhbiBpbm5lciBwYXltZW50CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGNhbGxzdWIgYnV5X21hbnkKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZGVsaXN0X3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTY5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo0My00NQogICAgLy8gIyBPbmUgYXBwIGhvc3RzIHRoZSBsaXN0aW5ncyBvZiBtYW55IHNlbGxlcnMgYW5kIG1hbnkgYXNzZXRzCiAgICAvLyAjIEluc3RlYWQgb2YgZ2xvYmFsIHN0YXRlLCBldmVyeSBsaXN0aW5nIGxpdmVzIGluIGl0cyBvd24gYm94IGtleWVkIGJ5IChzZWxsZXIsIGFzc2V0KQogICAgLy8gY2xhc3MgTWFya2V0cGxhY2VMaXN0aW5ncyhhcmM0LkFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxNjkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgY2FsbHN1YiBkZWxpc3QKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjQzLTQ1CiAgICAvLyAjIE9uZSBhcHAgaG9zdHMgdGhlIGxpc3RpbmdzIG9mIG1hbnkgc2VsbGVycyBhbmQgbWFueSBhc3NldHMKICAgIC8vICMgSW5zdGVhZCBvZiBnbG9iYWwgc3RhdGUsIGV2ZXJ5IGxpc3RpbmcgbGl2ZXMgaW4gaXRzIG93biBib3gga2V5ZWQgYnkgKHNlbGxlciwgYXNzZXQpCiAgICAvLyBjbGFzcyBNYXJrZXRwbGFjZUxpc3RpbmdzKGFyYzQuQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyByZWplY3QgdHJhbnNhY3Rpb24KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gaXMgY3JlYXRpbmcKICAgIGludCAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMubWFya2V0cGxhY2VfbGlzdGluZ3MuY29udHJhY3QuTWFya2V0cGxhY2VMaXN0aW5ncy5hbGxvd19hc3NldChtYnJfcGF5OiB1aW50NjQsIGFzc2V0OiB1aW50NjQpIC0+IHZvaWQ6CmFsbG93X2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjQ2LTQ5CiAgICAvLyAjIEJlZm9yZSB0aGUgYXBwIGNhbiBob2xkIGFuIGFzc2V0LCBpdCBtdXN0IG9wdC1pbiB0byBpdAogICAgLy8gIyBBbnlvbmUgY2FuIHBheSBmb3IgdGhlIG9wdC1pbiwgaXQgb25seSBuZWVkcyB0byBoYXBwZW4gb25jZSBwZXIgYXNzZXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGFsbG93X2Fzc2V0KHNlbGYsIG1icl9wYXk6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLCBhc3NldDogQXNzZXQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo1MAogICAgLy8gYXNzZXJ0IG5vdCBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLmlzX29wdGVkX2luKGFzc2V0KQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjUyCiAgICAvLyBhc3NlcnQgbWJyX3BheS5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjUzCiAgICAvLyBhc3NlcnQgbWJyX3BheS5hbW91bnQgPT0gR2xvYmFsLmFzc2V0X29wdF9pbl9taW5fYmFsYW5jZQogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBBbW91bnQKICAgIGdsb2JhbCBBc3NldE9wdEluTWluQmFsYW5jZQogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjU1LTU5CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjU3CiAgICAvLyBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo1OAogICAgLy8gYXNzZXRfYW1vdW50PTAsCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6NTUKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludCBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjU1LTU5CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5tYXJrZXRwbGFjZV9saXN0aW5ncy5jb250cmFjdC5NYXJrZXRwbGFjZUxpc3RpbmdzLmxpc3RfYXNzZXQobWJyX3BheTogdWludDY0LCB4ZmVyOiB1aW50NjQsIHVuaXRhcnlfcHJpY2U6IHVpbnQ2NCkgLT4gdm9pZDoKbGlzdF9hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo2MS02OQogICAgLy8gIyBBIHNlbGxlciBsaXN0cyBhbiBhc3NldCBieSBkZXBvc2l0aW5nIGl0IGFuZCBwYXlpbmcgZm9yIHRoZSBib3ggdGhhdCBzdG9yZXMgdGhlIGxpc3RpbmcKICAgIC8vICMgTm90IG5hbWVkICJsaXN0IiwgdGhlIGdlbmVyYXRlZCBjbGllbnQgd291bGQgc2hhZG93IHRoZSBidWlsdGluIHdpdGggaXQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGxpc3RfYXNzZXQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBtYnJfcGF5OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICAgICB4ZmVyOiBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbiwKICAgIC8vICAgICB1bml0YXJ5X3ByaWNlOiBVSW50NjQsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo3MAogICAgLy8ga2V5ID0gbGlzdGluZ19rZXkoVHhuLnNlbmRlciwgeGZlci54ZmVyX2Fzc2V0KQogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBYZmVyQXNzZXQKICAgIGNhbGxzdWIgbGlzdGluZ19rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo3MS03MgogICAgLy8gIyBBIHNlbGxlciBjYW4gb25seSBoYXZlIG9uZSBsaXN0aW5nIHBlciBhc3NldAogICAgLy8gX3ZhbHVlLCBleGlzdHMgPSBvcC5Cb3guZ2V0KGtleSkKICAgIGR1cAogICAgYm94X2dldAogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6NzMKICAgIC8vIGFzc2VydCBub3QgZXhpc3RzCiAgICAhCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo3NQogICAgLy8gYXNzZXJ0IG1icl9wYXkuc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6NzYKICAgIC8vIGFzc2VydCBtYnJfcGF5LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6NzcKICAgIC8vIGFzc2VydCBtYnJfcGF5LmFtb3VudCA9PSBMSVNUSU5HX0JPWF9NQlIKICAgIGZyYW1lX2RpZyAtMwogICAgZ3R4bnMgQW1vdW50CiAgICBpbnQgMjQ5MDAKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo3OQogICAgLy8gYXNzZXJ0IHhmZXIuc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6ODAKICAgIC8vIGFzc2VydCB4ZmVyLmFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgQXNzZXRSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo4MQogICAgLy8gYXNzZXJ0IHhmZXIuYXNzZXRfYW1vdW50ID4gMAogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBBc3NldEFtb3VudAogICAgZHVwCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo4NgogICAgLy8gcXVhbnRpdHk9YXJjNC5VSW50NjQoeGZlci5hc3NldF9hbW91bnQpLAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5Ojg3CiAgICAvLyB1bml0YXJ5X3ByaWNlPWFyYzQuVUludDY0KHVuaXRhcnlfcHJpY2UpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6ODUtODgKICAgIC8vIExpc3RpbmcoCiAgICAvLyAgICAgcXVhbnRpdHk9YXJjNC5VSW50NjQoeGZlci5hc3NldF9hbW91bnQpLAogICAgLy8gICAgIHVuaXRhcnlfcHJpY2U9YXJjNC5VSW50NjQodW5pdGFyeV9wcmljZSksCiAgICAvLyApLmJ5dGVzLAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6ODMtODkKICAgIC8vIG9wLkJveC5wdXQoCiAgICAvLyAgICAga2V5LAogICAgLy8gICAgIExpc3RpbmcoCiAgICAvLyAgICAgICAgIHF1YW50aXR5PWFyYzQuVUludDY0KHhmZXIuYXNzZXRfYW1vdW50KSwKICAgIC8vICAgICAgICAgdW5pdGFyeV9wcmljZT1hcmM0LlVJbnQ2NCh1bml0YXJ5X3ByaWNlKSwKICAgIC8vICAgICApLmJ5dGVzLAogICAgLy8gKQogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLm1hcmtldHBsYWNlX2xpc3RpbmdzLmNvbnRyYWN0Lmxpc3Rpbmdfa2V5KHNlbGxlcjogYnl0ZXMsIGFzc2V0OiB1aW50NjQpIC0+IGJ5dGVzOgpsaXN0aW5nX2tleToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTozOC0zOQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBsaXN0aW5nX2tleShzZWxsZXI6IEFjY291bnQsIGFzc2V0OiBBc3NldCkgLT4gQnl0ZXM6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo0MAogICAgLy8gcmV0dXJuIHNlbGxlci5ieXRlcyArIG9wLml0b2IoYXNzZXQuaWQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMubWFya2V0cGxhY2VfbGlzdGluZ3MuY29udHJhY3QuTWFya2V0cGxhY2VMaXN0aW5ncy5zZXRfcHJpY2UoYXNzZXQ6IHVpbnQ2NCwgdW5pdGFyeV9wcmljZTogdWludDY0KSAtPiB2b2lkOgpzZXRfcHJpY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6OTEtOTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIHNldF9wcmljZShzZWxmLCBhc3NldDogQXNzZXQsIHVuaXRhcnlfcHJpY2U6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjkzLTk0CiAgICAvLyAjIFRoZSBrZXkgaXMgZGVyaXZlZCBmcm9tIHRoZSBzZW5kZXIsIHNvIHNlbGxlcnMgY2FuIG9ubHkgY2hhbmdlIHRoZWlyIG93biBwcmljZQogICAgLy8ga2V5ID0gbGlzdGluZ19rZXkoVHhuLnNlbmRlciwgYXNzZXQpCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgbGlzdGluZ19rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weTo5NQogICAgLy8gdmFsdWUsIGV4aXN0cyA9IG9wLkJveC5nZXQoa2V5KQogICAgZHVwCiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6OTYKICAgIC8vIGFzc2VydCBleGlzdHMKICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gcXVhbnRpdHk9bGlzdGluZy5xdWFudGl0eSwKICAgIGV4dHJhY3QgMCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTAzCiAgICAvLyB1bml0YXJ5X3ByaWNlPWFyYzQuVUludDY0KHVuaXRhcnlfcHJpY2UpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTAxLTEwNAogICAgLy8gTGlzdGluZygKICAgIC8vICAgICBxdWFudGl0eT1saXN0aW5nLnF1YW50aXR5LAogICAgLy8gICAgIHVuaXRhcnlfcHJpY2U9YXJjNC5VSW50NjQodW5pdGFyeV9wcmljZSksCiAgICAvLyApLmJ5dGVzLAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6OTktMTA1CiAgICAvLyBvcC5Cb3gucHV0KAogICAgLy8gICAgIGtleSwKICAgIC8vICAgICBMaXN0aW5nKAogICAgLy8gICAgICAgICBxdWFudGl0eT1saXN0aW5nLnF1YW50aXR5LAogICAgLy8gICAgICAgICB1bml0YXJ5X3ByaWNlPWFyYzQuVUludDY0KHVuaXRhcnlfcHJpY2UpLAogICAgLy8gICAgICkuYnl0ZXMsCiAgICAvLyApCiAgICBib3hfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMubWFya2V0cGxhY2VfbGlzdGluZ3MuY29udHJhY3QuTWFya2V0cGxhY2VMaXN0aW5ncy5idXkoc2VsbGVyOiBieXRlcywgYXNzZXQ6IHVpbnQ2NCwgYnV5ZXJfdHhuOiB1aW50NjQsIHF1YW50aXR5OiB1aW50NjQpIC0+IHZvaWQ6CmJ1eToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxMDctMTE1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIC8vIGRlZiBidXkoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBzZWxsZXI6IEFjY291bnQsCiAgICAvLyAgICAgYXNzZXQ6IEFzc2V0LAogICAgLy8gICAgICMgVGhlIHBheW1lbnQgZ29lcyBzdHJhaWdodCB0byB0aGUgc2VsbGVyLCB0aGUgYXBwIG5ldmVyIGhvbGRzIHNhbGUgcHJvY2VlZHMKICAgIC8vICAgICBidXllcl90eG46IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLAogICAgLy8gICAgIHF1YW50aXR5OiBVSW50NjQsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA0IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxMTYKICAgIC8vIGFzc2VydCBidXllcl90eG4uc2VuZGVyID09IFR4bi5zZW5kZXIKICAgIGZyYW1lX2RpZyAtMgogICAgZ3R4bnMgU2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTE3CiAgICAvLyBhc3NlcnQgYnV5ZXJfdHhuLnJlY2VpdmVyID09IHNlbGxlcgogICAgZnJhbWVfZGlnIC0yCiAgICBndHhucyBSZWNlaXZlcgogICAgZnJhbWVfZGlnIC00CiAgICA9PQogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTE4CiAgICAvLyBhc3NlcnQgYnV5ZXJfdHhuLmFtb3VudCA9PSBzZWxmLnNlbGwoc2VsbGVyLCBhc3NldCwgcXVhbnRpdHkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIEFtb3VudAogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBzZWxsCiAgICA9PQogICAgYXNzZXJ0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMubWFya2V0cGxhY2VfbGlzdGluZ3MuY29udHJhY3QuTWFya2V0cGxhY2VMaXN0aW5ncy5zZWxsKHNlbGxlcjogYnl0ZXMsIGFzc2V0OiB1aW50NjQsIHF1YW50aXR5OiB1aW50NjQpIC0+IHVpbnQ2NDoKc2VsbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxNDMtMTQ2CiAgICAvLyAjIFRha2VzIHF1YW50aXR5IHVuaXRzIG91dCBvZiBhIGxpc3RpbmcgYW5kIHNlbmRzIHRoZW0gdG8gdGhlIGJ1eWVyCiAgICAvLyAjIFJldHVybnMgaG93IG11Y2ggdGhlIGJ1eWVyIG93ZXMgdGhlIHNlbGxlciBmb3IgdGhlbQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBzZWxsKHNlbGYsIHNlbGxlcjogQWNjb3VudCwgYXNzZXQ6IEFzc2V0LCBxdWFudGl0eTogVUludDY0KSAtPiBVSW50NjQ6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxNDcKICAgIC8vIGtleSA9IGxpc3Rpbmdfa2V5KHNlbGxlciwgYXNzZXQpCiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBsaXN0aW5nX2tleQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjE0OAogICAgLy8gdmFsdWUsIGV4aXN0cyA9IG9wLkJveC5nZXQoa2V5KQogICAgZHVwCiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTQ5CiAgICAvLyBhc3NlcnQgZXhpc3RzCiAgICBhc3NlcnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxNTYKICAgIC8vIHF1YW50aXR5PWFyYzQuVUludDY0KGxpc3RpbmcucXVhbnRpdHkubmF0aXZlIC0gcXVhbnRpdHkpLAogICAgZHVwCiAgICBleHRyYWN0IDAgOAogICAgYnRvaQogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTU3CiAgICAvLyB1bml0YXJ5X3ByaWNlPWxpc3RpbmcudW5pdGFyeV9wcmljZSwKICAgIHN3YXAKICAgIGV4dHJhY3QgOCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTU1LTE1OAogICAgLy8gTGlzdGluZygKICAgIC8vICAgICBxdWFudGl0eT1hcmM0LlVJbnQ2NChsaXN0aW5nLnF1YW50aXR5Lm5hdGl2ZSAtIHF1YW50aXR5KSwKICAgIC8vICAgICB1bml0YXJ5X3ByaWNlPWxpc3RpbmcudW5pdGFyeV9wcmljZSwKICAgIC8vICkuYnl0ZXMsCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjE1Mi0xNTkKICAgIC8vICMgRmFpbHMgaWYgdGhlIGJ1eWVyIGFza3MgZm9yIG1vcmUgdW5pdHMgdGhhbiBhcmUgbGVmdAogICAgLy8gb3AuQm94LnB1dCgKICAgIC8vICAgICBrZXksCiAgICAvLyAgICAgTGlzdGluZygKICAgIC8vICAgICAgICAgcXVhbnRpdHk9YXJjNC5VSW50NjQobGlzdGluZy5xdWFudGl0eS5uYXRpdmUgLSBxdWFudGl0eSksCiAgICAvLyAgICAgICAgIHVuaXRhcnlfcHJpY2U9bGlzdGluZy51bml0YXJ5X3ByaWNlLAogICAgLy8gICAgICkuYnl0ZXMsCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxNjEtMTY1CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1xdWFudGl0eSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxNjMKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjE2MQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTYxLTE2NQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9YXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9cXVhbnRpdHksCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjE2NwogICAgLy8gcmV0dXJuIGxpc3RpbmcudW5pdGFyeV9wcmljZS5uYXRpdmUgKiBxdWFudGl0eQogICAgYnRvaQogICAgZnJhbWVfZGlnIC0xCiAgICAqCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMubWFya2V0cGxhY2VfbGlzdGluZ3MuY29udHJhY3QuTWFya2V0cGxhY2VMaXN0aW5ncy5idXlfbWFueShidXllcl90eG46IHVpbnQ2NCwgaXRlbXM6IGJ5dGVzKSAtPiB2b2lkOgpidXlfbWFueToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxMjAtMTI3CiAgICAvLyAjIEJ1eXMgYSB3aG9sZSBjYXJ0IHdpdGggYSBzaW5nbGUgcGF5bWVudCB0byB0aGUgYXBwCiAgICAvLyAjIFRoZSBhcHAgZm9yd2FyZHMgZWFjaCBzZWxsZXIncyBzaGFyZSB3aXRoIGFuIGlubmVyIHBheW1lbnQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgLy8gZGVmIGJ1eV9tYW55KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgYnV5ZXJfdHhuOiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwKICAgIC8vICAgICBpdGVtczogYXJjNC5EeW5hbWljQXJyYXlbQ2FydEl0ZW1dLAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICBieXRlICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTI4CiAgICAvLyBhc3NlcnQgYnV5ZXJfdHhuLnNlbmRlciA9PSBUeG4uc2VuZGVyCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFNlbmRlcgogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjEyOQogICAgLy8gYXNzZXJ0IGJ1eWVyX3R4bi5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gdG90YWwgPSBVSW50NjQoMCkKICAgIGludCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTMyLTEzMwogICAgLy8gIyBBIHN0cnVjdCBpcyBtdXRhYmxlLCBzbyB0aGUgY2FydCBpcyByZWFkIGJ5IGluZGV4IGluc3RlYWQgb2YgaXRlcmF0ZWQKICAgIC8vIGZvciBpbmRleCBpbiB1cmFuZ2UoaXRlbXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnQgMAoKYnV5X21hbnlfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjEzMi0xMzMKICAgIC8vICMgQSBzdHJ1Y3QgaXMgbXV0YWJsZSwgc28gdGhlIGNhcnQgaXMgcmVhZCBieSBpbmRleCBpbnN0ZWFkIG9mIGl0ZXJhdGVkCiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKGl0ZW1zLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDIKICAgIDwKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBieiBidXlfbWFueV9hZnRlcl9mb3JANgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjEzNAogICAgLy8gaXRlbSA9IGl0ZW1zW2luZGV4XS5jb3B5KCkKICAgIGZyYW1lX2RpZyAwCiAgICBhc3NlcnQgLy8gSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludCA0OAogICAgKgogICAgaW50IDQ4CiAgICBleHRyYWN0MwogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjEzNQogICAgLy8gc2VsbGVyID0gQWNjb3VudChpdGVtLnNlbGxlci5ieXRlcykKICAgIGR1cAogICAgZXh0cmFjdCAwIDMyCiAgICBkdXAKICAgIGxlbgogICAgaW50IDMyCiAgICA9PQogICAgYXNzZXJ0IC8vIEFkZHJlc3MgbGVuZ3RoIGlzIDMyIGJ5dGVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTM2CiAgICAvLyBhbW91bnQgPSBzZWxmLnNlbGwoc2VsbGVyLCBBc3NldChpdGVtLmFzc2V0Lm5hdGl2ZSksIGl0ZW0ucXVhbnRpdHkubmF0aXZlKQogICAgZGlnIDEKICAgIGV4dHJhY3QgMzIgOAogICAgYnRvaQogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBleHRyYWN0IDQwIDgKICAgIGJ0b2kKICAgIGRpZyAxCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBzZWxsCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTM3CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9c2VsbGVyLCBhbW91bnQ9YW1vdW50KS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgc3dhcAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50IHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxMzgKICAgIC8vIHRvdGFsICs9IGFtb3VudAogICAgZnJhbWVfZGlnIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjEzMi0xMzMKICAgIC8vICMgQSBzdHJ1Y3QgaXMgbXV0YWJsZSwgc28gdGhlIGNhcnQgaXMgcmVhZCBieSBpbmRleCBpbnN0ZWFkIG9mIGl0ZXJhdGVkCiAgICAvLyBmb3IgaW5kZXggaW4gdXJhbmdlKGl0ZW1zLmxlbmd0aCk6CiAgICBpbnQgMQogICAgKwogICAgZnJhbWVfYnVyeSAzCiAgICBiIGJ1eV9tYW55X2Zvcl9oZWFkZXJAMQoKYnV5X21hbnlfYWZ0ZXJfZm9yQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTQwLTE0MQogICAgLy8gIyBUaGUgY2FydCBtdXN0IGJlIHBhaWQgZXhhY3RseSwgbm90aGluZyBtb3JlLCBub3RoaW5nIGxlc3MKICAgIC8vIGFzc2VydCBidXllcl90eG4uYW1vdW50ID09IHRvdGFsCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIEFtb3VudAogICAgZnJhbWVfZGlnIDEKICAgID09CiAgICBhc3NlcnQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5tYXJrZXRwbGFjZV9saXN0aW5ncy5jb250cmFjdC5NYXJrZXRwbGFjZUxpc3RpbmdzLmRlbGlzdChhc3NldDogdWludDY0KSAtPiB2b2lkOgpkZWxpc3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTY5LTE3MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICAvLyBkZWYgZGVsaXN0KHNlbGYsIGFzc2V0OiBBc3NldCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjE3MQogICAgLy8ga2V5ID0gbGlzdGluZ19rZXkoVHhuLnNlbmRlciwgYXNzZXQpCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgbGlzdGluZ19rZXkKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjE3MgogICAgLy8gdmFsdWUsIGV4aXN0cyA9IG9wLkJveC5nZXQoa2V5KQogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjE3MwogICAgLy8gYXNzZXJ0IGV4aXN0cwogICAgYXNzZXJ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTc2LTE3NwogICAgLy8gIyBTZW5kIHRoZSB1bnNvbGQgdW5pdHMgYmFjayB0byB0aGUgc2VsbGVyCiAgICAvLyBpZiBsaXN0aW5nLnF1YW50aXR5Lm5hdGl2ZToKICAgIGV4dHJhY3QgMCA4CiAgICBidG9pCiAgICBkdXAKICAgIGJ6IGRlbGlzdF9hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxNzgtMTgyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1saXN0aW5nLnF1YW50aXR5Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxODAKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgMQogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTc4CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxNzgtMTgyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1saXN0aW5nLnF1YW50aXR5Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CgpkZWxpc3RfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjE4NC0xODYKICAgIC8vICMgRGVsZXRpbmcgdGhlIGJveCB1bmxvY2tzIGl0cyBNQlIsIHNvIHdlIHJlZnVuZCBpdCB0byB0aGUgc2VsbGVyCiAgICAvLyAjIFRoZSByZXN1bHQgaXMgYXNzaWduZWQsIHB1eWFweSAwLjcgY2FuJ3QgY29tcGlsZSBhIGRpc2NhcmRlZCBib3hfZGVsCiAgICAvLyBfZGVsZXRlZCA9IG9wLkJveC5kZWxldGUoa2V5KQogICAgZnJhbWVfZGlnIDAKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjE4Ny0xOTAKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFtb3VudD1MSVNUSU5HX0JPWF9NQlIsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvbWFya2V0cGxhY2VfbGlzdGluZ3MvY29udHJhY3QucHk6MTg4CiAgICAvLyByZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjE4OQogICAgLy8gYW1vdW50PUxJU1RJTkdfQk9YX01CUiwKICAgIGludCAyNDkwMAogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxODcKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludCBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9tYXJrZXRwbGFjZV9saXN0aW5ncy9jb250cmFjdC5weToxODctMTkwCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhbW91bnQ9TElTVElOR19CT1hfTUJSLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1Ygo=",
+        "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMubWFya2V0cGxhY2VfbGlzdGluZ3MuY29udHJhY3QuTWFya2V0cGxhY2VMaXN0aW5ncy5jbGVhcl9zdGF0ZV9wcm9ncmFtOgogICAgLy8gc21hcnRfY29udHJhY3RzL21hcmtldHBsYWNlX2xpc3RpbmdzL2NvbnRyYWN0LnB5OjQzLTQ1CiAgICAvLyAjIE9uZSBhcHAgaG9zdHMgdGhlIGxpc3RpbmdzIG9mIG1hbnkgc2VsbGVycyBhbmQgbWFueSBhc3NldHMKICAgIC8vICMgSW5zdGVhZCBvZiBnbG9iYWwgc3RhdGUsIGV2ZXJ5IGxpc3RpbmcgbGl2ZXMgaW4gaXRzIG93biBib3gga2V5ZWQgYnkgKHNlbGxlciwgYXNzZXQpCiAgICAvLyBjbGFzcyBNYXJrZXRwbGFjZUxpc3RpbmdzKGFyYzQuQVJDNENvbnRyYWN0KToKICAgIGludCAxCiAgICByZXR1cm4K"
+    },
+    "state": {
+        "global": {
+            "num_byte_slices": 0,
+            "num_uints": 0
+        },
+        "local": {
+            "num_byte_slices": 0,
+            "num_uints": 0
+        }
+    },
+    "schema": {
+        "global": {
+            "declared": {},
+            "reserved": {}
+        },
+        "local": {
+            "declared": {},
+            "reserved": {}
+        }
+    },
+    "contract": {
+        "name": "MarketplaceListings",
+        "methods": [
+            {
+                "name": "allow_asset",
+                "args": [
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    },
+                    {
+                        "type": "asset",
+                        "name": "asset"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "list_asset",
+                "args": [
+                    {
+                        "type": "pay",
+                        "name": "mbr_pay"
+                    },
+                    {
+                        "type": "axfer",
+                        "name": "xfer"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "unitary_price"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "set_price",
+                "args": [
+                    {
+                        "type": "asset",
+                        "name": "asset"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "unitary_price"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "buy",
+                "args": [
+                    {
+                        "type": "account",
+                        "name": "seller"
+                    },
+                    {
+                        "type": "asset",
+                        "name": "asset"
+                    },
+                    {
+                        "type": "pay",
+                        "name": "buyer_txn"
+                    },
+                    {
+                        "type": "uint64",
+                        "name": "quantity"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "buy_many",
+                "args": [
+                    {
+                        "type": "pay",
+                        "name": "buyer_txn"
+                    },
+                    {
+                        "type": "(address,uint64,uint64)[]",
+                        "name": "items"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            },
+            {
+                "name": "delist",
+                "args": [
+                    {
+                        "type": "asset",
+                        "name": "asset"
+                    }
+                ],
+                "returns": {
+                    "type": "void"
+                }
+            }
+        ],
+        "networks": {}
+    },
+    "bare_call_config": {
+        "no_op": "CREATE"
+    }
+}"""
+APP_SPEC = algokit_utils.ApplicationSpecification.from_json(_APP_SPEC_JSON)
+_TReturn = typing.TypeVar("_TReturn")
+
+
+class _ArgsBase(ABC, typing.Generic[_TReturn]):
+    @staticmethod
+    @abstractmethod
+    def method() -> str:
+        ...
+
+
+_TArgs = typing.TypeVar("_TArgs", bound=_ArgsBase[typing.Any])
+
+
+@dataclasses.dataclass(kw_only=True)
+class _TArgsHolder(typing.Generic[_TArgs]):
+    args: _TArgs
+
+
+def _filter_none(value: dict | typing.Any) -> dict | typing.Any:
+    if isinstance(value, dict):
+        return {k: _filter_none(v) for k, v in value.items() if v is not None}
+    return value
+
+
+def _as_dict(data: typing.Any, *, convert_all: bool = True) -> dict[str, typing.Any]:
+    if data is None:
+        return {}
+    if not dataclasses.is_dataclass(data):
+        raise TypeError(f"{data} must be a dataclass")
+    if convert_all:
+        result = dataclasses.asdict(data)
+    else:
+        result = {f.name: getattr(data, f.name) for f in dataclasses.fields(data)}
+    return _filter_none(result)
+
+
+def _convert_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.TransactionParametersDict:
+    return typing.cast(algokit_utils.TransactionParametersDict, _as_dict(transaction_parameters))
+
+
+def _convert_call_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.OnCompleteCallParametersDict:
+    return typing.cast(algokit_utils.OnCompleteCallParametersDict, _as_dict(transaction_parameters))
+
+
+def _convert_create_transaction_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+    on_complete: algokit_utils.OnCompleteActionName,
+) -> algokit_utils.CreateCallParametersDict:
+    result = typing.cast(algokit_utils.CreateCallParametersDict, _as_dict(transaction_parameters))
+    on_complete_enum = on_complete.replace("_", " ").title().replace(" ", "") + "OC"
+    result["on_complete"] = getattr(algosdk.transaction.OnComplete, on_complete_enum)
+    return result
+
+
+def _convert_deploy_args(
+    deploy_args: algokit_utils.DeployCallArgs | None,
+) -> algokit_utils.ABICreateCallArgsDict | None:
+    if deploy_args is None:
+        return None
+
+    deploy_args_dict = typing.cast(algokit_utils.ABICreateCallArgsDict, _as_dict(deploy_args))
+    if isinstance(deploy_args, _TArgsHolder):
+        deploy_args_dict["args"] = _as_dict(deploy_args.args)
+        deploy_args_dict["method"] = deploy_args.args.method()
+
+    return deploy_args_dict
+
+
+@dataclasses.dataclass(kw_only=True)
+class AllowAssetArgs(_ArgsBase[None]):
+    mbr_pay: TransactionWithSigner
+    asset: int
+
+    @staticmethod
+    def method() -> str:
+        return "allow_asset(pay,asset)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class ListAssetArgs(_ArgsBase[None]):
+    mbr_pay: TransactionWithSigner
+    xfer: TransactionWithSigner
+    unitary_price: int
+
+    @staticmethod
+    def method() -> str:
+        return "list_asset(pay,axfer,uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class SetPriceArgs(_ArgsBase[None]):
+    asset: int
+    unitary_price: int
+
+    @staticmethod
+    def method() -> str:
+        return "set_price(asset,uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class BuyArgs(_ArgsBase[None]):
+    seller: str | bytes
+    asset: int
+    buyer_txn: TransactionWithSigner
+    quantity: int
+
+    @staticmethod
+    def method() -> str:
+        return "buy(account,asset,pay,uint64)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class BuyManyArgs(_ArgsBase[None]):
+    buyer_txn: TransactionWithSigner
+    items: list[tuple[str, int, int]]
+
+    @staticmethod
+    def method() -> str:
+        return "buy_many(pay,(address,uint64,uint64)[])void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class DelistArgs(_ArgsBase[None]):
+    asset: int
+
+    @staticmethod
+    def method() -> str:
+        return "delist(asset)void"
+
+
+@dataclasses.dataclass(kw_only=True)
+class SimulateOptions:
+    allow_more_logs: bool = dataclasses.field(default=False)
+    allow_empty_signatures: bool = dataclasses.field(default=False)
+    extra_opcode_budget: int = dataclasses.field(default=0)
+    exec_trace_config: models.SimulateTraceConfig | None         = dataclasses.field(default=None)
+
+
+class Composer:
+
+    def __init__(self, app_client: algokit_utils.ApplicationClient, atc: AtomicTransactionComposer):
+        self.app_client = app_client
+        self.atc = atc
+
+    def build(self) -> AtomicTransactionComposer:
+        return self.atc
+
+    def simulate(self, options: SimulateOptions | None = None) -> SimulateAtomicTransactionResponse:
+        request = models.SimulateRequest(
+            allow_more_logs=options.allow_more_logs,
+            allow_empty_signatures=options.allow_empty_signatures,
+            extra_opcode_budget=options.extra_opcode_budget,
+            exec_trace_config=options.exec_trace_config,
+            txn_groups=[]
+        ) if options else None
+        result = self.atc.simulate(self.app_client.algod_client, request)
+        return result
+
+    def execute(self) -> AtomicTransactionResponse:
+        return self.app_client.execute_atc(self.atc)
+
+    def allow_asset(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `allow_asset(pay,asset)void` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param int asset: The `asset` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = AllowAssetArgs(
+            mbr_pay=mbr_pay,
+            asset=asset,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def list_asset(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        xfer: TransactionWithSigner,
+        unitary_price: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `list_asset(pay,axfer,uint64)void` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param TransactionWithSigner xfer: The `xfer` ABI parameter
+        :param int unitary_price: The `unitary_price` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = ListAssetArgs(
+            mbr_pay=mbr_pay,
+            xfer=xfer,
+            unitary_price=unitary_price,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def set_price(
+        self,
+        *,
+        asset: int,
+        unitary_price: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `set_price(asset,uint64)void` ABI method
+        
+        :param int asset: The `asset` ABI parameter
+        :param int unitary_price: The `unitary_price` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = SetPriceArgs(
+            asset=asset,
+            unitary_price=unitary_price,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def buy(
+        self,
+        *,
+        seller: str | bytes,
+        asset: int,
+        buyer_txn: TransactionWithSigner,
+        quantity: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `buy(account,asset,pay,uint64)void` ABI method
+        
+        :param str | bytes seller: The `seller` ABI parameter
+        :param int asset: The `asset` ABI parameter
+        :param TransactionWithSigner buyer_txn: The `buyer_txn` ABI parameter
+        :param int quantity: The `quantity` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = BuyArgs(
+            seller=seller,
+            asset=asset,
+            buyer_txn=buyer_txn,
+            quantity=quantity,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def buy_many(
+        self,
+        *,
+        buyer_txn: TransactionWithSigner,
+        items: list[tuple[str, int, int]],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `buy_many(pay,(address,uint64,uint64)[])void` ABI method
+        
+        :param TransactionWithSigner buyer_txn: The `buyer_txn` ABI parameter
+        :param list[tuple[str, int, int]] items: The `items` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = BuyManyArgs(
+            buyer_txn=buyer_txn,
+            items=items,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def delist(
+        self,
+        *,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to `delist(asset)void` ABI method
+        
+        :param int asset: The `asset` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        args = DelistArgs(
+            asset=asset,
+        )
+        self.app_client.compose_call(
+            self.atc,
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return self
+
+    def create_bare(
+        self,
+        *,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds a call to create an application using the no_op bare method
+        
+        :param typing.Literal[no_op] on_complete: On completion type to use
+        :param algokit_utils.CreateTransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns Composer: This Composer instance"""
+
+        self.app_client.compose_create(
+            self.atc,
+            call_abi_method=False,
+            transaction_parameters=_convert_create_transaction_parameters(transaction_parameters, on_complete),
+        )
+        return self
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> "Composer":
+        """Adds a call to the application with on completion set to ClearState
+    
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass"""
+    
+        self.app_client.compose_clear_state(self.atc, _convert_transaction_parameters(transaction_parameters), app_args)
+        return self
+
+
+class MarketplaceListingsClient:
+    """A class for interacting with the MarketplaceListings app providing high productivity and
+    strongly typed methods to deploy and call the app"""
+
+    @typing.overload
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        app_id: int = 0,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        ...
+
+    @typing.overload
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        creator: str | algokit_utils.Account,
+        indexer_client: algosdk.v2client.indexer.IndexerClient | None = None,
+        existing_deployments: algokit_utils.AppLookup | None = None,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        ...
+
+    def __init__(
+        self,
+        algod_client: algosdk.v2client.algod.AlgodClient,
+        *,
+        creator: str | algokit_utils.Account | None = None,
+        indexer_client: algosdk.v2client.indexer.IndexerClient | None = None,
+        existing_deployments: algokit_utils.AppLookup | None = None,
+        app_id: int = 0,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: algosdk.transaction.SuggestedParams | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        app_name: str | None = None,
+    ) -> None:
+        """
+        MarketplaceListingsClient can be created with an app_id to interact with an existing application, alternatively
+        it can be created with a creator and indexer_client specified to find existing applications by name and creator.
+        
+        :param AlgodClient algod_client: AlgoSDK algod client
+        :param int app_id: The app_id of an existing application, to instead find the application by creator and name
+        use the creator and indexer_client parameters
+        :param str | Account creator: The address or Account of the app creator to resolve the app_id
+        :param IndexerClient indexer_client: AlgoSDK indexer client, only required if deploying or finding app_id by
+        creator and app name
+        :param AppLookup existing_deployments:
+        :param TransactionSigner | Account signer: Account or signer to use to sign transactions, if not specified and
+        creator was passed as an Account will use that.
+        :param str sender: Address to use as the sender for all transactions, will use the address associated with the
+        signer if not specified.
+        :param TemplateValueMapping template_values: Values to use for TMPL_* template variables, dictionary keys should
+        *NOT* include the TMPL_ prefix
+        :param str | None app_name: Name of application to use when deploying, defaults to name defined on the
+        Application Specification
+            """
+
+        self.app_spec = APP_SPEC
+        
+        # calling full __init__ signature, so ignoring mypy warning about overloads
+        self.app_client = algokit_utils.ApplicationClient(  # type: ignore[call-overload, misc]
+            algod_client=algod_client,
+            app_spec=self.app_spec,
+            app_id=app_id,
+            creator=creator,
+            indexer_client=indexer_client,
+            existing_deployments=existing_deployments,
+            signer=signer,
+            sender=sender,
+            suggested_params=suggested_params,
+            template_values=template_values,
+            app_name=app_name,
+        )
+
+    @property
+    def algod_client(self) -> algosdk.v2client.algod.AlgodClient:
+        return self.app_client.algod_client
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @app_id.setter
+    def app_id(self, value: int) -> None:
+        self.app_client.app_id = value
+
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+
+    @property
+    def sender(self) -> str | None:
+        return self.app_client.sender
+
+    @sender.setter
+    def sender(self, value: str) -> None:
+        self.app_client.sender = value
+
+    @property
+    def signer(self) -> TransactionSigner | None:
+        return self.app_client.signer
+
+    @signer.setter
+    def signer(self, value: TransactionSigner) -> None:
+        self.app_client.signer = value
+
+    @property
+    def suggested_params(self) -> algosdk.transaction.SuggestedParams | None:
+        return self.app_client.suggested_params
+
+    @suggested_params.setter
+    def suggested_params(self, value: algosdk.transaction.SuggestedParams | None) -> None:
+        self.app_client.suggested_params = value
+
+    def allow_asset(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `allow_asset(pay,asset)void` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param int asset: The `asset` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = AllowAssetArgs(
+            mbr_pay=mbr_pay,
+            asset=asset,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def list_asset(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        xfer: TransactionWithSigner,
+        unitary_price: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `list_asset(pay,axfer,uint64)void` ABI method
+        
+        :param TransactionWithSigner mbr_pay: The `mbr_pay` ABI parameter
+        :param TransactionWithSigner xfer: The `xfer` ABI parameter
+        :param int unitary_price: The `unitary_price` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = ListAssetArgs(
+            mbr_pay=mbr_pay,
+            xfer=xfer,
+            unitary_price=unitary_price,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def set_price(
+        self,
+        *,
+        asset: int,
+        unitary_price: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `set_price(asset,uint64)void` ABI method
+        
+        :param int asset: The `asset` ABI parameter
+        :param int unitary_price: The `unitary_price` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = SetPriceArgs(
+            asset=asset,
+            unitary_price=unitary_price,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def buy(
+        self,
+        *,
+        seller: str | bytes,
+        asset: int,
+        buyer_txn: TransactionWithSigner,
+        quantity: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `buy(account,asset,pay,uint64)void` ABI method
+        
+        :param str | bytes seller: The `seller` ABI parameter
+        :param int asset: The `asset` ABI parameter
+        :param TransactionWithSigner buyer_txn: The `buyer_txn` ABI parameter
+        :param int quantity: The `quantity` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = BuyArgs(
+            seller=seller,
+            asset=asset,
+            buyer_txn=buyer_txn,
+            quantity=quantity,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def buy_many(
+        self,
+        *,
+        buyer_txn: TransactionWithSigner,
+        items: list[tuple[str, int, int]],
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `buy_many(pay,(address,uint64,uint64)[])void` ABI method
+        
+        :param TransactionWithSigner buyer_txn: The `buyer_txn` ABI parameter
+        :param list[tuple[str, int, int]] items: The `items` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = BuyManyArgs(
+            buyer_txn=buyer_txn,
+            items=items,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def delist(
+        self,
+        *,
+        asset: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Calls `delist(asset)void` ABI method
+        
+        :param int asset: The `asset` ABI parameter
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.ABITransactionResponse[None]: The result of the transaction"""
+
+        args = DelistArgs(
+            asset=asset,
+        )
+        result = self.app_client.call(
+            call_abi_method=args.method(),
+            transaction_parameters=_convert_call_transaction_parameters(transaction_parameters),
+            **_as_dict(args, convert_all=True),
+        )
+        return result
+
+    def create_bare(
+        self,
+        *,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Creates an application using the no_op bare method
+        
+        :param typing.Literal[no_op] on_complete: On completion type to use
+        :param algokit_utils.CreateTransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+
+        result = self.app_client.create(
+            call_abi_method=False,
+            transaction_parameters=_convert_create_transaction_parameters(transaction_parameters, on_complete),
+        )
+        return result
+
+    def clear_state(
+        self,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+        app_args: list[bytes] | None = None,
+    ) -> algokit_utils.TransactionResponse:
+        """Calls the application with on completion set to ClearState
+    
+        :param algokit_utils.TransactionParameters transaction_parameters: (optional) Additional transaction parameters
+        :param list[bytes] | None app_args: (optional) Application args to pass
+        :returns algokit_utils.TransactionResponse: The result of the transaction"""
+    
+        return self.app_client.clear_state(_convert_transaction_parameters(transaction_parameters), app_args)
+
+    def deploy(
+        self,
+        version: str | None = None,
+        *,
+        signer: TransactionSigner | None = None,
+        sender: str | None = None,
+        allow_update: bool | None = None,
+        allow_delete: bool | None = None,
+        on_update: algokit_utils.OnUpdate = algokit_utils.OnUpdate.Fail,
+        on_schema_break: algokit_utils.OnSchemaBreak = algokit_utils.OnSchemaBreak.Fail,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        create_args: algokit_utils.DeployCallArgs | None = None,
+        update_args: algokit_utils.DeployCallArgs | None = None,
+        delete_args: algokit_utils.DeployCallArgs | None = None,
+    ) -> algokit_utils.DeployResponse:
+        """Deploy an application and update client to reference it.
+        
+        Idempotently deploy (create, update/delete if changed) an app against the given name via the given creator
+        account, including deploy-time template placeholder substitutions.
+        To understand the architecture decisions behind this functionality please see
+        <https://github.com/algorandfoundation/algokit-cli/blob/main/docs/architecture-decisions/2023-01-12_smart-contract-deployment.md>
+        
+        ```{note}
+        If there is a breaking state schema change to an existing app (and `on_schema_break` is set to
+        'ReplaceApp' the existing app will be deleted and re-created.
+        ```
+        
+        ```{note}
+        If there is an update (different TEAL code) to an existing app (and `on_update` is set to 'ReplaceApp')
+        the existing app will be deleted and re-created.
+        ```
+        
+        :param str version: version to use when creating or updating app, if None version will be auto incremented
+        :param algosdk.atomic_transaction_composer.TransactionSigner signer: signer to use when deploying app
+        , if None uses self.signer
+        :param str sender: sender address to use when deploying app, if None uses self.sender
+        :param bool allow_delete: Used to set the `TMPL_DELETABLE` template variable to conditionally control if an app
+        can be deleted
+        :param bool allow_update: Used to set the `TMPL_UPDATABLE` template variable to conditionally control if an app
+        can be updated
+        :param OnUpdate on_update: Determines what action to take if an application update is required
+        :param OnSchemaBreak on_schema_break: Determines what action to take if an application schema requirements
+        has increased beyond the current allocation
+        :param dict[str, int|str|bytes] template_values: Values to use for `TMPL_*` template variables, dictionary keys
+        should *NOT* include the TMPL_ prefix
+        :param algokit_utils.DeployCallArgs | None create_args: Arguments used when creating an application
+        :param algokit_utils.DeployCallArgs | None update_args: Arguments used when updating an application
+        :param algokit_utils.DeployCallArgs | None delete_args: Arguments used when deleting an application
+        :return DeployResponse: details action taken and relevant transactions
+        :raises DeploymentError: If the deployment failed"""
+
+        return self.app_client.deploy(
+            version,
+            signer=signer,
+            sender=sender,
+            allow_update=allow_update,
+            allow_delete=allow_delete,
+            on_update=on_update,
+            on_schema_break=on_schema_break,
+            template_values=template_values,
+            create_args=_convert_deploy_args(create_args),
+            update_args=_convert_deploy_args(update_args),
+            delete_args=_convert_deploy_args(delete_args),
+        )
+
+    def compose(self, atc: AtomicTransactionComposer | None = None) -> Composer:
+        return Composer(self.app_client, atc or AtomicTransactionComposer())
@@ -1,21 +1,51 @@
 import dataclasses
+import functools
 import importlib
-from collections.abc import Callable
+from collections.abc import Callable, Collection
 from pathlib import Path
+from types import ModuleType
+from typing import TYPE_CHECKING
 
-from algokit_utils import Account, ApplicationSpecification
-from algosdk.v2client.algod import AlgodClient
-from algosdk.v2client.indexer import IndexerClient
+if TYPE_CHECKING:
+    # only needed for type hints, deploy_config modules import these when deploying
+    from algokit_utils import Account, ApplicationSpecification
+    from algosdk.v2client.algod import AlgodClient
+    from algosdk.v2client.indexer import IndexerClient
+
+    from smart_contracts.helpers.profile import ProfileScenario
+
+DeployCallback = Callable[
+    ["AlgodClient", "IndexerClient", "ApplicationSpecification", "Account"], None
+]
 
 
 @dataclasses.dataclass
 class SmartContract:
     path: Path
     name: str
-    deploy: (
-        Callable[[AlgodClient, IndexerClient, ApplicationSpecification, Account], None]
-        | None
-    ) = None
+
+    @functools.cached_property
+    def deploy_module(self) -> ModuleType | None:
+        return import_module_if_exists(self.path.parent, "deploy_config")
+
+    @functools.cached_property
+    def profile_module(self) -> ModuleType | None:
+        return import_module_if_exists(self.path.parent, "profile_config")
+
+    @property
+    def deploy(self) -> DeployCallback | None:
+        """The deploy callback, deploy_config is only imported on first access."""
+        return getattr(self.deploy_module, "deploy", None)
+
+    @property
+    def profile(self) -> "ProfileScenario | None":
+        """The profiling scenario, profile_config is only imported on first access."""
+        return getattr(self.profile_module, "profile", None)
+
+    @property
+    def depends_on(self) -> list[str]:
+        """Names of contracts that must be deployed before this one."""
+        return list(getattr(self.deploy_module, "depends_on", []))
 
 
 def import_contract(folder: Path) -> Path:
@@ -27,18 +57,12 @@ def import_contract(folder: Path) -> Path:
         raise Exception(f"Contract not found in {folder}")
 
 
-def import_deploy_if_exists(
-    folder: Path,
-) -> (
-    Callable[[AlgodClient, IndexerClient, ApplicationSpecification, Account], None]
-    | None
-):
-    """Imports the deploy function from a folder if it exists."""
+def import_module_if_exists(folder: Path, module_name: str) -> ModuleType | None:
+    """Imports a module (e.g. deploy_config) from a contract folder if it exists."""
     try:
-        deploy_module = importlib.import_module(
-            f"{folder.parent.name}.{folder.name}.deploy_config"
+        return importlib.import_module(
+            f"{folder.parent.name}.{folder.name}.{module_name}"
         )
-        return deploy_module.deploy
     except ImportError:
         return None
 
@@ -48,14 +72,36 @@ def has_contract_file(directory: Path) -> bool:
     return (directory / "contract.py").exists()
 
 
+def discover_contracts(only: Collection[str] | None = None) -> list[SmartContract]:
+    """Finds the contracts to build and/or deploy, optionally only the named ones."""
+    if only:
+        folders = [base_dir / name for name in only]
+        missing = [folder.name for folder in folders if not has_contract_file(folder)]
+        if missing:
+            raise Exception(f"Contract not found: {', '.join(missing)}")
+    else:
+        folders = sorted(
+            folder
+            for folder in base_dir.iterdir()
+            if folder.is_dir() and has_contract_file(folder)
+        )
+    return [
+        SmartContract(path=import_contract(folder), name=folder.name)
+        for folder in folders
+    ]
+
+
+@functools.cache
+def _all_contracts() -> list[SmartContract]:
+    return discover_contracts()
+
+
+def __getattr__(name: str) -> list[SmartContract]:
+    # `contracts` is resolved on first access instead of at import time
+    if name == "contracts":
+        return _all_contracts()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # define contracts to build and/or deploy
 base_dir = Path("smart_contracts")
-contracts = [
-    SmartContract(
-        path=import_contract(folder),
-        name=folder.name,
-        deploy=import_deploy_if_exists(folder),
-    )
-    for folder in base_dir.iterdir()
-    if folder.is_dir() and has_contract_file(folder)
-]
@@ -0,0 +1,335 @@
+import asyncio
+import typing
+
+import algokit_utils
+from algosdk.abi import Method
+from algosdk.atomic_transaction_composer import (
+    ABIResult,
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.transaction import PaymentTxn, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.digital_marketplace import client as generated
+from smart_contracts.digital_marketplace.client import (
+    Composer,
+    asset_calls,
+    with_suggested_params,
+)
+from smart_contracts.digital_marketplace.types import (
+    BuyArgs,
+    DeleteApplicationArgs,
+    GlobalState,
+    MethodArgs,
+    OptInToAssetArgs,
+    SetPriceArgs,
+)
+from smart_contracts.helpers.async_algod import AsyncAlgodClient
+from smart_contracts.helpers.pipeline import GroupBuilder
+from smart_contracts.helpers.state_cache import decode_global_state
+
+
+class AsyncComposer:
+    """Async counterpart of the generated Composer.
+
+    Calls are collected as they are added and built once execute has fetched the
+    suggested params, so no method blocks the event loop on algod. Calls that
+    transfer the app's asset reference it themselves, like in the sync Composer.
+    """
+
+    def __init__(self, client: "AsyncDigitalMarketplaceClient") -> None:
+        self.client = client
+        self._calls: list[
+            tuple[MethodArgs, algokit_utils.TransactionParameters | None]
+        ] = []
+
+    def add(
+        self,
+        args: MethodArgs,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        self._calls.append((args, transaction_parameters))
+        return self
+
+    def set_price(
+        self,
+        *,
+        unitary_price: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        return self.add(
+            SetPriceArgs(unitary_price=unitary_price), transaction_parameters
+        )
+
+    def opt_in_to_asset(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        return self.add(OptInToAssetArgs(mbr_pay=mbr_pay), transaction_parameters)
+
+    def buy(
+        self,
+        *,
+        buyer_txn: TransactionWithSigner,
+        quantity: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        return self.add(
+            BuyArgs(buyer_txn=buyer_txn, quantity=quantity), transaction_parameters
+        )
+
+    def delete_delete_application(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "AsyncComposer":
+        return self.add(DeleteApplicationArgs(), transaction_parameters)
+
+    async def build(self) -> AtomicTransactionComposer:
+        if any(
+            isinstance(args, asset_calls)
+            and not (transaction_parameters and transaction_parameters.foreign_assets)
+            for args, transaction_parameters in self._calls
+        ):
+            # read ahead, so build_with finds the asset id without blocking
+            await self.client.get_asset_id()
+        return self.build_with(await self.client.get_suggested_params())
+
+    def build_with(
+        self, suggested_params: SuggestedParams
+    ) -> AtomicTransactionComposer:
+        composer = Composer(
+            self.client.app_client,
+            AtomicTransactionComposer(),
+            asset_id=self.client.cached_asset_id,
+        )
+        for args, transaction_parameters in self._calls:
+            composer.add(
+                args,
+                with_suggested_params(
+                    args.method(), transaction_parameters, suggested_params
+                ),
+            )
+        return composer.build()
+
+    async def execute(self, wait_rounds: int = 4) -> AtomicTransactionResponse:
+        """Sends the group and waits for it, while other coroutines keep running."""
+        atc = await self.build()
+        # signing happens locally, only sending and waiting need algod
+        signed_txns = atc.gather_signatures()
+        tx_ids = [txn.txn.get_txid() for txn in atc.build_group()]
+        algod = self.client.async_algod
+        await algod.send_transactions(signed_txns)
+        confirmation = await algod.wait_for_confirmation(tx_ids[0], wait_rounds)
+
+        method_indexes = sorted(atc.method_dict)
+        txn_infos = await asyncio.gather(
+            *(algod.pending_transaction_info(tx_ids[i]) for i in method_indexes)
+        )
+        abi_results = [
+            _abi_result(tx_ids[i], atc.method_dict[i], txn_info)
+            for i, txn_info in zip(method_indexes, txn_infos, strict=True)
+        ]
+        return AtomicTransactionResponse(
+            confirmed_round=confirmation["confirmed-round"],
+            tx_ids=tx_ids,
+            results=abi_results,
+        )
+
+
+def _abi_result(tx_id: str, method: Method, txn_info: dict) -> ABIResult:
+    # every method of the contract returns void, so there is no return value to decode
+    return ABIResult(
+        tx_id=tx_id,
+        raw_value=b"",
+        return_value=None,
+        decode_error=None,
+        tx_info=txn_info,
+        method=method,
+    )
+
+
+class AsyncDigitalMarketplaceClient:
+    """Async counterpart of DigitalMarketplaceClient.
+
+    Transactions are built and signed with the generated client, but suggested
+    params, sending and confirmation go through AsyncAlgodClient, so many purchases
+    can wait for confirmation concurrently on one event loop.
+    """
+
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        *,
+        app_id: int,
+        signer: TransactionSigner | algokit_utils.Account | None = None,
+        sender: str | None = None,
+        suggested_params: SuggestedParams | None = None,
+        async_algod: AsyncAlgodClient | None = None,
+    ) -> None:
+        self.app_client = algokit_utils.ApplicationClient(
+            algod_client=algod_client,
+            app_spec=generated.APP_SPEC,
+            app_id=app_id,
+            signer=signer,
+            sender=sender,
+            suggested_params=suggested_params,
+        )
+        # a client passed in may be shared, so only the one created here is closed
+        self._owns_async_algod = async_algod is None
+        self.async_algod = async_algod or AsyncAlgodClient.from_algod_client(
+            algod_client
+        )
+        self._asset_id: int | None = None
+
+    async def __aenter__(self) -> "AsyncDigitalMarketplaceClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        if self._owns_async_algod:
+            await self.async_algod.aclose()
+
+    @property
+    def app_id(self) -> int:
+        return self.app_client.app_id
+
+    @property
+    def app_address(self) -> str:
+        return self.app_client.app_address
+
+    async def get_suggested_params(self) -> SuggestedParams:
+        return (
+            self.app_client.suggested_params
+            or await self.async_algod.suggested_params()
+        )
+
+    async def get_global_state(self) -> GlobalState:
+        app_info = await self.async_algod.application_info(self.app_id)
+        return GlobalState.from_raw(
+            decode_global_state(app_info["params"].get("global-state", []))
+        )
+
+    async def get_asset_id(self) -> int:
+        """The app's asset, read from global state on first use."""
+        if self._asset_id is None:
+            self._asset_id = (await self.get_global_state()).asset_id
+        return self._asset_id
+
+    def cached_asset_id(self) -> int:
+        """The app's asset for the sync build_with, e.g. of a SubmissionPipeline.
+
+        Reads global state with a blocking call when get_asset_id wasn't awaited
+        before, once per client.
+        """
+        if self._asset_id is None:
+            state = self.app_client.get_global_state(raw=True)
+            self._asset_id = GlobalState.from_raw(
+                typing.cast(dict[bytes, bytes | int], state)
+            ).asset_id
+        return self._asset_id
+
+    def compose(self) -> AsyncComposer:
+        return AsyncComposer(self)
+
+    def buy_group_builder(
+        self,
+        *,
+        buyer: str,
+        signer: TransactionSigner,
+        quantity: int,
+        unitary_price: int,
+        asset_id: int,
+        note: bytes | None = None,
+    ) -> GroupBuilder:
+        """Returns how to build a buy group, for SubmissionPipeline.submit.
+
+        The payment is part of the group, so it is built again along with the app
+        call whenever the pipeline needs a group valid in later rounds. Orders that
+        are otherwise identical need distinct notes, or they share a transaction id.
+        """
+
+        def build(suggested_params: SuggestedParams) -> AtomicTransactionComposer:
+            payment = PaymentTxn(
+                sender=buyer,
+                sp=suggested_params,
+                receiver=self.app_address,
+                amt=quantity * unitary_price,
+            )
+            return (
+                self.compose()
+                .buy(
+                    buyer_txn=TransactionWithSigner(payment, signer),
+                    quantity=quantity,
+                    transaction_parameters=algokit_utils.TransactionParameters(
+                        sender=buyer,
+                        signer=signer,
+                        note=note,
+                        foreign_assets=[asset_id],
+                    ),
+                )
+                .build_with(suggested_params)
+            )
+
+        return build
+
+    async def set_price(
+        self,
+        *,
+        unitary_price: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> AtomicTransactionResponse:
+        return await (
+            self.compose()
+            .set_price(
+                unitary_price=unitary_price,
+                transaction_parameters=transaction_parameters,
+            )
+            .execute()
+        )
+
+    async def opt_in_to_asset(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> AtomicTransactionResponse:
+        return await (
+            self.compose()
+            .opt_in_to_asset(
+                mbr_pay=mbr_pay, transaction_parameters=transaction_parameters
+            )
+            .execute()
+        )
+
+    async def buy(
+        self,
+        *,
+        buyer_txn: TransactionWithSigner,
+        quantity: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> AtomicTransactionResponse:
+        return await (
+            self.compose()
+            .buy(
+                buyer_txn=buyer_txn,
+                quantity=quantity,
+                transaction_parameters=transaction_parameters,
+            )
+            .execute()
+        )
+
+    async def delete_delete_application(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> AtomicTransactionResponse:
+        return await (
+            self.compose()
+            .delete_delete_application(transaction_parameters=transaction_parameters)
+            .execute()
+        )
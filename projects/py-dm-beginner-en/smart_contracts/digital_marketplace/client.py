@@ -0,0 +1,459 @@
+import dataclasses
+import functools
+import os
+import typing
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+import algokit_utils
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    AtomicTransactionResponse,
+    TransactionWithSigner,
+)
+
+from smart_contracts.artifacts.digital_marketplace import client as generated
+from smart_contracts.digital_marketplace.fees import (
+    inner_txns,
+    pooled_suggested_params,
+)
+from smart_contracts.digital_marketplace.offline import BuyOrder, build_buy_groups
+from smart_contracts.digital_marketplace.types import (
+    BuyArgs,
+    DeleteApplicationArgs,
+    GlobalState,
+    MethodArgs,
+    OptInToAssetArgs,
+    SetPriceArgs,
+    call_parameters,
+)
+from smart_contracts.helpers.bytecode import (
+    PrecompiledAlgodClient,
+    load_compile_results,
+)
+from smart_contracts.helpers.deploy_registry import (
+    DeploymentRegistry,
+    registered_deploy,
+)
+from smart_contracts.helpers.state_cache import GlobalStateCache
+from smart_contracts.helpers.suggested_params import SuggestedParamsCache
+
+if typing.TYPE_CHECKING:
+    from algosdk.transaction import SuggestedParams, Transaction
+    from algosdk.v2client.algod import AlgodClient
+
+artifact_dir = Path(generated.__file__).parent
+
+
+@functools.cache
+def _compile_results() -> dict[str, dict]:
+    # read once per process, however many clients create apps
+    return load_compile_results(artifact_dir)
+
+
+def with_suggested_params(
+    method: str,
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+    suggested_params: "SuggestedParams",
+) -> algokit_utils.TransactionParameters:
+    """Sets suggested_params, with a fee that covers the inner transactions of method.
+
+    Suggested params passed by the caller are left untouched.
+    """
+    transaction_parameters = (
+        transaction_parameters or algokit_utils.TransactionParameters()
+    )
+    if transaction_parameters.suggested_params is not None:
+        return transaction_parameters
+    return dataclasses.replace(
+        transaction_parameters,
+        suggested_params=pooled_suggested_params(method, suggested_params),
+    )
+
+
+def with_asset_reference(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+    asset_id: Callable[[], int],
+) -> algokit_utils.TransactionParameters:
+    """References the app's asset, which the inner transfer of the call moves.
+
+    Foreign assets passed by the caller are left untouched, and asset_id is only
+    called when there are none.
+    """
+    transaction_parameters = (
+        transaction_parameters or algokit_utils.TransactionParameters()
+    )
+    if transaction_parameters.foreign_assets:
+        return transaction_parameters
+    return dataclasses.replace(transaction_parameters, foreign_assets=[asset_id()])
+
+
+def with_unique_lease(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.TransactionParameters:
+    """Gives the call a random lease, unless the caller passed a lease of their own.
+
+    Calls built from the same cached suggested params share their validity window,
+    so two identical calls would otherwise get the same txid.
+    """
+    transaction_parameters = (
+        transaction_parameters or algokit_utils.TransactionParameters()
+    )
+    if transaction_parameters.lease is not None:
+        return transaction_parameters
+    return dataclasses.replace(transaction_parameters, lease=os.urandom(32))
+
+
+def _transaction_parameters(
+    app_client: algokit_utils.ApplicationClient,
+    suggested_params_cache: SuggestedParamsCache | None,
+    method: str,
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.TransactionParameters:
+    """Makes the app call pay for the inner transactions of method.
+
+    Suggested params come from suggested_params_cache when there is one, and the
+    call then gets a unique lease.
+    """
+    if transaction_parameters and transaction_parameters.suggested_params:
+        return transaction_parameters
+    if suggested_params_cache is not None:
+        suggested_params = suggested_params_cache.get()
+        transaction_parameters = with_unique_lease(transaction_parameters)
+    elif inner_txns(method):
+        suggested_params = (
+            app_client.suggested_params or app_client.algod_client.suggested_params()
+        )
+    else:
+        # nothing to add, let the generated client fetch suggested params as usual
+        return transaction_parameters or algokit_utils.TransactionParameters()
+    return with_suggested_params(method, transaction_parameters, suggested_params)
+
+
+def _observe(
+    app_id: int,
+    confirmed_round: int | None,
+    suggested_params_cache: SuggestedParamsCache | None,
+    global_state_cache: GlobalStateCache | None,
+    *,
+    writes_global_state: bool,
+) -> None:
+    if suggested_params_cache is not None:
+        suggested_params_cache.observe_round(confirmed_round)
+    if global_state_cache is not None:
+        global_state_cache.observe_round(confirmed_round)
+        if writes_global_state:
+            global_state_cache.invalidate(app_id)
+
+
+# the calls that transfer the app's asset, so it must be in their foreign assets
+asset_calls = (OptInToAssetArgs, BuyArgs, DeleteApplicationArgs)
+
+
+class Composer(generated.Composer):
+    """Generated composer whose calls cover their own inner transaction fees.
+
+    With an asset_id, calls that transfer the app's asset reference it themselves.
+    """
+
+    def __init__(
+        self,
+        app_client: algokit_utils.ApplicationClient,
+        atc: AtomicTransactionComposer,
+        suggested_params_cache: SuggestedParamsCache | None = None,
+        global_state_cache: GlobalStateCache | None = None,
+        asset_id: Callable[[], int] | None = None,
+    ) -> None:
+        super().__init__(app_client, atc)
+        self.suggested_params_cache = suggested_params_cache
+        self.global_state_cache = global_state_cache
+        self.asset_id = asset_id
+        self._writes_global_state = False
+
+    def execute(self) -> AtomicTransactionResponse:
+        result = super().execute()
+        _observe(
+            self.app_client.app_id,
+            result.confirmed_round,
+            self.suggested_params_cache,
+            self.global_state_cache,
+            writes_global_state=self._writes_global_state,
+        )
+        return result
+
+    def add(
+        self,
+        args: MethodArgs,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        """Adds the call described by args to the group."""
+        if isinstance(args, asset_calls) and self.asset_id is not None:
+            transaction_parameters = with_asset_reference(
+                transaction_parameters, self.asset_id
+            )
+        parameters = call_parameters(
+            _transaction_parameters(
+                self.app_client,
+                self.suggested_params_cache,
+                args.method(),
+                transaction_parameters,
+            )
+        )
+        if isinstance(args, DeleteApplicationArgs):
+            self.app_client.compose_delete(
+                self.atc,
+                call_abi_method=args.method(),
+                transaction_parameters=parameters,
+            )
+        else:
+            self.app_client.compose_call(
+                self.atc,
+                call_abi_method=args.method(),
+                transaction_parameters=parameters,
+                **args.encode(),
+            )
+        if isinstance(args, SetPriceArgs | DeleteApplicationArgs):
+            self._writes_global_state = True
+        return self
+
+    def set_price(
+        self,
+        *,
+        unitary_price: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        return self.add(
+            SetPriceArgs(unitary_price=unitary_price), transaction_parameters
+        )
+
+    def opt_in_to_asset(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        return self.add(OptInToAssetArgs(mbr_pay=mbr_pay), transaction_parameters)
+
+    def buy(
+        self,
+        *,
+        buyer_txn: TransactionWithSigner,
+        quantity: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        return self.add(
+            BuyArgs(buyer_txn=buyer_txn, quantity=quantity), transaction_parameters
+        )
+
+    def delete_delete_application(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> "Composer":
+        return self.add(DeleteApplicationArgs(), transaction_parameters)
+
+
+class DigitalMarketplaceClient(generated.DigitalMarketplaceClient):
+    """Generated client whose calls cover their own inner transaction fees.
+
+    The fee of every app call is set to the minimum fee times one plus the inner
+    transactions the method issues, so the other transactions in the group only
+    pay their own minimum fee. Arguments are passed to algokit_utils as they are,
+    through the slotted types in types.py, instead of the deep copying dataclass
+    conversion of the generated client.
+
+    Calls that transfer the app's asset add it to their foreign assets when the
+    caller passes none. The asset id is read from global state on first use.
+
+    Pass a suggested_params_cache to stop fetching suggested params from algod
+    before every call (each call then gets a random lease to keep its txid
+    unique), and a global_state_cache to serve get_global_state from
+    memory. Both can be shared by clients in many threads.
+
+    Pass a DeploymentRegistry to deploy to find the app without the indexer.
+
+    Creating and deploying the app uses the bytecode the build compiled, when the
+    artifacts have it, instead of compiling the TEAL with algod every time.
+    """
+
+    def __init__(
+        self,
+        *args: typing.Any,
+        suggested_params_cache: SuggestedParamsCache | None = None,
+        global_state_cache: GlobalStateCache | None = None,
+        **kwargs: typing.Any,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        compile_results = _compile_results()
+        if compile_results:
+            self.app_client.algod_client = typing.cast(
+                "AlgodClient",
+                PrecompiledAlgodClient(self.app_client.algod_client, compile_results),
+            )
+        self.suggested_params_cache = suggested_params_cache
+        self.global_state_cache = global_state_cache
+        self._asset_id: int | None = None
+
+    @property
+    def asset_id(self) -> int:
+        # known once create_application or a first read set it, never read again
+        if self._asset_id is None:
+            self._asset_id = self.get_global_state().asset_id
+        return self._asset_id
+
+    def create_create_application(
+        self,
+        *,
+        asset_id: int,
+        unitary_price: int,
+        on_complete: typing.Literal["no_op"] = "no_op",
+        transaction_parameters: algokit_utils.CreateTransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Creates the app like the generated client and remembers its asset."""
+        result = super().create_create_application(
+            asset_id=asset_id,
+            unitary_price=unitary_price,
+            on_complete=on_complete,
+            transaction_parameters=transaction_parameters,
+        )
+        self._asset_id = asset_id
+        return result
+
+    def call(
+        self,
+        args: MethodArgs,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        """Sends the call described by args and waits for it."""
+        if isinstance(args, asset_calls):
+            transaction_parameters = with_asset_reference(
+                transaction_parameters, lambda: self.asset_id
+            )
+        parameters = call_parameters(
+            _transaction_parameters(
+                self.app_client,
+                self.suggested_params_cache,
+                args.method(),
+                transaction_parameters,
+            )
+        )
+        if isinstance(args, DeleteApplicationArgs):
+            result = self.app_client.delete(
+                call_abi_method=args.method(), transaction_parameters=parameters
+            )
+        else:
+            result = self.app_client.call(
+                call_abi_method=args.method(),
+                transaction_parameters=parameters,
+                **args.encode(),
+            )
+        _observe(
+            self.app_id,
+            result.confirmed_round,
+            self.suggested_params_cache,
+            self.global_state_cache,
+            writes_global_state=isinstance(args, SetPriceArgs | DeleteApplicationArgs),
+        )
+        return typing.cast(algokit_utils.ABITransactionResponse[None], result)
+
+    # the slotted GlobalState has the same fields as the generated one
+    def get_global_state(self) -> GlobalState:  # type: ignore[override]
+        if self.global_state_cache is not None:
+            return GlobalState.from_raw(self.global_state_cache.get(self.app_id))
+        state = self.app_client.get_global_state(raw=True)
+        return GlobalState.from_raw(typing.cast(dict[bytes, bytes | int], state))
+
+    def set_price(
+        self,
+        *,
+        unitary_price: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        return self.call(
+            SetPriceArgs(unitary_price=unitary_price), transaction_parameters
+        )
+
+    def opt_in_to_asset(
+        self,
+        *,
+        mbr_pay: TransactionWithSigner,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        return self.call(OptInToAssetArgs(mbr_pay=mbr_pay), transaction_parameters)
+
+    def buy(
+        self,
+        *,
+        buyer_txn: TransactionWithSigner,
+        quantity: int,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        return self.call(
+            BuyArgs(buyer_txn=buyer_txn, quantity=quantity), transaction_parameters
+        )
+
+    def delete_delete_application(
+        self,
+        *,
+        transaction_parameters: algokit_utils.TransactionParameters | None = None,
+    ) -> algokit_utils.ABITransactionResponse[None]:
+        return self.call(DeleteApplicationArgs(), transaction_parameters)
+
+    def deploy(
+        self,
+        version: str | None = None,
+        *,
+        sender: str | None = None,
+        allow_update: bool | None = None,
+        allow_delete: bool | None = None,
+        template_values: algokit_utils.TemplateValueMapping | None = None,
+        registry: DeploymentRegistry | None = None,
+        **kwargs: typing.Any,
+    ) -> algokit_utils.DeployResponse:
+        """Deploys like the generated client, see there for the arguments.
+
+        With a registry, the app is looked up there instead of by searching the
+        indexer for every app of the creator, see registered_deploy.
+        """
+        deploy = functools.partial(
+            super().deploy,
+            version,
+            sender=sender,
+            allow_update=allow_update,
+            allow_delete=allow_delete,
+            template_values=template_values,
+            **kwargs,
+        )
+        if registry is None:
+            return deploy()
+        return registered_deploy(
+            self.app_client,
+            registry,
+            deploy,
+            sender=sender,
+            version=version,
+            template_values=template_values,
+            allow_update=allow_update,
+            allow_delete=allow_delete,
+        )
+
+    def build_buy_groups(
+        self,
+        asset_id: int,
+        orders: Iterable[BuyOrder],
+        suggested_params: "SuggestedParams",
+    ) -> list[list["Transaction"]]:
+        """Builds unsigned buy groups for this app, without network I/O.
+
+        See offline.py to sign them, e.g. on worker processes.
+        """
+        return build_buy_groups(self.app_id, asset_id, orders, suggested_params)
+
+    def compose(self, atc: AtomicTransactionComposer | None = None) -> Composer:
+        return Composer(
+            self.app_client,
+            atc or AtomicTransactionComposer(),
+            self.suggested_params_cache,
+            self.global_state_cache,
+            lambda: self.asset_id,
+        )
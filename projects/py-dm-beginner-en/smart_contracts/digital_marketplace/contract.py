@@ -14,6 +14,8 @@ from algopy import (
     gtxn,
     # itxn is used to send transactions from within a smart contract
     itxn,
+    # op exposes the AVM opcodes that have no higher level equivalent
+    op,
 )
 
 
@@ -103,11 +105,16 @@ class DigitalMarketplace(arc4.ARC4Contract):
         # and is enough to cover the cost of the asset
         assert buyer_txn.sender == Txn.sender
         assert buyer_txn.receiver == Global.current_application_address
-        assert buyer_txn.amount == self.unitary_price * quantity
+        # create_application always sets the price, so it is read without the
+        # existence check that reading self.unitary_price would add
+        assert buyer_txn.amount == op.AppGlobal.get_uint64(b"unitary_price") * quantity
 
         # Once we've verified the payment, we can transfer the asset
         itxn.AssetTransfer(
-            xfer_asset=self.asset_id,
+            # The call has to reference the asset anyway, so it is read from there
+            # instead of from global state. The app only ever opts in to
+            # self.asset_id, so a transfer of any other asset fails
+            xfer_asset=Txn.assets(0),
             asset_receiver=Txn.sender,
             asset_amount=quantity,
         ).submit()
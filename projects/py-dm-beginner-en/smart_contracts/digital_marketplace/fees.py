@@ -0,0 +1,34 @@
+import functools
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from smart_contracts.helpers.fees import load_fee_table, with_pooled_fee
+
+if TYPE_CHECKING:
+    from algosdk.transaction import SuggestedParams
+
+# generated at build time next to the app spec, see smart_contracts/helpers/fees.py
+fee_table_path = (
+    Path(__file__).parent.parent
+    / "artifacts"
+    / "digital_marketplace"
+    / "DigitalMarketplace.fees.json"
+)
+
+
+@functools.cache
+def _fee_table() -> dict[str, int | None]:
+    return load_fee_table(fee_table_path)
+
+
+def inner_txns(method: str) -> int | None:
+    """Inner transactions the ABI method submits, None when it depends on the input."""
+    return _fee_table().get(method)
+
+
+def pooled_suggested_params(
+    method: str, suggested_params: "SuggestedParams"
+) -> "SuggestedParams":
+    """suggested_params with a fee that also covers the inner transactions of method."""
+    count = inner_txns(method)
+    return with_pooled_fee(suggested_params, count) if count else suggested_params
@@ -0,0 +1,79 @@
+import dataclasses
+from collections.abc import Callable, Iterable
+
+from algosdk import abi, transaction
+from algosdk.atomic_transaction_composer import TransactionSigner
+from algosdk.logic import get_application_address
+
+from smart_contracts.digital_marketplace.fees import pooled_suggested_params
+from smart_contracts.digital_marketplace.types import BuyArgs
+
+# parsed once, the method and its selector never change
+_buy_method = abi.Method.from_signature(BuyArgs.method())
+_buy_selector = _buy_method.get_selector()
+_quantity_type = abi.UintType(64)
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class BuyOrder:
+    buyer: str
+    quantity: int
+    unitary_price: int
+    # two orders with the same buyer, quantity and params would otherwise be the same
+    # transactions, and the network only accepts one of them
+    note: bytes | None = None
+
+
+def build_buy_group(
+    app_id: int,
+    asset_id: int,
+    order: BuyOrder,
+    suggested_params: transaction.SuggestedParams,
+) -> list[transaction.Transaction]:
+    """Builds the unsigned payment + buy call group of an order, without network I/O."""
+    payment = transaction.PaymentTxn(
+        sender=order.buyer,
+        sp=suggested_params,
+        receiver=get_application_address(app_id),
+        amt=order.quantity * order.unitary_price,
+        note=order.note,
+    )
+    app_call = transaction.ApplicationCallTxn(
+        sender=order.buyer,
+        sp=pooled_suggested_params(BuyArgs.method(), suggested_params),
+        index=app_id,
+        on_complete=transaction.OnComplete.NoOpOC,
+        # the payment argument is the transaction before the call, not an app arg
+        app_args=[_buy_selector, _quantity_type.encode(order.quantity)],
+        foreign_assets=[asset_id],
+        note=order.note,
+    )
+    return transaction.assign_group_id([payment, app_call])
+
+
+def build_buy_groups(
+    app_id: int,
+    asset_id: int,
+    orders: Iterable[BuyOrder],
+    suggested_params: transaction.SuggestedParams,
+) -> list[list[transaction.Transaction]]:
+    """Builds the groups of many orders, e.g. on worker processes ahead of time.
+
+    Every group is valid within suggested_params, so all of them have to be sent
+    before its last valid round.
+    """
+    return [
+        build_buy_group(app_id, asset_id, order, suggested_params) for order in orders
+    ]
+
+
+def sign_buy_groups(
+    groups: Iterable[list[transaction.Transaction]],
+    signer_for: Callable[[str], TransactionSigner],
+) -> list[list[transaction.GenericSignedTransaction]]:
+    """Signs every group with the signer of its buyer, also without network I/O."""
+    signed_groups = []
+    for group in groups:
+        signer = signer_for(group[0].sender)
+        signed_groups.append(signer.sign_transactions(group, list(range(len(group)))))
+    return signed_groups
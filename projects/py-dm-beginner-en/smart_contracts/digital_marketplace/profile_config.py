@@ -0,0 +1,78 @@
+from collections.abc import Iterator
+
+import algokit_utils
+from algokit_utils.beta.algorand_client import (
+    AlgorandClient,
+    AssetCreateParams,
+    AssetTransferParams,
+    PayParams,
+)
+from algokit_utils.beta.client_manager import AlgoSdkClients
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.v2client.algod import AlgodClient
+
+
+# walks the app through its lifecycle, yielding every ABI method call to profile
+def profile(
+    algod_client: AlgodClient, account: algokit_utils.Account
+) -> Iterator[tuple[str, AtomicTransactionComposer]]:
+    from smart_contracts.digital_marketplace.client import DigitalMarketplaceClient
+
+    algorand = AlgorandClient.from_clients(AlgoSdkClients(algod=algod_client))
+    algorand.set_signer(sender=account.address, signer=account.signer)
+
+    asset_id = algorand.send.asset_create(
+        AssetCreateParams(sender=account.address, total=10)
+    )["confirmation"]["asset-index"]
+
+    client = DigitalMarketplaceClient(
+        algod_client=algod_client,
+        sender=account.address,
+        signer=account.signer,
+    )
+    # the app id is only known once the create call is confirmed, so it isn't profiled
+    client.create_create_application(unitary_price=0, asset_id=asset_id)
+    asset_parameters = algokit_utils.TransactionParameters(foreign_assets=[asset_id])
+
+    mbr_pay_txn = algorand.transactions.payment(
+        PayParams(
+            sender=account.address,
+            receiver=client.app_address,
+            amount=200_000,
+        )
+    )
+    yield "opt_in_to_asset", client.compose().opt_in_to_asset(
+        mbr_pay=TransactionWithSigner(txn=mbr_pay_txn, signer=account.signer),
+        transaction_parameters=asset_parameters,
+    ).build()
+
+    algorand.send.asset_transfer(
+        AssetTransferParams(
+            sender=account.address,
+            receiver=client.app_address,
+            asset_id=asset_id,
+            amount=3,
+        )
+    )
+
+    yield "set_price", client.compose().set_price(unitary_price=3_300_000).build()
+
+    buyer_payment_txn = algorand.transactions.payment(
+        PayParams(
+            sender=account.address,
+            receiver=client.app_address,
+            amount=2 * 3_300_000,
+        )
+    )
+    yield "buy", client.compose().buy(
+        buyer_txn=TransactionWithSigner(txn=buyer_payment_txn, signer=account.signer),
+        quantity=2,
+        transaction_parameters=asset_parameters,
+    ).build()
+
+    yield "delete_application", client.compose().delete_delete_application(
+        transaction_parameters=asset_parameters
+    ).build()
@@ -0,0 +1,115 @@
+import base64
+import dataclasses
+from collections.abc import Callable, Collection, Iterator
+from pathlib import Path
+
+from algosdk import abi
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.digital_marketplace.types import BuyArgs
+from smart_contracts.helpers.block_follower import BATCH_SIZE, WORKERS, follow_blocks
+
+_buy_selector = abi.Method.from_signature(BuyArgs.method()).get_selector()
+_quantity_type = abi.UintType(64)
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class AssetTransfer:
+    asset_id: int
+    amount: int
+    receiver: str
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class Purchase:
+    """A confirmed buy call, read from its block."""
+
+    round: int
+    # the position of the call in its block, with round it identifies the purchase
+    intra_round_offset: int
+    app_id: int
+    buyer: str
+    quantity: int
+    # microALGO of the payment grouped with the call
+    paid: int
+    # the inner asset transfers of the call, what the buyer actually got
+    transfers: tuple[AssetTransfer, ...]
+
+
+def _transfers(signed_txn: dict) -> tuple[AssetTransfer, ...]:
+    # algod leaves out fields with a zero value, a 0 unit transfer has no "aamt"
+    return tuple(
+        AssetTransfer(
+            asset_id=inner["txn"]["xaid"],
+            amount=inner["txn"].get("aamt", 0),
+            receiver=inner["txn"]["arcv"],
+        )
+        for inner in signed_txn.get("dt", {}).get("itx", [])
+        if inner["txn"]["type"] == "axfer"
+    )
+
+
+def purchases_in_block(
+    round_number: int, block: dict, app_ids: Collection[int] | None = None
+) -> Iterator[Purchase]:
+    """The buy calls in a block of algod, to app_ids or to any app when None.
+
+    A purchase is a NoOp call with the selector of buy, grouped with the payment
+    just before it, as the buy(pay,uint64)void signature has it.
+    """
+    txns = block.get("txns", [])
+    for offset, signed_txn in enumerate(txns):
+        txn = signed_txn["txn"]
+        if txn["type"] != "appl" or txn.get("apan", 0) != 0:
+            continue
+        app_id = txn.get("apid", 0)
+        if app_ids is not None and app_id not in app_ids:
+            continue
+        args = [base64.b64decode(arg) for arg in txn.get("apaa", [])]
+        if len(args) != 2 or args[0] != _buy_selector:
+            continue
+        payment = txns[offset - 1]["txn"] if offset else {}
+        if payment.get("type") != "pay" or payment.get("grp") != txn.get("grp"):
+            continue
+        yield Purchase(
+            round=round_number,
+            intra_round_offset=offset,
+            app_id=app_id,
+            buyer=txn["snd"],
+            quantity=_quantity_type.decode(args[1]),
+            paid=payment.get("amt", 0),
+            transfers=_transfers(signed_txn),
+        )
+
+
+def follow_purchases(
+    algod_client: AlgodClient,
+    handle_purchase: Callable[[Purchase], None],
+    state_path: Path,
+    *,
+    app_ids: Collection[int] | None = None,
+    start_round: int | None = None,
+    stop_round: int | None = None,
+    batch_size: int = BATCH_SIZE,
+    workers: int = WORKERS,
+) -> int:
+    """Calls handle_purchase with every purchase from the blocks of algod, in order.
+
+    No indexer involved, see follow_blocks for where it starts and how it catches
+    up. After a crash the purchases of the last batch are handled again,
+    so handle_purchase should skip the ones it has seen, by round and offset.
+    """
+
+    def handle_block(round_number: int, block: dict) -> None:
+        for purchase in purchases_in_block(round_number, block, app_ids):
+            handle_purchase(purchase)
+
+    return follow_blocks(
+        algod_client,
+        handle_block,
+        state_path,
+        start_round=start_round,
+        stop_round=stop_round,
+        batch_size=batch_size,
+        workers=workers,
+    )
@@ -0,0 +1,97 @@
+import dataclasses
+import functools
+import typing
+
+import algokit_utils
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+# Slotted, frozen counterparts of the argument and state classes of the generated
+# client. The generated ones go through dataclasses.asdict, which deep copies every
+# argument (including the signer and the transaction of a TransactionWithSigner)
+# and the whole TransactionParameters on every call. These hand their fields to
+# algokit_utils as they are.
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class SetPriceArgs:
+    unitary_price: int
+
+    @staticmethod
+    def method() -> str:
+        return "set_price(uint64)void"
+
+    def encode(self) -> dict[str, typing.Any]:
+        return {"unitary_price": self.unitary_price}
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class OptInToAssetArgs:
+    mbr_pay: TransactionWithSigner
+
+    @staticmethod
+    def method() -> str:
+        return "opt_in_to_asset(pay)void"
+
+    def encode(self) -> dict[str, typing.Any]:
+        return {"mbr_pay": self.mbr_pay}
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class BuyArgs:
+    buyer_txn: TransactionWithSigner
+    quantity: int
+
+    @staticmethod
+    def method() -> str:
+        return "buy(pay,uint64)void"
+
+    def encode(self) -> dict[str, typing.Any]:
+        return {"buyer_txn": self.buyer_txn, "quantity": self.quantity}
+
+
+@dataclasses.dataclass(frozen=True, slots=True, kw_only=True)
+class DeleteApplicationArgs:
+    @staticmethod
+    def method() -> str:
+        return "delete_application()void"
+
+    def encode(self) -> dict[str, typing.Any]:
+        return {}
+
+
+MethodArgs = SetPriceArgs | OptInToAssetArgs | BuyArgs | DeleteApplicationArgs
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class GlobalState:
+    asset_id: int
+    unitary_price: int
+
+    @classmethod
+    def from_raw(cls, data: dict[bytes, bytes | int]) -> "GlobalState":
+        return cls(
+            asset_id=typing.cast(int, data.get(b"asset_id")),
+            unitary_price=typing.cast(int, data.get(b"unitary_price")),
+        )
+
+
+@functools.cache
+def _field_names(parameters_type: type) -> tuple[str, ...]:
+    return tuple(field.name for field in dataclasses.fields(parameters_type))
+
+
+def call_parameters(
+    transaction_parameters: algokit_utils.TransactionParameters | None,
+) -> algokit_utils.OnCompleteCallParametersDict:
+    """Shallow dict of the fields of transaction_parameters that are set."""
+    if transaction_parameters is None:
+        return {}
+    return typing.cast(
+        algokit_utils.OnCompleteCallParametersDict,
+        {
+            name: value
+            # mypy takes type[TransactionParameters] for an unhashable dataclass
+            for name in _field_names(typing.cast(type, type(transaction_parameters)))
+            if (value := getattr(transaction_parameters, name)) is not None
+        },
+    )
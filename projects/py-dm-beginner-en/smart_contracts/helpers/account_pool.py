@@ -0,0 +1,59 @@
+import threading
+
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient, PayParams
+
+# the most transactions an atomic group can hold
+MAX_GROUP_SIZE = 16
+
+
+class AccountPool:
+    """Funded accounts for tests, one each, so no two tests share an account.
+
+    The dispenser funds accounts batch_size at a time in a single atomic group,
+    rather than with one round trip per account. Every pytest-xdist worker has a
+    session of its own, and with it a pool of its own.
+    """
+
+    def __init__(
+        self,
+        algorand: AlgorandClient,
+        dispenser: AddressAndSigner,
+        *,
+        amount: int = 10_000_000,
+        batch_size: int = MAX_GROUP_SIZE,
+    ) -> None:
+        if not 1 <= batch_size <= MAX_GROUP_SIZE:
+            raise Exception(f"batch_size must be between 1 and {MAX_GROUP_SIZE}")
+        self.algorand = algorand
+        self.dispenser = dispenser
+        self.amount = amount
+        self.batch_size = batch_size
+        self._accounts: list[AddressAndSigner] = []
+        self._lock = threading.Lock()
+
+    def warm(self, count: int) -> None:
+        """Funds accounts until at least count of them are waiting to be taken."""
+        with self._lock:
+            while len(self._accounts) < count:
+                self._fund_batch()
+
+    def take(self) -> AddressAndSigner:
+        with self._lock:
+            if not self._accounts:
+                self._fund_batch()
+            return self._accounts.pop()
+
+    def _fund_batch(self) -> None:
+        accounts = [self.algorand.account.random() for _ in range(self.batch_size)]
+        group = self.algorand.new_group()
+        for account in accounts:
+            group.add_payment(
+                PayParams(
+                    sender=self.dispenser.address,
+                    receiver=account.address,
+                    amount=self.amount,
+                )
+            )
+        group.execute()
+        self._accounts.extend(accounts)
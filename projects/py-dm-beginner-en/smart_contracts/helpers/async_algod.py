@@ -0,0 +1,106 @@
+import base64
+from collections.abc import Sequence
+
+import httpx
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import GenericSignedTransaction, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+
+class AsyncAlgodClient:
+    """The handful of algod endpoints needed to send app calls, on a non-blocking transport.
+
+    One instance (and its connection pool) is meant to be shared by every coroutine
+    on the event loop.
+    """
+
+    def __init__(
+        self,
+        algod_address: str,
+        algod_token: str = "",
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        self.http_client = httpx.AsyncClient(
+            base_url=algod_address.rstrip("/"),
+            headers={"X-Algo-API-Token": algod_token, **(headers or {})},
+        )
+
+    @classmethod
+    def from_algod_client(cls, algod_client: AlgodClient) -> "AsyncAlgodClient":
+        return cls(
+            algod_client.algod_address,
+            algod_client.algod_token,
+            algod_client.headers,
+        )
+
+    async def aclose(self) -> None:
+        await self.http_client.aclose()
+
+    async def _request(
+        self, method: str, path: str, *, content: bytes | None = None
+    ) -> dict:
+        headers = {"Content-Type": "application/x-binary"} if content else None
+        response = await self.http_client.request(
+            method, path, content=content, headers=headers
+        )
+        if response.is_error:
+            try:
+                message = response.json()["message"]
+            except (ValueError, KeyError):
+                message = response.text
+            raise AlgodHTTPError(message, response.status_code)
+        return response.json()
+
+    async def suggested_params(self) -> SuggestedParams:
+        params = await self._request("GET", "/v2/transactions/params")
+        return SuggestedParams(
+            fee=params["fee"],
+            first=params["last-round"],
+            last=params["last-round"] + 1000,
+            gh=params["genesis-hash"],
+            gen=params["genesis-id"],
+            flat_fee=False,
+            consensus_version=params["consensus-version"],
+            min_fee=params["min-fee"],
+        )
+
+    async def send_transactions(self, txns: Sequence[GenericSignedTransaction]) -> str:
+        """Sends a signed group and returns the id of its first transaction."""
+        content = b"".join(base64.b64decode(encoding.msgpack_encode(t)) for t in txns)
+        response = await self._request("POST", "/v2/transactions", content=content)
+        return response["txId"]
+
+    async def pending_transaction_info(self, txid: str) -> dict:
+        return await self._request("GET", f"/v2/transactions/pending/{txid}")
+
+    async def block_txids(self, round_num: int) -> list[str]:
+        response = await self._request("GET", f"/v2/blocks/{round_num}/txids")
+        return response["blockTxids"]
+
+    async def status(self) -> dict:
+        return await self._request("GET", "/v2/status")
+
+    async def status_after_block(self, round_num: int) -> dict:
+        return await self._request(
+            "GET", f"/v2/status/wait-for-block-after/{round_num}"
+        )
+
+    async def application_info(self, app_id: int) -> dict:
+        return await self._request("GET", f"/v2/applications/{app_id}")
+
+    async def wait_for_confirmation(self, txid: str, wait_rounds: int = 4) -> dict:
+        """Waits without blocking the event loop, other coroutines keep running meanwhile."""
+        current_round = (await self.status())["last-round"]
+        last_round = current_round + wait_rounds
+        while current_round <= last_round:
+            txn_info = await self.pending_transaction_info(txid)
+            if txn_info.get("confirmed-round", 0) > 0:
+                return txn_info
+            if txn_info.get("pool-error"):
+                raise Exception(
+                    f"Transaction {txid} rejected: {txn_info['pool-error']}"
+                )
+            status = await self.status_after_block(current_round)
+            current_round = status["last-round"]
+        raise Exception(f"Transaction {txid} not confirmed after {wait_rounds} rounds")
@@ -0,0 +1,81 @@
+import json
+import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.helpers.util import write_atomically
+
+logger = logging.getLogger(__name__)
+# rounds fetched at once while catching up, and the threads fetching them
+BATCH_SIZE = 50
+WORKERS = 8
+
+BlockHandler = Callable[[int, dict], None]
+
+
+def _load(path: Path) -> int | None:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())["next_round"]
+
+
+def _save(path: Path, next_round: int) -> None:
+    write_atomically(path, json.dumps({"next_round": next_round}))
+
+
+def _block(algod_client: AlgodClient, round_number: int) -> dict:
+    response = algod_client.block_info(round_num=round_number)
+    assert isinstance(response, dict)
+    return response["block"]
+
+
+def _last_round(algod_client: AlgodClient) -> int:
+    status = algod_client.status()
+    assert isinstance(status, dict)
+    return status["last-round"]
+
+
+def follow_blocks(
+    algod_client: AlgodClient,
+    handle_block: BlockHandler,
+    state_path: Path,
+    *,
+    start_round: int | None = None,
+    stop_round: int | None = None,
+    batch_size: int = BATCH_SIZE,
+    workers: int = WORKERS,
+) -> int:
+    """Calls handle_block with every round and its block, in order, straight from algod.
+
+    Starts at the round saved in state_path, else at start_round, else at the last
+    round of the node. Rounds the node already has are fetched batch_size at a time
+    on workers threads, then handled in order; once caught up, it waits for each new
+    round. The position is saved after every batch, so after a crash the follower
+    starts over at the first round of the batch it was in: handle_block sees those
+    rounds again and has to tolerate it. Returns the next round to handle once
+    stop_round is handled, and never without a stop_round.
+    """
+    next_round = _load(state_path)
+    if next_round is None:
+        next_round = start_round
+    if next_round is None:
+        next_round = _last_round(algod_client)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while stop_round is None or next_round <= stop_round:
+            last_round = _last_round(algod_client)
+            if next_round > last_round:
+                algod_client.status_after_block(last_round)
+                continue
+            if stop_round is not None:
+                last_round = min(last_round, stop_round)
+            rounds = range(next_round, min(next_round + batch_size, last_round + 1))
+            blocks = executor.map(lambda r: _block(algod_client, r), rounds)
+            for round_number, block in zip(rounds, blocks, strict=True):
+                handle_block(round_number, block)
+            next_round = rounds[-1] + 1
+            _save(state_path, next_round)
+            logger.debug(f"Handled rounds {rounds[0]} to {rounds[-1]}")
+    return next_round
@@ -1,30 +1,153 @@
+import io
+import json
 import logging
 import subprocess
+import sys
+import time
+from collections.abc import Callable, Sequence
+from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from shutil import rmtree
 
+from smart_contracts.helpers import build_cache, bytecode, fees, manifest
 from smart_contracts.helpers.util import find_app_spec_file
 
 logger = logging.getLogger(__name__)
 deployment_extension = "py"
+puyapy_flags = ("--output-arc32",)
+# kept next to contract.py by `python -m smart_contracts sweep`, the puyapy options
+# of the cheapest variant that passed the tests
+variant_file_name = "puyapy_variant.json"
 
 
-def build(output_dir: Path, contract_path: Path) -> Path:
+def variant_flags(
+    optimization_level: int | None = None, avm_version: int | None = None
+) -> tuple[str, ...]:
+    flags: tuple[str, ...] = ()
+    if optimization_level is not None:
+        flags += (f"--optimization-level={optimization_level}",)
+    if avm_version is not None:
+        flags += (f"--target-avm-version={avm_version}",)
+    return flags
+
+
+def contract_flags(contract_path: Path) -> tuple[str, ...]:
+    """The puyapy flags of a contract, including the variant selected for it."""
+    variant_path = contract_path.parent / variant_file_name
+    if not variant_path.exists():
+        return puyapy_flags
+    return puyapy_flags + variant_flags(**json.loads(variant_path.read_text()))
+
+
+def build(
+    output_dir: Path,
+    contract_path: Path,
+    *,
+    use_cache: bool = True,
+    in_process: bool = True,
+    flags: Sequence[str] | None = None,
+) -> Path:
+    if flags is None:
+        flags = contract_flags(contract_path)
     output_dir = output_dir.resolve()
-    if output_dir.exists():
-        rmtree(output_dir)
-    output_dir.mkdir(exist_ok=True, parents=True)
-    logger.info(f"Exporting {contract_path} to {output_dir}")
+    output_dir.parent.mkdir(exist_ok=True, parents=True)
+    # build next to the output dir and swap it in at the end,
+    # so a failed build never leaves a half-written artifact directory behind
+    staging_dir = output_dir.with_name(f".{output_dir.name}.staging")
+    if staging_dir.exists():
+        rmtree(staging_dir)
+    staging_dir.mkdir()
+
+    try:
+        cache_key = build_cache.compute_key(contract_path, flags)
+        if use_cache and build_cache.restore(cache_key, staging_dir):
+            logger.info(f"Restored {contract_path} from build cache into {output_dir}")
+            # entries cached without bytecode (no algod at the time) get it now
+            if not bytecode.is_current(staging_dir):
+                bytecode.write_bytecode(staging_dir)
+        else:
+            logger.info(f"Exporting {contract_path} to {output_dir}")
+            started = time.perf_counter()
+            _compile(staging_dir, contract_path, flags, in_process=in_process)
+            build_cache.store(cache_key, staging_dir, time.perf_counter() - started)
+        app_spec_file_name = find_app_spec_file(staging_dir)
+        if app_spec_file_name is None:
+            raise Exception("Could not find .arc32.json file in build output")
+        # cheap, so written on cache hits too, which then also get a manifest if
+        # they were cached before manifests existed
+        manifest.write_manifest(staging_dir)
+        manifest.check_budget(
+            staging_dir, contract_path.parent / manifest.budget_file_name, output_dir
+        )
+        build_cache.replace_dir(staging_dir, output_dir)
+    finally:
+        if staging_dir.exists():
+            rmtree(staging_dir)
+    return output_dir / app_spec_file_name
+
+
+def _compile(
+    output_dir: Path, contract_path: Path, flags: Sequence[str], *, in_process: bool
+) -> None:
+    puyapy_args = [str(contract_path.absolute()), f"--out-dir={output_dir}"]
+    puyapy_args.extend(flags)
+    if not (in_process and _run_puyapy_in_process(puyapy_args)):
+        _run_puyapy_subprocess(puyapy_args)
+
+    app_spec_file_name = find_app_spec_file(output_dir)
+    if app_spec_file_name is None:
+        raise Exception("Could not generate typed client, .arc32.json file not found")
+
+    app_spec_path = output_dir / app_spec_file_name
+    client_path = output_dir / f"client.{deployment_extension}"
+    if not (in_process and _generate_client_in_process(app_spec_path, client_path)):
+        _generate_client_subprocess(app_spec_path, client_path)
+
+    fees.write_fee_table(output_dir)
+    # stored in the build cache with the rest, deploys load it instead of compiling
+    bytecode.write_bytecode(output_dir)
+
 
+def _run_captured(entry_point: Callable[[], object], argv: list[str]) -> str | None:
+    """Runs a CLI entry point in this interpreter, returns its output if it failed."""
+    output = io.StringIO()
+    original_argv = sys.argv
+    sys.argv = argv
+    try:
+        with redirect_stdout(output), redirect_stderr(output):
+            entry_point()
+    except SystemExit as ex:
+        if ex.code:
+            return output.getvalue()
+    finally:
+        sys.argv = original_argv
+    return None
+
+
+def _run_puyapy_in_process(puyapy_args: list[str]) -> bool:
+    """Compiles with the puyapy API already imported in this interpreter.
+
+    Returns False when puyapy isn't importable, so the caller can fall back to a subprocess.
+    """
+    try:
+        import structlog
+        from puya.__main__ import main as puyapy_main
+    except ImportError:
+        logger.debug("puyapy is not importable, compiling in a subprocess")
+        return False
+
+    # puyapy configures structlog once per run and refuses to do it a second time,
+    # so the configuration of the previous contract is dropped first
+    structlog.reset_defaults()
+    error_output = _run_captured(puyapy_main, ["puyapy", *puyapy_args])
+    if error_output is not None:
+        raise Exception(f"Could not build contract:\n{error_output}")
+    return True
+
+
+def _run_puyapy_subprocess(puyapy_args: list[str]) -> None:
     build_result = subprocess.run(
-        [
-            "poetry",
-            "run",
-            "puyapy",
-            contract_path.absolute(),
-            f"--out-dir={output_dir}",
-            "--output-arc32",
-        ],
+        ["poetry", "run", "puyapy", *puyapy_args],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
         text=True,
@@ -32,18 +155,28 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     if build_result.returncode:
         raise Exception(f"Could not build contract:\n{build_result.stdout}")
 
-    app_spec_file_name = find_app_spec_file(output_dir)
-    if app_spec_file_name is None:
-        raise Exception("Could not generate typed client, .arc32.json file not found")
 
+def _generate_client_in_process(app_spec_path: Path, client_path: Path) -> bool:
+    """Generates the typed client with algokit-client-generator, if it is installed."""
+    try:
+        from algokit_client_generator import generate_client
+    except ImportError:
+        logger.debug("algokit-client-generator is not importable, using algokit")
+        return False
+
+    generate_client(app_spec_path, client_path)
+    return True
+
+
+def _generate_client_subprocess(app_spec_path: Path, client_path: Path) -> None:
     generate_result = subprocess.run(
         [
             "algokit",
             "generate",
             "client",
-            output_dir / app_spec_file_name,
+            app_spec_path,
             "--output",
-            output_dir / f"client.{deployment_extension}",
+            client_path,
         ],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
@@ -59,4 +192,3 @@ def build(output_dir: Path, contract_path: Path) -> Path:
             raise Exception(
                 f"Could not generate typed client:\n{generate_result.stdout}"
             )
-    return output_dir / app_spec_file_name
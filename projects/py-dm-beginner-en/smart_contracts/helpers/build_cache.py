@@ -0,0 +1,161 @@
+import ast
+import dataclasses
+import hashlib
+import importlib.metadata
+import json
+import os
+import shutil
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+cache_dir = Path(".algokit") / "build-cache"
+# packages whose version changes the compiled output even when the sources don't
+versioned_packages = ("puyapy", "algorand-python", "algokit-client-generator")
+_metadata_file_name = "cache.json"
+
+
+@dataclasses.dataclass
+class BuildCacheStats:
+    hits: int = 0
+    misses: int = 0
+    time_saved: float = 0.0
+
+    def merge(self, other: "BuildCacheStats") -> None:
+        self.hits += other.hits
+        self.misses += other.misses
+        self.time_saved += other.time_saved
+
+    def report(self) -> str:
+        return (
+            f"Build cache: {self.hits} hit(s), {self.misses} miss(es), "
+            f"{self.time_saved:.2f}s saved"
+        )
+
+
+stats = BuildCacheStats()
+
+
+def _package_version(name: str) -> str:
+    try:
+        return importlib.metadata.version(name)
+    except importlib.metadata.PackageNotFoundError:
+        return "missing"
+
+
+def _resolve_module(module: str, root: Path) -> Path | None:
+    """Returns the local file backing a dotted module name, if it is part of the project."""
+    base = root.joinpath(*module.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _imported_files(source_file: Path, root: Path) -> Iterable[Path]:
+    """Yields the project files imported by source_file (third party modules are skipped)."""
+    tree = ast.parse(source_file.read_text(), filename=str(source_file))
+    package = source_file.parent.relative_to(root).parts
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            modules = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            prefix = package[: len(package) - node.level + 1] if node.level else ()
+            module = ".".join([*prefix, *(node.module or "").split(".")]).strip(".")
+            # `from pkg import name` may refer to a submodule or to an attribute
+            modules = [module, *(f"{module}.{alias.name}" for alias in node.names)]
+        else:
+            continue
+        for module in modules:
+            path = _resolve_module(module, root)
+            if path is not None:
+                yield path
+
+
+def compute_key(contract_path: Path, flags: Iterable[str]) -> str:
+    """Hashes the contract, the project modules it imports, toolchain versions and flags."""
+    root = Path.cwd().resolve()
+    pending = [contract_path.resolve()]
+    seen: set[Path] = set()
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        if path.is_relative_to(root):
+            pending.extend(p.resolve() for p in _imported_files(path, root))
+
+    digest = hashlib.sha256()
+    for path in sorted(seen):
+        name = path.relative_to(root) if path.is_relative_to(root) else path
+        digest.update(str(name).encode())
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    for package in versioned_packages:
+        digest.update(f"{package}=={_package_version(package)}".encode())
+    for flag in flags:
+        digest.update(flag.encode())
+    return digest.hexdigest()
+
+
+def replace_dir(staging_dir: Path, output_dir: Path) -> None:
+    """Moves the files of staging_dir into output_dir, then drops the stale ones.
+
+    Each file is swapped in with an atomic os.replace, so every artifact can be read
+    at any time, there is no moment without the directory or one of its files.
+    """
+    if not output_dir.exists():
+        staging_dir.rename(output_dir)
+        return
+    staged = {file.name for file in staging_dir.iterdir()}
+    for file_name in sorted(staged):
+        os.replace(staging_dir / file_name, output_dir / file_name)
+    for file in output_dir.iterdir():
+        if file.name not in staged:
+            if file.is_dir():
+                shutil.rmtree(file)
+            else:
+                file.unlink()
+    staging_dir.rmdir()
+
+
+def restore(key: str, staging_dir: Path) -> bool:
+    """Copies a cached build into staging_dir, returns False on a cache miss."""
+    entry = cache_dir / key
+    metadata_path = entry / _metadata_file_name
+    if not metadata_path.exists():
+        stats.misses += 1
+        return False
+
+    started = time.perf_counter()
+    metadata = json.loads(metadata_path.read_text())
+    for file_name in metadata["files"]:
+        shutil.copy2(entry / file_name, staging_dir / file_name)
+    elapsed = time.perf_counter() - started
+
+    stats.hits += 1
+    stats.time_saved += max(metadata["build_seconds"] - elapsed, 0.0)
+    return True
+
+
+def store(key: str, output_dir: Path, build_seconds: float) -> None:
+    """Saves the files of a fresh build under key."""
+    entry = cache_dir / key
+    if entry.exists():
+        return
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    staging_entry = cache_dir / f".{key}.staging"
+    if staging_entry.exists():
+        shutil.rmtree(staging_entry)
+    staging_entry.mkdir()
+
+    files = sorted(file.name for file in output_dir.iterdir() if file.is_file())
+    for file_name in files:
+        shutil.copy2(output_dir / file_name, staging_entry / file_name)
+    (staging_entry / _metadata_file_name).write_text(
+        json.dumps({"files": files, "build_seconds": build_seconds})
+    )
+    try:
+        staging_entry.rename(entry)
+    except OSError:
+        # another build stored the same key first
+        shutil.rmtree(staging_entry)
@@ -0,0 +1,177 @@
+import base64
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from smart_contracts.helpers.util import find_app_spec_file
+
+if TYPE_CHECKING:
+    from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+# stored next to the .arc32.json, the hashes of the .bin files and of their TEAL
+bytecode_suffix = ".bytecode.json"
+programs = ("approval", "clear")
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def _contract_name(output_dir: Path) -> str | None:
+    app_spec_file_name = find_app_spec_file(output_dir)
+    if app_spec_file_name is None:
+        return None
+    return app_spec_file_name.removesuffix(".arc32.json")
+
+
+def _default_algod_client() -> "AlgodClient | None":
+    """The algod of the environment, None when none is configured."""
+    if not os.getenv("ALGOD_SERVER"):
+        return None
+    # only needed here, keeps algokit_utils out of builds that have bytecode cached
+    from algokit_utils import get_algod_client
+
+    return get_algod_client()
+
+
+def is_current(output_dir: Path) -> bool:
+    """Whether output_dir has the bytecode of the TEAL it holds."""
+    contract_name = _contract_name(output_dir)
+    if contract_name is None:
+        return False
+    hashes_path = output_dir / f"{contract_name}{bytecode_suffix}"
+    if not hashes_path.exists():
+        return False
+    hashes = json.loads(hashes_path.read_text())
+    for program in programs:
+        teal = (output_dir / f"{contract_name}.{program}.teal").read_bytes()
+        if hashes[program]["teal_sha256"] != _sha256(teal):
+            return False
+        if not (output_dir / f"{contract_name}.{program}.bin").exists():
+            return False
+    return True
+
+
+def write_bytecode(output_dir: Path, algod_client: "AlgodClient | None" = None) -> bool:
+    """Compiles the TEAL in output_dir with algod and writes the bytecode next to it.
+
+    Writes <name>.<program>.bin, the algod source map as <name>.<program>.teal.map
+    and <name>.bytecode.json with the sha256 of each .bin and of the TEAL it came
+    from. Returns False, writing nothing, when the TEAL has template variables or
+    no algod is configured or reachable; deploys then compile the TEAL like they
+    always did. The files depend on the algod that compiled them, so they are
+    gitignored.
+    """
+    contract_name = _contract_name(output_dir)
+    if contract_name is None:
+        raise Exception("Could not write bytecode, .arc32.json file not found")
+    sources = {
+        program: (output_dir / f"{contract_name}.{program}.teal").read_text()
+        for program in programs
+    }
+    if any("TMPL_" in source for source in sources.values()):
+        logger.info("Not writing bytecode, the TEAL has deploy-time template values")
+        return False
+    algod_client = algod_client or _default_algod_client()
+    if algod_client is None:
+        logger.info("Not writing bytecode, ALGOD_SERVER is not set")
+        return False
+    # imported here like algokit_utils, builds without algod never load algosdk
+    from algosdk.error import AlgodHTTPError
+
+    try:
+        results = {
+            program: algod_client.compile(source, source_map=True)
+            for program, source in sources.items()
+        }
+    except (AlgodHTTPError, OSError) as ex:
+        logger.warning(f"Not writing bytecode, could not compile with algod: {ex}")
+        return False
+
+    hashes = {}
+    for program, result in results.items():
+        assert isinstance(result, dict)
+        bytecode = base64.b64decode(result["result"])
+        (output_dir / f"{contract_name}.{program}.bin").write_bytes(bytecode)
+        (output_dir / f"{contract_name}.{program}.teal.map").write_text(
+            json.dumps(result["sourcemap"])
+        )
+        hashes[program] = {
+            "sha256": _sha256(bytecode),
+            "teal_sha256": _sha256(sources[program].encode()),
+        }
+    (output_dir / f"{contract_name}{bytecode_suffix}").write_text(
+        json.dumps(hashes, indent=4) + "\n"
+    )
+    return True
+
+
+def load_compile_results(output_dir: Path) -> dict[str, dict]:
+    """What algod's compile endpoint answers for the TEAL in output_dir, by TEAL.
+
+    Keyed by the sha256 of the TEAL as algokit_utils sends it, comments stripped.
+    Programs whose bytecode is missing, or doesn't match its hash or its TEAL, are
+    left out, so they are compiled by algod as before.
+    """
+    from algokit_utils.deploy import strip_comments
+    from algosdk.logic import address
+
+    contract_name = _contract_name(output_dir)
+    if contract_name is None:
+        return {}
+    hashes_path = output_dir / f"{contract_name}{bytecode_suffix}"
+    if not hashes_path.exists():
+        return {}
+    hashes = json.loads(hashes_path.read_text())
+    results = {}
+    for program in programs:
+        source = (output_dir / f"{contract_name}.{program}.teal").read_text()
+        bytecode_path = output_dir / f"{contract_name}.{program}.bin"
+        if not bytecode_path.exists():
+            continue
+        bytecode = bytecode_path.read_bytes()
+        if (
+            _sha256(bytecode) != hashes[program]["sha256"]
+            or _sha256(source.encode()) != hashes[program]["teal_sha256"]
+        ):
+            logger.warning(f"{bytecode_path} is stale, rebuild to compile it again")
+            continue
+        results[_sha256(strip_comments(source).encode())] = {
+            "hash": address(bytecode),
+            "result": base64.b64encode(bytecode).decode(),
+            "sourcemap": json.loads(
+                (output_dir / f"{contract_name}.{program}.teal.map").read_text()
+            ),
+        }
+    return results
+
+
+class PrecompiledAlgodClient:
+    """Wraps an AlgodClient and answers compile calls from the bytecode of a build.
+
+    Everything else goes to the wrapped client, as does the compilation of TEAL the
+    build didn't compile, e.g. with other template values.
+    """
+
+    def __init__(
+        self, algod_client: "AlgodClient", compile_results: dict[str, dict]
+    ) -> None:
+        self.algod_client = algod_client
+        self.compile_results = compile_results
+
+    def compile(
+        self, source: str, *, source_map: bool = False, **kwargs: Any
+    ) -> dict | bytes:
+        result = self.compile_results.get(_sha256(source.encode()))
+        if result is None:
+            return self.algod_client.compile(source, source_map=source_map, **kwargs)
+        if not source_map:
+            result = {k: v for k, v in result.items() if k != "sourcemap"}
+        return result
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.algod_client, name)
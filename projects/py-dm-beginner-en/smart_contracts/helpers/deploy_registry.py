@@ -0,0 +1,196 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import threading
+from collections.abc import Callable
+from pathlib import Path
+
+import algokit_utils
+from algokit_utils.deploy import (
+    add_deploy_template_variables,
+    replace_template_variables,
+)
+from algosdk.error import AlgodHTTPError
+from algosdk.logic import get_application_address
+
+from smart_contracts.helpers.util import write_atomically
+
+logger = logging.getLogger(__name__)
+registry_path = Path(".algokit") / "deployments.json"
+
+
+@dataclasses.dataclass
+class Deployment:
+    """What the last deploy of an app left on chain, as far as the next one cares."""
+
+    app_id: int
+    # sha256 of the approval and clear TEAL, template variables substituted, and of
+    # the state schema
+    approval_hash: str
+    version: str
+    created_round: int
+    updated_round: int
+    deletable: bool | None
+    updatable: bool | None
+
+    def app_metadata(self, name: str) -> algokit_utils.AppMetaData:
+        """The metadata the algokit_utils deployer otherwise reads from the indexer."""
+        deploy_metadata = algokit_utils.AppDeployMetaData(
+            name=name,
+            version=self.version,
+            deletable=self.deletable,
+            updatable=self.updatable,
+        )
+        return algokit_utils.AppMetaData(
+            app_id=self.app_id,
+            app_address=get_application_address(self.app_id),
+            name=name,
+            version=self.version,
+            deletable=self.deletable,
+            updatable=self.updatable,
+            created_round=self.created_round,
+            updated_round=self.updated_round,
+            created_metadata=deploy_metadata,
+            deleted=False,
+        )
+
+
+class DeploymentRegistry:
+    """File-backed record of deployed apps, by network genesis hash, creator and name.
+
+    Safe to share between threads; every change is written to path straight away.
+    """
+
+    def __init__(self, path: Path = registry_path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        # genesis hash -> creator -> app name -> deployment
+        self._entries: dict[str, dict[str, dict[str, dict]]] = (
+            json.loads(path.read_text()) if path.exists() else {}
+        )
+
+    def get(self, genesis_hash: str, creator: str, name: str) -> Deployment | None:
+        with self._lock:
+            entry = self._entries.get(genesis_hash, {}).get(creator, {}).get(name)
+        return None if entry is None else Deployment(**entry)
+
+    def put(
+        self, genesis_hash: str, creator: str, name: str, deployment: Deployment
+    ) -> None:
+        with self._lock:
+            apps = self._entries.setdefault(genesis_hash, {}).setdefault(creator, {})
+            apps[name] = dataclasses.asdict(deployment)
+            self._save()
+
+    def remove(self, genesis_hash: str, creator: str, name: str) -> None:
+        with self._lock:
+            self._entries.get(genesis_hash, {}).get(creator, {}).pop(name, None)
+            self._save()
+
+    def _save(self) -> None:
+        write_atomically(self.path, json.dumps(self._entries, indent=2))
+
+
+def approval_hash(
+    app_spec: algokit_utils.ApplicationSpecification,
+    template_values: algokit_utils.TemplateValueMapping | None,
+    allow_update: bool | None,
+    allow_delete: bool | None,
+) -> str:
+    """Hash of the programs and schema a deploy with these arguments would install.
+
+    A change to any of them makes the deployer update or replace the app.
+    """
+    values = dict(template_values or {})
+    add_deploy_template_variables(values, allow_update, allow_delete)
+    digest = hashlib.sha256()
+    for teal in (app_spec.approval_program, app_spec.clear_program):
+        digest.update(replace_template_variables(teal, values).encode() + b"\0")
+    for schema in (app_spec.global_state_schema, app_spec.local_state_schema):
+        digest.update(f"{schema.num_uints},{schema.num_byte_slices};".encode())
+    return digest.hexdigest()
+
+
+def _app_exists(app_client: algokit_utils.ApplicationClient, app_id: int) -> bool:
+    try:
+        app_client.algod_client.application_info(app_id)
+    except AlgodHTTPError as ex:
+        if ex.code == 404:
+            return False
+        raise
+    return True
+
+
+def registered_deploy(
+    app_client: algokit_utils.ApplicationClient,
+    registry: DeploymentRegistry,
+    deploy: Callable[[], algokit_utils.DeployResponse],
+    *,
+    sender: str | None,
+    version: str | None,
+    template_values: algokit_utils.TemplateValueMapping | None,
+    allow_update: bool | None,
+    allow_delete: bool | None,
+) -> algokit_utils.DeployResponse:
+    """Runs deploy with the app found in registry instead of through the indexer.
+
+    When the registry has the app, with the same approval program and version,
+    nothing is sent: the app only has to still exist on algod. When the program
+    changed, the deployer gets the app from the registry and decides between
+    update and replace with algod alone. The indexer is only searched for apps
+    the registry doesn't have (or that were deleted since). The outcome is
+    recorded either way.
+    """
+    creator = sender or app_client.sender
+    if creator is None:
+        raise Exception("Could not look up the app, no sender (its creator) given")
+    name = app_client.app_name
+    genesis_hash = app_client.algod_client.suggested_params().gh
+    new_hash = approval_hash(
+        app_client.app_spec,
+        # the values given to the client apply unless deploy overrides them
+        {**(app_client.template_values or {}), **(template_values or {})},
+        allow_update,
+        allow_delete,
+    )
+    deployment = registry.get(genesis_hash, creator, name)
+    if deployment is not None and not _app_exists(app_client, deployment.app_id):
+        logger.info(f"{name} ({deployment.app_id}) no longer exists, forgetting it")
+        registry.remove(genesis_hash, creator, name)
+        deployment = None
+
+    if deployment is None:
+        logger.debug(f"{name} is not in {registry.path}, searching the indexer")
+    elif deployment.approval_hash == new_hash and version in (
+        None,
+        deployment.version,
+    ):
+        app_client.app_id = deployment.app_id
+        logger.info(f"{name} ({deployment.app_id}) is up to date, nothing to deploy")
+        return algokit_utils.DeployResponse(
+            app=deployment.app_metadata(name),
+            action_taken=algokit_utils.OperationPerformed.Nothing,
+        )
+    else:
+        app_client.existing_deployments = algokit_utils.AppLookup(
+            creator, {name: deployment.app_metadata(name)}
+        )
+
+    response = deploy()
+    app = response.app
+    registry.put(
+        genesis_hash,
+        creator,
+        name,
+        Deployment(
+            app_id=app.app_id,
+            approval_hash=new_hash,
+            version=app.version,
+            created_round=app.created_round,
+            updated_round=app.updated_round,
+            deletable=app.deletable,
+            updatable=app.updatable,
+        ),
+    )
+    return response
@@ -0,0 +1,42 @@
+"""In-process stand-in for LocalNet, selected with ``pytest --backend=emulator``.
+
+The approval programs the tests deploy are the TEAL sources in the artifacts, which
+emulator.avm interprets against the in-memory emulator.ledger. Nothing is sent
+over the network, so the suite and the benchmarks run without Docker or a node.
+
+Run `algokit project run build` after changing a contract, the ledger only knows
+the artifacts. Signatures aren't checked, and boxes and local state aren't
+emulated, tests that need them are marked `localnet`.
+"""
+
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import AlgorandClient
+from algokit_utils.beta.client_manager import AlgoSdkClients
+
+from smart_contracts.helpers.emulator.algod import EmulatedAlgodClient
+from smart_contracts.helpers.emulator.ledger import Ledger
+
+# what LocalNet's dispenser starts with, give or take
+DISPENSER_FUNDS = 4_000_000 * 10**6
+
+
+def algorand_client() -> AlgorandClient:
+    # every transaction is a round, so cached params and a 10 round window go stale
+    # after a few calls, the in-process params are free to fetch every time
+    return (
+        AlgorandClient.from_clients(AlgoSdkClients(algod=EmulatedAlgodClient()))
+        .set_suggested_params_timeout(0)
+        .set_default_validity_window(1000)
+    )
+
+
+def dispenser(algorand: AlgorandClient) -> AddressAndSigner:
+    """A new account that the emulated genesis funds, like LocalNet's dispenser."""
+    algod = algorand.client.algod
+    assert isinstance(algod, EmulatedAlgodClient)
+    account = algorand.account.random()
+    algod.ledger.fund(account.address, DISPENSER_FUNDS)
+    return account
+
+
+__all__ = ["EmulatedAlgodClient", "Ledger", "algorand_client", "dispenser"]
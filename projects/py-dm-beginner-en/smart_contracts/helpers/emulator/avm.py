@@ -0,0 +1,760 @@
+"""A small interpreter for the TEAL that puyapy writes to the artifacts.
+
+It runs the assembly source, not bytecode, and covers the opcodes the contracts of
+this project use plus the common stack, arithmetic and flow ones. Anything else
+raises NotImplementedError rather than being guessed at.
+"""
+
+import base64
+import dataclasses
+import re
+from collections.abc import Callable
+from typing import Protocol
+
+from algosdk import abi, encoding
+
+from smart_contracts.helpers.emulator.txn import (
+    TYPE_ENUMS,
+    Txn,
+    address_bytes,
+    address_str,
+)
+
+StackValue = int | bytes
+
+MAX_UINT64 = 2**64 - 1
+
+NAMED_INTS = {
+    **TYPE_ENUMS,
+    "unknown": 0,
+    "NoOp": 0,
+    "OptIn": 1,
+    "CloseOut": 2,
+    "ClearState": 3,
+    "UpdateApplication": 4,
+    "DeleteApplication": 5,
+}
+
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|\S+')
+
+# AVM transaction field name -> Txn attribute
+_FIELDS = {
+    "Sender": "sender",
+    "Fee": "fee",
+    "FirstValid": "first_valid",
+    "LastValid": "last_valid",
+    "Note": "note",
+    "GroupIndex": "group_index",
+    "Receiver": "receiver",
+    "Amount": "amount",
+    "CloseRemainderTo": "close_remainder_to",
+    "XferAsset": "xfer_asset",
+    "AssetAmount": "asset_amount",
+    "AssetSender": "asset_sender",
+    "AssetReceiver": "asset_receiver",
+    "AssetCloseTo": "asset_close_to",
+    "ConfigAsset": "config_asset",
+    "ConfigAssetTotal": "config_asset_total",
+    "ConfigAssetDecimals": "config_asset_decimals",
+    "ConfigAssetDefaultFrozen": "config_asset_default_frozen",
+    "ConfigAssetUnitName": "config_asset_unit_name",
+    "ConfigAssetName": "config_asset_name",
+    "ConfigAssetURL": "config_asset_url",
+    "ConfigAssetManager": "config_asset_manager",
+    "ConfigAssetReserve": "config_asset_reserve",
+    "ConfigAssetFreeze": "config_asset_freeze",
+    "ConfigAssetClawback": "config_asset_clawback",
+    "ApplicationID": "application_id",
+    "OnCompletion": "on_completion",
+    "ApprovalProgram": "approval_program",
+    "ClearStateProgram": "clear_state_program",
+    "GlobalNumUint": "global_num_uint",
+    "GlobalNumByteSlice": "global_num_byte_slice",
+}
+_ADDRESS_FIELDS = {
+    "Sender",
+    "Receiver",
+    "CloseRemainderTo",
+    "AssetSender",
+    "AssetReceiver",
+    "AssetCloseTo",
+    "ConfigAssetManager",
+    "ConfigAssetReserve",
+    "ConfigAssetFreeze",
+    "ConfigAssetClawback",
+}
+_ARRAY_FIELDS = {
+    "ApplicationArgs": "application_args",
+    "Accounts": "accounts",
+    "Assets": "assets",
+    "Applications": "applications",
+}
+_COUNT_FIELDS = {
+    "NumAppArgs": "ApplicationArgs",
+    "NumAccounts": "Accounts",
+    "NumAssets": "Assets",
+    "NumApplications": "Applications",
+}
+
+
+class LogicError(Exception):
+    """The program rejected the transaction, or failed while running."""
+
+
+class ApplicationContext(Protocol):
+    """What the interpreter needs from the ledger while an app call runs."""
+
+    app_id: int
+    app_address: str
+    creator: str
+    group: list[Txn]
+    group_index: int
+    round: int
+    timestamp: int
+
+    def global_state(self, app_id: int) -> dict[bytes, StackValue] | None: ...
+
+    def asset_holding(self, address: str, asset_id: int) -> int | None: ...
+
+    def balance(self, address: str) -> int: ...
+
+    def min_balance(self, address: str) -> int: ...
+
+    def submit_inner(self, txns: list[Txn]) -> None: ...
+
+
+@dataclasses.dataclass(frozen=True)
+class Instruction:
+    op: str
+    args: tuple[str, ...]
+    line: int
+
+
+@dataclasses.dataclass(frozen=True)
+class Program:
+    instructions: tuple[Instruction, ...]
+    labels: dict[str, int]
+
+    @classmethod
+    def parse(cls, source: str) -> "Program":
+        instructions: list[Instruction] = []
+        labels: dict[str, int] = {}
+        for line_number, line in enumerate(source.splitlines(), start=1):
+            tokens = []
+            for token in _TOKEN.findall(line):
+                if token.startswith("//"):
+                    break
+                tokens.append(token)
+            if not tokens or tokens[0].startswith("#"):
+                continue
+            if len(tokens) == 1 and tokens[0].endswith(":"):
+                labels[tokens[0][:-1]] = len(instructions)
+                continue
+            instructions.append(Instruction(tokens[0], tuple(tokens[1:]), line_number))
+        return cls(tuple(instructions), labels)
+
+
+def _parse_bytes(args: tuple[str, ...]) -> bytes:
+    value = args[0]
+    if value.startswith('"'):
+        return value[1:-1].encode().decode("unicode_escape").encode("latin-1")
+    if value.startswith("0x"):
+        return bytes.fromhex(value[2:])
+    if value in ("base64", "b64"):
+        return base64.b64decode(args[1])
+    if value.startswith(("base64(", "b64(")):
+        return base64.b64decode(value[value.index("(") + 1 : -1])
+    raise LogicError(f"unsupported byte constant {' '.join(args)}")
+
+
+def _parse_int(value: str) -> int:
+    if value in NAMED_INTS:
+        return NAMED_INTS[value]
+    return int(value, 0)
+
+
+@dataclasses.dataclass
+class _Frame:
+    return_pc: int
+    # set by proto: the stack height at entry and the number of args/returns
+    base: int | None = None
+    num_args: int = 0
+    num_returns: int = 0
+
+
+class _Machine:
+    def __init__(self, program: Program, ctx: ApplicationContext) -> None:
+        self.program = program
+        self.ctx = ctx
+        self.txn = ctx.group[ctx.group_index]
+        self.stack: list[StackValue] = []
+        self.frames: list[_Frame] = []
+        self.scratch: list[StackValue] = [0] * 256
+        self.inner: list[Txn] = []
+        self.logs: list[bytes] = []
+        self.pc = 0
+
+    # stack helpers
+
+    def pop(self) -> StackValue:
+        if not self.stack:
+            raise LogicError("stack underflow")
+        return self.stack.pop()
+
+    def pop_int(self) -> int:
+        value = self.pop()
+        if not isinstance(value, int):
+            raise LogicError(f"expected uint64, got bytes {value!r}")
+        return value
+
+    def pop_bytes(self) -> bytes:
+        value = self.pop()
+        if not isinstance(value, bytes):
+            raise LogicError(f"expected bytes, got uint64 {value}")
+        return value
+
+    def push(self, value: StackValue | bool) -> None:
+        if isinstance(value, bool):
+            value = int(value)
+        if isinstance(value, int) and not 0 <= value <= MAX_UINT64:
+            raise LogicError(f"uint64 overflow or underflow: {value}")
+        self.stack.append(value)
+
+    # fields
+
+    def txn_field(self, txn: Txn, field: str, index: int | None = None) -> StackValue:
+        if field in _ARRAY_FIELDS:
+            if index is None:
+                raise LogicError(f"{field} needs an index")
+            return self._array_item(txn, field, index)
+        if field in _COUNT_FIELDS:
+            # the implicit sender and current app are not counted
+            return len(getattr(txn, _ARRAY_FIELDS[_COUNT_FIELDS[field]]))
+        if field == "TypeEnum":
+            return TYPE_ENUMS.get(txn.type or "", 0)
+        if field == "Type":
+            return (txn.type or "").encode()
+        if field == "TxID":
+            return base64.b32decode(txn.tx_id + "====")
+        if field not in _FIELDS:
+            raise NotImplementedError(f"transaction field {field} is not emulated")
+        value = getattr(txn, _FIELDS[field])
+        if field in _ADDRESS_FIELDS:
+            return address_bytes(value)
+        if isinstance(value, bool):
+            return int(value)
+        return 0 if value is None else value
+
+    def _array_item(self, txn: Txn, field: str, index: int) -> StackValue:
+        items: list = getattr(txn, _ARRAY_FIELDS[field])
+        if field == "Accounts":
+            items = [txn.sender, *items]
+        elif field == "Applications":
+            items = [txn.application_id, *items]
+        if index >= len(items):
+            raise LogicError(f"invalid {field} index {index}")
+        value = items[index]
+        return address_bytes(value) if field == "Accounts" else value
+
+    def global_field(self, field: str) -> StackValue:
+        ctx = self.ctx
+        values: dict[str, Callable[[], StackValue]] = {
+            "MinTxnFee": lambda: 1_000,
+            "MinBalance": lambda: 100_000,
+            "AssetOptInMinBalance": lambda: 100_000,
+            "AssetCreateMinBalance": lambda: 100_000,
+            "MaxTxnLife": lambda: 1_000,
+            "ZeroAddress": lambda: address_bytes(None),
+            "GroupSize": lambda: len(ctx.group),
+            "Round": lambda: ctx.round,
+            "LatestTimestamp": lambda: ctx.timestamp,
+            "CurrentApplicationID": lambda: ctx.app_id,
+            "CurrentApplicationAddress": lambda: address_bytes(ctx.app_address),
+            "CreatorAddress": lambda: address_bytes(ctx.creator),
+            "CallerApplicationID": lambda: 0,
+        }
+        if field not in values:
+            raise NotImplementedError(f"global field {field} is not emulated")
+        return values[field]()
+
+    def account(self, value: StackValue) -> str:
+        if isinstance(value, int):
+            address = self._array_item(self.txn, "Accounts", value)
+            assert isinstance(address, bytes)
+            return address_str(address) or ""
+        return encoding.encode_address(value)
+
+    def asset(self, value: int) -> int:
+        # small values index the Assets array, like the AVM does for old programs
+        if value < 256 and value < len(self.txn.assets):
+            return self.txn.assets[value]
+        return value
+
+    def app(self, value: int) -> int:
+        if value == 0:
+            return self.ctx.app_id
+        if value < 256 and value <= len(self.txn.applications):
+            return self.txn.applications[value - 1]
+        return value
+
+    # control flow
+
+    def jump(self, label: str) -> None:
+        if label not in self.program.labels:
+            raise LogicError(f"unknown label {label}")
+        self.pc = self.program.labels[label]
+
+    def run(self) -> bool:
+        instructions = self.program.instructions
+        while self.pc < len(instructions):
+            instruction = instructions[self.pc]
+            self.pc += 1
+            try:
+                handler = _OPS[instruction.op]
+            except KeyError:
+                raise NotImplementedError(
+                    f"line {instruction.line}: opcode {instruction.op} is not emulated"
+                ) from None
+            try:
+                result = handler(self, instruction.args)
+            except LogicError as ex:
+                raise LogicError(f"line {instruction.line}: {ex}") from ex
+            if result is not None:
+                return result
+        if len(self.stack) != 1:
+            raise LogicError(f"stack has {len(self.stack)} values at the end")
+        return self.pop_int() != 0
+
+
+def _binary(fn: Callable[[int, int], int | bool]) -> Callable:
+    def op(machine: _Machine, _args: tuple[str, ...]) -> None:
+        b, a = machine.pop_int(), machine.pop_int()
+        machine.push(fn(a, b))
+
+    return op
+
+
+def _div(a: int, b: int) -> int:
+    if b == 0:
+        raise LogicError("division by zero")
+    return a // b
+
+
+def _mod(a: int, b: int) -> int:
+    if b == 0:
+        raise LogicError("modulo by zero")
+    return a % b
+
+
+def _equal(machine: _Machine, args: tuple[str, ...], *, negate: bool = False) -> None:
+    b, a = machine.pop(), machine.pop()
+    if type(a) is not type(b):
+        raise LogicError("comparing a uint64 with bytes")
+    machine.push((a == b) != negate)
+
+
+def _assert(machine: _Machine, _args: tuple[str, ...]) -> None:
+    if machine.pop_int() == 0:
+        raise LogicError("assert failed")
+
+
+def _err(_machine: _Machine, _args: tuple[str, ...]) -> None:
+    raise LogicError("err opcode executed")
+
+
+def _return(machine: _Machine, _args: tuple[str, ...]) -> bool:
+    return machine.pop_int() != 0
+
+
+def _branch(condition: Callable[[int], bool] | None) -> Callable:
+    def op(machine: _Machine, args: tuple[str, ...]) -> None:
+        if condition is None or condition(machine.pop_int()):
+            machine.jump(args[0])
+
+    return op
+
+
+def _callsub(machine: _Machine, args: tuple[str, ...]) -> None:
+    machine.frames.append(_Frame(machine.pc))
+    machine.jump(args[0])
+
+
+def _retsub(machine: _Machine, _args: tuple[str, ...]) -> None:
+    if not machine.frames:
+        raise LogicError("retsub outside of a subroutine")
+    frame = machine.frames.pop()
+    if frame.base is not None:
+        results = machine.stack[len(machine.stack) - frame.num_returns :]
+        if len(machine.stack) - frame.num_returns < frame.base:
+            raise LogicError("retsub with too few values on the stack")
+        del machine.stack[frame.base - frame.num_args :]
+        machine.stack.extend(results)
+    machine.pc = frame.return_pc
+
+
+def _proto(machine: _Machine, args: tuple[str, ...]) -> None:
+    frame = machine.frames[-1]
+    frame.base = len(machine.stack)
+    frame.num_args, frame.num_returns = int(args[0]), int(args[1])
+    if frame.num_args > frame.base:
+        raise LogicError("proto with fewer values on the stack than args")
+
+
+def _frame_index(machine: _Machine, offset: int) -> int:
+    frame = machine.frames[-1] if machine.frames else None
+    if frame is None or frame.base is None:
+        raise LogicError("frame access outside of a proto subroutine")
+    index = frame.base + offset
+    if not frame.base - frame.num_args <= index < len(machine.stack):
+        raise LogicError(f"frame offset {offset} is out of range")
+    return index
+
+
+def _frame_dig(machine: _Machine, args: tuple[str, ...]) -> None:
+    machine.push(machine.stack[_frame_index(machine, int(args[0]))])
+
+
+def _frame_bury(machine: _Machine, args: tuple[str, ...]) -> None:
+    value = machine.pop()
+    machine.stack[_frame_index(machine, int(args[0]))] = value
+
+
+def _match(machine: _Machine, args: tuple[str, ...]) -> None:
+    value = machine.pop()
+    candidates = [machine.pop() for _ in args][::-1]
+    for label, candidate in zip(args, candidates, strict=True):
+        if candidate == value:
+            machine.jump(label)
+            return
+
+
+def _switch(machine: _Machine, args: tuple[str, ...]) -> None:
+    index = machine.pop_int()
+    if index < len(args):
+        machine.jump(args[index])
+
+
+def _stack_index(machine: _Machine, depth: int) -> int:
+    if depth >= len(machine.stack):
+        raise LogicError("stack underflow")
+    return len(machine.stack) - 1 - depth
+
+
+def _dig(machine: _Machine, args: tuple[str, ...]) -> None:
+    machine.push(machine.stack[_stack_index(machine, int(args[0]))])
+
+
+def _bury(machine: _Machine, args: tuple[str, ...]) -> None:
+    value = machine.pop()
+    machine.stack[_stack_index(machine, int(args[0]) - 1)] = value
+
+
+def _cover(machine: _Machine, args: tuple[str, ...]) -> None:
+    value = machine.pop()
+    machine.stack.insert(_stack_index(machine, int(args[0]) - 1), value)
+
+
+def _uncover(machine: _Machine, args: tuple[str, ...]) -> None:
+    machine.push(machine.stack.pop(_stack_index(machine, int(args[0]))))
+
+
+def _select(machine: _Machine, _args: tuple[str, ...]) -> None:
+    condition, b, a = machine.pop_int(), machine.pop(), machine.pop()
+    machine.push(b if condition else a)
+
+
+def _btoi(machine: _Machine, _args: tuple[str, ...]) -> None:
+    value = machine.pop_bytes()
+    if len(value) > 8:
+        raise LogicError("btoi of more than 8 bytes")
+    machine.push(int.from_bytes(value, "big"))
+
+
+def _itob(machine: _Machine, _args: tuple[str, ...]) -> None:
+    machine.push(machine.pop_int().to_bytes(8, "big"))
+
+
+def _concat(machine: _Machine, _args: tuple[str, ...]) -> None:
+    b, a = machine.pop_bytes(), machine.pop_bytes()
+    machine.push(a + b)
+
+
+def _extract(machine: _Machine, args: tuple[str, ...]) -> None:
+    value = machine.pop_bytes()
+    start, length = int(args[0]), int(args[1])
+    end = len(value) if length == 0 else start + length
+    if end > len(value):
+        raise LogicError("extract out of range")
+    machine.push(value[start:end])
+
+
+def _txn(machine: _Machine, args: tuple[str, ...]) -> None:
+    index = int(args[1]) if len(args) > 1 else None
+    machine.push(machine.txn_field(machine.txn, args[0], index))
+
+
+def _txnas(machine: _Machine, args: tuple[str, ...]) -> None:
+    index = machine.pop_int()
+    machine.push(machine.txn_field(machine.txn, args[0], index))
+
+
+def _gtxn(machine: _Machine, args: tuple[str, ...]) -> None:
+    index = int(args[2]) if len(args) > 2 else None
+    machine.push(machine.txn_field(_group_txn(machine, int(args[0])), args[1], index))
+
+
+def _gtxns(machine: _Machine, args: tuple[str, ...]) -> None:
+    txn = _group_txn(machine, machine.pop_int())
+    index = int(args[1]) if len(args) > 1 else None
+    machine.push(machine.txn_field(txn, args[0], index))
+
+
+def _group_txn(machine: _Machine, index: int) -> Txn:
+    if index >= len(machine.ctx.group):
+        raise LogicError(f"group index {index} is out of range")
+    return machine.ctx.group[index]
+
+
+def _global(machine: _Machine, args: tuple[str, ...]) -> None:
+    machine.push(machine.global_field(args[0]))
+
+
+def _app_global_get(machine: _Machine, _args: tuple[str, ...]) -> None:
+    key = machine.pop_bytes()
+    state = machine.ctx.global_state(machine.ctx.app_id) or {}
+    machine.push(state.get(key, 0))
+
+
+def _app_global_get_ex(machine: _Machine, _args: tuple[str, ...]) -> None:
+    key, app_id = machine.pop_bytes(), machine.app(machine.pop_int())
+    state = machine.ctx.global_state(app_id) or {}
+    machine.push(state.get(key, 0))
+    machine.push(key in state)
+
+
+def _app_global_put(machine: _Machine, _args: tuple[str, ...]) -> None:
+    value, key = machine.pop(), machine.pop_bytes()
+    state = machine.ctx.global_state(machine.ctx.app_id)
+    assert state is not None
+    state[key] = value
+
+
+def _app_global_del(machine: _Machine, _args: tuple[str, ...]) -> None:
+    key = machine.pop_bytes()
+    state = machine.ctx.global_state(machine.ctx.app_id)
+    assert state is not None
+    state.pop(key, None)
+
+
+def _asset_holding_get(machine: _Machine, args: tuple[str, ...]) -> None:
+    asset_id = machine.asset(machine.pop_int())
+    holding = machine.ctx.asset_holding(machine.account(machine.pop()), asset_id)
+    if args[0] == "AssetBalance":
+        machine.push(holding or 0)
+    elif args[0] == "AssetFrozen":
+        machine.push(0)
+    else:
+        raise NotImplementedError(f"asset holding field {args[0]} is not emulated")
+    machine.push(holding is not None)
+
+
+def _balance(machine: _Machine, _args: tuple[str, ...]) -> None:
+    machine.push(machine.ctx.balance(machine.account(machine.pop())))
+
+
+def _min_balance(machine: _Machine, _args: tuple[str, ...]) -> None:
+    machine.push(machine.ctx.min_balance(machine.account(machine.pop())))
+
+
+def _itxn_begin(machine: _Machine, _args: tuple[str, ...]) -> None:
+    if machine.inner:
+        raise LogicError("itxn_begin without itxn_submit")
+    machine.inner.append(Txn(sender=machine.ctx.app_address))
+
+
+def _itxn_next(machine: _Machine, _args: tuple[str, ...]) -> None:
+    if not machine.inner:
+        raise LogicError("itxn_next without itxn_begin")
+    machine.inner.append(Txn(sender=machine.ctx.app_address))
+
+
+def _itxn_field(machine: _Machine, args: tuple[str, ...]) -> None:
+    if not machine.inner:
+        raise LogicError("itxn_field without itxn_begin")
+    txn, field, value = machine.inner[-1], args[0], machine.pop()
+    if field == "TypeEnum":
+        by_enum = {enum: name for name, enum in TYPE_ENUMS.items()}
+        txn.type = by_enum[value]  # type: ignore[index]
+    elif field == "Type":
+        txn.type = value.decode()  # type: ignore[union-attr]
+    elif field == "Accounts":
+        txn.accounts.append(address_str(value))  # type: ignore[arg-type]
+    elif field in _ARRAY_FIELDS:
+        getattr(txn, _ARRAY_FIELDS[field]).append(value)
+    elif field in _ADDRESS_FIELDS:
+        setattr(txn, _FIELDS[field], address_str(value))  # type: ignore[arg-type]
+    elif field in _FIELDS:
+        setattr(txn, _FIELDS[field], value)
+    else:
+        raise NotImplementedError(f"inner transaction field {field} is not emulated")
+
+
+def _itxn_submit(machine: _Machine, _args: tuple[str, ...]) -> None:
+    if not machine.inner:
+        raise LogicError("itxn_submit without itxn_begin")
+    inner, machine.inner = machine.inner, []
+    machine.ctx.submit_inner(inner)
+
+
+def _log(machine: _Machine, _args: tuple[str, ...]) -> None:
+    machine.logs.append(machine.pop_bytes())
+
+
+def _push_int(machine: _Machine, args: tuple[str, ...]) -> None:
+    machine.push(_parse_int(args[0]))
+
+
+def _push_bytes(machine: _Machine, args: tuple[str, ...]) -> None:
+    machine.push(_parse_bytes(args))
+
+
+def _push_addr(machine: _Machine, args: tuple[str, ...]) -> None:
+    machine.push(encoding.decode_address(args[0]))
+
+
+def _push_method(machine: _Machine, args: tuple[str, ...]) -> None:
+    signature = _parse_bytes(args).decode()
+    machine.push(abi.Method.from_signature(signature).get_selector())
+
+
+def _store(machine: _Machine, args: tuple[str, ...]) -> None:
+    machine.scratch[int(args[0])] = machine.pop()
+
+
+def _load(machine: _Machine, args: tuple[str, ...]) -> None:
+    machine.push(machine.scratch[int(args[0])])
+
+
+def _pop(machine: _Machine, _args: tuple[str, ...]) -> None:
+    machine.pop()
+
+
+def _popn(machine: _Machine, args: tuple[str, ...]) -> None:
+    for _ in range(int(args[0])):
+        machine.pop()
+
+
+def _dup(machine: _Machine, _args: tuple[str, ...]) -> None:
+    machine.push(machine.stack[_stack_index(machine, 0)])
+
+
+def _dupn(machine: _Machine, args: tuple[str, ...]) -> None:
+    value = machine.stack[_stack_index(machine, 0)]
+    for _ in range(int(args[0])):
+        machine.push(value)
+
+
+def _dup2(machine: _Machine, _args: tuple[str, ...]) -> None:
+    machine.stack.extend(machine.stack[_stack_index(machine, 1) :])
+
+
+def _swap(machine: _Machine, _args: tuple[str, ...]) -> None:
+    b, a = machine.pop(), machine.pop()
+    machine.stack.extend((b, a))
+
+
+def _not(machine: _Machine, _args: tuple[str, ...]) -> None:
+    machine.push(machine.pop_int() == 0)
+
+
+def _len(machine: _Machine, _args: tuple[str, ...]) -> None:
+    machine.push(len(machine.pop_bytes()))
+
+
+_OPS: dict[str, Callable[[_Machine, tuple[str, ...]], bool | None]] = {
+    "int": _push_int,
+    "pushint": _push_int,
+    "byte": _push_bytes,
+    "pushbytes": _push_bytes,
+    "addr": _push_addr,
+    "method": _push_method,
+    "err": _err,
+    "assert": _assert,
+    "return": _return,
+    "b": _branch(None),
+    "bz": _branch(lambda value: value == 0),
+    "bnz": _branch(lambda value: value != 0),
+    "callsub": _callsub,
+    "retsub": _retsub,
+    "proto": _proto,
+    "frame_dig": _frame_dig,
+    "frame_bury": _frame_bury,
+    "match": _match,
+    "switch": _switch,
+    "pop": _pop,
+    "popn": _popn,
+    "dup": _dup,
+    "dupn": _dupn,
+    "dup2": _dup2,
+    "swap": _swap,
+    "dig": _dig,
+    "bury": _bury,
+    "cover": _cover,
+    "uncover": _uncover,
+    "select": _select,
+    "store": _store,
+    "load": _load,
+    "+": _binary(lambda a, b: a + b),
+    "-": _binary(lambda a, b: a - b),
+    "*": _binary(lambda a, b: a * b),
+    "/": _binary(_div),
+    "%": _binary(_mod),
+    "<": _binary(lambda a, b: a < b),
+    ">": _binary(lambda a, b: a > b),
+    "<=": _binary(lambda a, b: a <= b),
+    ">=": _binary(lambda a, b: a >= b),
+    "&&": _binary(lambda a, b: a != 0 and b != 0),
+    "||": _binary(lambda a, b: a != 0 or b != 0),
+    "&": _binary(lambda a, b: a & b),
+    "|": _binary(lambda a, b: a | b),
+    "^": _binary(lambda a, b: a ^ b),
+    "==": _equal,
+    "!=": lambda machine, args: _equal(machine, args, negate=True),
+    "!": _not,
+    "len": _len,
+    "btoi": _btoi,
+    "itob": _itob,
+    "concat": _concat,
+    "extract": _extract,
+    "txn": _txn,
+    "txna": _txn,
+    "txnas": _txnas,
+    "gtxn": _gtxn,
+    "gtxna": _gtxn,
+    "gtxns": _gtxns,
+    "gtxnsa": _gtxns,
+    "global": _global,
+    "app_global_get": _app_global_get,
+    "app_global_get_ex": _app_global_get_ex,
+    "app_global_put": _app_global_put,
+    "app_global_del": _app_global_del,
+    "asset_holding_get": _asset_holding_get,
+    "balance": _balance,
+    "min_balance": _min_balance,
+    "itxn_begin": _itxn_begin,
+    "itxn_next": _itxn_next,
+    "itxn_field": _itxn_field,
+    "itxn_submit": _itxn_submit,
+    "log": _log,
+}
+
+
+def run(program: Program, ctx: ApplicationContext) -> list[bytes]:
+    """Runs program for the app call ctx.group[ctx.group_index] and returns its logs.
+
+    Raises LogicError when the program rejects the call or fails.
+    """
+    machine = _Machine(program, ctx)
+    if not machine.run():
+        raise LogicError("program rejected the transaction")
+    return machine.logs
@@ -0,0 +1,435 @@
+"""An in-memory ledger that applies transaction groups the way algod does.
+
+Signatures are not checked, and every accepted group is confirmed in a round of its
+own. Balances, minimum balances, asset holdings, fee pooling and the global state of
+apps follow the protocol closely enough for the tests of this project.
+"""
+
+import base64
+import copy
+import dataclasses
+import functools
+import hashlib
+import time
+from pathlib import Path
+
+from algosdk import constants, transaction
+from algosdk.logic import get_application_address
+
+from smart_contracts.helpers.emulator import avm
+from smart_contracts.helpers.emulator.txn import Txn
+
+MIN_TXN_FEE = 1_000
+MIN_BALANCE = 100_000
+ASSET_MIN_BALANCE = 100_000
+APP_MIN_BALANCE = 100_000
+SCHEMA_UINT_MIN_BALANCE = 28_500
+SCHEMA_BYTES_MIN_BALANCE = 50_000
+MAX_TXN_LIFE = 1_000
+
+# prefixed to the TEAL source the emulated algod "compiles", so an app program can be
+# told apart from bytecode compiled by a real node
+PROGRAM_PREFIX = b"#emulated-teal\n"
+ARTIFACTS_DIR = Path(__file__).parents[2] / "artifacts"
+
+
+class LedgerError(Exception):
+    """algod would have rejected the group; nothing of it was applied."""
+
+
+@dataclasses.dataclass
+class Account:
+    balance: int = 0
+    # asset id -> amount held
+    assets: dict[int, int] = dataclasses.field(default_factory=dict)
+    created_assets: set[int] = dataclasses.field(default_factory=set)
+    created_apps: set[int] = dataclasses.field(default_factory=set)
+
+
+@dataclasses.dataclass
+class Asset:
+    id: int
+    creator: str
+    total: int
+    decimals: int
+    default_frozen: bool
+    unit_name: bytes
+    name: bytes
+    url: bytes
+    manager: str | None
+    reserve: str | None
+    freeze: str | None
+    clawback: str | None
+
+
+@dataclasses.dataclass
+class App:
+    id: int
+    creator: str
+    approval_program: bytes
+    clear_state_program: bytes
+    global_num_uint: int
+    global_num_byte_slice: int
+    global_state: dict[bytes, avm.StackValue] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass
+class _State:
+    accounts: dict[str, Account] = dataclasses.field(default_factory=dict)
+    assets: dict[int, Asset] = dataclasses.field(default_factory=dict)
+    apps: dict[int, App] = dataclasses.field(default_factory=dict)
+    next_id: int = 1_001
+
+
+def compile_program(source: bytes) -> bytes:
+    return PROGRAM_PREFIX + source
+
+
+@functools.cache
+def _artifact_sources() -> dict[bytes, bytes]:
+    """The TEAL of the bytecode the build compiled, by bytecode."""
+    return {
+        bytecode_path.read_bytes(): bytecode_path.with_suffix(".teal").read_bytes()
+        for bytecode_path in ARTIFACTS_DIR.glob("*/*.bin")
+    }
+
+
+def _program(program: bytes) -> avm.Program:
+    # clients deploy the bytecode of the artifacts when there is some, which a
+    # real node compiled, so it runs as the TEAL it came from
+    if program in _artifact_sources():
+        program = compile_program(_artifact_sources()[program])
+    if not program.startswith(PROGRAM_PREFIX):
+        raise LedgerError(
+            "only programs compiled by the emulated algod, or in the artifacts, "
+            "can be run"
+        )
+    return _parse(program)
+
+
+_parsed: dict[bytes, avm.Program] = {}
+
+
+def _parse(program: bytes) -> avm.Program:
+    if program not in _parsed:
+        source = program.removeprefix(PROGRAM_PREFIX).decode()
+        _parsed[program] = avm.Program.parse(source)
+    return _parsed[program]
+
+
+class _AppCall:
+    """The ApplicationContext of one app call, outer or inner."""
+
+    def __init__(
+        self, ledger: "Ledger", app: App, group: list[Txn], group_index: int
+    ) -> None:
+        self.ledger = ledger
+        self.app_id = app.id
+        self.app_address = get_application_address(app.id)
+        self.creator = app.creator
+        self.group = group
+        self.group_index = group_index
+        self.round = ledger.round + 1
+        self.timestamp = int(time.time())
+        self.inner_txns: list[Txn] = []
+        self.logs: list[bytes] = []
+
+    def global_state(self, app_id: int) -> dict[bytes, avm.StackValue] | None:
+        app = self.ledger.state.apps.get(app_id)
+        return None if app is None else app.global_state
+
+    def asset_holding(self, address: str, asset_id: int) -> int | None:
+        return self.ledger.account(address).assets.get(asset_id)
+
+    def balance(self, address: str) -> int:
+        return self.ledger.account(address).balance
+
+    def min_balance(self, address: str) -> int:
+        return self.ledger.min_balance(address)
+
+    def submit_inner(self, txns: list[Txn]) -> None:
+        for index, txn in enumerate(txns):
+            txn.group_index = index
+            if txn.fee is None:
+                # paid from the surplus of the outer group, else by the app
+                txn.fee = MIN_TXN_FEE
+                if self.ledger.fee_credit >= MIN_TXN_FEE:
+                    self.ledger.fee_credit -= MIN_TXN_FEE
+                    txn.fee = 0
+            self.ledger.charge_fee(txn)
+        for index, txn in enumerate(txns):
+            self.ledger.apply(txn, txns, index)
+        self.inner_txns.extend(txns)
+
+
+def _block_txn(info: dict) -> dict:
+    # a transaction in a block carries its effects in "dt" instead of next to it
+    apply_data = {}
+    if info.get("inner-txns"):
+        apply_data["itx"] = info["inner-txns"]
+    if info.get("logs"):
+        apply_data["lg"] = info["logs"]
+    txn = {"txn": info["txn"], "hgi": True}
+    if "application-index" in info:
+        txn["apid"] = info["application-index"]
+    if "asset-index" in info:
+        txn["caid"] = info["asset-index"]
+    if apply_data:
+        txn["dt"] = apply_data
+    return txn
+
+
+class Ledger:
+    genesis_id = "emulated-v1"
+    genesis_hash = base64.b64encode(hashlib.sha256(b"emulated-v1").digest()).decode()
+
+    def __init__(self) -> None:
+        self.state = _State()
+        self.round = 1
+        # tx id -> pending transaction info of every confirmed transaction
+        self.confirmed: dict[str, dict] = {}
+        # round -> the transactions of its block, in algod's JSON block format
+        self.block_txns: dict[int, list[dict]] = {}
+        # min fees the current group paid beyond what its transactions needed
+        self.fee_credit = 0
+
+    def account(self, address: str) -> Account:
+        return self.state.accounts.setdefault(address, Account())
+
+    def fund(self, address: str, amount: int) -> None:
+        """Credits amount out of thin air, like the genesis allocation of a network."""
+        self.account(address).balance += amount
+
+    def min_balance(self, address: str) -> int:
+        account = self.account(address)
+        apps = [self.state.apps[app_id] for app_id in account.created_apps]
+        return (
+            MIN_BALANCE
+            + ASSET_MIN_BALANCE * len(account.assets)
+            + sum(
+                APP_MIN_BALANCE
+                + SCHEMA_UINT_MIN_BALANCE * app.global_num_uint
+                + SCHEMA_BYTES_MIN_BALANCE * app.global_num_byte_slice
+                for app in apps
+            )
+        )
+
+    def advance(self) -> None:
+        """Closes an empty round, like a dev mode node would on demand."""
+        self.round += 1
+
+    def submit(self, signed_txns: list[transaction.GenericSignedTransaction]) -> str:
+        """Applies a group atomically in a new round, returning the first tx id."""
+        group = [
+            Txn.from_algosdk(signed.transaction, index)
+            for index, signed in enumerate(signed_txns)
+        ]
+        self._check_group(signed_txns, group)
+        snapshot = copy.deepcopy(self.state)
+        try:
+            infos = self._apply_group(group)
+        except (avm.LogicError, LedgerError) as ex:
+            self.state = snapshot
+            raise LedgerError(f"transaction {group[0].tx_id}: {ex}") from ex
+        self.round += 1
+        for txn, info in zip(group, infos, strict=True):
+            self.confirmed[txn.tx_id] = {
+                "confirmed-round": self.round,
+                "pool-error": "",
+                **info,
+            }
+        self.block_txns[self.round] = [_block_txn(info) for info in infos]
+        return group[0].tx_id
+
+    def block(self, round_number: int) -> dict:
+        """The block of a round as algod returns it, with the fields emulated."""
+        block = {"rnd": round_number, "gen": self.genesis_id, "gh": self.genesis_hash}
+        if self.block_txns.get(round_number):
+            block["txns"] = self.block_txns[round_number]
+        return block
+
+    def _check_group(
+        self,
+        signed_txns: list[transaction.GenericSignedTransaction],
+        group: list[Txn],
+    ) -> None:
+        group_ids = {signed.transaction.group for signed in signed_txns}
+        if len(group) > 1 and (len(group_ids) != 1 or None in group_ids):
+            raise LedgerError("transactions of a group must share its group id")
+        for txn in group:
+            if txn.tx_id in self.confirmed:
+                raise LedgerError(f"transaction already in ledger: {txn.tx_id}")
+            next_round = self.round + 1
+            if not txn.first_valid <= next_round <= txn.last_valid:
+                raise LedgerError(
+                    f"txn dead: round {next_round} outside of "
+                    f"{txn.first_valid}--{txn.last_valid}"
+                )
+            if txn.last_valid - txn.first_valid > MAX_TXN_LIFE:
+                raise LedgerError("validity window is longer than MaxTxnLife")
+
+    def _apply_group(self, group: list[Txn]) -> list[dict]:
+        fees = sum(txn.fee or 0 for txn in group)
+        required = MIN_TXN_FEE * len(group)
+        if fees < required:
+            raise LedgerError(
+                f"txgroup had {fees} in fees, which is less than the minimum {required}"
+            )
+        self.fee_credit = fees - required
+        for txn in group:
+            self.charge_fee(txn)
+        infos = [self.apply(txn, group, index) for index, txn in enumerate(group)]
+        for address, account in self.state.accounts.items():
+            if account.balance == 0 and not (
+                account.assets or account.created_apps or account.created_assets
+            ):
+                continue
+            min_balance = self.min_balance(address)
+            if account.balance < min_balance:
+                raise LedgerError(
+                    f"account {address} balance {account.balance} below min "
+                    f"{min_balance}"
+                )
+        return infos
+
+    def charge_fee(self, txn: Txn) -> None:
+        self._debit(txn.sender, txn.fee or 0)
+
+    def _debit(self, address: str, amount: int) -> None:
+        account = self.account(address)
+        if account.balance < amount:
+            raise LedgerError(
+                f"overspend: {address} has {account.balance}, needs {amount}"
+            )
+        account.balance -= amount
+
+    def apply(self, txn: Txn, group: list[Txn], index: int) -> dict:
+        if txn.type == constants.payment_txn:
+            info = self._pay(txn)
+        elif txn.type == constants.assettransfer_txn:
+            info = self._asset_transfer(txn)
+        elif txn.type == constants.assetconfig_txn:
+            info = self._asset_config(txn)
+        elif txn.type == constants.appcall_txn:
+            info = self._app_call(txn, group, index)
+        else:
+            raise LedgerError(f"{txn.type} transactions are not emulated")
+        return info | txn.to_info()
+
+    def _pay(self, txn: Txn) -> dict:
+        assert txn.receiver is not None
+        self._debit(txn.sender, txn.amount)
+        self.account(txn.receiver).balance += txn.amount
+        if txn.close_remainder_to is not None:
+            sender = self.account(txn.sender)
+            if sender.assets or sender.created_apps or sender.created_assets:
+                raise LedgerError(f"cannot close {txn.sender}, it still holds assets")
+            self.account(txn.close_remainder_to).balance += sender.balance
+            sender.balance = 0
+        return {}
+
+    def _asset_transfer(self, txn: Txn) -> dict:
+        if txn.asset_sender is not None:
+            raise LedgerError("clawback transfers are not emulated")
+        asset_id, receiver = txn.xfer_asset, txn.asset_receiver
+        if asset_id not in self.state.assets:
+            raise LedgerError(f"asset {asset_id} does not exist")
+        assert receiver is not None
+        sender = self.account(txn.sender)
+        if (
+            txn.sender == receiver
+            and txn.asset_amount == 0
+            and asset_id not in sender.assets
+        ):
+            sender.assets[asset_id] = 0
+            return {}
+        if asset_id not in sender.assets:
+            raise LedgerError(f"{txn.sender} is not opted in to asset {asset_id}")
+        recipient = self.account(receiver)
+        if asset_id not in recipient.assets:
+            raise LedgerError(f"{receiver} is not opted in to asset {asset_id}")
+        if sender.assets[asset_id] < txn.asset_amount:
+            raise LedgerError(
+                f"underflow on asset {asset_id}: {txn.sender} has "
+                f"{sender.assets[asset_id]}, needs {txn.asset_amount}"
+            )
+        sender.assets[asset_id] -= txn.asset_amount
+        recipient.assets[asset_id] += txn.asset_amount
+        if txn.asset_close_to is not None:
+            close_to = self.account(txn.asset_close_to)
+            if asset_id not in close_to.assets:
+                raise LedgerError(
+                    f"{txn.asset_close_to} is not opted in to asset {asset_id}"
+                )
+            if self.state.assets[asset_id].creator == txn.sender:
+                raise LedgerError("the creator cannot close out of its asset")
+            close_to.assets[asset_id] += sender.assets.pop(asset_id)
+        return {}
+
+    def _asset_config(self, txn: Txn) -> dict:
+        if txn.config_asset != 0:
+            raise LedgerError("reconfiguring or destroying assets is not emulated")
+        asset_id = self._next_id()
+        self.state.assets[asset_id] = Asset(
+            id=asset_id,
+            creator=txn.sender,
+            total=txn.config_asset_total,
+            decimals=txn.config_asset_decimals,
+            default_frozen=txn.config_asset_default_frozen,
+            unit_name=txn.config_asset_unit_name,
+            name=txn.config_asset_name,
+            url=txn.config_asset_url,
+            manager=txn.config_asset_manager,
+            reserve=txn.config_asset_reserve,
+            freeze=txn.config_asset_freeze,
+            clawback=txn.config_asset_clawback,
+        )
+        creator = self.account(txn.sender)
+        creator.created_assets.add(asset_id)
+        creator.assets[asset_id] = txn.config_asset_total
+        return {"asset-index": asset_id}
+
+    def _app_call(self, txn: Txn, group: list[Txn], index: int) -> dict:
+        info = {}
+        if txn.application_id == 0:
+            app = App(
+                id=self._next_id(),
+                creator=txn.sender,
+                approval_program=txn.approval_program,
+                clear_state_program=txn.clear_state_program,
+                global_num_uint=txn.global_num_uint,
+                global_num_byte_slice=txn.global_num_byte_slice,
+            )
+            self.state.apps[app.id] = app
+            self.account(txn.sender).created_apps.add(app.id)
+            info["application-index"] = app.id
+        elif txn.application_id in self.state.apps:
+            app = self.state.apps[txn.application_id]
+        else:
+            raise LedgerError(f"application {txn.application_id} does not exist")
+
+        if txn.on_completion not in (
+            transaction.OnComplete.NoOpOC,
+            transaction.OnComplete.DeleteApplicationOC,
+        ):
+            raise LedgerError(f"OnCompletion {txn.on_completion} is not emulated")
+        call = _AppCall(self, app, group, index)
+        call.logs = avm.run(_program(app.approval_program), call)
+        self._check_schema(app)
+        if txn.on_completion == transaction.OnComplete.DeleteApplicationOC:
+            del self.state.apps[app.id]
+            self.account(app.creator).created_apps.discard(app.id)
+        return info | {
+            "logs": [base64.b64encode(log).decode() for log in call.logs],
+            "inner-txns": [inner.to_info() for inner in call.inner_txns],
+        }
+
+    def _check_schema(self, app: App) -> None:
+        uints = sum(isinstance(v, int) for v in app.global_state.values())
+        byte_slices = len(app.global_state) - uints
+        if uints > app.global_num_uint or byte_slices > app.global_num_byte_slice:
+            raise LedgerError(f"global state of app {app.id} exceeds its schema")
+
+    def _next_id(self) -> int:
+        self.state.next_id += 1
+        return self.state.next_id - 1
@@ -0,0 +1,161 @@
+import base64
+import dataclasses
+
+from algosdk import constants, encoding, transaction
+
+TYPE_ENUMS = {
+    constants.payment_txn: 1,
+    constants.keyreg_txn: 2,
+    constants.assetconfig_txn: 3,
+    constants.assettransfer_txn: 4,
+    constants.assetfreeze_txn: 5,
+    constants.appcall_txn: 6,
+}
+ZERO_ADDRESS = bytes(32)
+
+
+@dataclasses.dataclass(kw_only=True)
+class Txn:
+    """A transaction as the AVM sees it, for outer and inner transactions alike."""
+
+    type: str | None = None
+    sender: str
+    # None on an inner transaction that leaves the fee to the AVM
+    fee: int | None = None
+    first_valid: int = 0
+    last_valid: int = 0
+    note: bytes = b""
+    group_index: int = 0
+    group: bytes = b""
+    tx_id: str = ""
+
+    receiver: str | None = None
+    amount: int = 0
+    close_remainder_to: str | None = None
+
+    xfer_asset: int = 0
+    asset_amount: int = 0
+    asset_sender: str | None = None
+    asset_receiver: str | None = None
+    asset_close_to: str | None = None
+
+    config_asset: int = 0
+    config_asset_total: int = 0
+    config_asset_decimals: int = 0
+    config_asset_default_frozen: bool = False
+    config_asset_unit_name: bytes = b""
+    config_asset_name: bytes = b""
+    config_asset_url: bytes = b""
+    config_asset_manager: str | None = None
+    config_asset_reserve: str | None = None
+    config_asset_freeze: str | None = None
+    config_asset_clawback: str | None = None
+
+    application_id: int = 0
+    on_completion: int = 0
+    application_args: list[bytes] = dataclasses.field(default_factory=list)
+    accounts: list[str] = dataclasses.field(default_factory=list)
+    assets: list[int] = dataclasses.field(default_factory=list)
+    applications: list[int] = dataclasses.field(default_factory=list)
+    approval_program: bytes = b""
+    clear_state_program: bytes = b""
+    global_num_uint: int = 0
+    global_num_byte_slice: int = 0
+
+    @classmethod
+    def from_algosdk(cls, txn: transaction.Transaction, group_index: int) -> "Txn":
+        fields = {
+            "type": txn.type,
+            "sender": txn.sender,
+            "fee": txn.fee,
+            "first_valid": txn.first_valid_round,
+            "last_valid": txn.last_valid_round,
+            "note": txn.note or b"",
+            "group_index": group_index,
+            "group": txn.group or b"",
+            "tx_id": txn.get_txid(),
+        }
+        if isinstance(txn, transaction.PaymentTxn):
+            fields |= {
+                "receiver": txn.receiver,
+                "amount": txn.amt,
+                "close_remainder_to": txn.close_remainder_to,
+            }
+        elif isinstance(txn, transaction.AssetTransferTxn):
+            fields |= {
+                "xfer_asset": txn.index,
+                "asset_amount": txn.amount,
+                "asset_sender": txn.revocation_target,
+                "asset_receiver": txn.receiver,
+                "asset_close_to": txn.close_assets_to,
+            }
+        elif isinstance(txn, transaction.AssetConfigTxn):
+            fields |= {
+                "config_asset": txn.index or 0,
+                "config_asset_total": txn.total or 0,
+                "config_asset_decimals": txn.decimals or 0,
+                "config_asset_default_frozen": bool(txn.default_frozen),
+                "config_asset_unit_name": (txn.unit_name or "").encode(),
+                "config_asset_name": (txn.asset_name or "").encode(),
+                "config_asset_url": (txn.url or "").encode(),
+                "config_asset_manager": txn.manager,
+                "config_asset_reserve": txn.reserve,
+                "config_asset_freeze": txn.freeze,
+                "config_asset_clawback": txn.clawback,
+            }
+        elif isinstance(txn, transaction.ApplicationCallTxn):
+            fields |= {
+                "application_id": txn.index or 0,
+                "on_completion": int(txn.on_complete),
+                "application_args": list(txn.app_args or []),
+                "accounts": list(txn.accounts or []),
+                "assets": list(txn.foreign_assets or []),
+                "applications": list(txn.foreign_apps or []),
+                "approval_program": txn.approval_program or b"",
+                "clear_state_program": txn.clear_program or b"",
+            }
+            if txn.global_schema is not None:
+                fields |= {
+                    "global_num_uint": txn.global_schema.num_uints or 0,
+                    "global_num_byte_slice": txn.global_schema.num_byte_slices or 0,
+                }
+        else:
+            raise NotImplementedError(f"{txn.type} transactions are not emulated")
+        return cls(**fields)
+
+    def to_info(self) -> dict:
+        """The transaction fields algod reports, as far as the emulator tracks them."""
+        fields: dict[str, object] = {
+            "type": self.type,
+            "snd": self.sender,
+            "fee": self.fee,
+        }
+        if self.group:
+            fields |= {"grp": base64.b64encode(self.group).decode()}
+        if self.receiver:
+            fields |= {"rcv": self.receiver, "amt": self.amount}
+        if self.xfer_asset:
+            fields |= {
+                "xaid": self.xfer_asset,
+                "aamt": self.asset_amount,
+                "arcv": self.asset_receiver,
+            }
+        if self.type == constants.appcall_txn:
+            fields |= {
+                "apid": self.application_id,
+                "apan": self.on_completion,
+                "apaa": [
+                    base64.b64encode(arg).decode() for arg in self.application_args
+                ],
+                "apas": self.assets,
+            }
+        # like algod, leave out what is empty or zero
+        return {"txn": {name: value for name, value in fields.items() if value}}
+
+
+def address_bytes(address: str | None) -> bytes:
+    return ZERO_ADDRESS if address is None else encoding.decode_address(address)
+
+
+def address_str(value: bytes) -> str | None:
+    return None if value == ZERO_ADDRESS else encoding.encode_address(value)
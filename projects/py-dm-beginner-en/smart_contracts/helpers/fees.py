@@ -0,0 +1,58 @@
+import copy
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from smart_contracts.helpers import teal
+from smart_contracts.helpers.util import find_app_spec_file
+
+if TYPE_CHECKING:
+    from algosdk.transaction import SuggestedParams
+
+# stored next to the .arc32.json, maps ABI method signature -> inner transactions
+fee_table_suffix = ".fees.json"
+_inner_txn_ops = {"itxn_begin", "itxn_next"}
+MIN_TXN_FEE = 1_000
+
+
+def inner_txn_counts(approval_teal: str) -> dict[str, int | None]:
+    """Statically counts the inner transactions each ABI method can issue.
+
+    The count is the maximum over all paths through the method, None when the
+    method loops (e.g. over an array argument) and the count depends on its input.
+    """
+    blocks, signatures = teal.parse_blocks(approval_teal)
+    return {
+        signature: teal.max_over_paths(
+            blocks, label, lambda instruction: instruction[0] in _inner_txn_ops
+        )
+        for signature, label in zip(signatures, teal.route_labels(blocks), strict=False)
+    }
+
+
+def write_fee_table(output_dir: Path) -> Path:
+    """Writes the inner transaction count of every method next to the app spec."""
+    app_spec_file_name = find_app_spec_file(output_dir)
+    if app_spec_file_name is None:
+        raise Exception("Could not write fee table, .arc32.json file not found")
+    contract_name = app_spec_file_name.removesuffix(".arc32.json")
+    approval_teal = (output_dir / f"{contract_name}.approval.teal").read_text()
+    fee_table_path = output_dir / f"{contract_name}{fee_table_suffix}"
+    fee_table_path.write_text(
+        json.dumps(inner_txn_counts(approval_teal), indent=4) + "\n"
+    )
+    return fee_table_path
+
+
+def load_fee_table(path: Path) -> dict[str, int | None]:
+    return json.loads(path.read_text())
+
+
+def with_pooled_fee(
+    suggested_params: "SuggestedParams", inner_txns: int
+) -> "SuggestedParams":
+    """Returns a copy of suggested_params whose flat fee also covers inner_txns."""
+    params = copy.copy(suggested_params)
+    params.flat_fee = True
+    params.fee = (suggested_params.min_fee or MIN_TXN_FEE) * (1 + inner_txns)
+    return params
@@ -0,0 +1,129 @@
+import difflib
+import json
+import math
+from pathlib import Path
+
+from smart_contracts.helpers import teal
+from smart_contracts.helpers.fees import inner_txn_counts
+from smart_contracts.helpers.util import find_app_spec_file
+
+# stored next to the .arc32.json, the size and static cost of the compiled programs
+manifest_suffix = ".size.json"
+# kept next to contract.py, the maxima the manifest is checked against on every build
+budget_file_name = "teal_budget.json"
+PAGE_SIZE = 2_048
+MAX_EXTRA_PAGES = 3
+
+Manifest = dict
+
+
+def _program_size(output_dir: Path, contract_name: str, program: str) -> dict:
+    # estimated from the TEAL even when the build has bytecode, which is untracked
+    # and depends on the algod that compiled it, so the manifest stays reproducible
+    teal_source = (output_dir / f"{contract_name}.{program}.teal").read_text()
+    return {"bytes": teal.program_size(teal_source), "exact": False}
+
+
+def build_manifest(output_dir: Path) -> Manifest:
+    """Sizes, page count and per-method static cost of the programs in output_dir.
+
+    A method's static cost is the opcode budget of its most expensive path,
+    including the router, or None when the method loops.
+    """
+    app_spec_file_name = find_app_spec_file(output_dir)
+    if app_spec_file_name is None:
+        raise Exception("Could not write size manifest, .arc32.json file not found")
+    contract_name = app_spec_file_name.removesuffix(".arc32.json")
+    approval = _program_size(output_dir, contract_name, "approval")
+    clear = _program_size(output_dir, contract_name, "clear")
+
+    approval_teal = (output_dir / f"{contract_name}.approval.teal").read_text()
+    blocks, signatures = teal.parse_blocks(approval_teal)
+    router_cost = sum(
+        teal.opcode_cost(instruction) for instruction in teal.router_prelude(blocks)
+    )
+    inner_txns = inner_txn_counts(approval_teal)
+    methods = {}
+    for signature, label in zip(signatures, teal.route_labels(blocks), strict=False):
+        cost = teal.max_over_paths(blocks, label, teal.opcode_cost)
+        methods[signature] = {
+            "static_cost": None if cost is None else router_cost + cost,
+            "inner_txns": inner_txns.get(signature),
+        }
+
+    total_bytes = approval["bytes"] + clear["bytes"]
+    return {
+        "approval": approval,
+        "clear": clear,
+        # approval and clear share 1 + extra_pages pages
+        "extra_pages": max(0, math.ceil(total_bytes / PAGE_SIZE) - 1),
+        "methods": methods,
+    }
+
+
+def manifest_path(output_dir: Path) -> Path | None:
+    app_spec_file_name = find_app_spec_file(output_dir)
+    if app_spec_file_name is None:
+        return None
+    contract_name = app_spec_file_name.removesuffix(".arc32.json")
+    return output_dir / f"{contract_name}{manifest_suffix}"
+
+
+def _dumps(manifest: Manifest) -> str:
+    return json.dumps(manifest, indent=4) + "\n"
+
+
+def write_manifest(output_dir: Path) -> Path:
+    manifest = build_manifest(output_dir)
+    path = manifest_path(output_dir)
+    assert path is not None
+    path.write_text(_dumps(manifest))
+    return path
+
+
+def find_violations(manifest: Manifest, budget: dict, prefix: str = "") -> list[str]:
+    """Compares every number in budget with the value at the same place in manifest."""
+    violations = []
+    for key, limit in budget.items():
+        name = f"{prefix}{key}"
+        actual = manifest.get(key)
+        if isinstance(limit, dict):
+            violations.extend(find_violations(actual or {}, limit, f"{name}."))
+        elif key not in manifest:
+            violations.append(f"{name}: not in the manifest")
+        elif actual is None:
+            violations.append(f"{name}: unbounded (loops), budget {limit}")
+        elif actual > limit:
+            violations.append(f"{name}: {actual} > budget {limit} (+{actual - limit})")
+    return violations
+
+
+def check_budget(output_dir: Path, budget_path: Path, previous_dir: Path) -> None:
+    """Fails the build when the new manifest in output_dir exceeds budget_path.
+
+    The error lists what is over budget, and a diff against the manifest of the
+    previous build in previous_dir when there is one.
+    """
+    if not budget_path.exists():
+        return
+    path = manifest_path(output_dir)
+    if path is None or not path.exists():
+        raise Exception(f"Could not check {budget_path}, no size manifest was built")
+    manifest = json.loads(path.read_text())
+    budget = json.loads(budget_path.read_text())
+    budget.setdefault("extra_pages", MAX_EXTRA_PAGES)
+    violations = find_violations(manifest, budget)
+    if not violations:
+        return
+
+    message = f"TEAL budget {budget_path} exceeded:\n" + "\n".join(violations)
+    previous_path = previous_dir / path.name
+    if previous_path.exists():
+        diff = difflib.unified_diff(
+            previous_path.read_text().splitlines(keepends=True),
+            _dumps(manifest).splitlines(keepends=True),
+            fromfile=f"{previous_path} (previous build)",
+            tofile=f"{path.name} (this build)",
+        )
+        message += "\n\n" + "".join(diff)
+    raise Exception(message)
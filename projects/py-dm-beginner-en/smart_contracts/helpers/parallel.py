@@ -0,0 +1,160 @@
+import contextvars
+import logging
+from collections.abc import Callable, Iterator
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
+from pathlib import Path
+
+from smart_contracts.config import SmartContract
+from smart_contracts.helpers import build_cache
+from smart_contracts.helpers.build import build
+
+logger = logging.getLogger(__name__)
+_current_contract: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "current_contract", default=""
+)
+
+
+class ContractLogFilter(logging.Filter):
+    """Adds a `contract` prefix to log records emitted while working on a contract."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        name = _current_contract.get()
+        record.contract = f"[{name}] " if name else ""
+        return True
+
+
+@contextmanager
+def contract_context(name: str) -> Iterator[None]:
+    token = _current_contract.set(name)
+    try:
+        yield
+    finally:
+        _current_contract.reset(token)
+
+
+class _InlineExecutor(Executor):
+    """Runs submitted work immediately, keeps `--jobs 1` debugger friendly."""
+
+    def submit(
+        self, fn: Callable[..., object], /, *args: object, **kwargs: object
+    ) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as ex:
+            future.set_exception(ex)
+        return future
+
+
+def _build_one(
+    name: str, output_dir: Path, contract_path: Path, *, in_process: bool
+) -> tuple[Path, build_cache.BuildCacheStats]:
+    # each task reports only its own cache usage, pool workers are reused
+    build_cache.stats = build_cache.BuildCacheStats()
+    with contract_context(name):
+        logger.info(f"Building app at {contract_path}")
+        app_spec_path = build(output_dir, contract_path, in_process=in_process)
+    return app_spec_path, build_cache.stats
+
+
+def _deploy_one(contract: SmartContract, app_spec_path: Path) -> None:
+    # imported here so build-only runs don't pay for loading algokit_utils and algosdk
+    from smart_contracts.helpers.deploy import deploy
+
+    with contract_context(contract.name):
+        logger.info(f"Deploying app {contract.name}")
+        if contract.deploy:
+            deploy(app_spec_path, contract.deploy)
+
+
+def build_all(
+    artifact_path: Path,
+    contracts: list[SmartContract],
+    jobs: int = 1,
+    *,
+    in_process: bool = True,
+) -> dict[str, Path]:
+    """Builds contracts across a process pool, returns the app spec path per contract name."""
+    executor = _InlineExecutor() if jobs <= 1 else ProcessPoolExecutor(jobs)
+    with executor:
+        futures = {
+            contract.name: executor.submit(
+                _build_one,
+                contract.name,
+                artifact_path / contract.name,
+                contract.path,
+                in_process=in_process,
+            )
+            for contract in contracts
+        }
+        app_spec_paths = {}
+        failed = []
+        cache_stats = build_cache.BuildCacheStats()
+        for name, future in futures.items():
+            try:
+                app_spec_paths[name], task_stats = future.result()
+                cache_stats.merge(task_stats)
+            except Exception as ex:
+                logger.error(f"[{name}] Build failed: {ex}")
+                failed.append(name)
+    logger.info(cache_stats.report())
+    if failed:
+        raise Exception(f"Could not build {', '.join(failed)}")
+    return app_spec_paths
+
+
+def deploy_all(
+    app_spec_paths: dict[str, Path], contracts: list[SmartContract], jobs: int = 1
+) -> None:
+    """Deploys contracts across a thread pool, each one only after its dependencies."""
+    by_name = {contract.name: contract for contract in contracts}
+    # dependencies left out of the run (e.g. by --only) count as already deployed
+    done: set[str] = set()
+    for contract in contracts:
+        for dep in contract.depends_on:
+            if dep not in by_name and dep not in done:
+                logger.info(f"{dep} is not selected, assuming it is already deployed")
+                done.add(dep)
+
+    pending = dict(by_name)
+    failed: set[str] = set()
+    running: dict[Future, str] = {}
+    executor = _InlineExecutor() if jobs <= 1 else ThreadPoolExecutor(jobs)
+    with executor:
+        while pending or running:
+            for name, contract in list(pending.items()):
+                if any(dep in failed for dep in contract.depends_on):
+                    logger.error(f"[{name}] Skipped, a dependency failed to deploy")
+                    failed.add(name)
+                    del pending[name]
+                elif all(dep in done for dep in contract.depends_on):
+                    future = executor.submit(
+                        _deploy_one, contract, app_spec_paths[name]
+                    )
+                    running[future] = name
+                    del pending[name]
+            if not running:
+                if pending:
+                    raise Exception(
+                        f"Circular deploy dependencies between {', '.join(pending)}"
+                    )
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    future.result()
+                    done.add(name)
+                except Exception as ex:
+                    logger.error(f"[{name}] Deploy failed: {ex}")
+                    failed.add(name)
+    if failed:
+        raise Exception(f"Could not deploy {', '.join(sorted(failed))}")
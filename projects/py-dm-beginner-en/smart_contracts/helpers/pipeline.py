@@ -0,0 +1,208 @@
+import asyncio
+import copy
+import dataclasses
+import logging
+from collections.abc import Callable
+
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import SuggestedParams
+
+from smart_contracts.helpers.async_algod import AsyncAlgodClient
+
+logger = logging.getLogger(__name__)
+
+# builds (and signs) a fresh group that is only valid within the given params
+GroupBuilder = Callable[[SuggestedParams], AtomicTransactionComposer]
+
+
+@dataclasses.dataclass(frozen=True)
+class Confirmation:
+    tx_ids: list[str]
+    confirmed_round: int
+    # 1 unless the group expired and had to be built again
+    attempts: int
+
+
+# compared by identity, two groups are never the same even with equal fields
+@dataclasses.dataclass(eq=False)
+class _PendingGroup:
+    build: GroupBuilder
+    future: "asyncio.Future[Confirmation]"
+    tx_ids: list[str] = dataclasses.field(default_factory=list)
+    first_valid: int = 0
+    last_valid: int = 0
+    attempts: int = 0
+
+
+class SubmissionPipeline:
+    """Sends groups as soon as they are built and tracks them all from one task.
+
+    Instead of every caller waiting for its own group, a single tracker follows the
+    rounds the node reports and checks every pending group once per round. Groups
+    get a short validity window, a group that is still unconfirmed after its last
+    valid round can never be confirmed anymore. The node forgets about confirmed
+    transactions after a while, so before an expired group is built and sent again
+    with fresh params, the blocks of its validity window are searched for it.
+    If the tracker fails, every pending future fails with its error and later
+    submits raise.
+
+        async with SubmissionPipeline(algod) as pipeline:
+            futures = [await pipeline.submit(build) for build in builders]
+            confirmations = await asyncio.gather(*futures)
+    """
+
+    def __init__(
+        self,
+        algod: AsyncAlgodClient,
+        *,
+        validity_rounds: int = 10,
+        max_attempts: int = 3,
+    ) -> None:
+        self.algod = algod
+        self.validity_rounds = validity_rounds
+        self.max_attempts = max_attempts
+        self._pending: list[_PendingGroup] = []
+        self._has_pending = asyncio.Event()
+        self._closing = False
+        self._round = 0
+        self._params: SuggestedParams | None = None
+        self._params_round = -1
+        self._tracker: asyncio.Task | None = None
+        # set once the tracker has died, nothing would resolve new groups anymore
+        self._failure: Exception | None = None
+
+    async def __aenter__(self) -> "SubmissionPipeline":
+        self._tracker = asyncio.create_task(self._track())
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        # let every submitted group settle before stopping the tracker
+        self._closing = True
+        self._has_pending.set()
+        if self._tracker is not None:
+            await self._tracker
+
+    async def _suggested_params(self) -> SuggestedParams:
+        """Fetches suggested params at most once per round, shared by all groups."""
+        if self._params is None or self._params_round != self._round:
+            self._params = await self.algod.suggested_params()
+            self._params_round = self._round
+        params = copy.copy(self._params)
+        params.last = params.first + self.validity_rounds
+        return params
+
+    async def _send(self, group: _PendingGroup) -> None:
+        group.attempts += 1
+        params = await self._suggested_params()
+        atc = group.build(params)
+        await self.algod.send_transactions(atc.gather_signatures())
+        group.tx_ids = [txn.txn.get_txid() for txn in atc.build_group()]
+        group.first_valid = params.first
+        group.last_valid = params.last
+
+    async def submit(self, build: GroupBuilder) -> "asyncio.Future[Confirmation]":
+        """Sends the group built by build, the future resolves once it is confirmed."""
+        if self._failure is not None:
+            raise Exception("Submission pipeline stopped tracking groups") from (
+                self._failure
+            )
+        group = _PendingGroup(
+            build=build, future=asyncio.get_running_loop().create_future()
+        )
+        await self._send(group)
+        if self._failure is not None:
+            # the tracker died while the group was being sent
+            group.future.set_exception(self._failure)
+            return group.future
+        self._pending.append(group)
+        self._has_pending.set()
+        return group.future
+
+    def _confirm(self, group: _PendingGroup, confirmed_round: int) -> None:
+        group.future.set_result(
+            Confirmation(group.tx_ids, confirmed_round, group.attempts)
+        )
+
+    async def _confirmed_round(self, group: _PendingGroup) -> int | None:
+        """Searches the blocks of the validity window of the group for it."""
+        rounds = range(group.first_valid, group.last_valid + 1)
+        block_txids = await asyncio.gather(
+            *(self.algod.block_txids(round_num) for round_num in rounds)
+        )
+        for round_num, txids in zip(rounds, block_txids, strict=True):
+            if group.tx_ids[0] in txids:
+                return round_num
+        return None
+
+    async def _check(self, group: _PendingGroup) -> bool:
+        """Returns True once the group is settled, either way."""
+        try:
+            txn_info = await self.algod.pending_transaction_info(group.tx_ids[0])
+        except AlgodHTTPError as ex:
+            if ex.code != 404:
+                raise
+            # unknown to the node, it only matters once it can't be confirmed anymore
+            txn_info = {}
+
+        if txn_info.get("confirmed-round"):
+            self._confirm(group, txn_info["confirmed-round"])
+            return True
+        if txn_info.get("pool-error"):
+            pool_error = txn_info["pool-error"]
+            group.future.set_exception(
+                Exception(f"Group {group.tx_ids[0]} rejected: {pool_error}")
+            )
+            return True
+        if self._round <= group.last_valid:
+            return False
+        # a 404 doesn't tell a dropped group from one confirmed a while ago
+        confirmed_round = await self._confirmed_round(group)
+        if confirmed_round is not None:
+            self._confirm(group, confirmed_round)
+            return True
+
+        if group.attempts >= self.max_attempts:
+            group.future.set_exception(
+                Exception(
+                    f"Group {group.tx_ids[0]} expired {group.attempts} time(s), "
+                    "giving up"
+                )
+            )
+            return True
+        logger.info(f"Group {group.tx_ids[0]} expired, sending it again")
+        try:
+            await self._send(group)
+        except Exception as ex:
+            group.future.set_exception(ex)
+            return True
+        return False
+
+    async def _track(self) -> None:
+        try:
+            self._round = (await self.algod.status())["last-round"]
+            while True:
+                await self._has_pending.wait()
+                if not self._pending:
+                    if self._closing:
+                        return
+                    self._has_pending.clear()
+                    continue
+
+                checked = list(self._pending)
+                settled = await asyncio.gather(*(self._check(g) for g in checked))
+                # groups submitted while checking stay pending for the next round
+                done = [
+                    g for g, is_done in zip(checked, settled, strict=True) if is_done
+                ]
+                self._pending = [g for g in self._pending if g not in done]
+                if self._pending:
+                    status = await self.algod.status_after_block(self._round)
+                    self._round = status["last-round"]
+        except Exception as ex:
+            # nothing would ever resolve the pending futures otherwise
+            self._failure = ex
+            for group in self._pending:
+                if not group.future.done():
+                    group.future.set_exception(ex)
+            raise
@@ -0,0 +1,195 @@
+import dataclasses
+import json
+import logging
+import re
+from collections import Counter
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from algokit_utils import Account, get_account, get_algod_client, is_localnet
+from algosdk.atomic_transaction_composer import AtomicTransactionComposer
+from algosdk.source_map import SourceMap
+from algosdk.v2client import models
+from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+
+# opcode budget of a single app call, app calls in the same group pool their budget
+APP_CALL_BUDGET = 700
+MIN_TXN_FEE = 1_000
+report_dir = Path(".algokit") / "profile"
+baseline_file_name = "profile_baseline.json"
+# puyapy annotates TEAL with comments like `// smart_contracts/x/contract.py:20-21`
+_source_comment = re.compile(r"^\s*// (?P<file>\S+\.py):(?P<start>\d+)(?:-\d+)?$")
+
+# yields (method name, composer ready to be simulated and then executed)
+ProfileScenario = Callable[
+    [AlgodClient, Account], Iterable[tuple[str, AtomicTransactionComposer]]
+]
+
+
+@dataclasses.dataclass
+class MethodProfile:
+    method: str
+    app_calls: int
+    budget_consumed: int
+    inner_txns: int
+    opcodes: dict[str, int]
+    source_lines: dict[str, int]
+
+    @property
+    def budget_available(self) -> int:
+        return APP_CALL_BUDGET * self.app_calls
+
+    @property
+    def fees(self) -> int:
+        """Minimum fees the caller pays for the app calls and their inner transactions."""
+        return MIN_TXN_FEE * (self.app_calls + self.inner_txns)
+
+
+def _teal_line_info(teal: str) -> tuple[list[str], list[str]]:
+    """Returns the opcode and the Python source location of every TEAL line."""
+    opcodes = []
+    sources = []
+    source = "<unknown>"
+    for line in teal.splitlines():
+        match = _source_comment.match(line)
+        if match:
+            source = f"{match['file']}:{match['start']}"
+        # comment-only lines, like the source comments, have no opcode
+        code = line.split("//")[0].split()
+        opcodes.append(code[0] if code else "")
+        sources.append(source)
+    return opcodes, sources
+
+
+def _count_inner_txns(txn_result: dict) -> int:
+    inner_txns = txn_result.get("inner-txns", [])
+    return len(inner_txns) + sum(_count_inner_txns(inner) for inner in inner_txns)
+
+
+def profile_composer(
+    algod_client: AlgodClient,
+    method: str,
+    atc: AtomicTransactionComposer,
+    approval_teal: str,
+    source_map: SourceMap,
+) -> MethodProfile:
+    """Simulates the group with execution traces and attributes every executed opcode."""
+    opcodes, sources = _teal_line_info(approval_teal)
+    request = models.SimulateRequest(
+        txn_groups=[],
+        exec_trace_config=models.SimulateTraceConfig(enable=True),
+    )
+    response = atc.simulate(algod_client, request)
+    if response.failure_message:
+        raise Exception(f"Simulating {method} failed: {response.failure_message}")
+
+    opcode_counts: Counter[str] = Counter()
+    line_counts: Counter[str] = Counter()
+    app_calls = budget = inner_txns = 0
+    for txn in response.simulate_response["txn-groups"][0]["txn-results"]:
+        trace = txn.get("exec-trace", {}).get("approval-program-trace")
+        if trace is None:
+            continue
+        app_calls += 1
+        budget += txn.get("app-budget-consumed", 0)
+        inner_txns += _count_inner_txns(txn["txn-result"])
+        for step in trace:
+            line = source_map.get_line_for_pc(step["pc"])
+            if line is None:
+                continue
+            opcode_counts[opcodes[line]] += 1
+            line_counts[sources[line]] += 1
+
+    return MethodProfile(
+        method=method,
+        app_calls=app_calls,
+        budget_consumed=budget,
+        inner_txns=inner_txns,
+        opcodes=dict(opcode_counts.most_common()),
+        source_lines=dict(sorted(line_counts.items())),
+    )
+
+
+def _compile_source_map(algod_client: AlgodClient, teal: str) -> SourceMap:
+    response = algod_client.compile(teal, source_map=True)
+    assert isinstance(response, dict)
+    return SourceMap(response["sourcemap"])
+
+
+def find_regressions(
+    profiles: list[MethodProfile], baseline: dict[str, dict]
+) -> list[str]:
+    regressions = []
+    for method_profile in profiles:
+        previous = baseline.get(method_profile.method)
+        if previous is None:
+            continue
+        for field in ("budget_consumed", "inner_txns"):
+            before, after = previous[field], getattr(method_profile, field)
+            if after > before:
+                regressions.append(
+                    f"{method_profile.method}: {field} {before} -> {after}"
+                )
+    return regressions
+
+
+def profile(
+    name: str,
+    approval_teal_path: Path,
+    scenario: ProfileScenario,
+    baseline_path: Path | None,
+    *,
+    update_baseline: bool = False,
+) -> None:
+    """Profiles the scenario, then checks it against baseline_path unless it is None.
+
+    The report goes to .algokit/profile/<name>.json. A missing baseline is written
+    from this run, an existing one makes the run fail on any method that uses more
+    budget or inner transactions, unless update_baseline accepts the new numbers.
+    """
+    algod_client = get_algod_client()
+    if not is_localnet(algod_client):
+        raise Exception("Profiling sends transactions, it only runs against LocalNet")
+    account = get_account(algod_client, "PROFILER")
+
+    approval_teal = approval_teal_path.read_text()
+    source_map = _compile_source_map(algod_client, approval_teal)
+    profiles = []
+    for method, atc in scenario(algod_client, account):
+        method_profile = profile_composer(
+            algod_client, method, atc, approval_teal, source_map
+        )
+        profiles.append(method_profile)
+        logger.info(
+            f"{method}: {method_profile.budget_consumed}/"
+            f"{method_profile.budget_available} opcode budget, "
+            f"{method_profile.inner_txns} inner txn(s), "
+            f"{method_profile.fees} µALGO min fees"
+        )
+        # move the app forward so the next method runs against the state it expects
+        atc.execute(algod_client, 4)
+
+    report = {
+        method_profile.method: dataclasses.asdict(method_profile)
+        | {"fees": method_profile.fees}
+        for method_profile in profiles
+    }
+    report_dir.mkdir(parents=True, exist_ok=True)
+    report_path = report_dir / f"{name}.json"
+    report_path.write_text(json.dumps(report, indent=2))
+    logger.info(f"Wrote profile report to {report_path}")
+
+    if baseline_path is None:
+        return
+    if update_baseline or not baseline_path.exists():
+        baseline_path.write_text(json.dumps(report, indent=2))
+        logger.info(f"Updated profile baseline {baseline_path}")
+        return
+
+    regressions = find_regressions(profiles, json.loads(baseline_path.read_text()))
+    if regressions:
+        raise Exception(
+            f"Profile regressions against {baseline_path}:\n" + "\n".join(regressions)
+        )
@@ -0,0 +1,183 @@
+import base64
+import dataclasses
+import json
+import logging
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from algosdk import abi
+
+from smart_contracts.helpers.util import write_atomically
+
+if TYPE_CHECKING:
+    from algosdk.v2client.indexer import IndexerClient
+
+logger = logging.getLogger(__name__)
+sales_dir = Path(".algokit") / "sales"
+PAGE_SIZE = 1_000
+
+
+@dataclasses.dataclass
+class AppSales:
+    """Running totals of the sales of one app, stored with its cursor."""
+
+    calls: int = 0
+    # the sum of the quantity argument, and of what the inner transfers delivered
+    quantity: int = 0
+    units: int = 0
+    first_round: int | None = None
+    last_round: int | None = None
+
+    def add(self, quantity: int, units: int, confirmed_round: int) -> None:
+        self.calls += 1
+        self.quantity += quantity
+        self.units += units
+        if self.first_round is None:
+            self.first_round = confirmed_round
+        self.last_round = confirmed_round
+
+
+@dataclasses.dataclass
+class Cursor:
+    """Where the scan of an app resumes.
+
+    A scan covers min_round to max_round, max_round being the indexer round when it
+    started, page by page. next_token is set while a scan is in progress.
+    """
+
+    min_round: int = 0
+    max_round: int | None = None
+    next_token: str | None = None
+
+
+@dataclasses.dataclass
+class _AppState:
+    cursor: Cursor = dataclasses.field(default_factory=Cursor)
+    sales: AppSales = dataclasses.field(default_factory=AppSales)
+
+
+class MethodDecoder:
+    """Decodes the ABI arguments of the app calls to one method of an app spec."""
+
+    def __init__(self, app_spec: dict, method_name: str) -> None:
+        contract = abi.Contract.from_json(json.dumps(app_spec["contract"]))
+        self.method = contract.get_method_by_name(method_name)
+        self.selector = self.method.get_selector()
+
+    def decode(self, app_args: list[str]) -> dict[str, Any] | None:
+        """The arguments by name, None when the call is to another method.
+
+        Transaction arguments aren't in the app args, and reference arguments
+        decode to their index in the foreign arrays.
+        """
+        if not app_args or base64.b64decode(app_args[0]) != self.selector:
+            return None
+        values = iter(base64.b64decode(arg) for arg in app_args[1:])
+        decoded: dict[str, Any] = {}
+        for arg in self.method.args:
+            if abi.is_abi_transaction_type(arg.type):
+                continue
+            # the app specs puyapy writes name every argument
+            assert arg.name is not None
+            if abi.is_abi_reference_type(arg.type):
+                decoded[arg.name] = abi.UintType(8).decode(next(values))
+            else:
+                assert isinstance(arg.type, abi.ABIType)
+                decoded[arg.name] = arg.type.decode(next(values))
+        return decoded
+
+
+def _transferred_units(txn: dict) -> int:
+    return sum(
+        inner["asset-transfer-transaction"]["amount"]
+        for inner in txn.get("inner-txns", [])
+        if inner["tx-type"] == "axfer"
+    )
+
+
+def _pages(
+    indexer_client: "IndexerClient", app_id: int, cursor: Cursor, page_size: int
+) -> Iterator[list[dict]]:
+    """Yields the app calls of the scan in cursor a page at a time, moving cursor.
+
+    The caller saves cursor after each page, so a scan resumes where it stopped.
+    """
+    if cursor.max_round is None:
+        health = indexer_client.health()
+        assert isinstance(health, dict)
+        cursor.max_round = health["round"]
+    max_round = cursor.max_round
+    while True:
+        response = indexer_client.search_transactions(
+            application_id=app_id,
+            txn_type="appl",
+            min_round=cursor.min_round,
+            max_round=max_round,
+            limit=page_size,
+            next_page=cursor.next_token,
+        )
+        assert isinstance(response, dict)
+        transactions = response.get("transactions", [])
+        cursor.next_token = response.get("next-token") if transactions else None
+        if cursor.next_token is None:
+            # the scan is done, the next one starts after it
+            cursor.min_round, cursor.max_round = max_round + 1, None
+        yield transactions
+        if cursor.next_token is None:
+            return
+
+
+def _load(path: Path) -> dict[int, _AppState]:
+    if not path.exists():
+        return {}
+    states = {}
+    for app_id, state in json.loads(path.read_text()).items():
+        states[int(app_id)] = _AppState(
+            cursor=Cursor(**state["cursor"]), sales=AppSales(**state["sales"])
+        )
+    return states
+
+
+def _save(path: Path, states: dict[int, _AppState]) -> None:
+    data = {str(app_id): dataclasses.asdict(state) for app_id, state in states.items()}
+    write_atomically(path, json.dumps(data, indent=2))
+
+
+def scan_sales(
+    indexer_client: "IndexerClient",
+    app_spec: dict,
+    app_ids: list[int],
+    state_path: Path,
+    *,
+    method_name: str = "buy",
+    quantity_arg: str = "quantity",
+    page_size: int = PAGE_SIZE,
+) -> dict[int, AppSales]:
+    """Adds the sales made since the last scan to the totals saved in state_path.
+
+    Calls to method_name of every app are read from the indexer one page at a time
+    and counted straight away, so memory use doesn't grow with the history. The
+    totals and the cursor are saved after every page.
+    """
+    decoder = MethodDecoder(app_spec, method_name)
+    states = _load(state_path)
+    for app_id in app_ids:
+        state = states.setdefault(app_id, _AppState())
+        for page in _pages(indexer_client, app_id, state.cursor, page_size):
+            for txn in page:
+                app_call = txn["application-transaction"]
+                args = decoder.decode(app_call.get("application-args", []))
+                if args is None:
+                    continue
+                state.sales.add(
+                    quantity=args.get(quantity_arg, 0),
+                    units=_transferred_units(txn),
+                    confirmed_round=txn["confirmed-round"],
+                )
+            _save(state_path, states)
+        logger.info(
+            f"App {app_id}: {state.sales.calls} {method_name} call(s), "
+            f"{state.sales.units} unit(s) up to round {state.cursor.min_round - 1}"
+        )
+    return {app_id: states[app_id].sales for app_id in app_ids}
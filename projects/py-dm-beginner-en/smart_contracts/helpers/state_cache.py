@@ -0,0 +1,135 @@
+import base64
+import dataclasses
+import threading
+import time
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from algosdk.v2client.algod import AlgodClient
+
+RawGlobalState = dict[bytes, bytes | int]
+
+
+def decode_global_state(entries: list[dict]) -> RawGlobalState:
+    """Decodes the global-state of an algod application record."""
+    state: RawGlobalState = {}
+    for entry in entries:
+        key, value = base64.b64decode(entry["key"]), entry["value"]
+        # type 1 is a byte slice, type 2 a uint64
+        if value["type"] == 1:
+            state[key] = base64.b64decode(value["bytes"])
+        else:
+            state[key] = value["uint"]
+    return state
+
+
+@dataclasses.dataclass
+class GlobalStateCacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    def report(self) -> str:
+        return f"Global state cache: {self.hits} hit(s), {self.misses} miss(es)"
+
+
+@dataclasses.dataclass(frozen=True)
+class _Entry:
+    state: RawGlobalState
+    fetched_at: float
+    # the latest round the cache knew about when the state was read
+    round: int
+
+
+class GlobalStateCache:
+    """Read-through cache of the global state of many apps, shared between threads.
+
+    An app's state is read again once it is max_age seconds old, or once a round
+    passed to observe_round is max_rounds past the round it was read in. Clients
+    invalidate the apps they change, so their own writes are never served stale.
+    """
+
+    def __init__(
+        self,
+        algod_client: "AlgodClient",
+        *,
+        max_age: float = 10.0,
+        max_rounds: int = 5,
+    ) -> None:
+        self.algod_client = algod_client
+        self.max_age = max_age
+        self.max_rounds = max_rounds
+        self.stats = GlobalStateCacheStats()
+        self._lock = threading.Lock()
+        self._entries: dict[int, _Entry] = {}
+        # bumped by invalidate, so a read that raced with a write isn't cached
+        self._generations: dict[int, int] = {}
+        self._last_round = 0
+
+    def _fresh_entry(self, app_id: int) -> _Entry | None:
+        entry = self._entries.get(app_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.fetched_at >= self.max_age:
+            return None
+        if self._last_round - entry.round >= self.max_rounds:
+            return None
+        return entry
+
+    def _fetch(self, app_id: int) -> RawGlobalState:
+        app_info = self.algod_client.application_info(app_id)
+        assert isinstance(app_info, dict)
+        return decode_global_state(app_info["params"].get("global-state", []))
+
+    def get(self, app_id: int) -> RawGlobalState:
+        return self.get_many([app_id])[app_id]
+
+    def get_many(
+        self, app_ids: Iterable[int], max_workers: int = 8
+    ) -> dict[int, RawGlobalState]:
+        """Returns the state of every app, reading all the missing ones concurrently.
+
+        algod has no endpoint that returns many applications at once, so the misses
+        are read in parallel rather than one after the other.
+        """
+        app_ids = list(dict.fromkeys(app_ids))
+        result: dict[int, RawGlobalState] = {}
+        with self._lock:
+            for app_id in app_ids:
+                entry = self._fresh_entry(app_id)
+                if entry is not None:
+                    result[app_id] = entry.state
+            self.stats.hits += len(result)
+            self.stats.misses += len(app_ids) - len(result)
+            fetched_round = self._last_round
+            generations = dict(self._generations)
+
+        missing = [app_id for app_id in app_ids if app_id not in result]
+        if not missing:
+            return result
+        fetched_at = time.monotonic()
+        if len(missing) == 1:
+            states = [self._fetch(missing[0])]
+        else:
+            with ThreadPoolExecutor(min(max_workers, len(missing))) as pool:
+                states = list(pool.map(self._fetch, missing))
+
+        with self._lock:
+            for app_id, state in zip(missing, states, strict=True):
+                if self._generations.get(app_id) == generations.get(app_id):
+                    self._entries[app_id] = _Entry(state, fetched_at, fetched_round)
+                result[app_id] = state
+        return result
+
+    def observe_round(self, confirmed_round: int | None) -> None:
+        """Records a round the network reached, e.g. from a confirmed transaction."""
+        if confirmed_round is None:
+            return
+        with self._lock:
+            self._last_round = max(self._last_round, confirmed_round)
+
+    def invalidate(self, app_id: int) -> None:
+        with self._lock:
+            self._entries.pop(app_id, None)
+            self._generations[app_id] = self._generations.get(app_id, 0) + 1
@@ -0,0 +1,85 @@
+import copy
+import dataclasses
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from algosdk.transaction import SuggestedParams
+    from algosdk.v2client.algod import AlgodClient
+
+
+@dataclasses.dataclass
+class SuggestedParamsCacheStats:
+    hits: int = 0
+    refreshes: int = 0
+
+    @property
+    def round_trips_saved(self) -> int:
+        """Every hit is a GET /v2/transactions/params that algod didn't have to serve."""
+        return self.hits
+
+    def report(self) -> str:
+        return (
+            f"Suggested params cache: {self.hits} hit(s), {self.refreshes} "
+            f"refresh(es), {self.round_trips_saved} algod round trip(s) saved"
+        )
+
+
+class SuggestedParamsCache:
+    """Shares one set of suggested params between many transactions and threads.
+
+    The params are fetched again once they are max_age seconds old, or once a
+    confirmed round passed to observe_round is max_rounds past their first valid
+    round. A transaction is valid for 1000 rounds after it, so the defaults keep
+    every transaction well inside its validity window.
+
+    Transactions built from the same cached params share first and last valid
+    rounds, so two otherwise identical ones get the same txid and the second is
+    rejected. Give them a distinct note or lease, DigitalMarketplaceClient adds a
+    random lease to its calls when it uses the cache.
+    """
+
+    def __init__(
+        self,
+        algod_client: "AlgodClient",
+        *,
+        max_age: float = 60.0,
+        max_rounds: int = 100,
+    ) -> None:
+        self.algod_client = algod_client
+        self.max_age = max_age
+        self.max_rounds = max_rounds
+        self.stats = SuggestedParamsCacheStats()
+        self._lock = threading.Lock()
+        self._params: "SuggestedParams | None" = None
+        self._fetched_at = 0.0
+        self._last_round = 0
+
+    def _is_stale(self, params: "SuggestedParams") -> bool:
+        if time.monotonic() - self._fetched_at >= self.max_age:
+            return True
+        return self._last_round - params.first >= self.max_rounds
+
+    def get(self) -> "SuggestedParams":
+        """Returns a copy of the cached params, the caller is free to change its fee."""
+        with self._lock:
+            params = self._params
+            if params is None or self._is_stale(params):
+                params = self._params = self.algod_client.suggested_params()
+                self._fetched_at = time.monotonic()
+                self.stats.refreshes += 1
+            else:
+                self.stats.hits += 1
+            return copy.copy(params)
+
+    def observe_round(self, confirmed_round: int | None) -> None:
+        """Records a round the network reached, e.g. from a confirmed transaction."""
+        if confirmed_round is None:
+            return
+        with self._lock:
+            self._last_round = max(self._last_round, confirmed_round)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._params = None
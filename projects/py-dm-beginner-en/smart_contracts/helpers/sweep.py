@@ -0,0 +1,194 @@
+import dataclasses
+import json
+import logging
+import shutil
+import subprocess
+import sys
+from collections.abc import Sequence
+from pathlib import Path
+
+from smart_contracts.config import SmartContract
+from smart_contracts.helpers import build_cache, manifest
+from smart_contracts.helpers.build import (
+    build,
+    puyapy_flags,
+    variant_file_name,
+    variant_flags,
+)
+
+logger = logging.getLogger(__name__)
+
+optimization_levels = (0, 1, 2)
+sweep_dir = Path(".algokit") / "sweep"
+
+
+@dataclasses.dataclass
+class VariantResult:
+    optimization_level: int
+    avm_version: int | None
+    error: str | None = None
+    bytes: int | None = None
+    extra_pages: int | None = None
+    # per ABI method, the simulated opcode budget with --simulate, else the static one
+    costs: dict[str, int | None] = dataclasses.field(default_factory=dict)
+    tests_passed: bool | None = None
+
+    @property
+    def label(self) -> str:
+        avm = "" if self.avm_version is None else f"-avm{self.avm_version}"
+        return f"O{self.optimization_level}{avm}"
+
+    def cost_key(self) -> tuple[int, int, float]:
+        """Orders variants by what they cost us: the pages, then bytes, then budget.
+
+        Every extra page adds to the creator's min balance. A method that loops has
+        no static bound and ranks last.
+        """
+        assert self.bytes is not None and self.extra_pages is not None
+        budget = sum(
+            float("inf") if cost is None else cost for cost in self.costs.values()
+        )
+        return self.extra_pages, self.bytes, budget
+
+
+def _install(variant_dir: Path, output_dir: Path) -> None:
+    staging_dir = output_dir.with_name(f".{output_dir.name}.staging")
+    if staging_dir.exists():
+        shutil.rmtree(staging_dir)
+    shutil.copytree(variant_dir, staging_dir)
+    build_cache.replace_dir(staging_dir, output_dir)
+
+
+def _simulated_costs(name: str) -> dict[str, int | None]:
+    # a fresh interpreter, so the profile scenario imports the installed client
+    from smart_contracts.helpers.profile import report_dir
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "smart_contracts",
+            "profile",
+            "--only",
+            name,
+            "--no-baseline",
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    if result.returncode:
+        raise Exception(f"Could not simulate variant:\n{result.stdout}")
+    report = json.loads((report_dir / f"{name}.json").read_text())
+    return {method: entry["budget_consumed"] for method, entry in report.items()}
+
+
+def _run_tests(pytest_args: Sequence[str]) -> bool:
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", *pytest_args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    if result.returncode:
+        logger.info(f"Tests failed:\n{result.stdout[-2_000:]}")
+    return result.returncode == 0
+
+
+def sweep(
+    contract: SmartContract,
+    output_dir: Path,
+    *,
+    avm_versions: Sequence[int | None] = (None,),
+    simulate: bool = False,
+    pytest_args: Sequence[str] = (),
+    in_process: bool = True,
+) -> VariantResult:
+    """Compiles contract at every optimization level and AVM version, keeps the best.
+
+    Each variant is built, checked against the TEAL budget and measured. Then, from the
+    cheapest up, variants are installed into output_dir until one passes the tests. It
+    stays installed and its options are saved next to contract.py, so later builds use
+    them. The previous artifacts are put back when no variant passes.
+    """
+    contract_sweep_dir = sweep_dir / contract.name
+    original_dir = contract_sweep_dir / "original"
+    if original_dir.exists():
+        shutil.rmtree(original_dir)
+    contract_sweep_dir.mkdir(parents=True, exist_ok=True)
+    if output_dir.exists():
+        shutil.copytree(output_dir, original_dir)
+
+    results = []
+    for avm_version in avm_versions:
+        for optimization_level in optimization_levels:
+            result = VariantResult(optimization_level, avm_version)
+            results.append(result)
+            variant_dir = contract_sweep_dir / result.label
+            flags = puyapy_flags + variant_flags(optimization_level, avm_version)
+            try:
+                build(variant_dir, contract.path, in_process=in_process, flags=flags)
+            except Exception as ex:
+                # e.g. over the TEAL budget, or an AVM version puyapy doesn't target
+                result.error = str(ex)
+                logger.info(f"{result.label}: {ex}")
+                continue
+            manifest_path = manifest.manifest_path(variant_dir)
+            assert manifest_path is not None
+            size = json.loads(manifest_path.read_text())
+            result.bytes = size["approval"]["bytes"] + size["clear"]["bytes"]
+            result.extra_pages = size["extra_pages"]
+            result.costs = {
+                signature: method["static_cost"]
+                for signature, method in size["methods"].items()
+            }
+            if simulate and contract.profile is not None:
+                _install(variant_dir, output_dir)
+                result.costs = _simulated_costs(contract.name)
+            logger.info(
+                f"{result.label}: {result.bytes} bytes, {result.extra_pages} extra "
+                f"page(s), costs {result.costs}"
+            )
+
+    selected = None
+    for result in sorted(
+        (result for result in results if result.error is None),
+        key=VariantResult.cost_key,
+    ):
+        _install(contract_sweep_dir / result.label, output_dir)
+        result.tests_passed = _run_tests(pytest_args)
+        if result.tests_passed:
+            selected = result
+            break
+
+    if selected is None:
+        if original_dir.exists():
+            _install(original_dir, output_dir)
+    else:
+        (contract.path.parent / variant_file_name).write_text(
+            json.dumps(
+                {
+                    "optimization_level": selected.optimization_level,
+                    "avm_version": selected.avm_version,
+                },
+                indent=4,
+            )
+            + "\n"
+        )
+    report_path = sweep_dir / f"{contract.name}.json"
+    report_path.write_text(
+        json.dumps(
+            {
+                "selected": None if selected is None else selected.label,
+                "variants": {
+                    result.label: dataclasses.asdict(result) for result in results
+                },
+            },
+            indent=2,
+        )
+    )
+    logger.info(f"Wrote sweep report to {report_path}")
+    if selected is None:
+        raise Exception("No variant passed the tests, kept the previous artifacts")
+    logger.info(f"Selected {selected.label}, saved to {variant_file_name}")
+    return selected
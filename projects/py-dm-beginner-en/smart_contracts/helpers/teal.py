@@ -0,0 +1,275 @@
+import math
+import re
+from collections import Counter
+from collections.abc import Callable
+
+Instruction = list[str]
+Blocks = list[tuple[str, list[Instruction]]]
+
+_method_line = re.compile(r'^method "(?P<signature>[^"]+)"$')
+_token = re.compile(r'"(?:[^"\\]|\\.)*"|\S+')
+_branch_ops = {"bz", "bnz"}
+_terminal_ops = {"retsub", "return", "err"}
+
+# the opcodes that cost more than 1 in AVM v10, the others all cost 1
+opcode_costs = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_verify": 1700,
+    "ecdsa_pk_decompress": 650,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+    "bsqrt": 40,
+    "sqrt": 4,
+}
+
+# number of single-byte immediates of the opcodes that have any
+_byte_immediates = {
+    **dict.fromkeys(
+        (
+            "txn",
+            "global",
+            "gtxns",
+            "itxn",
+            "itxn_field",
+            "frame_dig",
+            "frame_bury",
+            "bury",
+            "dig",
+            "cover",
+            "uncover",
+            "dupn",
+            "popn",
+            "load",
+            "store",
+            "asset_holding_get",
+            "asset_params_get",
+            "app_params_get",
+            "acct_params_get",
+            "txnas",
+            "gtxnas",
+            "gtxnsas",
+            "itxnas",
+            "replace2",
+            "base64_decode",
+            "json_ref",
+            "ecdsa_verify",
+            "ecdsa_pk_decompress",
+            "ecdsa_pk_recover",
+            "vrf_verify",
+            "block",
+            "intc",
+            "bytec",
+            "arg",
+        ),
+        1,
+    ),
+    **dict.fromkeys(
+        ("txna", "gtxn", "gtxnsa", "itxna", "extract", "substring", "proto"), 2
+    ),
+    "gtxna": 3,
+}
+# the named constants of the int pseudo-op
+named_ints = {
+    "pay": 1,
+    "keyreg": 2,
+    "acfg": 3,
+    "axfer": 4,
+    "afrz": 5,
+    "appl": 6,
+    "NoOp": 0,
+    "OptIn": 1,
+    "CloseOut": 2,
+    "ClearState": 3,
+    "UpdateApplication": 4,
+    "DeleteApplication": 5,
+}
+_label_ops = {"b", "bz", "bnz", "callsub"}
+_int_ops = {"int", "pushint"}
+_bytes_ops = {"byte", "pushbytes", "method", "addr"}
+
+
+def parse_blocks(teal: str) -> tuple[Blocks, list[str]]:
+    """Splits TEAL into labelled blocks of instructions, and the routed signatures."""
+    blocks: Blocks = [("", [])]
+    signatures = []
+    for raw_line in teal.splitlines():
+        tokens = []
+        for token in _token.findall(raw_line):
+            if token.startswith("//"):
+                break
+            tokens.append(token)
+        if not tokens or tokens[0].startswith("#"):
+            continue
+        if len(tokens) == 1 and tokens[0].endswith(":"):
+            blocks.append((tokens[0][:-1], []))
+            continue
+        method = _method_line.match(" ".join(tokens))
+        if method:
+            signatures.append(method["signature"])
+        blocks[-1][1].append(tokens)
+    return blocks, signatures
+
+
+def route_labels(blocks: Blocks) -> list[str]:
+    """The labels the ARC4 router jumps to, in the order of the routed methods."""
+    for _, instructions in blocks:
+        match = next((args for op, *args in instructions if op == "match"), None)
+        if match is not None:
+            return match
+    return []
+
+
+def router_prelude(blocks: Blocks) -> list[Instruction]:
+    """The instructions every ABI call runs before the router jumps to its method."""
+    prelude: list[Instruction] = []
+    for _, instructions in blocks:
+        for instruction in instructions:
+            prelude.append(instruction)
+            if instruction[0] == "match":
+                return prelude
+    return []
+
+
+def max_over_paths(
+    blocks: Blocks, start: str, weight: Callable[[Instruction], int]
+) -> int | None:
+    """The largest total weight of the instructions on any path from label start.
+
+    Follows branches and subroutine calls until the program returns. None when a
+    path loops, so the total depends on the input.
+    """
+    index = {label: i for i, (label, _) in enumerate(blocks)}
+
+    def walk(block: int, start: int, path: frozenset[tuple[int, int]]) -> int | None:
+        if block >= len(blocks):
+            return 0
+        if (block, start) in path:
+            return None
+        path = path | {(block, start)}
+        total = 0
+        instructions = blocks[block][1]
+        for offset in range(start, len(instructions)):
+            instruction = instructions[offset]
+            op, *args = instruction
+            total += weight(instruction)
+            if op == "callsub":
+                called = walk(index[args[0]], 0, path)
+                if called is None:
+                    return None
+                total += called
+            elif op == "b":
+                rest = walk(index[args[0]], 0, path)
+                return None if rest is None else total + rest
+            elif op in _branch_ops:
+                taken = walk(index[args[0]], 0, path)
+                # puyapy puts the code of the other path right after the branch
+                not_taken = walk(block, offset + 1, path)
+                if taken is None or not_taken is None:
+                    return None
+                return total + max(taken, not_taken)
+            elif op in _terminal_ops:
+                return total
+        # the end of a block falls through to the next one
+        rest = walk(block + 1, 0, path)
+        return None if rest is None else total + rest
+
+    return walk(index[start], 0, frozenset())
+
+
+def opcode_cost(instruction: Instruction) -> int:
+    """Static opcode budget an instruction uses, labels and pragmas aside."""
+    return opcode_costs.get(instruction[0], 1)
+
+
+def _varuint_size(value: int) -> int:
+    return max(1, math.ceil(value.bit_length() / 7))
+
+
+def _int_value(value: str) -> int:
+    return named_ints[value] if value in named_ints else int(value, 0)
+
+
+def _constant(instruction: Instruction) -> int | bytes | None:
+    op, *args = instruction
+    if op in _int_ops:
+        return _int_value(args[0])
+    if op in _bytes_ops:
+        # only the identity of the constant matters here, not its decoded value
+        value = " ".join(args).encode()
+        return b"m" + value if op == "method" else value
+    return None
+
+
+def _constant_size(instruction: Instruction) -> int:
+    """Size of the value of a constant, encoded as a pushint or pushbytes immediate."""
+    op, *args = instruction
+    if op in _int_ops:
+        return _varuint_size(_int_value(args[0]))
+    if op == "method":
+        length = 4
+    elif op == "addr":
+        length = 32
+    elif args[0].startswith('"'):
+        length = len(args[0][1:-1].encode().decode("unicode_escape"))
+    elif args[0].startswith("0x"):
+        length = len(args[0]) // 2 - 1
+    else:
+        # base64 forms, 3 bytes for every 4 characters
+        length = len(args[-1].split("(")[-1].rstrip(")")) * 3 // 4
+    return _varuint_size(length) + length
+
+
+def program_size(teal: str) -> int:
+    """Estimates the size in bytes of the assembled program.
+
+    Constants used more than once go in an intcblock/bytecblock and the others are
+    pushed, like the assembler does, so the estimate is close but not exact.
+    """
+    blocks, _ = parse_blocks(teal)
+    instructions = [instruction for _, block in blocks for instruction in block]
+    uses = Counter(
+        constant
+        for instruction in instructions
+        if (constant := _constant(instruction)) is not None
+    )
+    # the most used constants get the 1 byte intc_0..3 / bytec_0..3 references
+    slots: dict[int | bytes, int] = {}
+    block_lengths = {int: 0, bytes: 0}
+    for constant, count in uses.most_common():
+        if count > 1:
+            kind = type(constant)
+            slots[constant] = block_lengths[kind]
+            block_lengths[kind] += 1
+
+    size = 1  # the version
+    block_values: dict[int | bytes, int] = {}
+    for instruction in instructions:
+        op, *args = instruction
+        constant = _constant(instruction)
+        if constant in slots:
+            block_values.setdefault(constant, _constant_size(instruction))
+            size += 1 if slots[constant] < 4 else 2
+        elif constant is not None:
+            size += 1 + _constant_size(instruction)
+        elif op in ("match", "switch"):
+            size += 2 + 2 * len(args)
+        else:
+            size += 1 + 2 * (op in _label_ops) + _byte_immediates.get(op, 0)
+    for length in block_lengths.values():
+        if length:
+            size += 1 + _varuint_size(length)
+    return size + sum(block_values.values())
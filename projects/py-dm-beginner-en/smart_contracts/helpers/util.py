@@ -6,3 +6,12 @@ def find_app_spec_file(output_dir: Path) -> str | None:
         if file.is_file() and file.suffixes == [".arc32", ".json"]:
             return file.name
     return None
+
+
+def write_atomically(path: Path, text: str) -> None:
+    """Replaces the contents of path with text, creating its directory if needed."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # written next to the old file and renamed over it, so a crash keeps one intact
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_text(text)
+    temp_path.replace(path)
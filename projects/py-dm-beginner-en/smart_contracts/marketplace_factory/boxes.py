@@ -0,0 +1,63 @@
+import base64
+
+from algosdk.encoding import decode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+# must match the constants in contract.py
+APPROVAL_BOX = b"approval"
+CLEAR_BOX = b"clear"
+MARKETPLACE_APP_MBR = 100_000 + 28_500 * 2
+MARKETPLACE_BOX_MBR = 2_500 + 400 * (32 + 8 + 8)
+ASSET_OPT_IN_MBR = 100_000
+# the min balance of the marketplace account once it holds the asset
+MARKETPLACE_ACCOUNT_MBR = 100_000 + ASSET_OPT_IN_MBR
+# the mbr_pay of create_marketplace
+ONBOARDING_MBR = MARKETPLACE_APP_MBR + MARKETPLACE_BOX_MBR + MARKETPLACE_ACCOUNT_MBR
+
+
+def marketplace_key(seller: str, asset_id: int) -> bytes:
+    """Box name of the marketplace seller created for asset_id."""
+    return decode_address(seller) + asset_id.to_bytes(8, "big")
+
+
+def marketplace_box(seller: str, asset_id: int) -> tuple[int, bytes]:
+    """Box reference to pass in `TransactionParameters.boxes` when calling the app."""
+    # app id 0 refers to the app being called
+    return 0, marketplace_key(seller, asset_id)
+
+
+def program_boxes_mbr(approval: bytes, clear: bytes) -> int:
+    """What the factory account must hold on top of its MBR to store the programs."""
+    return 2 * 2_500 + 400 * (
+        len(APPROVAL_BOX) + len(approval) + len(CLEAR_BOX) + len(clear)
+    )
+
+
+def _box_value(algod_client: AlgodClient, app_id: int, name: bytes) -> bytes | None:
+    try:
+        response = algod_client.application_box_by_name(app_id, name)
+    except AlgodHTTPError as ex:
+        if ex.code == 404:
+            return None
+        raise
+    assert isinstance(response, dict)
+    return base64.b64decode(response["value"])
+
+
+def get_programs(
+    algod_client: AlgodClient, app_id: int
+) -> tuple[bytes | None, bytes | None]:
+    """The approval and clear programs the factory creates marketplaces with."""
+    return (
+        _box_value(algod_client, app_id, APPROVAL_BOX),
+        _box_value(algod_client, app_id, CLEAR_BOX),
+    )
+
+
+def get_marketplace_id(
+    algod_client: AlgodClient, app_id: int, seller: str, asset_id: int
+) -> int | None:
+    """The marketplace seller created for asset_id, None if there is none."""
+    value = _box_value(algod_client, app_id, marketplace_key(seller, asset_id))
+    return None if value is None else int.from_bytes(value, "big")
@@ -0,0 +1,191 @@
+# pyright: reportMissingModuleSource=false
+from algopy import (
+    Account,
+    Application,
+    Asset,
+    Bytes,
+    Global,
+    OnCompleteAction,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    itxn,
+    op,
+    subroutine,
+)
+
+# The compiled DigitalMarketplace programs, set by the creator with set_programs
+APPROVAL_BOX = b"approval"
+CLEAR_BOX = b"clear"
+
+# Creating an app locks 100_000 uALGO in the creator account (here the factory)
+# plus 28_500 uALGO per global uint, DigitalMarketplace stores two of them
+MARKETPLACE_APP_MBR = 100_000 + 28_500 * 2
+# Every box costs 2_500 uALGO plus 400 uALGO per byte of key and value
+# A marketplace key is the seller address (32 bytes) followed by the asset id (8 bytes)
+# A marketplace value is the id of the DigitalMarketplace app (8 bytes)
+MARKETPLACE_BOX_MBR = 2_500 + 400 * (32 + 8 + 8)
+
+
+@subroutine
+def marketplace_key(seller: Account, asset: Asset) -> Bytes:
+    return seller.bytes + op.itob(asset.id)
+
+
+# Creates a DigitalMarketplace for a seller in a single app call
+# The factory is the creator of every marketplace it creates, so the seller
+# changes the price and deletes the marketplace through the factory
+class MarketplaceFactory(arc4.ARC4Contract):
+    # The creator stores the programs every new marketplace is created with
+    # The app account must already hold the MBR of the two boxes
+    @arc4.abimethod
+    def set_programs(self, approval: Bytes, clear: Bytes) -> None:
+        assert Txn.sender == Global.creator_address
+
+        # A box can't change size, so the old programs are deleted first
+        # The results are assigned, puyapy 0.7 can't compile a discarded box_del
+        _deleted = op.Box.delete(APPROVAL_BOX)
+        op.Box.put(APPROVAL_BOX, approval)
+        _deleted = op.Box.delete(CLEAR_BOX)
+        op.Box.put(CLEAR_BOX, clear)
+
+    # The deposit goes through the factory, so it must opt-in to the asset first
+    # Anyone can pay for the opt-in, it only needs to happen once per asset
+    @arc4.abimethod
+    def allow_asset(self, mbr_pay: gtxn.PaymentTransaction, asset: Asset) -> None:
+        assert not Global.current_application_address.is_opted_in(asset)
+
+        assert mbr_pay.receiver == Global.current_application_address
+        assert mbr_pay.amount == Global.asset_opt_in_min_balance
+
+        itxn.AssetTransfer(
+            xfer_asset=asset,
+            asset_receiver=Global.current_application_address,
+            asset_amount=0,
+        ).submit()
+
+    # Creates the marketplace, funds it, opts it in to the asset and hands it the
+    # deposit, which is everything a seller otherwise does in four steps
+    # Returns the id of the new marketplace
+    @arc4.abimethod
+    def create_marketplace(
+        self,
+        mbr_pay: gtxn.PaymentTransaction,
+        deposit: gtxn.AssetTransferTransaction,
+        unitary_price: UInt64,
+    ) -> UInt64:
+        asset = deposit.xfer_asset
+        key = marketplace_key(Txn.sender, asset)
+        # A seller can only have one marketplace per asset
+        _value, exists = op.Box.get(key)
+        assert not exists
+
+        # The seller pays for the marketplace app, its box here and its own MBR
+        assert mbr_pay.sender == Txn.sender
+        assert mbr_pay.receiver == Global.current_application_address
+        assert mbr_pay.amount == (
+            MARKETPLACE_APP_MBR
+            + MARKETPLACE_BOX_MBR
+            + Global.min_balance
+            + Global.asset_opt_in_min_balance
+        )
+
+        assert deposit.sender == Txn.sender
+        assert deposit.asset_receiver == Global.current_application_address
+        assert deposit.asset_amount > 0
+
+        approval, approval_exists = op.Box.get(APPROVAL_BOX)
+        clear, clear_exists = op.Box.get(CLEAR_BOX)
+        assert approval_exists and clear_exists
+
+        # The asset argument of create_application is its index in the foreign assets
+        marketplace = (
+            itxn.ApplicationCall(
+                approval_program=approval,
+                clear_state_program=clear,
+                global_num_uint=2,
+                app_args=(
+                    arc4.arc4_signature("create_application(asset,uint64)void"),
+                    arc4.UInt8(0),
+                    arc4.UInt64(unitary_price),
+                ),
+                assets=(asset,),
+            )
+            .submit()
+            .created_app
+        )
+
+        # opt_in_to_asset checks the payment just before it, so both go in one group
+        itxn.submit_txns(
+            itxn.Payment(
+                receiver=marketplace.address,
+                amount=Global.min_balance + Global.asset_opt_in_min_balance,
+            ),
+            itxn.ApplicationCall(
+                app_id=marketplace,
+                app_args=(arc4.arc4_signature("opt_in_to_asset(pay)void"),),
+                assets=(asset,),
+            ),
+        )
+
+        itxn.AssetTransfer(
+            xfer_asset=asset,
+            asset_receiver=marketplace.address,
+            asset_amount=deposit.asset_amount,
+        ).submit()
+
+        op.Box.put(key, op.itob(marketplace.id))
+        return marketplace.id
+
+    @arc4.abimethod
+    def set_price(self, asset: Asset, unitary_price: UInt64) -> None:
+        # The key is derived from the sender, so sellers can only change their own price
+        marketplace = self.marketplace(Txn.sender, asset)
+
+        itxn.ApplicationCall(
+            app_id=marketplace,
+            app_args=(
+                arc4.arc4_signature("set_price(uint64)void"),
+                arc4.UInt64(unitary_price),
+            ),
+        ).submit()
+
+    @arc4.abimethod
+    def delete_marketplace(self, asset: Asset) -> None:
+        marketplace = self.marketplace(Txn.sender, asset)
+
+        # The marketplace closes out to its creator, the factory,
+        # so whatever the factory gains from the deletion belongs to the seller
+        balance = Global.current_application_address.balance
+        units = asset.balance(Global.current_application_address)
+        itxn.ApplicationCall(
+            app_id=marketplace,
+            on_completion=OnCompleteAction.DeleteApplication,
+            app_args=(arc4.arc4_signature("delete_application()void"),),
+            assets=(asset,),
+        ).submit()
+
+        # Send the unsold units back to the seller
+        itxn.AssetTransfer(
+            xfer_asset=asset,
+            asset_receiver=Txn.sender,
+            asset_amount=asset.balance(Global.current_application_address) - units,
+        ).submit()
+
+        # Deleting the app and the box unlocks their MBR, so we refund it as well
+        _deleted = op.Box.delete(marketplace_key(Txn.sender, asset))
+        itxn.Payment(
+            receiver=Txn.sender,
+            amount=Global.current_application_address.balance
+            - balance
+            + MARKETPLACE_APP_MBR
+            + MARKETPLACE_BOX_MBR,
+        ).submit()
+
+    # The marketplace seller created for asset, fails if there is none
+    @subroutine
+    def marketplace(self, seller: Account, asset: Asset) -> Application:
+        value, exists = op.Box.get(marketplace_key(seller, asset))
+        assert exists
+        return Application(op.btoi(value))
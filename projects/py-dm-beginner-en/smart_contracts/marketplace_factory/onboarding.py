@@ -0,0 +1,280 @@
+"""Puts a seller's asset on sale through MarketplaceFactory in one group.
+
+The seller pays ONBOARDING_MBR up front, covering the DigitalMarketplace app,
+its funding and the box that records the seller's marketplace. The first group
+for a new asset also opts the factory in to it (0.1 ALGO, once per asset). The
+factory creates marketplaces from the programs kept in its two program boxes.
+It is their creator, so sellers set the price and delete through the factory,
+while buyers call the marketplace itself.
+"""
+
+import logging
+import typing
+from pathlib import Path
+
+import algokit_utils
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionResponse,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import AssetTransferTxn, PaymentTxn, SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.helpers.bytecode import (
+    PrecompiledAlgodClient,
+    load_compile_results,
+)
+from smart_contracts.helpers.fees import with_pooled_fee
+from smart_contracts.marketplace_factory.boxes import (
+    APPROVAL_BOX,
+    ASSET_OPT_IN_MBR,
+    CLEAR_BOX,
+    ONBOARDING_MBR,
+    get_marketplace_id,
+    get_programs,
+    marketplace_box,
+    program_boxes_mbr,
+)
+
+if typing.TYPE_CHECKING:
+    from smart_contracts.artifacts.marketplace_factory.client import (
+        Composer,
+        MarketplaceFactoryClient,
+    )
+
+logger = logging.getLogger(__name__)
+# the static fee table only sees the factory's own inner transactions, these also
+# count the ones of the DigitalMarketplace calls the factory makes
+ALLOW_ASSET_INNER_TXNS = 1
+CREATE_MARKETPLACE_INNER_TXNS = 5
+SET_PRICE_INNER_TXNS = 1
+DELETE_MARKETPLACE_INNER_TXNS = 5
+# the programs the factory creates marketplaces with come from this build output
+marketplace_artifact_dir = (
+    Path(__file__).parent.parent / "artifacts" / "digital_marketplace"
+)
+
+
+def marketplace_programs(algod_client: AlgodClient) -> tuple[bytes, bytes]:
+    """The compiled approval and clear programs of DigitalMarketplace.
+
+    Uses the bytecode of the build when it has it, else compiles with algod.
+    """
+    app_spec = algokit_utils.ApplicationSpecification.from_json(
+        (marketplace_artifact_dir / "DigitalMarketplace.arc32.json").read_text()
+    )
+    compiler = typing.cast(
+        AlgodClient,
+        PrecompiledAlgodClient(
+            algod_client, load_compile_results(marketplace_artifact_dir)
+        ),
+    )
+    return (
+        algokit_utils.Program(app_spec.approval_program, compiler).raw_binary,
+        algokit_utils.Program(app_spec.clear_program, compiler).raw_binary,
+    )
+
+
+def update_programs(
+    client: "MarketplaceFactoryClient", funding_source: algokit_utils.Account
+) -> bool:
+    """Stores the current DigitalMarketplace programs in the factory.
+
+    Does nothing when the factory already has them, returns whether it sent them.
+    """
+    approval, clear = marketplace_programs(client.algod_client)
+    if get_programs(client.algod_client, client.app_id) == (approval, clear):
+        return False
+    # the old boxes are freed in the same call, so this may fund a bit more than needed
+    algokit_utils.ensure_funded(
+        client.algod_client,
+        algokit_utils.EnsureBalanceParameters(
+            account_to_fund=client.app_address,
+            min_spending_balance_micro_algos=program_boxes_mbr(approval, clear),
+            funding_source=funding_source,
+        ),
+    )
+    client.set_programs(
+        approval=approval,
+        clear=clear,
+        transaction_parameters=algokit_utils.TransactionParameters(
+            boxes=[(0, APPROVAL_BOX), (0, CLEAR_BOX)]
+        ),
+    )
+    logger.info(f"Stored the DigitalMarketplace programs in {client.app_id}")
+    return True
+
+
+def is_asset_allowed(algod_client: AlgodClient, address: str, asset_id: int) -> bool:
+    """Whether the factory at address is opted in to asset_id."""
+    try:
+        algod_client.account_asset_info(address, asset_id)
+    except AlgodHTTPError as ex:
+        if ex.code == 404:
+            return False
+        raise
+    return True
+
+
+def compose_onboarding(
+    client: "MarketplaceFactoryClient",
+    *,
+    seller: str,
+    signer: TransactionSigner,
+    asset_id: int,
+    quantity: int,
+    unitary_price: int,
+    suggested_params: SuggestedParams,
+    allow_asset: bool,
+) -> "Composer":
+    """Composes the single atomic group that puts a seller's asset on sale.
+
+    With allow_asset, the group starts with the factory's opt-in to the asset,
+    which only the first seller of an asset needs.
+    """
+    composer = client.compose()
+    if allow_asset:
+        composer.allow_asset(
+            mbr_pay=TransactionWithSigner(
+                PaymentTxn(
+                    seller, suggested_params, client.app_address, ASSET_OPT_IN_MBR
+                ),
+                signer,
+            ),
+            asset=asset_id,
+            transaction_parameters=algokit_utils.TransactionParameters(
+                sender=seller,
+                signer=signer,
+                suggested_params=with_pooled_fee(
+                    suggested_params, ALLOW_ASSET_INNER_TXNS
+                ),
+                foreign_assets=[asset_id],
+            ),
+        )
+    composer.create_marketplace(
+        mbr_pay=TransactionWithSigner(
+            PaymentTxn(seller, suggested_params, client.app_address, ONBOARDING_MBR),
+            signer,
+        ),
+        deposit=TransactionWithSigner(
+            AssetTransferTxn(
+                seller, suggested_params, client.app_address, quantity, asset_id
+            ),
+            signer,
+        ),
+        unitary_price=unitary_price,
+        transaction_parameters=algokit_utils.TransactionParameters(
+            sender=seller,
+            signer=signer,
+            suggested_params=with_pooled_fee(
+                suggested_params, CREATE_MARKETPLACE_INNER_TXNS
+            ),
+            foreign_assets=[asset_id],
+            boxes=[
+                (0, APPROVAL_BOX),
+                (0, CLEAR_BOX),
+                marketplace_box(seller, asset_id),
+            ],
+        ),
+    )
+    return composer
+
+
+def onboard(
+    client: "MarketplaceFactoryClient",
+    *,
+    seller: str,
+    signer: TransactionSigner,
+    asset_id: int,
+    quantity: int,
+    unitary_price: int,
+) -> int:
+    """Creates a marketplace selling quantity units of asset_id, returns its app id.
+
+    Waits for a single confirmation, where creating the app, funding it, opting
+    it in and depositing the asset take one each without the factory.
+    """
+    response = compose_onboarding(
+        client,
+        seller=seller,
+        signer=signer,
+        asset_id=asset_id,
+        quantity=quantity,
+        unitary_price=unitary_price,
+        suggested_params=client.algod_client.suggested_params(),
+        allow_asset=not is_asset_allowed(
+            client.algod_client, client.app_address, asset_id
+        ),
+    ).execute()
+    return response.abi_results[-1].return_value
+
+
+def _marketplace_parameters(
+    client: "MarketplaceFactoryClient",
+    seller: str,
+    signer: TransactionSigner,
+    asset_id: int,
+    inner_txns: int,
+) -> algokit_utils.TransactionParameters:
+    marketplace_id = get_marketplace_id(
+        client.algod_client, client.app_id, seller, asset_id
+    )
+    if marketplace_id is None:
+        raise Exception(f"{seller} has no marketplace for asset {asset_id}")
+    return algokit_utils.TransactionParameters(
+        sender=seller,
+        signer=signer,
+        suggested_params=with_pooled_fee(
+            client.algod_client.suggested_params(), inner_txns
+        ),
+        foreign_apps=[marketplace_id],
+        foreign_assets=[asset_id],
+        boxes=[marketplace_box(seller, asset_id)],
+    )
+
+
+def set_price(
+    client: "MarketplaceFactoryClient",
+    *,
+    seller: str,
+    signer: TransactionSigner,
+    asset_id: int,
+    unitary_price: int,
+) -> AtomicTransactionResponse:
+    """Changes the price of the marketplace seller created for asset_id."""
+    return (
+        client.compose()
+        .set_price(
+            asset=asset_id,
+            unitary_price=unitary_price,
+            transaction_parameters=_marketplace_parameters(
+                client, seller, signer, asset_id, SET_PRICE_INNER_TXNS
+            ),
+        )
+        .execute()
+    )
+
+
+def delete_marketplace(
+    client: "MarketplaceFactoryClient",
+    *,
+    seller: str,
+    signer: TransactionSigner,
+    asset_id: int,
+) -> AtomicTransactionResponse:
+    """Deletes the marketplace of seller for asset_id.
+
+    The seller gets back the unsold units, the proceeds and every MBR paid for it.
+    """
+    return (
+        client.compose()
+        .delete_marketplace(
+            asset=asset_id,
+            transaction_parameters=_marketplace_parameters(
+                client, seller, signer, asset_id, DELETE_MARKETPLACE_INNER_TXNS
+            ),
+        )
+        .execute()
+    )
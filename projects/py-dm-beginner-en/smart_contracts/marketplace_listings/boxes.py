@@ -0,0 +1,67 @@
+import base64
+import dataclasses
+
+from algosdk.encoding import decode_address, encode_address
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+# must match LISTING_BOX_MBR in contract.py
+LISTING_BOX_MBR = 2_500 + 400 * (32 + 8 + 16)
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class Listing:
+    """Typed view of a listing box, keyed by (seller, asset_id)."""
+
+    seller: str
+    asset_id: int
+    quantity: int
+    unitary_price: int
+
+
+def listing_key(seller: str, asset_id: int) -> bytes:
+    """Box name of the listing of asset_id by seller."""
+    return decode_address(seller) + asset_id.to_bytes(8, "big")
+
+
+def listing_box(seller: str, asset_id: int) -> tuple[int, bytes]:
+    """Box reference to pass in `TransactionParameters.boxes` when calling the app."""
+    # app id 0 refers to the app being called
+    return 0, listing_key(seller, asset_id)
+
+
+def decode_listing(key: bytes, value: bytes) -> Listing:
+    return Listing(
+        seller=encode_address(key[:32]),
+        asset_id=int.from_bytes(key[32:40], "big"),
+        quantity=int.from_bytes(value[:8], "big"),
+        unitary_price=int.from_bytes(value[8:16], "big"),
+    )
+
+
+def get_listing(
+    algod_client: AlgodClient, app_id: int, seller: str, asset_id: int
+) -> Listing | None:
+    """Reads a single listing, returns None if seller hasn't listed asset_id."""
+    key = listing_key(seller, asset_id)
+    try:
+        response = algod_client.application_box_by_name(app_id, key)
+    except AlgodHTTPError as ex:
+        if ex.code == 404:
+            return None
+        raise
+    assert isinstance(response, dict)
+    return decode_listing(key, base64.b64decode(response["value"]))
+
+
+def get_listings(algod_client: AlgodClient, app_id: int) -> list[Listing]:
+    """Reads every listing hosted by the app."""
+    response = algod_client.application_boxes(app_id)
+    assert isinstance(response, dict)
+    listings = []
+    for box in response["boxes"]:
+        key = base64.b64decode(box["name"])
+        value = algod_client.application_box_by_name(app_id, key)
+        assert isinstance(value, dict)
+        listings.append(decode_listing(key, base64.b64decode(value["value"])))
+    return listings
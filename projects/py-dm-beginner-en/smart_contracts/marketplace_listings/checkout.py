@@ -0,0 +1,118 @@
+import copy
+import dataclasses
+from typing import TYPE_CHECKING
+
+import algokit_utils
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionResponse,
+    TransactionSigner,
+    TransactionWithSigner,
+)
+from algosdk.transaction import PaymentTxn, SuggestedParams
+
+from smart_contracts.marketplace_listings.boxes import listing_box
+
+if TYPE_CHECKING:
+    from smart_contracts.artifacts.marketplace_listings.client import (
+        Composer,
+        MarketplaceListingsClient,
+    )
+
+# an app call can reference at most 8 accounts, assets, apps and boxes combined
+MAX_REFERENCES_PER_CALL = 8
+# every buy_many call comes with its payment, and a group holds at most 16 transactions
+MAX_CALLS_PER_GROUP = 8
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CartItem:
+    seller: str
+    asset_id: int
+    quantity: int
+    unitary_price: int
+
+    @property
+    def amount(self) -> int:
+        return self.quantity * self.unitary_price
+
+
+def _references(items: list[CartItem]) -> int:
+    sellers = {item.seller for item in items}
+    assets = {item.asset_id for item in items}
+    # one box per item, plus every distinct seller account and asset
+    return len(items) + len(sellers) + len(assets)
+
+
+def split_cart(items: list[CartItem]) -> list[list[CartItem]]:
+    """Splits a cart into buy_many calls that each fit the app call reference limit."""
+    calls: list[list[CartItem]] = []
+    for item in items:
+        if calls and _references([*calls[-1], item]) <= MAX_REFERENCES_PER_CALL:
+            calls[-1].append(item)
+        else:
+            calls.append([item])
+    if len(calls) > MAX_CALLS_PER_GROUP:
+        raise Exception(
+            f"Cart needs {len(calls)} buy_many calls, "
+            f"at most {MAX_CALLS_PER_GROUP} fit in one atomic group"
+        )
+    return calls
+
+
+def compose_buy_many(
+    client: "MarketplaceListingsClient",
+    items: list[CartItem],
+    *,
+    buyer: str,
+    signer: TransactionSigner,
+    suggested_params: SuggestedParams,
+) -> "Composer":
+    """Composes a single atomic group that buys every item in the cart.
+
+    Each buy_many call pays for its own inner transactions (an asset transfer
+    and a payment to the seller per item) through fee pooling.
+    """
+    composer = client.compose()
+    for call_items in split_cart(items):
+        payment = PaymentTxn(
+            sender=buyer,
+            sp=suggested_params,
+            receiver=client.app_address,
+            amt=sum(item.amount for item in call_items),
+        )
+        call_params = copy.copy(suggested_params)
+        call_params.flat_fee = True
+        call_params.fee = max(suggested_params.min_fee, suggested_params.fee) * (
+            1 + 2 * len(call_items)
+        )
+        composer.buy_many(
+            buyer_txn=TransactionWithSigner(payment, signer),
+            items=[(item.seller, item.asset_id, item.quantity) for item in call_items],
+            transaction_parameters=algokit_utils.TransactionParameters(
+                sender=buyer,
+                signer=signer,
+                suggested_params=call_params,
+                accounts=sorted({item.seller for item in call_items}),
+                foreign_assets=sorted({item.asset_id for item in call_items}),
+                boxes=[listing_box(item.seller, item.asset_id) for item in call_items],
+            ),
+        )
+    return composer
+
+
+def checkout(
+    client: "MarketplaceListingsClient",
+    items: list[CartItem],
+    *,
+    buyer: str,
+    signer: TransactionSigner,
+) -> AtomicTransactionResponse:
+    """Buys every item in the cart, waiting for a single confirmation."""
+    suggested_params = client.algod_client.suggested_params()
+    return compose_buy_many(
+        client,
+        items,
+        buyer=buyer,
+        signer=signer,
+        suggested_params=suggested_params,
+    ).execute()
@@ -0,0 +1,190 @@
+# pyright: reportMissingModuleSource=false
+from algopy import (
+    Account,
+    Asset,
+    Bytes,
+    Global,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    itxn,
+    op,
+    subroutine,
+    urange,
+)
+
+# Every box costs 2_500 uALGO plus 400 uALGO per byte of key and value
+# A listing key is the seller address (32 bytes) followed by the asset id (8 bytes)
+# A listing value is a Listing struct (2 * 8 bytes)
+LISTING_BOX_MBR = 2_500 + 400 * (32 + 8 + 16)
+
+
+# The value we store in the box of every listing
+class Listing(arc4.Struct):
+    # How many units of the asset the app still holds for the seller
+    quantity: arc4.UInt64
+    # The price of a single unit, in uALGO
+    unitary_price: arc4.UInt64
+
+
+# One line of a shopping cart
+class CartItem(arc4.Struct):
+    seller: arc4.Address
+    asset: arc4.UInt64
+    quantity: arc4.UInt64
+
+
+@subroutine
+def listing_key(seller: Account, asset: Asset) -> Bytes:
+    return seller.bytes + op.itob(asset.id)
+
+
+# One app hosts the listings of many sellers and many assets
+# Instead of global state, every listing lives in its own box keyed by (seller, asset)
+class MarketplaceListings(arc4.ARC4Contract):
+    # Before the app can hold an asset, it must opt-in to it
+    # Anyone can pay for the opt-in, it only needs to happen once per asset
+    @arc4.abimethod
+    def allow_asset(self, mbr_pay: gtxn.PaymentTransaction, asset: Asset) -> None:
+        assert not Global.current_application_address.is_opted_in(asset)
+
+        assert mbr_pay.receiver == Global.current_application_address
+        assert mbr_pay.amount == Global.asset_opt_in_min_balance
+
+        itxn.AssetTransfer(
+            xfer_asset=asset,
+            asset_receiver=Global.current_application_address,
+            asset_amount=0,
+        ).submit()
+
+    # A seller lists an asset by depositing it and paying for the box that stores the listing
+    # Not named "list", the generated client would shadow the builtin with it
+    @arc4.abimethod
+    def list_asset(
+        self,
+        mbr_pay: gtxn.PaymentTransaction,
+        xfer: gtxn.AssetTransferTransaction,
+        unitary_price: UInt64,
+    ) -> None:
+        key = listing_key(Txn.sender, xfer.xfer_asset)
+        # A seller can only have one listing per asset
+        _value, exists = op.Box.get(key)
+        assert not exists
+
+        assert mbr_pay.sender == Txn.sender
+        assert mbr_pay.receiver == Global.current_application_address
+        assert mbr_pay.amount == LISTING_BOX_MBR
+
+        assert xfer.sender == Txn.sender
+        assert xfer.asset_receiver == Global.current_application_address
+        assert xfer.asset_amount > 0
+
+        op.Box.put(
+            key,
+            Listing(
+                quantity=arc4.UInt64(xfer.asset_amount),
+                unitary_price=arc4.UInt64(unitary_price),
+            ).bytes,
+        )
+
+    @arc4.abimethod
+    def set_price(self, asset: Asset, unitary_price: UInt64) -> None:
+        # The key is derived from the sender, so sellers can only change their own price
+        key = listing_key(Txn.sender, asset)
+        value, exists = op.Box.get(key)
+        assert exists
+
+        listing = Listing.from_bytes(value)
+        op.Box.put(
+            key,
+            Listing(
+                quantity=listing.quantity,
+                unitary_price=arc4.UInt64(unitary_price),
+            ).bytes,
+        )
+
+    @arc4.abimethod
+    def buy(
+        self,
+        seller: Account,
+        asset: Asset,
+        # The payment goes straight to the seller, the app never holds sale proceeds
+        buyer_txn: gtxn.PaymentTransaction,
+        quantity: UInt64,
+    ) -> None:
+        assert buyer_txn.sender == Txn.sender
+        assert buyer_txn.receiver == seller
+        assert buyer_txn.amount == self.sell(seller, asset, quantity)
+
+    # Buys a whole cart with a single payment to the app
+    # The app forwards each seller's share with an inner payment
+    @arc4.abimethod
+    def buy_many(
+        self,
+        buyer_txn: gtxn.PaymentTransaction,
+        items: arc4.DynamicArray[CartItem],
+    ) -> None:
+        assert buyer_txn.sender == Txn.sender
+        assert buyer_txn.receiver == Global.current_application_address
+
+        total = UInt64(0)
+        # A struct is mutable, so the cart is read by index instead of iterated
+        for index in urange(items.length):
+            item = items[index].copy()
+            seller = Account(item.seller.bytes)
+            amount = self.sell(seller, Asset(item.asset.native), item.quantity.native)
+            itxn.Payment(receiver=seller, amount=amount).submit()
+            total += amount
+
+        # The cart must be paid exactly, nothing more, nothing less
+        assert buyer_txn.amount == total
+
+    # Takes quantity units out of a listing and sends them to the buyer
+    # Returns how much the buyer owes the seller for them
+    @subroutine
+    def sell(self, seller: Account, asset: Asset, quantity: UInt64) -> UInt64:
+        key = listing_key(seller, asset)
+        value, exists = op.Box.get(key)
+        assert exists
+        listing = Listing.from_bytes(value)
+
+        # Fails if the buyer asks for more units than are left
+        op.Box.put(
+            key,
+            Listing(
+                quantity=arc4.UInt64(listing.quantity.native - quantity),
+                unitary_price=listing.unitary_price,
+            ).bytes,
+        )
+
+        itxn.AssetTransfer(
+            xfer_asset=asset,
+            asset_receiver=Txn.sender,
+            asset_amount=quantity,
+        ).submit()
+
+        return listing.unitary_price.native * quantity
+
+    @arc4.abimethod
+    def delist(self, asset: Asset) -> None:
+        key = listing_key(Txn.sender, asset)
+        value, exists = op.Box.get(key)
+        assert exists
+        listing = Listing.from_bytes(value)
+
+        # Send the unsold units back to the seller
+        if listing.quantity.native:
+            itxn.AssetTransfer(
+                xfer_asset=asset,
+                asset_receiver=Txn.sender,
+                asset_amount=listing.quantity.native,
+            ).submit()
+
+        # Deleting the box unlocks its MBR, so we refund it to the seller
+        # The result is assigned, puyapy 0.7 can't compile a discarded box_del
+        _deleted = op.Box.delete(key)
+        itxn.Payment(
+            receiver=Txn.sender,
+            amount=LISTING_BOX_MBR,
+        ).submit()
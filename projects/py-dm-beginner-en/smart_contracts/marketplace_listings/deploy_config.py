@@ -0,0 +1,44 @@
+import logging
+
+import algokit_utils
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+logger = logging.getLogger(__name__)
+
+
+# define deployment behaviour based on supplied app spec
+def deploy(
+    algod_client: AlgodClient,
+    indexer_client: IndexerClient,
+    app_spec: algokit_utils.ApplicationSpecification,
+    deployer: algokit_utils.Account,
+) -> None:
+    from smart_contracts.artifacts.marketplace_listings.client import (
+        MarketplaceListingsClient,
+    )
+
+    app_client = MarketplaceListingsClient(
+        algod_client,
+        creator=deployer,
+        indexer_client=indexer_client,
+    )
+    app_client.deploy(
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+        on_update=algokit_utils.OnUpdate.AppendApp,
+    )
+
+    # the app account needs its own minimum balance before it can hold assets and boxes,
+    # sellers pay for the opt-ins and boxes they add on top of it
+    algokit_utils.ensure_funded(
+        algod_client,
+        algokit_utils.EnsureBalanceParameters(
+            account_to_fund=app_client.app_address,
+            min_spending_balance_micro_algos=0,
+            funding_source=deployer,
+        ),
+    )
+    logger.info(
+        f"Deployed {app_spec.contract.name} ({app_client.app_id}) "
+        f"at {app_client.app_address}"
+    )
@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+
+def record_blocks(
+    algod_client: AlgodClient, first_round: int, last_round: int
+) -> dict[int, dict]:
+    """The blocks of first_round to last_round, as algod returns them."""
+    blocks = {}
+    for round_number in range(first_round, last_round + 1):
+        response = algod_client.block_info(round_num=round_number)
+        assert isinstance(response, dict)
+        blocks[round_number] = response["block"]
+    return blocks
+
+
+def save_blocks(path: Path, blocks: dict[int, dict]) -> None:
+    path.write_text(json.dumps({str(r): block for r, block in blocks.items()}))
+
+
+class ReplayAlgodClient(AlgodClient):
+    """An AlgodClient that serves recorded blocks, to test block followers offline.
+
+    The node it replays is at the last recorded round and never gets further, so
+    waiting for a later round fails instead of hanging.
+    """
+
+    def __init__(self, blocks: dict[int, dict]) -> None:
+        super().__init__("", "http://replayed-algod")
+        self.blocks = blocks
+
+    @classmethod
+    def from_file(cls, path: Path) -> "ReplayAlgodClient":
+        recorded = json.loads(path.read_text())
+        return cls({int(r): block for r, block in recorded.items()})
+
+    def algod_request(  # type: ignore[override]
+        self,
+        method: str,
+        requrl: str,
+        params: dict | None = None,
+        data: bytes | None = None,
+        headers: dict | None = None,
+        response_format: str | None = "json",
+    ) -> dict:
+        path = requrl.split("?")[0].removeprefix("/v2")
+        last_round = max(self.blocks)
+        if method != "GET" or response_format not in (None, "json"):
+            raise AlgodHTTPError(f"{method} {requrl} is not replayed", 501)
+        if path == "/status":
+            return {"last-round": last_round}
+        if path.startswith("/status/wait-for-block-after/"):
+            raise AlgodHTTPError(f"no block was recorded after {last_round}", 503)
+        if path.startswith("/blocks/"):
+            round_number = int(path.removeprefix("/blocks/"))
+            if round_number not in self.blocks:
+                raise AlgodHTTPError(f"round {round_number} was not recorded", 404)
+            return {"block": self.blocks[round_number]}
+        raise AlgodHTTPError(f"{method} {requrl} is not replayed", 501)
@@ -0,0 +1,75 @@
+from pathlib import Path
+
+import pytest
+
+from smart_contracts.helpers import build_cache
+
+
+@pytest.fixture()
+def project(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    # compute_key resolves project imports from the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(build_cache, "cache_dir", tmp_path / "cache")
+    monkeypatch.setattr(build_cache, "stats", build_cache.BuildCacheStats())
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / "__init__.py").write_text("")
+    (tmp_path / "pkg" / "helpers.py").write_text("FEE = 1000\n")
+    (tmp_path / "pkg" / "contract.py").write_text("from pkg.helpers import FEE\n")
+    return tmp_path
+
+
+def _output(path: Path, files: dict[str, str]) -> Path:
+    path.mkdir()
+    for name, text in files.items():
+        (path / name).write_text(text)
+    return path
+
+
+def test_cache_miss_then_hit(project: Path) -> None:
+    key = build_cache.compute_key(project / "pkg" / "contract.py", [])
+    staging_dir = _output(project / "staging", {})
+
+    assert not build_cache.restore(key, staging_dir)
+    build_cache.store(
+        key, _output(project / "built", {"app.arc32.json": "{}"}), build_seconds=2.0
+    )
+    assert build_cache.restore(key, staging_dir)
+
+    assert (staging_dir / "app.arc32.json").read_text() == "{}"
+    assert build_cache.stats.hits == 1
+    assert build_cache.stats.misses == 1
+    assert 0 < build_cache.stats.time_saved <= 2.0
+
+
+def test_cache_key_invalidation(project: Path) -> None:
+    contract_path = project / "pkg" / "contract.py"
+    key = build_cache.compute_key(contract_path, [])
+
+    assert build_cache.compute_key(contract_path, []) == key
+    assert build_cache.compute_key(contract_path, ["-O2"]) != key
+    # an imported project module is part of the key, like the contract itself
+    (project / "pkg" / "helpers.py").write_text("FEE = 2000\n")
+    assert build_cache.compute_key(contract_path, []) != key
+
+
+def test_replace_dir(tmp_path: Path) -> None:
+    output_dir = _output(tmp_path / "out", {"app.arc32.json": "old", "stale": ""})
+    staging_dir = _output(tmp_path / "staging", {"app.arc32.json": "new", "x": ""})
+
+    build_cache.replace_dir(staging_dir, output_dir)
+
+    assert sorted(file.name for file in output_dir.iterdir()) == [
+        "app.arc32.json",
+        "x",
+    ]
+    assert (output_dir / "app.arc32.json").read_text() == "new"
+    assert not staging_dir.exists()
+
+
+def test_replace_dir_without_output(tmp_path: Path) -> None:
+    staging_dir = _output(tmp_path / "staging", {"app.arc32.json": "new"})
+
+    build_cache.replace_dir(staging_dir, tmp_path / "out")
+
+    assert (tmp_path / "out" / "app.arc32.json").read_text() == "new"
+    assert not staging_dir.exists()
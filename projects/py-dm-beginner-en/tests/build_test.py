@@ -0,0 +1,64 @@
+import logging
+from pathlib import Path
+
+import pytest
+
+from smart_contracts.config import SmartContract
+from smart_contracts.helpers import build_cache
+from smart_contracts.helpers.build import build
+from smart_contracts.helpers.parallel import build_all
+
+contracts_dir = Path(__file__).parent.parent / "smart_contracts"
+
+
+def test_build_contracts_in_one_process(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    pytest.importorskip("puya")
+    pytest.importorskip("algokit_client_generator")
+    # compiling to bytecode would need algod, the build skips it without one
+    monkeypatch.delenv("ALGOD_SERVER", raising=False)
+
+    # puyapy configures its logging on every run, the second one used to fail
+    for name in ("digital_marketplace", "marketplace_listings"):
+        app_spec_path = build(
+            tmp_path / name,
+            contracts_dir / name / "contract.py",
+            use_cache=False,
+            in_process=True,
+        )
+
+        assert app_spec_path.exists()
+        assert (tmp_path / name / "client.py").exists()
+
+
+def test_build_all(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    pytest.importorskip("puya")
+    pytest.importorskip("algokit_client_generator")
+    monkeypatch.delenv("ALGOD_SERVER", raising=False)
+    # pool workers are forked, so they see the patched cache dir too
+    monkeypatch.setattr(build_cache, "cache_dir", tmp_path / "cache")
+    contracts = [
+        SmartContract(path=contracts_dir / name / "contract.py", name=name)
+        for name in ("digital_marketplace", "marketplace_listings")
+    ]
+    caplog.set_level(logging.INFO)
+
+    app_spec_paths = build_all(tmp_path / "artifacts", contracts, jobs=2)
+    assert "0 hit(s), 2 miss(es)" in caplog.text
+    assert sorted(app_spec_paths) == ["digital_marketplace", "marketplace_listings"]
+    assert all(path.exists() for path in app_spec_paths.values())
+
+    caplog.clear()
+    assert build_all(tmp_path / "artifacts", contracts, jobs=1) == app_spec_paths
+    assert "2 hit(s), 0 miss(es)" in caplog.text
+
+
+def test_build_all_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(build_cache, "cache_dir", tmp_path / "cache")
+    missing = SmartContract(path=tmp_path / "missing" / "contract.py", name="missing")
+
+    with pytest.raises(Exception, match="Could not build missing"):
+        build_all(tmp_path / "artifacts", [missing], jobs=1)
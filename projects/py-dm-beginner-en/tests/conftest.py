@@ -11,6 +11,37 @@ from algosdk.v2client.indexer import IndexerClient
 from dotenv import load_dotenv
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--backend",
+        choices=("localnet", "emulator"),
+        default="localnet",
+        help="run the contract tests against LocalNet or the in-process emulator",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers", "localnet: needs a LocalNet node, skipped with --backend=emulator"
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    if config.getoption("--backend") != "emulator":
+        return
+    skip = pytest.mark.skip(reason="needs LocalNet, not the emulator")
+    for item in items:
+        if "localnet" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(scope="session")
+def backend(request: pytest.FixtureRequest) -> str:
+    return request.config.getoption("--backend")
+
+
 @pytest.fixture(autouse=True, scope="session")
 def environment_fixture() -> None:
     env_path = Path(__file__).parent.parent / ".env.localnet"
@@ -1,3 +1,12 @@
+import asyncio
+import base64
+import functools
+import json
+import shutil
+import time
+import typing
+from pathlib import Path
+
 import algokit_utils
 import algosdk
 import pytest
@@ -9,38 +18,78 @@ from algokit_utils.beta.algorand_client import (
     AssetTransferParams,
     PayParams,
 )
-from algosdk.atomic_transaction_composer import TransactionWithSigner
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.v2client.indexer import IndexerClient
 
-from smart_contracts.artifacts.digital_marketplace.client import (
+from smart_contracts.artifacts.digital_marketplace import client as generated
+from smart_contracts.digital_marketplace.async_client import (
+    AsyncDigitalMarketplaceClient,
+)
+from smart_contracts.digital_marketplace.client import (
     DigitalMarketplaceClient,
+    artifact_dir,
+)
+from smart_contracts.digital_marketplace.offline import BuyOrder, sign_buy_groups
+from smart_contracts.digital_marketplace.purchases import (
+    AssetTransfer,
+    Purchase,
+    follow_purchases,
 )
+from smart_contracts.helpers import emulator
+from smart_contracts.helpers.account_pool import MAX_GROUP_SIZE, AccountPool
+from smart_contracts.helpers.bytecode import (
+    PrecompiledAlgodClient,
+    is_current,
+    load_compile_results,
+    write_bytecode,
+)
+from smart_contracts.helpers.deploy_registry import DeploymentRegistry
+from smart_contracts.helpers.pipeline import SubmissionPipeline
+from smart_contracts.helpers.sales import scan_sales
+from smart_contracts.helpers.state_cache import GlobalStateCache
+from smart_contracts.helpers.suggested_params import SuggestedParamsCache
+from tests.block_replay import ReplayAlgodClient, record_blocks, save_blocks
 
 
 @pytest.fixture(scope="session")
-def algorand() -> AlgorandClient:
+def algorand(backend: str) -> AlgorandClient:
     """Get an AlgorandClient to use throughout the tests"""
-    return AlgorandClient.default_local_net()
+    if backend == "emulator":
+        algorand = emulator.algorand_client()
+    else:
+        algorand = AlgorandClient.default_local_net()
+    # LocalNet in dev mode also closes a round per transaction, so neither backend
+    # keeps suggested params cached or sticks to the default 10 round window
+    return algorand.set_suggested_params_timeout(0).set_default_validity_window(1000)
 
 
 @pytest.fixture(scope="session")
-def dispenser(algorand: AlgorandClient) -> AddressAndSigner:
+def dispenser(algorand: AlgorandClient, backend: str) -> AddressAndSigner:
     """Get the dispenser to fund test addresses"""
+    if backend == "emulator":
+        return emulator.dispenser(algorand)
     return algorand.account.dispenser()
 
 
 @pytest.fixture(scope="session")
-def creator(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
-    acct = algorand.account.random()
+def account_pool(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AccountPool:
+    pool = AccountPool(algorand, dispenser)
+    # a creator for most tests, funded before the first one starts
+    pool.warm(MAX_GROUP_SIZE)
+    return pool
 
-    # Make sure the account has some ALGO
-    algorand.send.payment(
-        PayParams(sender=dispenser.address, receiver=acct.address, amount=10_000_000)
-    )
 
-    return acct
+@pytest.fixture
+def creator(account_pool: AccountPool) -> AddressAndSigner:
+    # every test gets an account, asset and app of its own, so tests don't depend on
+    # each other and can run in any order or on many pytest-xdist workers
+    return account_pool.take()
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 def test_asset_id(creator: AddressAndSigner, algorand: AlgorandClient) -> int:
     # Create an asset
     sent_txn = algorand.send.asset_create(
@@ -51,7 +100,7 @@ def test_asset_id(creator: AddressAndSigner, algorand: AlgorandClient) -> int:
     return sent_txn["confirmation"]["asset-index"]
 
 
-@pytest.fixture(scope="session")
+@pytest.fixture
 def digital_marketplace_client(
     algorand: AlgorandClient, creator: AddressAndSigner, test_asset_id: int
 ) -> DigitalMarketplaceClient:
@@ -68,39 +117,113 @@ def digital_marketplace_client(
     return client
 
 
-def test_opt_in_to_asset(
+@pytest.fixture
+def listed_marketplace_client(
     digital_marketplace_client: DigitalMarketplaceClient,
     creator: AddressAndSigner,
     test_asset_id: int,
     algorand: AlgorandClient,
-):
-    # ensure get_asset_information throws an error because the app is not yet opted in
-    pytest.raises(
-        algosdk.error.AlgodHTTPError,
-        lambda: algorand.account.get_asset_information(
-            digital_marketplace_client.app_address, test_asset_id
-        ),
-    )
+) -> DigitalMarketplaceClient:
+    """The app of digital_marketplace_client, selling 3 units for 3_300_000 each"""
+    opt_in_to_asset(digital_marketplace_client, creator, test_asset_id, algorand)
+    deposit(digital_marketplace_client, creator, test_asset_id, algorand, amount=3)
+    digital_marketplace_client.set_price(unitary_price=3_300_000)
+    return digital_marketplace_client
+
 
+def opt_in_to_asset(
+    client: DigitalMarketplaceClient,
+    creator: AddressAndSigner,
+    asset_id: int,
+    algorand: AlgorandClient,
+) -> algokit_utils.ABITransactionResponse:
     # We need to send 100_000 uALGO for account MBR and 100_000 uALGO for ASA MBR
     mbr_pay_txn = algorand.transactions.payment(
         PayParams(
             sender=creator.address,
-            receiver=digital_marketplace_client.app_address,
+            receiver=client.app_address,
             amount=200_000,
-            extra_fee=1_000,
         )
     )
 
-    result = digital_marketplace_client.opt_in_to_asset(
+    return client.opt_in_to_asset(
         mbr_pay=TransactionWithSigner(txn=mbr_pay_txn, signer=creator.signer),
         transaction_parameters=algokit_utils.TransactionParameters(
             # We are using this asset in the contract, thus we need to tell the AVM its asset ID
             # In the near future, this will be done automatically
-            foreign_assets=[test_asset_id]
+            foreign_assets=[asset_id]
+        ),
+    )
+
+
+def deposit(
+    client: DigitalMarketplaceClient,
+    creator: AddressAndSigner,
+    asset_id: int,
+    algorand: AlgorandClient,
+    amount: int,
+) -> dict:
+    return algorand.send.asset_transfer(
+        AssetTransferParams(
+            sender=creator.address,
+            receiver=client.app_address,
+            asset_id=asset_id,
+            amount=amount,
+        )
+    )
+
+
+def buy(
+    client: DigitalMarketplaceClient,
+    buyer: AddressAndSigner,
+    asset_id: int,
+    algorand: AlgorandClient,
+    quantity: int,
+) -> algokit_utils.ABITransactionResponse:
+    # opt the buyer into the asset
+    algorand.send.asset_opt_in(
+        AssetOptInParams(sender=buyer.address, asset_id=asset_id)
+    )
+
+    # form a transaction to buy the assets (quantity * 3_300_000)
+    buyer_payment_txn = algorand.transactions.payment(
+        PayParams(
+            sender=buyer.address,
+            receiver=client.app_address,
+            amount=quantity * 3_300_000,
+        )
+    )
+
+    return client.buy(
+        buyer_txn=TransactionWithSigner(txn=buyer_payment_txn, signer=buyer.signer),
+        quantity=quantity,
+        transaction_parameters=algokit_utils.TransactionParameters(
+            sender=buyer.address,
+            signer=buyer.signer,
+            # we need to tell the AVM about the asset the call will use
+            foreign_assets=[asset_id],
+        ),
+    )
+
+
+def test_opt_in_to_asset(
+    digital_marketplace_client: DigitalMarketplaceClient,
+    creator: AddressAndSigner,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+) -> None:
+    # ensure get_asset_information throws an error because the app is not yet opted in
+    pytest.raises(
+        algosdk.error.AlgodHTTPError,
+        lambda: algorand.account.get_asset_information(
+            digital_marketplace_client.app_address, test_asset_id
         ),
     )
 
+    result = opt_in_to_asset(
+        digital_marketplace_client, creator, test_asset_id, algorand
+    )
+
     assert result.confirmed_round
 
     assert (
@@ -117,14 +240,11 @@ def test_deposit(
     test_asset_id: int,
     algorand: AlgorandClient,
 ):
+    opt_in_to_asset(digital_marketplace_client, creator, test_asset_id, algorand)
+
     # transfer 3 assets to the app
-    result = algorand.send.asset_transfer(
-        AssetTransferParams(
-            sender=creator.address,
-            receiver=digital_marketplace_client.app_address,
-            asset_id=test_asset_id,
-            amount=3,
-        )
+    result = deposit(
+        digital_marketplace_client, creator, test_asset_id, algorand, amount=3
     )
 
     # make sure the transfer was successful
@@ -145,67 +265,476 @@ def test_set_price(digital_marketplace_client: DigitalMarketplaceClient):
     assert result.confirmed_round
 
 
-def test_buy(
+def test_set_price_with_suggested_params_cache(
     digital_marketplace_client: DigitalMarketplaceClient,
     creator: AddressAndSigner,
+    algorand: AlgorandClient,
+) -> None:
+    cache = SuggestedParamsCache(algorand.client.algod)
+    client = DigitalMarketplaceClient(
+        algod_client=algorand.client.algod,
+        app_id=digital_marketplace_client.app_id,
+        sender=creator.address,
+        signer=creator.signer,
+        suggested_params_cache=cache,
+    )
+
+    for note in (b"1", b"2", b"3"):
+        # the cached params share a validity window, the note tells the calls apart
+        assert client.set_price(
+            unitary_price=3_300_000,
+            transaction_parameters=algokit_utils.TransactionParameters(note=note),
+        ).confirmed_round
+
+    # identical calls, told apart by the lease the client adds
+    for _ in range(2):
+        assert client.set_price(unitary_price=3_300_000).confirmed_round
+
+    # only the first call had to ask algod for suggested params
+    assert cache.stats.refreshes == 1
+    assert cache.stats.round_trips_saved == 4
+
+
+# the async clients talk to algod over HTTP themselves
+@pytest.mark.localnet
+def test_set_price_async(
+    digital_marketplace_client: DigitalMarketplaceClient,
+    creator: AddressAndSigner,
+    algorand: AlgorandClient,
+) -> None:
+    async def set_price() -> int:
+        async with AsyncDigitalMarketplaceClient(
+            algorand.client.algod,
+            app_id=digital_marketplace_client.app_id,
+            sender=creator.address,
+            signer=creator.signer,
+        ) as client:
+            result = await client.set_price(unitary_price=3_300_000)
+            assert result.confirmed_round
+            return (await client.get_global_state()).unitary_price
+
+    assert asyncio.run(set_price()) == 3_300_000
+
+
+@pytest.mark.localnet
+def test_set_price_pipelined(
+    digital_marketplace_client: DigitalMarketplaceClient,
+    creator: AddressAndSigner,
+    algorand: AlgorandClient,
+) -> None:
+    async def set_prices() -> list[int]:
+        async with AsyncDigitalMarketplaceClient(
+            algorand.client.algod,
+            app_id=digital_marketplace_client.app_id,
+            sender=creator.address,
+            signer=creator.signer,
+        ) as client, SubmissionPipeline(client.async_algod) as pipeline:
+
+            def build(
+                params: algosdk.transaction.SuggestedParams, note: bytes
+            ) -> AtomicTransactionComposer:
+                return (
+                    client.compose()
+                    .set_price(
+                        unitary_price=3_300_000,
+                        # tells the otherwise identical transactions apart
+                        transaction_parameters=algokit_utils.TransactionParameters(
+                            note=note
+                        ),
+                    )
+                    .build_with(params)
+                )
+
+            # every group is sent right away, none of them waits for the previous one
+            futures = [
+                await pipeline.submit(functools.partial(build, note=note))
+                for note in (b"1", b"2", b"3")
+            ]
+            confirmations = await asyncio.gather(*futures)
+            return [confirmation.attempts for confirmation in confirmations]
+
+    assert asyncio.run(set_prices()) == [1, 1, 1]
+
+
+def test_global_state_cache(
+    listed_marketplace_client: DigitalMarketplaceClient,
+    creator: AddressAndSigner,
+    algorand: AlgorandClient,
+) -> None:
+    cache = GlobalStateCache(algorand.client.algod)
+    client = DigitalMarketplaceClient(
+        algod_client=algorand.client.algod,
+        app_id=listed_marketplace_client.app_id,
+        sender=creator.address,
+        signer=creator.signer,
+        global_state_cache=cache,
+    )
+
+    assert client.get_global_state().unitary_price == 3_300_000
+    assert client.get_global_state().unitary_price == 3_300_000
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    # set_price invalidates the cached state, the next read goes to algod
+    client.set_price(unitary_price=1_000_000)
+    assert client.get_global_state().unitary_price == 1_000_000
+    client.set_price(unitary_price=3_300_000)
+    assert client.get_global_state().unitary_price == 3_300_000
+    assert (cache.stats.hits, cache.stats.misses) == (1, 3)
+
+
+def test_buy(
+    listed_marketplace_client: DigitalMarketplaceClient,
     test_asset_id: int,
     algorand: AlgorandClient,
-    dispenser: AddressAndSigner,
+    account_pool: AccountPool,
 ):
-    # create new account to be the buyer
-    buyer = algorand.account.random()
+    buyer = account_pool.take()
+
+    result = buy(listed_marketplace_client, buyer, test_asset_id, algorand, quantity=2)
 
-    # use the dispenser to fund buyer
-    algorand.send.payment(
-        PayParams(sender=dispenser.address, receiver=buyer.address, amount=10_000_000)
+    assert result.confirmed_round
+
+    assert (
+        algorand.account.get_asset_information(buyer.address, test_asset_id)[
+            "asset-holding"
+        ]["amount"]
+        == 2
     )
 
-    # opt the buyer into the asset
+
+def test_buy_references_the_asset(
+    listed_marketplace_client: DigitalMarketplaceClient,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+    account_pool: AccountPool,
+) -> None:
+    buyer = account_pool.take()
     algorand.send.asset_opt_in(
         AssetOptInParams(sender=buyer.address, asset_id=test_asset_id)
     )
-
-    # form a transaction to buy two assets (2 * 3_300_000)
     buyer_payment_txn = algorand.transactions.payment(
         PayParams(
             sender=buyer.address,
-            receiver=digital_marketplace_client.app_address,
-            amount=2 * 3_300_000,
-            extra_fee=1_000,
+            receiver=listed_marketplace_client.app_address,
+            amount=3_300_000,
         )
     )
 
-    result = digital_marketplace_client.buy(
+    # no foreign_assets, the client adds the asset of the app
+    result = listed_marketplace_client.buy(
         buyer_txn=TransactionWithSigner(txn=buyer_payment_txn, signer=buyer.signer),
-        quantity=2,
+        quantity=1,
         transaction_parameters=algokit_utils.TransactionParameters(
-            sender=buyer.address,
-            signer=buyer.signer,
-            # we need to tell the AVM about the asset the call will use
-            foreign_assets=[test_asset_id],
+            sender=buyer.address, signer=buyer.signer
         ),
     )
 
     assert result.confirmed_round
+    assert listed_marketplace_client.asset_id == test_asset_id
+    assert (
+        algorand.account.get_asset_information(buyer.address, test_asset_id)[
+            "asset-holding"
+        ]["amount"]
+        == 1
+    )
 
+
+@pytest.mark.localnet
+def test_buy_async_references_the_asset(
+    listed_marketplace_client: DigitalMarketplaceClient,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+    account_pool: AccountPool,
+) -> None:
+    buyer = account_pool.take()
+    algorand.send.asset_opt_in(
+        AssetOptInParams(sender=buyer.address, asset_id=test_asset_id)
+    )
+    buyer_payment_txn = algorand.transactions.payment(
+        PayParams(
+            sender=buyer.address,
+            receiver=listed_marketplace_client.app_address,
+            amount=3_300_000,
+        )
+    )
+
+    async def buy_async() -> int:
+        async with AsyncDigitalMarketplaceClient(
+            algorand.client.algod,
+            app_id=listed_marketplace_client.app_id,
+            sender=buyer.address,
+            signer=buyer.signer,
+        ) as client:
+            # no foreign_assets, the client adds the asset of the app
+            result = await client.buy(
+                buyer_txn=TransactionWithSigner(
+                    txn=buyer_payment_txn, signer=buyer.signer
+                ),
+                quantity=1,
+            )
+            assert result.confirmed_round
+            return await client.get_asset_id()
+
+    assert asyncio.run(buy_async()) == test_asset_id
     assert (
         algorand.account.get_asset_information(buyer.address, test_asset_id)[
             "asset-holding"
         ]["amount"]
-        == 2
+        == 1
     )
 
 
-def test_delete_application(
+def test_asset_id_set_on_create(
+    digital_marketplace_client: DigitalMarketplaceClient,
+    test_asset_id: int,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def get_global_state() -> None:
+        raise AssertionError("the asset id was read from global state")
+
+    monkeypatch.setattr(
+        digital_marketplace_client, "get_global_state", get_global_state
+    )
+
+    assert digital_marketplace_client.asset_id == test_asset_id
+
+
+def test_build_buy_groups_offline(
     digital_marketplace_client: DigitalMarketplaceClient,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+) -> None:
+    buyer = algorand.account.random()
+    suggested_params = algorand.client.algod.suggested_params()
+    orders = [
+        BuyOrder(
+            buyer=buyer.address,
+            quantity=1,
+            unitary_price=3_300_000,
+            note=str(i).encode(),
+        )
+        for i in range(3)
+    ]
+
+    groups = digital_marketplace_client.build_buy_groups(
+        test_asset_id, orders, suggested_params
+    )
+    signed_groups = sign_buy_groups(groups, lambda _address: buyer.signer)
+
+    assert len(signed_groups) == 3
+    for (payment, app_call), signed_group in zip(groups, signed_groups, strict=True):
+        assert payment.group == app_call.group
+        assert isinstance(payment, algosdk.transaction.PaymentTxn)
+        assert payment.amt == 3_300_000
+        # the app call pays for the inner asset transfer
+        assert app_call.fee == 2 * suggested_params.min_fee
+        assert [txn.transaction for txn in signed_group] == [payment, app_call]
+
+
+def wait_for_indexer(indexer_client: IndexerClient, confirmed_round: int) -> None:
+    deadline = time.monotonic() + 30
+    while indexer_client.health()["round"] < confirmed_round:
+        assert time.monotonic() < deadline, "indexer did not catch up"
+        time.sleep(0.5)
+
+
+@pytest.mark.localnet
+def test_scan_sales(
+    listed_marketplace_client: DigitalMarketplaceClient,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+    account_pool: AccountPool,
+    indexer_client: IndexerClient,
+    tmp_path: Path,
+) -> None:
+    app_spec = json.loads(listed_marketplace_client.app_client.app_spec.to_json())
+    app_id = listed_marketplace_client.app_id
+    state_path = tmp_path / "sales.json"
+
+    buy(listed_marketplace_client, account_pool.take(), test_asset_id, algorand, 1)
+    result = buy(
+        listed_marketplace_client, account_pool.take(), test_asset_id, algorand, 2
+    )
+    assert result.confirmed_round is not None
+    wait_for_indexer(indexer_client, result.confirmed_round)
+
+    # a page size of 1 makes the scan go through the cursor on every call
+    sales = scan_sales(indexer_client, app_spec, [app_id], state_path, page_size=1)
+    assert (sales[app_id].calls, sales[app_id].units) == (2, 3)
+
+    # the next scan resumes after the last one, so nothing is counted twice
+    result = buy(
+        listed_marketplace_client, account_pool.take(), test_asset_id, algorand, 0
+    )
+    assert result.confirmed_round is not None
+    wait_for_indexer(indexer_client, result.confirmed_round)
+    sales = scan_sales(indexer_client, app_spec, [app_id], state_path, page_size=1)
+    assert (sales[app_id].calls, sales[app_id].quantity) == (3, 3)
+
+
+def last_round(algod: algosdk.v2client.algod.AlgodClient) -> int:
+    status = algod.status()
+    assert isinstance(status, dict)
+    return status["last-round"]
+
+
+def test_follow_purchases(
+    listed_marketplace_client: DigitalMarketplaceClient,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+    account_pool: AccountPool,
+    tmp_path: Path,
+) -> None:
+    algod = algorand.client.algod
+    app_id = listed_marketplace_client.app_id
+    first_round = last_round(algod) + 1
+    buyers = [account_pool.take(), account_pool.take()]
+    buy(listed_marketplace_client, buyers[0], test_asset_id, algorand, 1)
+    buy(listed_marketplace_client, buyers[1], test_asset_id, algorand, 2)
+    stop_round = last_round(algod)
+
+    # the follower reads the recording, not the node the blocks came from
+    recording_path = tmp_path / "blocks.json"
+    save_blocks(recording_path, record_blocks(algod, first_round, stop_round))
+    replay = ReplayAlgodClient.from_file(recording_path)
+    state_path = tmp_path / "follower.json"
+    purchases: list[Purchase] = []
+
+    def crash_after_first_purchase(purchase: Purchase) -> None:
+        purchases.append(purchase)
+        raise RuntimeError("crashed")
+
+    # one round per batch, so the position is saved up to the first purchase
+    with pytest.raises(RuntimeError, match="crashed"):
+        follow_purchases(
+            replay,
+            crash_after_first_purchase,
+            state_path,
+            app_ids=[app_id],
+            start_round=first_round,
+            stop_round=stop_round,
+            batch_size=1,
+        )
+    next_round = follow_purchases(
+        replay,
+        purchases.append,
+        state_path,
+        app_ids=[app_id],
+        stop_round=stop_round,
+        batch_size=3,
+    )
+
+    assert next_round == stop_round + 1
+    # the round of the crash is handled again after the restart
+    assert purchases[0] == purchases[1]
+    assert [(p.buyer, p.quantity, p.paid) for p in purchases[1:]] == [
+        (buyers[0].address, 1, 3_300_000),
+        (buyers[1].address, 2, 6_600_000),
+    ]
+    assert [p.transfers for p in purchases[1:]] == [
+        (AssetTransfer(asset_id=test_asset_id, amount=1, receiver=buyers[0].address),),
+        (AssetTransfer(asset_id=test_asset_id, amount=2, receiver=buyers[1].address),),
+    ]
+
+
+@pytest.mark.localnet
+def test_deploy_with_registry(
+    creator: AddressAndSigner,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+    indexer_client: IndexerClient,
+    tmp_path: Path,
+) -> None:
+    registry = DeploymentRegistry(tmp_path / "deployments.json")
+    create_args = generated.DeployCreate(
+        args=generated.CreateApplicationArgs(asset_id=test_asset_id, unitary_price=0)
+    )
+    delete_args = generated.Deploy(args=generated.DeleteApplicationArgs())
+
+    def deploy(indexer: IndexerClient | None) -> algokit_utils.DeployResponse:
+        client = DigitalMarketplaceClient(
+            algorand.client.algod,
+            creator=creator.address,
+            indexer_client=indexer,
+            signer=creator.signer,
+            sender=creator.address,
+        )
+        response = client.deploy(
+            create_args=create_args, delete_args=delete_args, registry=registry
+        )
+        assert client.app_id == response.app.app_id
+        return response
+
+    # the first deploy doesn't know the app, so it searches the indexer
+    created = deploy(indexer_client)
+    assert created.action_taken == algokit_utils.OperationPerformed.Create
+
+    # the next one finds it in the registry and has no indexer to search
+    response = deploy(None)
+    assert response.action_taken == algokit_utils.OperationPerformed.Nothing
+    assert response.app.app_id == created.app.app_id
+    saved = DeploymentRegistry(registry.path).get(
+        algorand.client.algod.suggested_params().gh,
+        creator.address,
+        "DigitalMarketplace",
+    )
+    assert saved is not None and saved.app_id == created.app.app_id
+
+
+def test_create_from_bytecode(
     creator: AddressAndSigner,
     test_asset_id: int,
     algorand: AlgorandClient,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # a build of the artifacts, compiled by the node the tests run against
+    algod = algorand.client.algod
+    for suffix in (".approval.teal", ".clear.teal", ".arc32.json"):
+        shutil.copy(artifact_dir / f"DigitalMarketplace{suffix}", tmp_path)
+    assert write_bytecode(tmp_path, algod)
+    assert is_current(tmp_path)
+
+    def compile_with_algod(*args: typing.Any, **kwargs: typing.Any) -> dict:
+        raise AssertionError("the TEAL was sent to algod to compile")
+
+    monkeypatch.setattr(algod, "compile", compile_with_algod)
+    client = DigitalMarketplaceClient(
+        algod_client=typing.cast(
+            algosdk.v2client.algod.AlgodClient,
+            PrecompiledAlgodClient(algod, load_compile_results(tmp_path)),
+        ),
+        sender=creator.address,
+        signer=creator.signer,
+    )
+    client.create_create_application(unitary_price=0, asset_id=test_asset_id)
+
+    app_info = algorand.client.algod.application_info(client.app_id)
+    assert isinstance(app_info, dict)
+    approval = (tmp_path / "DigitalMarketplace.approval.bin").read_bytes()
+    assert base64.b64decode(app_info["params"]["approval-program"]) == approval
+
+
+def test_delete_application(
+    listed_marketplace_client: DigitalMarketplaceClient,
+    creator: AddressAndSigner,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+    account_pool: AccountPool,
 ):
+    # the app returns the proceeds of this sale to the creator when it's deleted
+    buy(
+        listed_marketplace_client,
+        account_pool.take(),
+        test_asset_id,
+        algorand,
+        quantity=2,
+    )
+
     # Get the balance of the creator before we delete so we can measure the effect of the deletion
     before_call_amount = algorand.account.get_information(creator.address)["amount"]
 
-    result = digital_marketplace_client.delete_delete_application(
+    result = listed_marketplace_client.delete_delete_application(
         transaction_parameters=algokit_utils.TransactionParameters(
             # we are sending the asset in the call, so we need to tell the AVM
             foreign_assets=[test_asset_id],
@@ -219,7 +748,7 @@ def test_delete_application(
     # Make sure the creator got all of the remaning assets and the remaining balance in the contract (minus fees)
     # 2 * 3_300_000 for the ALGO we got from sales
     # 200_000 for the MBR ALGO in the app that gets unlocked by opting out and closing the account
-    # -3_000 for the fees
+    # -3_000 for the fees, the call pays for its two inner transactions
     assert after_call_amount - before_call_amount == (2 * 3_300_000) + 200_000 - 3_000
     # We sold two assets, so the creator should get 8 back
     assert (
@@ -0,0 +1,86 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from smart_contracts.helpers import manifest
+
+MANIFEST = {
+    "approval": {"bytes": 352, "exact": False},
+    "extra_pages": 0,
+    "methods": {
+        "buy(pay,uint64)void": {"static_cost": 55, "inner_txns": 1},
+        "buy_many(pay,uint64[])void": {"static_cost": None, "inner_txns": None},
+    },
+}
+
+
+def test_find_violations_within_budget() -> None:
+    budget = {
+        "approval": {"bytes": 400},
+        "methods": {"buy(pay,uint64)void": {"static_cost": 55}},
+    }
+
+    assert manifest.find_violations(MANIFEST, budget) == []
+
+
+def test_find_violations_over_budget() -> None:
+    budget = {
+        "approval": {"bytes": 300},
+        "methods": {
+            "buy(pay,uint64)void": {"static_cost": 50, "inner_txns": 1},
+            "buy_many(pay,uint64[])void": {"inner_txns": 2},
+            "sell(uint64)void": {"static_cost": 10},
+        },
+    }
+
+    assert manifest.find_violations(MANIFEST, budget) == [
+        "approval.bytes: 352 > budget 300 (+52)",
+        "methods.buy(pay,uint64)void.static_cost: 55 > budget 50 (+5)",
+        "methods.buy_many(pay,uint64[])void.inner_txns: unbounded (loops), budget 2",
+        "methods.sell(uint64)void.static_cost: not in the manifest",
+    ]
+
+
+def _write_build(output_dir: Path, size: dict) -> None:
+    output_dir.mkdir()
+    (output_dir / "App.arc32.json").write_text("{}")
+    (output_dir / "App.size.json").write_text(json.dumps(size, indent=4) + "\n")
+
+
+def test_check_budget_without_budget_file(tmp_path: Path) -> None:
+    _write_build(tmp_path / "build", MANIFEST)
+
+    manifest.check_budget(tmp_path / "build", tmp_path / "missing.json", tmp_path)
+
+
+def test_check_budget_passes(tmp_path: Path) -> None:
+    _write_build(tmp_path / "build", MANIFEST)
+    budget_path = tmp_path / "teal_budget.json"
+    budget_path.write_text(json.dumps({"approval": {"bytes": 352}}))
+
+    manifest.check_budget(tmp_path / "build", budget_path, tmp_path / "previous")
+
+
+def test_check_budget_fails_with_diff(tmp_path: Path) -> None:
+    _write_build(tmp_path / "previous", {**MANIFEST, "approval": {"bytes": 340}})
+    _write_build(tmp_path / "build", MANIFEST)
+    budget_path = tmp_path / "teal_budget.json"
+    budget_path.write_text(json.dumps({"approval": {"bytes": 350}}))
+
+    with pytest.raises(Exception, match="approval.bytes: 352 > budget 350") as ex:
+        manifest.check_budget(tmp_path / "build", budget_path, tmp_path / "previous")
+
+    # the previous build's manifest is diffed against this one
+    assert '-        "bytes": 340' in str(ex.value)
+    assert '+        "bytes": 352,' in str(ex.value)
+
+
+def test_check_budget_limits_extra_pages(tmp_path: Path) -> None:
+    _write_build(tmp_path / "build", {**MANIFEST, "extra_pages": 4})
+    budget_path = tmp_path / "teal_budget.json"
+    budget_path.write_text("{}")
+
+    # even an empty budget holds the AVM's own limit
+    with pytest.raises(Exception, match="extra_pages: 4 > budget 3"):
+        manifest.check_budget(tmp_path / "build", budget_path, tmp_path)
@@ -0,0 +1,247 @@
+import algokit_utils
+import pytest
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import (
+    AlgorandClient,
+    AssetCreateParams,
+    AssetOptInParams,
+    PayParams,
+)
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+from smart_contracts.artifacts.marketplace_factory.client import (
+    MarketplaceFactoryClient,
+)
+from smart_contracts.digital_marketplace.client import DigitalMarketplaceClient
+from smart_contracts.marketplace_factory.boxes import (
+    ONBOARDING_MBR,
+    get_marketplace_id,
+)
+from smart_contracts.marketplace_factory.onboarding import (
+    DELETE_MARKETPLACE_INNER_TXNS,
+    delete_marketplace,
+    onboard,
+    set_price,
+    update_programs,
+)
+
+# the emulator implements neither boxes nor inner app calls
+pytestmark = pytest.mark.localnet
+
+
+@pytest.fixture(scope="session")
+def algorand() -> AlgorandClient:
+    """Get an AlgorandClient to use throughout the tests"""
+    return AlgorandClient.default_local_net()
+
+
+@pytest.fixture(scope="session")
+def dispenser(algorand: AlgorandClient) -> AddressAndSigner:
+    """Get the dispenser to fund test addresses"""
+    return algorand.account.dispenser()
+
+
+@pytest.fixture(scope="session")
+def seller(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
+    acct = algorand.account.random()
+
+    algorand.send.payment(
+        PayParams(sender=dispenser.address, receiver=acct.address, amount=10_000_000)
+    )
+
+    return acct
+
+
+@pytest.fixture(scope="session")
+def test_asset_id(seller: AddressAndSigner, algorand: AlgorandClient) -> int:
+    sent_txn = algorand.send.asset_create(
+        AssetCreateParams(sender=seller.address, total=10)
+    )
+
+    return sent_txn["confirmation"]["asset-index"]
+
+
+@pytest.fixture(scope="session")
+def factory_client(
+    algorand: AlgorandClient, dispenser: AddressAndSigner
+) -> MarketplaceFactoryClient:
+    creator = algokit_utils.get_localnet_default_account(algorand.client.algod)
+    client = MarketplaceFactoryClient(
+        algod_client=algorand.client.algod,
+        sender=creator.address,
+        signer=creator.signer,
+    )
+    client.create_bare()
+
+    # The app account needs its own MBR before it can hold assets and boxes
+    algorand.send.payment(
+        PayParams(sender=dispenser.address, receiver=client.app_address, amount=100_000)
+    )
+    assert update_programs(client, creator)
+
+    return client
+
+
+@pytest.fixture(scope="session")
+def marketplace_id(
+    factory_client: MarketplaceFactoryClient,
+    seller: AddressAndSigner,
+    test_asset_id: int,
+) -> int:
+    return onboard(
+        factory_client,
+        seller=seller.address,
+        signer=seller.signer,
+        asset_id=test_asset_id,
+        quantity=5,
+        unitary_price=1_000_000,
+    )
+
+
+def test_update_programs_again(
+    factory_client: MarketplaceFactoryClient, algorand: AlgorandClient
+) -> None:
+    creator = algokit_utils.get_localnet_default_account(algorand.client.algod)
+
+    # The factory already has the programs of this build
+    assert not update_programs(factory_client, creator)
+
+
+def test_create_marketplace(
+    factory_client: MarketplaceFactoryClient,
+    marketplace_id: int,
+    seller: AddressAndSigner,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+) -> None:
+    assert (
+        get_marketplace_id(
+            algorand.client.algod,
+            factory_client.app_id,
+            seller.address,
+            test_asset_id,
+        )
+        == marketplace_id
+    )
+
+    marketplace = DigitalMarketplaceClient(
+        algod_client=algorand.client.algod, app_id=marketplace_id
+    )
+    state = marketplace.get_global_state()
+    assert state.asset_id == test_asset_id
+    assert state.unitary_price == 1_000_000
+    # The deposit went through the factory to the marketplace
+    assert (
+        algorand.account.get_asset_information(marketplace.app_address, test_asset_id)[
+            "asset-holding"
+        ]["amount"]
+        == 5
+    )
+
+
+def test_set_price(
+    factory_client: MarketplaceFactoryClient,
+    marketplace_id: int,
+    seller: AddressAndSigner,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+) -> None:
+    result = set_price(
+        factory_client,
+        seller=seller.address,
+        signer=seller.signer,
+        asset_id=test_asset_id,
+        unitary_price=3_300_000,
+    )
+
+    assert result.confirmed_round
+
+    marketplace = DigitalMarketplaceClient(
+        algod_client=algorand.client.algod, app_id=marketplace_id
+    )
+    assert marketplace.get_global_state().unitary_price == 3_300_000
+
+
+def test_buy(
+    marketplace_id: int,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+    dispenser: AddressAndSigner,
+) -> None:
+    buyer = algorand.account.random()
+    algorand.send.payment(
+        PayParams(sender=dispenser.address, receiver=buyer.address, amount=10_000_000)
+    )
+    algorand.send.asset_opt_in(
+        AssetOptInParams(sender=buyer.address, asset_id=test_asset_id)
+    )
+    marketplace = DigitalMarketplaceClient(
+        algod_client=algorand.client.algod,
+        app_id=marketplace_id,
+        sender=buyer.address,
+        signer=buyer.signer,
+    )
+    buyer_payment_txn = algorand.transactions.payment(
+        PayParams(
+            sender=buyer.address,
+            receiver=marketplace.app_address,
+            amount=2 * 3_300_000,
+        )
+    )
+
+    # Buyers call the marketplace itself, the factory isn't involved
+    result = marketplace.buy(
+        buyer_txn=TransactionWithSigner(txn=buyer_payment_txn, signer=buyer.signer),
+        quantity=2,
+    )
+
+    assert result.confirmed_round
+    assert (
+        algorand.account.get_asset_information(buyer.address, test_asset_id)[
+            "asset-holding"
+        ]["amount"]
+        == 2
+    )
+
+
+def test_delete_marketplace(
+    factory_client: MarketplaceFactoryClient,
+    marketplace_id: int,
+    seller: AddressAndSigner,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+) -> None:
+    before_call_amount = algorand.account.get_information(seller.address)["amount"]
+
+    result = delete_marketplace(
+        factory_client,
+        seller=seller.address,
+        signer=seller.signer,
+        asset_id=test_asset_id,
+    )
+
+    assert result.confirmed_round
+
+    after_call_amount = algorand.account.get_information(seller.address)["amount"]
+
+    # The seller gets the proceeds and every MBR paid at onboarding,
+    # minus the fees for the call and its inner transactions
+    assert after_call_amount - before_call_amount == (
+        2 * 3_300_000 + ONBOARDING_MBR - 1_000 * (1 + DELETE_MARKETPLACE_INNER_TXNS)
+    )
+    # 10 created, 5 deposited and 2 sold
+    assert (
+        algorand.account.get_asset_information(seller.address, test_asset_id)[
+            "asset-holding"
+        ]["amount"]
+        == 8
+    )
+    assert (
+        get_marketplace_id(
+            algorand.client.algod,
+            factory_client.app_id,
+            seller.address,
+            test_asset_id,
+        )
+        is None
+    )
@@ -0,0 +1,311 @@
+import algokit_utils
+import algosdk
+import pytest
+from algokit_utils.beta.account_manager import AddressAndSigner
+from algokit_utils.beta.algorand_client import (
+    AlgorandClient,
+    AssetCreateParams,
+    AssetOptInParams,
+    AssetTransferParams,
+    PayParams,
+)
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+
+from smart_contracts.artifacts.marketplace_listings.client import (
+    MarketplaceListingsClient,
+)
+from smart_contracts.marketplace_listings.boxes import (
+    LISTING_BOX_MBR,
+    get_listing,
+    get_listings,
+    listing_box,
+)
+from smart_contracts.marketplace_listings.checkout import CartItem, checkout
+
+# the emulator doesn't implement boxes
+pytestmark = pytest.mark.localnet
+
+
+@pytest.fixture(scope="session")
+def algorand() -> AlgorandClient:
+    """Get an AlgorandClient to use throughout the tests"""
+    return AlgorandClient.default_local_net()
+
+
+@pytest.fixture(scope="session")
+def dispenser(algorand: AlgorandClient) -> AddressAndSigner:
+    """Get the dispenser to fund test addresses"""
+    return algorand.account.dispenser()
+
+
+@pytest.fixture(scope="session")
+def seller(algorand: AlgorandClient, dispenser: AddressAndSigner) -> AddressAndSigner:
+    acct = algorand.account.random()
+
+    algorand.send.payment(
+        PayParams(sender=dispenser.address, receiver=acct.address, amount=10_000_000)
+    )
+
+    return acct
+
+
+@pytest.fixture(scope="session")
+def test_asset_id(seller: AddressAndSigner, algorand: AlgorandClient) -> int:
+    sent_txn = algorand.send.asset_create(
+        AssetCreateParams(sender=seller.address, total=10)
+    )
+
+    return sent_txn["confirmation"]["asset-index"]
+
+
+@pytest.fixture(scope="session")
+def listings_client(
+    algorand: AlgorandClient, seller: AddressAndSigner, dispenser: AddressAndSigner
+) -> MarketplaceListingsClient:
+    client = MarketplaceListingsClient(
+        algod_client=algorand.client.algod,
+        sender=seller.address,
+        signer=seller.signer,
+    )
+    client.create_bare()
+
+    # The app account needs its own MBR before it can hold assets and boxes
+    algorand.send.payment(
+        PayParams(sender=dispenser.address, receiver=client.app_address, amount=100_000)
+    )
+
+    return client
+
+
+def test_allow_asset(
+    listings_client: MarketplaceListingsClient,
+    seller: AddressAndSigner,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+) -> None:
+    mbr_pay_txn = algorand.transactions.payment(
+        PayParams(
+            sender=seller.address,
+            receiver=listings_client.app_address,
+            amount=100_000,
+            extra_fee=1_000,
+        )
+    )
+
+    result = listings_client.allow_asset(
+        mbr_pay=TransactionWithSigner(txn=mbr_pay_txn, signer=seller.signer),
+        asset=test_asset_id,
+    )
+
+    assert result.confirmed_round
+
+
+def test_list(
+    listings_client: MarketplaceListingsClient,
+    seller: AddressAndSigner,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+) -> None:
+    mbr_pay_txn = algorand.transactions.payment(
+        PayParams(
+            sender=seller.address,
+            receiver=listings_client.app_address,
+            amount=LISTING_BOX_MBR,
+        )
+    )
+    xfer_txn = algorand.transactions.asset_transfer(
+        AssetTransferParams(
+            sender=seller.address,
+            receiver=listings_client.app_address,
+            asset_id=test_asset_id,
+            amount=3,
+        )
+    )
+
+    result = listings_client.list_asset(
+        mbr_pay=TransactionWithSigner(txn=mbr_pay_txn, signer=seller.signer),
+        xfer=TransactionWithSigner(txn=xfer_txn, signer=seller.signer),
+        unitary_price=1_000_000,
+        transaction_parameters=algokit_utils.TransactionParameters(
+            boxes=[listing_box(seller.address, test_asset_id)],
+        ),
+    )
+
+    assert result.confirmed_round
+
+    listing = get_listing(
+        algorand.client.algod,
+        listings_client.app_id,
+        seller.address,
+        test_asset_id,
+    )
+    assert listing is not None
+    assert listing.quantity == 3
+    assert listing.unitary_price == 1_000_000
+
+
+def test_set_price(
+    listings_client: MarketplaceListingsClient,
+    seller: AddressAndSigner,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+) -> None:
+    result = listings_client.set_price(
+        asset=test_asset_id,
+        unitary_price=3_300_000,
+        transaction_parameters=algokit_utils.TransactionParameters(
+            boxes=[listing_box(seller.address, test_asset_id)],
+        ),
+    )
+
+    assert result.confirmed_round
+
+    listing = get_listing(
+        algorand.client.algod,
+        listings_client.app_id,
+        seller.address,
+        test_asset_id,
+    )
+    assert listing is not None
+    assert listing.unitary_price == 3_300_000
+
+
+def test_buy(
+    listings_client: MarketplaceListingsClient,
+    seller: AddressAndSigner,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+    dispenser: AddressAndSigner,
+) -> None:
+    buyer = algorand.account.random()
+    algorand.send.payment(
+        PayParams(sender=dispenser.address, receiver=buyer.address, amount=10_000_000)
+    )
+    algorand.send.asset_opt_in(
+        AssetOptInParams(sender=buyer.address, asset_id=test_asset_id)
+    )
+
+    # The payment goes to the seller, not to the app
+    buyer_payment_txn = algorand.transactions.payment(
+        PayParams(
+            sender=buyer.address,
+            receiver=seller.address,
+            amount=2 * 3_300_000,
+            extra_fee=1_000,
+        )
+    )
+
+    result = listings_client.buy(
+        seller=seller.address,
+        asset=test_asset_id,
+        buyer_txn=TransactionWithSigner(txn=buyer_payment_txn, signer=buyer.signer),
+        quantity=2,
+        transaction_parameters=algokit_utils.TransactionParameters(
+            sender=buyer.address,
+            signer=buyer.signer,
+            boxes=[listing_box(seller.address, test_asset_id)],
+        ),
+    )
+
+    assert result.confirmed_round
+
+    assert (
+        algorand.account.get_asset_information(buyer.address, test_asset_id)[
+            "asset-holding"
+        ]["amount"]
+        == 2
+    )
+    listing = get_listing(
+        algorand.client.algod,
+        listings_client.app_id,
+        seller.address,
+        test_asset_id,
+    )
+    assert listing is not None
+    assert listing.quantity == 1
+
+
+def test_buy_many(
+    listings_client: MarketplaceListingsClient,
+    seller: AddressAndSigner,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+    dispenser: AddressAndSigner,
+) -> None:
+    buyer = algorand.account.random()
+    algorand.send.payment(
+        PayParams(sender=dispenser.address, receiver=buyer.address, amount=10_000_000)
+    )
+    algorand.send.asset_opt_in(
+        AssetOptInParams(sender=buyer.address, asset_id=test_asset_id)
+    )
+    before_call_amount = algorand.account.get_information(seller.address)["amount"]
+
+    # A single payment to the app covers the whole cart
+    result = checkout(
+        listings_client,
+        [
+            CartItem(
+                seller=seller.address,
+                asset_id=test_asset_id,
+                quantity=1,
+                unitary_price=3_300_000,
+            )
+        ],
+        buyer=buyer.address,
+        signer=buyer.signer,
+    )
+
+    assert result.confirmed_round
+
+    # The app forwarded the proceeds to the seller
+    after_call_amount = algorand.account.get_information(seller.address)["amount"]
+    assert after_call_amount - before_call_amount == 3_300_000
+    assert (
+        algorand.account.get_asset_information(buyer.address, test_asset_id)[
+            "asset-holding"
+        ]["amount"]
+        == 1
+    )
+
+
+def test_delist(
+    listings_client: MarketplaceListingsClient,
+    seller: AddressAndSigner,
+    test_asset_id: int,
+    algorand: AlgorandClient,
+) -> None:
+    before_call_amount = algorand.account.get_information(seller.address)["amount"]
+
+    result = listings_client.delist(
+        asset=test_asset_id,
+        transaction_parameters=algokit_utils.TransactionParameters(
+            boxes=[listing_box(seller.address, test_asset_id)],
+            # covers the MBR refund inner transaction, every unit was sold
+            suggested_params=_fee_params(algorand, 2_000),
+        ),
+    )
+
+    assert result.confirmed_round
+
+    after_call_amount = algorand.account.get_information(seller.address)["amount"]
+
+    # The box MBR is refunded, minus the fees for the call and the inner payment
+    assert after_call_amount - before_call_amount == LISTING_BOX_MBR - 2_000
+    # 10 created, 3 listed and sold
+    assert (
+        algorand.account.get_asset_information(seller.address, test_asset_id)[
+            "asset-holding"
+        ]["amount"]
+        == 7
+    )
+    assert get_listings(algorand.client.algod, listings_client.app_id) == []
+
+
+def _fee_params(
+    algorand: AlgorandClient, fee: int
+) -> algosdk.transaction.SuggestedParams:
+    params = algorand.client.algod.suggested_params()
+    params.flat_fee = True
+    params.fee = fee
+    return params
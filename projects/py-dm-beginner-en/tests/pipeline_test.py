@@ -0,0 +1,112 @@
+import asyncio
+
+import httpx
+import msgpack  # type: ignore[import-untyped]
+import pytest
+from algosdk import account
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import PaymentTxn, SignedTransaction, SuggestedParams
+
+from smart_contracts.helpers.async_algod import AsyncAlgodClient
+from smart_contracts.helpers.pipeline import SubmissionPipeline
+
+_PRIVATE_KEY, _ADDRESS = account.generate_account()
+
+
+def _build_payment(params: SuggestedParams) -> AtomicTransactionComposer:
+    atc = AtomicTransactionComposer()
+    atc.add_transaction(
+        TransactionWithSigner(
+            PaymentTxn(_ADDRESS, params, _ADDRESS, 0),
+            AccountTransactionSigner(_PRIVATE_KEY),
+        )
+    )
+    return atc
+
+
+class _Node:
+    """Confirms every group in the round after it is sent and forgets it right away."""
+
+    def __init__(self, *, fail_waiting: bool = False) -> None:
+        self.round = 1
+        self.fail_waiting = fail_waiting
+        self.sent = 0
+        self.blocks: dict[int, list[str]] = {}
+
+    def client(self) -> AsyncAlgodClient:
+        client = AsyncAlgodClient("http://node")
+        client.http_client = httpx.AsyncClient(
+            base_url="http://node", transport=httpx.MockTransport(self.handle)
+        )
+        return client
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path == "/v2/transactions/params":
+            return httpx.Response(
+                200,
+                json={
+                    "fee": 0,
+                    "last-round": self.round,
+                    "genesis-hash": "SGO1GKSzyE7IEPItTxCByw9x8FmnrCDexi9/cOUJOiI=",
+                    "genesis-id": "testnet-v1.0",
+                    "consensus-version": "future",
+                    "min-fee": 1000,
+                },
+            )
+        if path == "/v2/transactions":
+            self.sent += 1
+            stxns = msgpack.Unpacker(raw=False)
+            stxns.feed(request.content)
+            self.blocks[self.round + 1] = [
+                SignedTransaction.undictify(stxn).get_txid() for stxn in stxns
+            ]
+            return httpx.Response(200, json={"txId": self.blocks[self.round + 1][0]})
+        if path.startswith("/v2/transactions/pending/"):
+            return httpx.Response(404, json={"message": "txn not found"})
+        if path == "/v2/status":
+            return httpx.Response(200, json={"last-round": self.round})
+        if path.startswith("/v2/status/wait-for-block-after/"):
+            if self.fail_waiting:
+                return httpx.Response(500, json={"message": "node is down"})
+            self.round = int(path.rsplit("/", 1)[1]) + 1
+            return httpx.Response(200, json={"last-round": self.round})
+        if path.startswith("/v2/blocks/"):
+            round_num = int(path.split("/")[3])
+            return httpx.Response(
+                200, json={"blockTxids": self.blocks.get(round_num, [])}
+            )
+        return httpx.Response(404, json={"message": f"no route {path}"})
+
+
+def test_pipeline_finds_forgotten_group_in_blocks() -> None:
+    node = _Node()
+
+    async def submit() -> tuple[int, int]:
+        async with SubmissionPipeline(node.client(), validity_rounds=2) as pipeline:
+            confirmation = await (await pipeline.submit(_build_payment))
+        return confirmation.confirmed_round, confirmation.attempts
+
+    assert asyncio.run(submit()) == (2, 1)
+    # the group is never sent again, although the node no longer knows about it
+    assert node.sent == 1
+
+
+def test_pipeline_rejects_groups_once_tracker_died() -> None:
+    node = _Node(fail_waiting=True)
+
+    async def submit() -> None:
+        async with SubmissionPipeline(node.client()) as pipeline:
+            future = await pipeline.submit(_build_payment)
+            with pytest.raises(AlgodHTTPError, match="node is down"):
+                await future
+            with pytest.raises(Exception, match="stopped tracking"):
+                await pipeline.submit(_build_payment)
+
+    with pytest.raises(AlgodHTTPError, match="node is down"):
+        asyncio.run(submit())
@@ -0,0 +1,99 @@
+from smart_contracts.helpers import teal
+from smart_contracts.helpers.fees import inner_txn_counts
+
+
+def _inner_txns(teal_source: str, start: str) -> int | None:
+    blocks, _ = teal.parse_blocks(teal_source)
+    return teal.max_over_paths(
+        blocks, start, lambda instruction: instruction[0] == "itxn_submit"
+    )
+
+
+def test_max_over_paths_mid_block_branch() -> None:
+    # like puyapy emits it, the code the branch skips follows it in the same block
+    source = """
+#pragma version 10
+
+main:
+    txn NumAppArgs
+    bz main_after_if@2
+    itxn_begin
+    itxn_submit
+    itxn_begin
+    itxn_submit
+
+main_after_if@2:
+    itxn_begin
+    itxn_submit
+    int 1
+    return
+"""
+    blocks, _ = teal.parse_blocks(source)
+
+    assert _inner_txns(source, "main") == 3
+    # 2 instructions up to the branch, 4 skipped by it, then 4 after the label
+    assert teal.max_over_paths(blocks, "main", teal.opcode_cost) == 10
+
+
+def test_max_over_paths_loop() -> None:
+    source = """
+#pragma version 10
+
+main:
+    int 0
+
+main_for_header@1:
+    dup
+    txn NumAppArgs
+    <
+    bz main_after_for@3
+    itxn_begin
+    itxn_submit
+    int 1
+    +
+    b main_for_header@1
+
+main_after_for@3:
+    return
+"""
+
+    # the count depends on the input, so there is no static one
+    assert _inner_txns(source, "main") is None
+    assert _inner_txns(source, "main_after_for@3") == 0
+
+
+def test_inner_txn_counts_per_method() -> None:
+    source = """
+#pragma version 10
+
+main:
+    method "one()void"
+    method "two()void"
+    txna ApplicationArgs 0
+    match main_one_route@1 main_two_route@2
+    err
+
+main_one_route@1:
+    callsub one
+    int 1
+    return
+
+main_two_route@2:
+    txn NumAppArgs
+    bnz main_two_many@3
+    int 1
+    return
+
+main_two_many@3:
+    callsub one
+    callsub one
+    int 1
+    return
+
+one:
+    itxn_begin
+    itxn_submit
+    retsub
+"""
+
+    assert inner_txn_counts(source) == {"one()void": 1, "two()void": 2}